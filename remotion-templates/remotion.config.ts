@@ -6,3 +6,29 @@ Config.setOverwriteOutput(true);
 // Use 50% of cores for better stability
 const cpuCores = require('os').cpus().length;
 Config.setConcurrency(Math.min(Math.floor(cpuCores * 0.5), 8));
+
+[%- if component_library or bundle_cache_dir %]
+
+// Share bundling work between projects in this workspace
+Config.overrideWebpackConfig((config) => ({
+  ...config,
+[%- if bundle_cache_dir %]
+  // Persist webpack's filesystem cache in a workspace-wide directory
+  cache:
+    config.cache && typeof config.cache === 'object'
+      ? { ...config.cache, cacheDirectory: '[[ bundle_cache_dir ]]' }
+      : config.cache,
+[%- endif %]
+[%- if component_library %]
+  resolve: {
+    ...config.resolve,
+    alias: {
+      ...(config.resolve?.alias as Record<string, string> | undefined),
+      '@remotion-library': '[[ component_library ]]',
+    },
+    // Library components live outside the project, so resolve their imports here
+    modules: [require('path').resolve(process.cwd(), 'node_modules'), 'node_modules'],
+  },
+[%- endif %]
+}));
+[%- endif %]
@@ -0,0 +1,30 @@
+import React from 'react';
+import { CalculateMetadataFunction, Composition } from 'remotion';
+import { TimelineComposition, TimelineCompositionProps } from './TimelineComposition';
+import timeline from './timeline.json';
+
+// Video metadata follows the timeline passed as inputProps, so variants with a
+// different length or resolution render from the same bundle
+const calculateMetadata: CalculateMetadataFunction<TimelineCompositionProps> = ({ props }) => ({
+  durationInFrames: Math.max(1, props.duration_frames),
+  fps: props.fps,
+  width: props.width,
+  height: props.height,
+});
+
+export const RemotionRoot: React.FC = () => {
+  return (
+    <>
+      <Composition
+        id="[[ composition_id ]]"
+        component={TimelineComposition}
+        calculateMetadata={calculateMetadata}
+        durationInFrames={[[ duration_in_frames ]]}
+        fps={[[ fps ]]}
+        width={[[ width ]]}
+        height={[[ height ]]}
+        defaultProps={timeline as unknown as TimelineCompositionProps}
+      />
+    </>
+  );
+};
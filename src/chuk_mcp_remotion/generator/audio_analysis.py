@@ -0,0 +1,273 @@
+"""
+Audio Analysis - Per-frame level tables for audio-reactive components.
+
+Audio-reactive components need the loudness and spectrum of the audio at
+each video frame. Decoding and analysing audio in the renderer would repeat
+that work on every frame of every render worker, so WAV files are analysed
+once here: RMS level, peak level and log-spaced band energies for every
+frame at the composition fps, quantized to 0-255.
+
+Files are read with the stdlib wave module and streamed in chunks of video
+frames, so long recordings never sit in memory as a whole. Results are
+cached by the SHA-256 of the file (in memory for the most recently used
+tables, and on disk when a cache directory is given). The analysis needs NumPy: pip install
+chuk-mcp-remotion[audio].
+"""
+import hashlib
+import json
+import math
+import wave
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bump when the table format or the analysis changes, to invalidate caches
+ANALYSIS_VERSION = 1
+
+# Video frames decoded per read
+CHUNK_FRAMES = 256
+
+# Band edges span this frequency range (capped at the Nyquist frequency)
+MIN_FREQUENCY = 30.0
+MAX_FREQUENCY = 16000.0
+
+# Band energies are mapped from this range (dB below the loudest band) to 0-255
+BAND_FLOOR_DB = -60.0
+
+LEVEL_MAX = 255
+
+# Tables kept in memory (least recently used dropped first)
+ANALYSIS_CACHE_SIZE = 16
+
+# Cache key -> table
+_memory_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def _copy_table(table: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a table so callers never share the cached lists."""
+    return {key: list(value) if isinstance(value, list) else value for key, value in table.items()}
+
+
+def file_hash(path: Union[str, Path]) -> str:
+    """SHA-256 of a file, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _decode(raw: bytes, sample_width: int, channels: int):
+    """Decode PCM bytes to mono float samples in [-1, 1]."""
+    if sample_width == 1:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float64) - 128) / 128
+    elif sample_width == 2:
+        samples = np.frombuffer(raw, dtype="<i2") / 32768.0
+    elif sample_width == 3:
+        triples = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        values = triples[:, 0] | (triples[:, 1] << 8) | (triples[:, 2] << 16)
+        samples = np.where(values >= 1 << 23, values - (1 << 24), values) / float(1 << 23)
+    elif sample_width == 4:
+        samples = np.frombuffer(raw, dtype="<i4") / float(1 << 31)
+    else:
+        raise ValueError(f"Unsupported WAV sample width: {sample_width * 8} bits")
+    return samples.reshape(-1, channels).mean(axis=1)
+
+
+def _band_edges(band_count: int, sample_rate: int, fft_size: int) -> List[Tuple[int, int]]:
+    """FFT bin ranges for log-spaced bands, each at least one bin wide."""
+    top = min(MAX_FREQUENCY, sample_rate / 2)
+    edges = np.geomspace(MIN_FREQUENCY, top, band_count + 1)
+    bins = np.round(edges * fft_size / sample_rate).astype(int)
+    ranges = []
+    for low, high in zip(bins[:-1], bins[1:]):
+        low = max(1, int(low))
+        ranges.append((low, max(low + 1, int(high))))
+    return ranges
+
+
+def _analyse_chunk(samples, offsets, window, fft_size, band_ranges):
+    """RMS, peak and band magnitudes for the frames starting at offsets."""
+    squares = samples * samples
+    counts = np.diff(np.append(offsets, len(samples)))
+    rms = np.sqrt(np.add.reduceat(squares, offsets) / np.maximum(counts, 1))
+    peak = np.maximum.reduceat(np.abs(samples), offsets)
+
+    if not band_ranges:
+        return rms, peak, None
+
+    # One fixed-size, Hann-windowed slice per frame (zero padded at the end)
+    padded = np.concatenate([samples, np.zeros(window)])
+    windows = padded[offsets[:, None] + np.arange(window)] * np.hanning(window)
+    spectrum = np.abs(np.fft.rfft(windows, n=fft_size, axis=1))
+    bands = np.stack([spectrum[:, low:high].mean(axis=1) for low, high in band_ranges], axis=1)
+    return rms, peak, bands
+
+
+def _quantize(values) -> List[int]:
+    """Map values in [0, 1] to integer levels 0-255."""
+    return np.clip(np.rint(values * LEVEL_MAX), 0, LEVEL_MAX).astype(int).ravel().tolist()
+
+
+def _analyse(path: Path, fps: int, band_count: int) -> Dict[str, Any]:
+    """Stream a WAV file and build its per-frame tables."""
+    with wave.open(str(path), "rb") as wav:
+        if wav.getcomptype() != "NONE":
+            raise ValueError(f"Compressed WAV files are not supported: {wav.getcompname()}")
+        channels = wav.getnchannels()
+        sample_width = wav.getsampwidth()
+        sample_rate = wav.getframerate()
+        total_samples = wav.getnframes()
+
+        samples_per_frame = sample_rate / fps
+        frame_count = max(1, math.ceil(total_samples / samples_per_frame))
+        window = max(1, int(samples_per_frame))
+        fft_size = 1 << (window - 1).bit_length()
+        band_ranges = _band_edges(band_count, sample_rate, fft_size) if band_count else []
+
+        def boundary(frame: int) -> int:
+            return min(total_samples, round(frame * samples_per_frame))
+
+        rms_parts, peak_parts, band_parts = [], [], []
+        for first in range(0, frame_count, CHUNK_FRAMES):
+            last = min(frame_count, first + CHUNK_FRAMES)
+            start = boundary(first)
+            raw = wav.readframes(boundary(last) - start)
+            samples = _decode(raw, sample_width, channels)
+            if len(samples) == 0:
+                samples = np.zeros(1)
+            offsets = np.array([boundary(k) - start for k in range(first, last)])
+            offsets = np.minimum(offsets, len(samples) - 1)
+            rms, peak, bands = _analyse_chunk(samples, offsets, window, fft_size, band_ranges)
+            rms_parts.append(rms)
+            peak_parts.append(peak)
+            if bands is not None:
+                band_parts.append(bands)
+
+    table: Dict[str, Any] = {
+        "fps": fps,
+        "frames": frame_count,
+        "duration": total_samples / sample_rate,
+        "sample_rate": sample_rate,
+        "channels": channels,
+        "rms": _quantize(np.concatenate(rms_parts)),
+        "peak": _quantize(np.concatenate(peak_parts)),
+        "band_count": band_count,
+        "bands": []
+    }
+    if band_parts:
+        # Decibels relative to the loudest band anywhere in the file
+        bands = np.concatenate(band_parts)
+        loudest = bands.max()
+        if loudest > 0:
+            decibels = 20 * np.log10(np.maximum(bands / loudest, 1e-12))
+            table["bands"] = _quantize(1 - decibels / BAND_FLOOR_DB)
+        else:
+            table["bands"] = [0] * bands.size
+    return table
+
+
+def analyze_audio(
+    path: Union[str, Path],
+    fps: int = 30,
+    bands: int = 16,
+    cache_dir: Optional[Union[str, Path]] = None
+) -> Dict[str, Any]:
+    """
+    Analyse a WAV file into per-frame level tables.
+
+    Args:
+        path: WAV file (8/16/24/32-bit PCM, any channel count)
+        fps: Composition frame rate
+        bands: Number of log-spaced frequency bands (0 skips the spectrum)
+        cache_dir: Directory for cached tables (default: in-memory only)
+
+    Returns:
+        Dictionary with "frames", "duration", "sample_rate", "channels",
+        per-frame "rms" and "peak" levels (0-255), "band_count" and the flat
+        "bands" levels ordered [frame][band], plus the file's "sha256"
+    """
+    if np is None:
+        raise ImportError("Audio analysis requires NumPy: pip install chuk-mcp-remotion[audio]")
+    if fps < 1:
+        raise ValueError(f"fps must be at least 1, got {fps}")
+    if bands < 0:
+        raise ValueError(f"bands must not be negative, got {bands}")
+
+    path = Path(path)
+    digest = file_hash(path)
+    key = f"{digest}-{fps}-{bands}-v{ANALYSIS_VERSION}"
+
+    if key in _memory_cache:
+        _memory_cache.move_to_end(key)
+        return _copy_table(_memory_cache[key])
+
+    cache_file = Path(cache_dir) / f"audio-{key}.json" if cache_dir else None
+    if cache_file is not None and cache_file.exists():
+        table = json.loads(cache_file.read_text())
+    else:
+        try:
+            table = _analyse(path, fps, bands)
+        except wave.Error as e:
+            raise ValueError(f"Not a readable WAV file: {path} ({e})") from None
+        table["sha256"] = digest
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(table, separators=(",", ":")))
+
+    _memory_cache[key] = table
+    while len(_memory_cache) > ANALYSIS_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+    return _copy_table(table)
+
+
+def slice_table(table: Dict[str, Any], start: int, count: int) -> Dict[str, Any]:
+    """
+    Cut a frame range out of an analysis table.
+
+    Frames past the end of the audio are silent.
+
+    Args:
+        table: Output of analyze_audio
+        start: First frame
+        count: Number of frames
+
+    Returns:
+        Table with the same keys covering frames start ... start + count - 1
+    """
+    def window(values: List[int], width: int) -> List[int]:
+        part = values[start * width:(start + count) * width]
+        return part + [0] * (count * width - len(part))
+
+    sliced = dict(table)
+    sliced["frames"] = count
+    sliced["rms"] = window(table["rms"], 1)
+    sliced["peak"] = window(table["peak"], 1)
+    sliced["bands"] = window(table["bands"], table["band_count"]) if table["bands"] else []
+    return sliced
+
+
+def waveform_overview(peaks: List[int], columns: int) -> List[int]:
+    """
+    Reduce per-frame peaks to a fixed number of columns (max per column).
+
+    Args:
+        peaks: Per-frame peak levels
+        columns: Number of columns
+
+    Returns:
+        Peak level of each column
+    """
+    if not peaks or columns < 1:
+        return []
+    overview = []
+    for column in range(columns):
+        low = column * len(peaks) // columns
+        high = max(low + 1, (column + 1) * len(peaks) // columns)
+        overview.append(max(peaks[low:high]))
+    return overview
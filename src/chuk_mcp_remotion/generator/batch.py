@@ -0,0 +1,421 @@
+"""
+Batch Variant Generator - Generates personalized variants from a row source.
+
+Takes a base composition timeline (the output of CompositionBuilder.to_dict())
+whose string props contain [[ column ]] placeholders, and a streaming source
+of rows (CSV or JSON Lines). Placeholders are plain column substitutions,
+never templates: only names from the row source's header are substituted,
+and any other [[ in a prop (code such as arr[[0, 1]] or v[[i]]) is kept as
+written. Each row produces either:
+- "props": a timeline JSON file for the data-driven TimelineComposition
+- "project": a complete Remotion project copied from a shared scaffold
+
+Rows are fanned out across a process pool. Placeholders are compiled once per
+worker and the project scaffold (config files and component TSX) is built
+once per batch, so each variant only pays for substitution and writing.
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from jinja2 import Template
+
+from ..utils.project_manager import ProjectManager, write_data_files
+from .composition_builder import CompositionBuilder
+
+BATCH_MODES = ("props", "project")
+
+# Rows sent to a worker per task (amortizes inter-process overhead)
+DEFAULT_CHUNK_SIZE = 16
+
+# Maximum errors kept in the batch report
+MAX_REPORTED_ERRORS = 20
+
+_TEMPLATE_DIR = Path(__file__).parent.parent.parent.parent / "remotion-templates"
+
+# A [[ column ]] placeholder; only bare column names are substituted
+_PLACEHOLDER = re.compile(r"\[\[\s*([A-Za-z_][A-Za-z0-9_]*)\s*\]\]")
+
+# A prop that is exactly one placeholder keeps the row value's native type
+_SINGLE_PLACEHOLDER = re.compile(r"^\[\[\s*([A-Za-z_][A-Za-z0-9_]*)\s*\]\]$")
+
+
+def iter_rows(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Stream rows from a CSV or JSON Lines file without loading it into memory.
+
+    Args:
+        path: .csv file with a header row, or .jsonl file with one object per line
+
+    Yields:
+        One dictionary per row
+    """
+    path = Path(path)
+    if path.suffix.lower() in (".jsonl", ".ndjson"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif path.suffix.lower() == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+    else:
+        raise ValueError(f"Unsupported row source '{path.suffix}'. Use .csv or .jsonl")
+
+
+def compile_timeline(value: Any, columns: Optional[Iterable[str]] = None) -> Any:
+    """
+    Compile the placeholders of a serialized timeline.
+
+    Strings containing [[ column ]] placeholders are split into literal text
+    and column lookups (or a single lookup when the whole string is one
+    placeholder); all other values are kept. Nothing in a prop is evaluated.
+
+    Args:
+        value: Serialized timeline (or any part of it)
+        columns: Column names to substitute (default: every [[ name ]]).
+            Placeholders naming other columns are kept as written, and so
+            are placeholders a row has no value for.
+    """
+    allowed = None if columns is None else frozenset(columns)
+    return _compile(value, allowed)
+
+
+def _compile(value: Any, allowed: Optional[frozenset]) -> Any:
+    if isinstance(value, str):
+        if "[[" not in value:
+            return value
+        match = _SINGLE_PLACEHOLDER.match(value)
+        if match and (allowed is None or match.group(1) in allowed):
+            return ("column", (match.group(1), value))
+
+        # Alternating literal text and (column, placeholder text)
+        parts: List[Any] = []
+        position = 0
+        for match in _PLACEHOLDER.finditer(value):
+            if allowed is not None and match.group(1) not in allowed:
+                continue
+            parts.extend((value[position:match.start()], (match.group(1), match.group(0))))
+            position = match.end()
+        if not parts:
+            return value
+        parts.append(value[position:])
+        return ("text", tuple(parts))
+    if isinstance(value, dict):
+        return {key: _compile(item, allowed) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_compile(item, allowed) for item in value]
+    return value
+
+
+def _lookup(row: Dict[str, Any], column: Tuple[str, str]) -> Any:
+    """A row's value for a placeholder, or the placeholder text if it has none."""
+    name, placeholder = column
+    return row[name] if name in row else placeholder
+
+
+def render_timeline(compiled: Any, row: Dict[str, Any]) -> Any:
+    """Substitute a row into a compiled timeline."""
+    if isinstance(compiled, tuple):
+        kind, target = compiled
+        if kind == "column":
+            return _lookup(row, target)
+        return "".join(
+            part if index % 2 == 0 else str(_lookup(row, part))
+            for index, part in enumerate(target)
+        )
+    if isinstance(compiled, dict):
+        return {key: render_timeline(item, row) for key, item in compiled.items()}
+    if isinstance(compiled, list):
+        return [render_timeline(item, row) for item in compiled]
+    return compiled
+
+
+def variant_name(index: int, row: Dict[str, Any], name_column: Optional[str] = None) -> str:
+    """Get a filesystem-safe variant name for a row."""
+    if name_column and row.get(name_column):
+        slug = re.sub(r"[^A-Za-z0-9-]+", "-", str(row[name_column])).strip("-").lower()
+        if slug:
+            return f"{index:05d}-{slug}"
+    return f"variant-{index:05d}"
+
+
+# Per-process state, set up once by _init_worker
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(config: Dict[str, Any]):
+    """Compile the base timeline and templates once per worker process."""
+    _WORKER.clear()
+    _WORKER.update(config)
+    _WORKER["compiled"] = compile_timeline(config["base"], config["columns"])
+    if config["mode"] == "project":
+        _WORKER["root_template"] = Template(
+            (_TEMPLATE_DIR / "src" / "Root.tsx").read_text(),
+            variable_start_string='[[',
+            variable_end_string=']]',
+            block_start_string='[%',
+            block_end_string='%]'
+        )
+
+
+def _generate_variant(index: int, row: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate one variant in the current worker."""
+    timings = {}
+    output_dir = Path(_WORKER["output_dir"])
+    name = variant_name(index, row, _WORKER["name_column"])
+
+    started = time.perf_counter()
+    timeline = render_timeline(_WORKER["compiled"], row)
+    timings["substitute"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    composition = CompositionBuilder.from_dict(timeline)
+    if _WORKER["mode"] == "props":
+        payload = json.dumps(composition.to_dict())
+    else:
+        composition_tsx = composition.generate_composition_tsx()
+        root_tsx = _WORKER["root_template"].render(
+            composition_id=_WORKER["project_name"].replace('_', '-'),
+            duration_in_frames=composition.get_total_duration_frames(),
+            fps=composition.fps,
+            width=composition.width,
+            height=composition.height,
+            theme=composition.theme
+        )
+    timings["build"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    if _WORKER["mode"] == "props":
+        path = output_dir / f"{name}.json"
+        path.write_text(payload)
+    else:
+        path = output_dir / name
+        shutil.copytree(_WORKER["scaffold_dir"], path, dirs_exist_ok=True)
+        (path / "src" / "VideoComposition.tsx").write_text(composition_tsx)
+        write_data_files(path / "src" / "data", composition.data_files)
+        (path / "src" / "Root.tsx").write_text(root_tsx)
+    timings["write"] = time.perf_counter() - started
+
+    return {"index": index, "name": name, "path": str(path), "timings": timings}
+
+
+def _generate_chunk(rows: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Generate a chunk of variants, capturing per-row failures."""
+    results = []
+    for index, row in rows:
+        try:
+            results.append(_generate_variant(index, row))
+        except Exception as e:
+            results.append({"index": index, "error": f"{type(e).__name__}: {e}"})
+    return results
+
+
+def _chunked(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Tuple[int, Dict[str, Any]]]]:
+    """Group an iterable of rows into indexed chunks."""
+    chunk = []
+    for index, row in enumerate(rows):
+        chunk.append((index, row))
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class VariantBatch:
+    """Generates many personalized variants of one base composition."""
+
+    def __init__(
+        self,
+        base: Dict[str, Any],
+        output_dir: Path,
+        mode: str = "props",
+        workers: Optional[int] = None,
+        name_column: Optional[str] = None,
+        project_name: str = "variant",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        columns: Optional[Iterable[str]] = None
+    ):
+        """
+        Initialize the batch.
+
+        Args:
+            base: Base timeline from CompositionBuilder.to_dict(), with [[ column ]] placeholders
+            output_dir: Directory for generated variants
+            mode: "props" (timeline JSON per row) or "project" (project per row)
+            workers: Worker processes (default: CPU count; 1 runs in-process)
+            name_column: Row column used to name variant files
+            project_name: package.json name of generated projects
+            chunk_size: Rows sent to a worker per task
+            columns: Column names substituted into placeholders (default: the
+                row source's header, i.e. the keys of the first row)
+        """
+        if mode not in BATCH_MODES:
+            raise ValueError(f"Unknown batch mode '{mode}'. Use one of: {', '.join(BATCH_MODES)}")
+
+        self.base = base
+        self.output_dir = Path(output_dir)
+        self.mode = mode
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.name_column = name_column
+        self.project_name = project_name
+        self.chunk_size = max(1, chunk_size)
+        self.columns = None if columns is None else list(columns)
+
+    def _prepare_scaffold(self, scaffold_root: Path) -> Path:
+        """Build the shared project scaffold (config files and component TSX) once."""
+        manager = ProjectManager(workspace_dir=scaffold_root)
+        manager.create_project(
+            self.project_name,
+            theme=self.base.get("theme", "tech"),
+            fps=self.base.get("fps", 30),
+            width=self.base.get("width", 1920),
+            height=self.base.get("height", 1080)
+        )
+        composition = CompositionBuilder.from_dict(self.base)
+        for component_type in composition.get_component_types():
+            manager.add_component_to_project(component_type, {}, composition.theme)
+
+        return scaffold_root / self.project_name
+
+    def run(self, rows: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Generate one variant per row.
+
+        Rows are consumed lazily with a bounded number of chunks in flight,
+        so arbitrarily large row sources run in constant memory.
+
+        Args:
+            rows: Iterable of row dictionaries
+
+        Returns:
+            Report with counts, throughput and per-stage timings
+        """
+        started = time.perf_counter()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        columns = self.columns
+        if columns is None:
+            # The header (CSV) or first row's keys (JSON Lines) name the columns
+            rows = iter(rows)
+            first = next(rows, None)
+            columns = list(first) if first is not None else []
+            if first is not None:
+                rows = chain([first], rows)
+        stages = {"setup": 0.0, "substitute": 0.0, "build": 0.0, "write": 0.0}
+        report: Dict[str, Any] = {"variants": 0, "failed": 0, "errors": []}
+
+        def collect(results: List[Dict[str, Any]]):
+            for result in results:
+                if "error" in result:
+                    report["failed"] += 1
+                    if len(report["errors"]) < MAX_REPORTED_ERRORS:
+                        report["errors"].append(result)
+                    continue
+                report["variants"] += 1
+                for stage, seconds in result["timings"].items():
+                    stages[stage] += seconds
+
+        with tempfile.TemporaryDirectory(prefix="remotion-scaffold-") as scaffold_root:
+            config = {
+                "base": self.base,
+                "mode": self.mode,
+                "output_dir": str(self.output_dir),
+                "name_column": self.name_column,
+                "project_name": self.project_name,
+                "columns": columns,
+                "scaffold_dir": None
+            }
+            if self.mode == "project":
+                config["scaffold_dir"] = str(self._prepare_scaffold(Path(scaffold_root)))
+            stages["setup"] = time.perf_counter() - started
+
+            chunks = _chunked(rows, self.chunk_size)
+            if self.workers == 1:
+                _init_worker(config)
+                for chunk in chunks:
+                    collect(_generate_chunk(chunk))
+            else:
+                max_in_flight = self.workers * 2
+                with ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_init_worker,
+                    initargs=(config,)
+                ) as pool:
+                    pending = set()
+                    for chunk in chunks:
+                        pending.add(pool.submit(_generate_chunk, chunk))
+                        if len(pending) >= max_in_flight:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                collect(future.result())
+                    for future in pending:
+                        collect(future.result())
+
+        elapsed = time.perf_counter() - started
+        generated = report["variants"]
+
+        return {
+            "mode": self.mode,
+            "output_dir": str(self.output_dir),
+            "workers": self.workers,
+            **report,
+            "elapsed_seconds": round(elapsed, 3),
+            "variants_per_second": round(generated / elapsed, 2) if elapsed > 0 else 0.0,
+            # Setup is wall-clock; the other stages are summed across workers
+            "stage_seconds": {stage: round(seconds, 4) for stage, seconds in stages.items()},
+            "stage_ms_per_variant": {
+                stage: round(seconds * 1000 / generated, 3) if generated else 0.0
+                for stage, seconds in stages.items() if stage != "setup"
+            }
+        }
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point for batch variant generation."""
+    parser = argparse.ArgumentParser(
+        description="Generate personalized Remotion variants from a CSV or JSON Lines file"
+    )
+    parser.add_argument("base", help="Base timeline JSON (from remotion_export_timeline)")
+    parser.add_argument("rows", help="Row source (.csv or .jsonl)")
+    parser.add_argument("--out", required=True, help="Output directory")
+    parser.add_argument("--mode", choices=BATCH_MODES, default="props", help="What to generate per row")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--name-column", default=None, help="Column used to name variants")
+    parser.add_argument("--project-name", default="variant", help="Project name for --mode project")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per worker task")
+    parser.add_argument(
+        "--columns", default=None, help="Comma-separated columns to substitute (default: the row source's header)"
+    )
+
+    args = parser.parse_args(argv)
+
+    base = json.loads(Path(args.base).read_text())
+    batch = VariantBatch(
+        base,
+        Path(args.out),
+        mode=args.mode,
+        workers=args.workers,
+        name_column=args.name_column,
+        project_name=args.project_name,
+        chunk_size=args.chunk_size,
+        columns=args.columns.split(",") if args.columns else None
+    )
+    report = batch.run(iter_rows(Path(args.rows)))
+    print(json.dumps(report, indent=2))
+
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Captions - Streaming SRT/WebVTT import into a single caption track.
+
+A video can carry hundreds of caption cues. One component per cue would
+mean hundreds of ComponentInstances and Sequences in the composition, so
+cues are parsed into one CaptionTrack component instead: parallel arrays of
+start and end frames and offsets into one concatenated text string.
+Overlapping cues are split into spans that do not overlap, each showing the
+cue that started last, so the template finds the span on a frame with a
+binary search over the starts.
+
+Files are parsed line by line, so large caption files are never read into
+memory as a whole.
+"""
+import re
+from bisect import insort
+from heapq import heappop, heappush
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+CAPTION_FORMATS = ("srt", "vtt")
+
+# 00:00:01,000 --> 00:00:04,000 (SRT) or 00:01.000 --> 00:04.000 line:90% (VTT)
+_TIMING = re.compile(
+    r"^\s*((?:\d+:)?\d{1,2}:\d{2}[.,]\d{1,3})\s*-->\s*((?:\d+:)?\d{1,2}:\d{2}[.,]\d{1,3})"
+)
+
+# Inline markup: <i>, </b>, <v Speaker>, <00:00:01.500> and {\an8}
+_MARKUP = re.compile(r"<[^>]*>|\{\\[^}]*\}")
+
+# VTT blocks without cues
+_VTT_SKIPPED_BLOCKS = ("NOTE", "STYLE", "REGION")
+
+
+@dataclass
+class Cue:
+    """A caption cue with times in seconds."""
+    start: float
+    end: float
+    text: str
+
+
+def parse_timestamp(value: str) -> float:
+    """Parse hh:mm:ss,mmm / mm:ss.mmm into seconds."""
+    clock, fraction = re.split(r"[.,]", value.strip())
+    seconds = 0.0
+    for part in clock.split(":"):
+        seconds = seconds * 60 + int(part)
+    return seconds + int(fraction.ljust(3, "0")) / 1000
+
+
+def _clean(lines: List[str]) -> str:
+    """Join a cue's text lines and drop inline markup."""
+    text = "\n".join(_MARKUP.sub("", line).strip() for line in lines)
+    return text.replace("&amp;", "&").replace("&lt;", "<").replace("&gt;", ">").strip()
+
+
+def parse_captions(lines: Iterable[str]) -> Iterator[Cue]:
+    """
+    Parse SRT or WebVTT lines into cues, one block at a time.
+
+    Both formats are handled by the same parser: a cue is an optional
+    identifier line, a timing line and text lines up to the next blank line.
+    VTT headers, NOTE, STYLE and REGION blocks have no timing line and are
+    skipped.
+
+    Args:
+        lines: Lines of the caption file (e.g. an open file)
+
+    Yields:
+        Cues in file order; cues with no text are skipped
+    """
+    timing = None
+    text: List[str] = []
+    skipping = False
+
+    for raw in lines:
+        line = raw.rstrip("\r\n").lstrip("\ufeff")
+
+        if not line.strip():
+            if timing is not None and text:
+                yield Cue(timing[0], timing[1], _clean(text))
+            timing, text, skipping = None, [], False
+            continue
+
+        if skipping:
+            continue
+
+        if timing is None:
+            match = _TIMING.match(line)
+            if match:
+                timing = (parse_timestamp(match.group(1)), parse_timestamp(match.group(2)))
+            elif line.split(" ", 1)[0] in _VTT_SKIPPED_BLOCKS:
+                skipping = True
+            # Anything else before the timing line is a cue identifier or header
+        else:
+            text.append(line)
+
+    if timing is not None and text:
+        yield Cue(timing[0], timing[1], _clean(text))
+
+
+def _visible_spans(entries: List[tuple]) -> List[List[int]]:
+    """
+    Split sorted (start, end, ...) entries into [start, end, entry] spans
+    that do not overlap, each showing the active entry that started last.
+    """
+    bounds = sorted({frame for start, end, *_ in entries for frame in (start, end)})
+    # (-entry, end) of cues that have started; ended ones are dropped lazily
+    active: List[Tuple[int, int]] = []
+    spans: List[List[int]] = []
+    position = 0
+    for left, right in zip(bounds, bounds[1:]):
+        while position < len(entries) and entries[position][0] <= left:
+            heappush(active, (-position, entries[position][1]))
+            position += 1
+        while active and active[0][1] <= left:
+            heappop(active)
+        if not active:
+            continue
+        entry = -active[0][0]
+        if spans and spans[-1][2] == entry and spans[-1][1] == left:
+            spans[-1][1] = right
+        else:
+            spans.append([left, right, entry])
+    return spans
+
+
+def build_caption_track(cues: Iterable[Cue], fps: int, offset: float = 0.0) -> Dict[str, Any]:
+    """
+    Pack cues into the CaptionTrack table.
+
+    Where cues overlap, the one that started last is shown: a cue running
+    through a shorter one is split around it, so the spans in the table
+    never overlap.
+
+    Args:
+        cues: Parsed cues
+        fps: Composition frame rate
+        offset: Seconds added to every cue (negative to trim the start)
+
+    Returns:
+        Dictionary with parallel "starts" and "ends" frame arrays of
+        non-overlapping spans sorted by start, "offsets" into "text" (cue i is text[offsets[i]:offsets[i + 1]])
+        and the concatenated "text"
+    """
+    entries: List[tuple] = []
+    for index, cue in enumerate(cues):
+        start = round((cue.start + offset) * fps)
+        end = round((cue.end + offset) * fps)
+        if end <= 0 or end <= start:
+            continue
+        # Files are almost always in order, so this is an append
+        insort(entries, (max(0, start), end, index, cue.text))
+
+    starts, ends, offsets, parts = [], [], [0], []
+    for start, end, entry in _visible_spans(entries):
+        text = entries[entry][3]
+        starts.append(start)
+        ends.append(end)
+        parts.append(text)
+        offsets.append(offsets[-1] + len(text))
+
+    return {"starts": starts, "ends": ends, "offsets": offsets, "text": "".join(parts)}
+
+
+def load_captions(
+    source: Union[str, Path],
+    fps: int,
+    offset: float = 0.0,
+    encoding: str = "utf-8-sig"
+) -> Dict[str, Any]:
+    """
+    Stream-parse an SRT or VTT file into a CaptionTrack table.
+
+    Args:
+        source: Path to a .srt or .vtt file
+        fps: Composition frame rate
+        offset: Seconds added to every cue
+        encoding: File encoding
+
+    Returns:
+        CaptionTrack table (see build_caption_track)
+    """
+    path = Path(source)
+    suffix = path.suffix.lower().lstrip(".")
+    if suffix not in CAPTION_FORMATS:
+        raise ValueError(f"Unsupported caption format '{path.suffix}'. Use one of: .srt, .vtt")
+    with open(path, encoding=encoding) as f:
+        return build_caption_track(parse_captions(f), fps, offset)
+
+
+def parse_caption_text(content: str, fps: int, offset: float = 0.0) -> Dict[str, Any]:
+    """
+    Parse SRT or VTT content given as a string into a CaptionTrack table.
+
+    Args:
+        content: Caption file content
+        fps: Composition frame rate
+        offset: Seconds added to every cue
+
+    Returns:
+        CaptionTrack table (see build_caption_track)
+    """
+    return build_caption_track(parse_captions(content.splitlines()), fps, offset)
+
+
+def track_end_frame(track: Dict[str, Any]) -> Optional[int]:
+    """Frame at which the last cue ends, or None for an empty track."""
+    return max(track["ends"]) if track["ends"] else None
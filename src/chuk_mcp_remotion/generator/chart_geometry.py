@@ -0,0 +1,357 @@
+"""
+Chart Geometry - Precomputes chart layouts at generation time.
+
+Charts used to scale their data and rebuild SVG paths in the browser on
+every frame. The geometry only depends on the data and chart size, so it is
+computed once here: bounds, scaled coordinates, the SVG path string and the
+cumulative path lengths used by the draw-on animation. Per frame, the
+template only has to turn animation progress into a stroke offset. Point
+markers are drawn for a bounded set of points (all of them for short
+series, otherwise the ends and the extremes), not for every point.
+
+Series longer than the chart is wide are downsampled first, to about one
+point per pixel column, with Largest-Triangle-Three-Buckets (keeps the
+visual shape) or min/max per bucket (keeps every peak and trough).
+
+NumPy is used for the numeric work when it is installed
+(pip install chuk-mcp-remotion[fast]); a pure-Python path gives identical
+results otherwise.
+"""
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Default LineChart SVG size, matching LineChart.tsx.j2
+CHART_WIDTH = 800
+CHART_HEIGHT = 400
+CHART_PADDING = 60
+
+# Decimal places kept for SVG coordinates
+COORDINATE_PRECISION = 2
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+
+# Series with at most this many points get a marker on every point
+MAX_MARKERS = 24
+
+
+def normalize_points(data: Sequence[Any]) -> Tuple[List[float], List[float]]:
+    """
+    Split chart data into x and y values.
+
+    Args:
+        data: List of [x, y] pairs, or a list of y values (x is the index)
+
+    Returns:
+        Tuple of (x values, y values)
+    """
+    if np is not None and data and not isinstance(data[0], dict):
+        try:
+            array = np.asarray(data, dtype=float)
+        except (TypeError, ValueError):
+            array = None
+        if array is not None and array.ndim == 1:
+            return np.arange(len(array), dtype=float).tolist(), array.tolist()
+        if array is not None and array.ndim == 2 and array.shape[1] >= 2:
+            return array[:, 0].tolist(), array[:, 1].tolist()
+
+    xs, ys = [], []
+    for index, item in enumerate(data):
+        if isinstance(item, (list, tuple)):
+            if len(item) < 2:
+                raise ValueError(f"Data point {index} must be [x, y], got {item!r}")
+            xs.append(float(item[0]))
+            ys.append(float(item[1]))
+        elif isinstance(item, dict):
+            xs.append(float(item.get("x", index)))
+            ys.append(float(item["y"]))
+        else:
+            xs.append(float(index))
+            ys.append(float(item))
+    return xs, ys
+
+
+def point_budget(width: float = CHART_WIDTH, padding: float = CHART_PADDING) -> int:
+    """Get the number of points worth drawing: one per plot pixel column."""
+    return max(4, int(width - 2 * padding))
+
+
+def _lttb_python(xs: List[float], ys: List[float], max_points: int) -> List[int]:
+    """Largest-Triangle-Three-Buckets: indices of the points to keep."""
+    n = len(xs)
+    buckets = max_points - 2
+    selected = [0]
+    a = 0
+    for i in range(buckets):
+        # Integer bucket edges so the last bucket always ends at n - 1
+        start = i * (n - 2) // buckets + 1
+        end = (i + 1) * (n - 2) // buckets + 1
+        # Average of the next bucket (the last point for the final bucket)
+        next_start = end
+        next_end = min((i + 2) * (n - 2) // buckets + 1, n)
+        if next_start >= n - 1:
+            cx, cy = xs[n - 1], ys[n - 1]
+        else:
+            count = next_end - next_start
+            cx = sum(xs[next_start:next_end]) / count
+            cy = sum(ys[next_start:next_end]) / count
+
+        ax, ay = xs[a], ys[a]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((ax - cx) * (ys[j] - ay) - (ax - xs[j]) * (cy - ay))
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return selected
+
+
+def _lttb_numpy(x, y, max_points: int) -> List[int]:
+    """LTTB with bucket averages precomputed and per-bucket areas vectorized."""
+    n = len(x)
+    buckets = max_points - 2
+    edges = np.arange(buckets + 1) * (n - 2) // buckets + 1
+
+    # Average of each bucket; the one after the last bucket is the final point
+    counts = np.diff(edges)
+    avg_x = np.append(np.add.reduceat(x[:n - 1], edges[:-1]) / counts, x[n - 1])
+    avg_y = np.append(np.add.reduceat(y[:n - 1], edges[:-1]) / counts, y[n - 1])
+
+    selected = [0]
+    a = 0
+    for i in range(buckets):
+        start, end = edges[i], edges[i + 1]
+        ax, ay = x[a], y[a]
+        cx, cy = avg_x[i + 1], avg_y[i + 1]
+        areas = np.abs((ax - cx) * (y[start:end] - ay) - (ax - x[start:end]) * (cy - ay))
+        a = int(start + np.argmax(areas))
+        selected.append(a)
+    selected.append(n - 1)
+    return selected
+
+
+def _minmax_python(ys: List[float], max_points: int) -> List[int]:
+    """Min/max per bucket: indices of each bucket's lowest and highest point."""
+    n = len(ys)
+    buckets = (max_points - 2) // 2
+    lows: Dict[int, int] = {}
+    highs: Dict[int, int] = {}
+    for i in range(1, n - 1):
+        bucket = (i - 1) * buckets // (n - 2)
+        if bucket not in lows or ys[i] < ys[lows[bucket]]:
+            lows[bucket] = i
+        # Last maximum, matching the stable sort in the NumPy path
+        if bucket not in highs or ys[i] >= ys[highs[bucket]]:
+            highs[bucket] = i
+    return sorted({0, n - 1, *lows.values(), *highs.values()})
+
+
+def _minmax_numpy(y, max_points: int) -> List[int]:
+    """Min/max per bucket using one stable sort by (bucket, y)."""
+    n = len(y)
+    buckets = (max_points - 2) // 2
+    interior = np.arange(1, n - 1)
+    bucket_ids = (interior - 1) * buckets // (n - 2)
+    order = interior[np.lexsort((y[1:-1], bucket_ids))]
+    sorted_ids = bucket_ids[order - 1]
+    # Within each bucket the first entry is the minimum and the last the maximum
+    boundaries = np.flatnonzero(np.diff(sorted_ids)) + 1
+    firsts = np.concatenate(([0], boundaries))
+    lasts = np.concatenate((boundaries - 1, [len(order) - 1]))
+    keep = np.concatenate(([0, n - 1], order[firsts], order[lasts]))
+    return np.unique(keep).tolist()
+
+
+def downsample_points(
+    xs: List[float], ys: List[float], max_points: int, method: str = "lttb"
+) -> Tuple[List[float], List[float]]:
+    """
+    Reduce a series to at most max_points points.
+
+    Args:
+        xs: X values, in drawing order
+        ys: Y values
+        max_points: Point budget (see point_budget)
+        method: "lttb" or "minmax"
+
+    Returns:
+        Tuple of (x values, y values); unchanged when already within budget
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unknown downsample method '{method}'. Use one of: {', '.join(DOWNSAMPLE_METHODS)}")
+    minimum = 3 if method == "lttb" else 4
+    if max_points < minimum:
+        raise ValueError(f"max_points must be at least {minimum} for {method}, got {max_points}")
+    if len(xs) <= max_points:
+        return xs, ys
+
+    if np is not None:
+        x = np.asarray(xs, dtype=float)
+        y = np.asarray(ys, dtype=float)
+        indices = _lttb_numpy(x, y, max_points) if method == "lttb" else _minmax_numpy(y, max_points)
+    elif method == "lttb":
+        indices = _lttb_python(xs, ys, max_points)
+    else:
+        indices = _minmax_python(ys, max_points)
+
+    return [xs[i] for i in indices], [ys[i] for i in indices]
+
+
+def _scale_python(
+    values: List[float], low: float, high: float, start: float, span: float
+) -> List[float]:
+    """Map values from [low, high] onto [start, start + span]."""
+    if high == low:
+        return [round(start + span / 2, COORDINATE_PRECISION)] * len(values)
+    factor = span / (high - low)
+    return [round(start + (value - low) * factor, COORDINATE_PRECISION) for value in values]
+
+
+def _lengths_python(xs: List[float], ys: List[float]) -> List[float]:
+    """Cumulative polyline length at each point."""
+    lengths = [0.0]
+    total = 0.0
+    for i in range(1, len(xs)):
+        total += math.hypot(xs[i] - xs[i - 1], ys[i] - ys[i - 1])
+        lengths.append(round(total, COORDINATE_PRECISION))
+    return lengths
+
+
+def _geometry_numpy(
+    xs: List[float],
+    ys: List[float],
+    bounds: Dict[str, float],
+    width: float,
+    height: float,
+    padding: float
+) -> Tuple[List[float], List[float], List[float]]:
+    """Vectorized scaling and path lengths."""
+    x = np.asarray(xs, dtype=float)
+    y = np.asarray(ys, dtype=float)
+    plot_width = width - 2 * padding
+    plot_height = height - 2 * padding
+
+    # Same arithmetic as _scale_python, so both paths agree exactly
+    x_min, x_max = bounds["x_min"], bounds["x_max"]
+    y_min, y_max = bounds["y_min"], bounds["y_max"]
+    if x_max == x_min:
+        sx = np.full_like(x, padding + plot_width / 2)
+    else:
+        sx = padding + (x - x_min) * (plot_width / (x_max - x_min))
+    # SVG y grows downwards, so the maximum maps to the top of the plot
+    if y_max == y_min:
+        sy = np.full_like(y, padding + plot_height / 2)
+    else:
+        sy = padding + (y - y_max) * (plot_height / (y_min - y_max))
+    sx = np.round(sx, COORDINATE_PRECISION)
+    sy = np.round(sy, COORDINATE_PRECISION)
+
+    segments = np.hypot(np.diff(sx), np.diff(sy))
+    lengths = np.round(np.concatenate(([0.0], np.cumsum(segments))), COORDINATE_PRECISION)
+
+    return sx.tolist(), sy.tolist(), lengths.tolist()
+
+
+def _format_number(value: float) -> str:
+    """Format a coordinate compactly (no trailing zeros)."""
+    text = f"{value:.{COORDINATE_PRECISION}f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def marker_indices(ys: Sequence[float], max_markers: int = MAX_MARKERS) -> List[int]:
+    """
+    Points that get a marker on the chart.
+
+    Args:
+        ys: Emitted y values
+        max_markers: Series up to this long mark every point
+
+    Returns:
+        Sorted point indices: every point for short series, otherwise the
+        first and last points and the minimum and maximum
+    """
+    if len(ys) <= max_markers:
+        return list(range(len(ys)))
+    extremes = {0, len(ys) - 1, ys.index(min(ys)), ys.index(max(ys))}
+    return sorted(extremes)
+
+
+def compute_line_geometry(
+    data: Sequence[Any],
+    width: float = CHART_WIDTH,
+    height: float = CHART_HEIGHT,
+    padding: float = CHART_PADDING,
+    downsample: Optional[str] = "lttb",
+    max_points: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Compute the SVG geometry of a line chart.
+
+    Args:
+        data: List of [x, y] pairs or y values
+        width: Chart width in pixels
+        height: Chart height in pixels
+        padding: Inner padding in pixels
+        downsample: "lttb", "minmax", or None to keep every point
+        max_points: Point budget (default: one per plot pixel column)
+
+    Returns:
+        Dictionary with bounds, scaled points, SVG path, cumulative lengths,
+        total length, marker point indices, and the source and emitted
+        point counts
+    """
+    xs, ys = normalize_points(data)
+    geometry: Dict[str, Any] = {
+        "width": width,
+        "height": height,
+        "padding": padding,
+        "source_points": len(xs)
+    }
+
+    if not xs:
+        return {
+            **geometry,
+            "emitted_points": 0,
+            "bounds": None,
+            "points": [],
+            "path": "",
+            "lengths": [],
+            "total_length": 0.0,
+            "markers": []
+        }
+
+    # Bounds cover the full series so downsampling never changes the axes
+    bounds = {"x_min": min(xs), "x_max": max(xs), "y_min": min(ys), "y_max": max(ys)}
+
+    if downsample is not None:
+        xs, ys = downsample_points(xs, ys, max_points or point_budget(width, padding), downsample)
+    geometry["emitted_points"] = len(xs)
+
+    if np is not None:
+        sx, sy, lengths = _geometry_numpy(xs, ys, bounds, width, height, padding)
+    else:
+        sx = _scale_python(xs, bounds["x_min"], bounds["x_max"], padding, width - 2 * padding)
+        # SVG y grows downwards, so the minimum maps to the bottom of the plot
+        sy = _scale_python(ys, bounds["y_max"], bounds["y_min"], padding, height - 2 * padding)
+        lengths = _lengths_python(sx, sy)
+
+    path = " ".join(
+        f"{'M' if i == 0 else 'L'} {_format_number(x)} {_format_number(y)}"
+        for i, (x, y) in enumerate(zip(sx, sy))
+    )
+
+    return {
+        **geometry,
+        "bounds": bounds,
+        "points": [[x, y] for x, y in zip(sx, sy)],
+        "path": path,
+        "lengths": lengths,
+        "total_length": lengths[-1],
+        "markers": marker_indices(list(ys))
+    }
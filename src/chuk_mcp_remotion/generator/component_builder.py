@@ -4,20 +4,29 @@ TSX Component Builder - Generates Remotion React components from templates.
 Uses Jinja2 templates to generate type-safe TSX components.
 """
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from jinja2 import Environment, FileSystemLoader, Template
 
-from ..tokens.colors import COLOR_TOKENS
-from ..tokens.typography import TYPOGRAPHY_TOKENS
-from ..tokens.motion import MOTION_TOKENS
-from ..themes.youtube_themes import YOUTUBE_THEMES
+from ..themes.resolved import ResolvedTheme, builtin_theme
+from .theme_module import font_stack, link_theme_references, theme_context
+
+if TYPE_CHECKING:
+    from ..themes.theme_manager import ThemeManager
 
 
 class ComponentBuilder:
     """Builds TSX components from templates and configurations."""
 
-    def __init__(self):
-        """Initialize the component builder with Jinja2 environment."""
+    def __init__(self, theme_manager: Optional["ThemeManager"] = None):
+        """
+        Initialize the component builder with Jinja2 environment.
+
+        Args:
+            theme_manager: Resolves theme names, including custom themes and
+                tokens (default: built-in themes only)
+        """
+        self.theme_manager = theme_manager
+
         # Get template directory
         self.template_dir = Path(__file__).parent / "templates"
         self.template_dir.mkdir(exist_ok=True)
@@ -38,10 +47,24 @@ class ComponentBuilder:
         # Add custom filters
         self.env.filters['to_camel_case'] = self._to_camel_case
         self.env.filters['to_pascal_case'] = self._to_pascal_case
+        self.env.filters['font_stack'] = font_stack
 
         # Template categories for organized template discovery
         self.template_categories = ['layouts', 'overlays', 'effects', 'content']
 
+    def resolve_theme(self, theme_name: str) -> ResolvedTheme:
+        """
+        Get the resolved values of a theme.
+
+        Args:
+            theme_name: Theme name (unknown names fall back to "tech")
+
+        Returns:
+            ResolvedTheme snapshot
+        """
+        resolved = self.theme_manager.resolve_theme(theme_name) if self.theme_manager else None
+        return resolved or builtin_theme(theme_name)
+
     def _to_camel_case(self, snake_str: str) -> str:
         """Convert snake_case to camelCase."""
         components = snake_str.split('_')
@@ -51,6 +74,12 @@ class ComponentBuilder:
         """Convert snake_case to PascalCase."""
         return ''.join(x.title() for x in snake_str.split('_'))
 
+    def template_names(self) -> List[str]:
+        """Names of the components that have a template."""
+        return sorted(
+            path.name[:-len(".tsx.j2")] for path in self.template_dir.rglob("*.tsx.j2")
+        )
+
     def _find_template(self, component_name: str) -> str:
         """
         Find template file in organized subdirectories.
@@ -81,7 +110,8 @@ class ComponentBuilder:
         self,
         component_name: str,
         config: Dict[str, Any],
-        theme_name: str = "tech"
+        theme_name: str = "tech",
+        shared_theme: bool = False
     ) -> str:
         """
         Build a TSX component from configuration.
@@ -90,12 +120,14 @@ class ComponentBuilder:
             component_name: Name of the component (e.g., "LowerThird")
             config: Component configuration dictionary
             theme_name: Theme to apply
+            shared_theme: Read theme values from the project's src/theme
+                module instead of baking them into the component
 
         Returns:
             Generated TSX component code as string
         """
         # Get theme
-        theme = YOUTUBE_THEMES.get(theme_name, YOUTUBE_THEMES["tech"])
+        theme = self.resolve_theme(theme_name)
 
         # Find and get template
         try:
@@ -104,18 +136,20 @@ class ComponentBuilder:
         except Exception as e:
             raise ValueError(f"Template not found for {component_name}: {e}")
 
-        # Get font sizes for the theme's resolution
-        resolution = theme["typography"].get("default_resolution", "video_1080p")
-        font_sizes = TYPOGRAPHY_TOKENS["font_sizes"][resolution]
+        if shared_theme:
+            return link_theme_references(
+                template.render(config=config, shared_theme=True, **theme_context(theme.to_dict()))
+            )
 
         # Render template
         tsx_code = template.render(
             config=config,
+            shared_theme=False,
             theme=theme,
-            colors=theme["colors"],
-            typography=theme["typography"],
-            motion=theme["motion"],
-            font_sizes=font_sizes
+            colors=theme.colors,
+            typography=theme.typography,
+            motion=theme.motion,
+            font_sizes=theme.font_sizes
         )
 
         return tsx_code
@@ -188,8 +222,7 @@ class ComponentBuilder:
         Returns:
             JavaScript object with theme styles
         """
-        theme = YOUTUBE_THEMES.get(theme_name, YOUTUBE_THEMES["tech"])
-        colors = theme["colors"]
+        colors = self.resolve_theme(theme_name).to_dict()["colors"]
 
         styles = {
             "primary": colors["primary"][0] if isinstance(colors["primary"], list) else colors["primary"],
@@ -0,0 +1,130 @@
+"""
+Component Library - Shared, versioned component TSX for all workspace projects.
+
+Generated components only depend on the template sources and the theme, so
+projects using the same templates and theme would otherwise each carry an
+identical copy under src/components/. The library renders each component
+once per (template version, theme) into the workspace and projects import it
+through a thin re-export, which also lets webpack's shared filesystem cache
+reuse the compiled modules across projects.
+"""
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .component_builder import ComponentBuilder
+
+# Library directory inside the workspace
+LIBRARY_DIRNAME = ".remotion-library"
+
+# Shared webpack cache directory inside the workspace
+BUNDLE_CACHE_DIRNAME = ".remotion-cache"
+
+# Webpack alias pointing at the library directory (see remotion.config.ts)
+LIBRARY_ALIAS = "@remotion-library"
+
+
+class ComponentLibrary:
+    """Shared component library keyed by template version and theme."""
+
+    def __init__(self, workspace_dir: Path, component_builder: Optional[ComponentBuilder] = None):
+        """
+        Initialize the component library.
+
+        Args:
+            workspace_dir: Workspace directory holding the library
+            component_builder: Builder used to render components (default: new instance)
+        """
+        self.root = Path(workspace_dir) / LIBRARY_DIRNAME
+        self.bundle_cache_dir = Path(workspace_dir) / BUNDLE_CACHE_DIRNAME / "webpack"
+        self.component_builder = component_builder or ComponentBuilder()
+        self._template_version: Optional[str] = None
+
+    @property
+    def template_version(self) -> str:
+        """Hash of all component template sources."""
+        if self._template_version is None:
+            digest = hashlib.sha256()
+            template_dir = self.component_builder.template_dir
+            for path in sorted(template_dir.rglob("*.j2")):
+                digest.update(path.relative_to(template_dir).as_posix().encode())
+                digest.update(path.read_bytes())
+            self._template_version = digest.hexdigest()
+        return self._template_version
+
+    def library_id(self, theme: str) -> str:
+        """Get the library directory name for a theme at the current template version."""
+        digest = hashlib.sha256()
+        digest.update(self.template_version.encode())
+        digest.update(self.component_builder.resolve_theme(theme).fingerprint.encode())
+        return f"{theme}-{digest.hexdigest()[:12]}"
+
+    def library_dir(self, theme: str) -> Path:
+        """Get the directory holding a theme's components."""
+        return self.root / self.library_id(theme)
+
+    def ensure_component(self, component_type: str, theme: str) -> Path:
+        """
+        Render a component into the library unless it is already there.
+
+        Args:
+            component_type: Component name (e.g., "CodeBlock")
+            theme: Theme name
+
+        Returns:
+            Path to the library component file
+        """
+        library_dir = self.library_dir(theme)
+        component_file = library_dir / f"{component_type}.tsx"
+        if component_file.exists():
+            return component_file
+
+        # Props come from the composition, so the shared component has no config
+        tsx_code = self.component_builder.build_component(component_type, {}, theme)
+
+        library_dir.mkdir(parents=True, exist_ok=True)
+        # Write atomically so concurrent projects never import a partial file
+        fd, temp_path = tempfile.mkstemp(dir=library_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(tsx_code)
+        os.replace(temp_path, component_file)
+
+        return component_file
+
+    def import_path(self, component_type: str, theme: str) -> str:
+        """Get the webpack import path of a library component."""
+        return f"{LIBRARY_ALIAS}/{self.library_id(theme)}/{component_type}"
+
+    def build_stub(self, component_type: str, theme: str) -> str:
+        """
+        Ensure a component exists in the library and build the project stub for it.
+
+        Args:
+            component_type: Component name
+            theme: Theme name
+
+        Returns:
+            TSX re-exporting the library component
+        """
+        self.ensure_component(component_type, theme)
+        return (
+            f"// Shared component library: {self.library_id(theme)}\n"
+            f"export {{ {component_type} }} from '{self.import_path(component_type, theme)}';\n"
+        )
+
+    def list_libraries(self) -> List[Dict[str, object]]:
+        """List library versions and their components."""
+        if not self.root.exists():
+            return []
+
+        return [
+            {
+                "id": library.name,
+                "path": str(library),
+                "components": sorted(p.stem for p in library.glob("*.tsx"))
+            }
+            for library in sorted(self.root.iterdir())
+            if library.is_dir()
+        ]
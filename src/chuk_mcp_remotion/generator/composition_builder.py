@@ -3,10 +3,54 @@ Composition Builder - Combines components into complete video compositions.
 
 Manages the timeline, layering, and sequencing of video components.
 """
-from typing import List, Dict, Any, Optional
+import hashlib
+import json
+import math
+from typing import List, Dict, Any, Callable, Optional, Union
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from .audio_analysis import analyze_audio, slice_table, waveform_overview
+from .bar_chart_race import compute_bar_chart_race
+from .captions import load_captions, parse_caption_text, track_end_frame
+from .chart_geometry import compute_line_geometry
+from .particles import simulate_particles
+from .springs import BLUR_IN_SPRING, measure_spring
+from .syntax import tokenize_code
+from .typing_reveal import build_reveal_table, chars_per_second
+from ..themes.resolved import ResolvedTheme, builtin_theme
+
+# Prop values whose JSON exceeds this many bytes are written to src/data/
+# instead of being inlined into VideoComposition.tsx
+HOIST_THRESHOLD_BYTES = 4096
+
+# Spring behind each TitleScene animation ("theme": the theme's default spring)
+TITLE_SPRINGS: Dict[str, Any] = {
+    "fade_zoom": "theme",
+    "slide_up": "theme",
+    "fade_slide": "theme",
+    "zoom": "theme",
+    "blur_in": BLUR_IN_SPRING
+}
+
+# Entrance frames of TitleScene animations without a spring (default: fade)
+TITLE_ENTRANCE_FRAMES = {"typewriter": 60}
+DEFAULT_TITLE_ENTRANCE_FRAMES = 20
+
+# Exit fades of the templates (frames)
+TITLE_EXIT_FRAMES = 20
+LOWER_THIRD_EXIT_FRAMES = 10
+
+# How long an auto-sized scene holds after its entrance has settled
+ENTRANCE_HOLD_SECONDS = 2.0
+
+# Props kept only to recompute derived props (see refresh_derived_props);
+# they are not passed to the component
+SOURCE_PROPS = {
+    "LineChart": ("data", "downsample", "max_points"),
+    "TypingCode": ("typing",)
+}
+
 
 @dataclass
 class ComponentInstance:
@@ -18,10 +62,54 @@ class ComponentInstance:
     layer: int = 0  # Higher layers render on top
 
 
+def iter_child_components(component: ComponentInstance):
+    """Yield the ComponentInstance children nested in a component's props."""
+    for value in component.props.values():
+        if isinstance(value, ComponentInstance):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, ComponentInstance):
+                    yield item
+
+
+def _is_component_dict(value: Any) -> bool:
+    """Check whether a serialized prop value is a nested component."""
+    return (
+        isinstance(value, dict)
+        and {"type", "start_frame", "duration_frames", "props"} <= value.keys()
+    )
+
+
+def _component_from_dict(data: Dict[str, Any]) -> ComponentInstance:
+    """Rebuild a ComponentInstance (and its nested children) from serialized data."""
+    def load_prop(value: Any) -> Any:
+        if _is_component_dict(value):
+            return _component_from_dict(value)
+        if isinstance(value, list):
+            return [load_prop(item) for item in value]
+        return value
+
+    return ComponentInstance(
+        component_type=data["type"],
+        start_frame=data["start_frame"],
+        duration_frames=data["duration_frames"],
+        props={key: load_prop(value) for key, value in data.get("props", {}).items()},
+        layer=data.get("layer", 0)
+    )
+
+
 class CompositionBuilder:
     """Builds complete video compositions from components."""
 
-    def __init__(self, fps: int = 30, width: int = 1920, height: int = 1080, transparent: bool = False):
+    def __init__(
+        self,
+        fps: int = 30,
+        width: int = 1920,
+        height: int = 1080,
+        transparent: bool = False,
+        theme_resolver: Optional[Callable[[str], ResolvedTheme]] = None
+    ):
         """
         Initialize composition builder.
 
@@ -30,6 +118,8 @@ class CompositionBuilder:
             width: Video width in pixels (default: 1920)
             height: Video height in pixels (default: 1080)
             transparent: Use transparent background (default: False)
+            theme_resolver: Resolves a theme name, e.g. ThemeManager's
+                resolve_theme (default: built-in themes only)
         """
         self.fps = fps
         self.width = width
@@ -37,6 +127,10 @@ class CompositionBuilder:
         self.components: List[ComponentInstance] = []
         self.theme = "tech"
         self.transparent = transparent
+        self.theme_resolver = theme_resolver or builtin_theme
+        self.hoist_threshold: Optional[int] = HOIST_THRESHOLD_BYTES
+        # Data modules produced by the last generate_composition_tsx() call
+        self.data_files: Dict[str, str] = {}
 
     def seconds_to_frames(self, seconds: float) -> int:
         """Convert seconds to frames."""
@@ -46,6 +140,20 @@ class CompositionBuilder:
         """Convert frames to seconds."""
         return frames / self.fps
 
+    def theme_spring(self) -> Dict[str, Any]:
+        """The theme's default spring, as the templates pass it to spring()."""
+        config = self.theme_resolver(self.theme).motion["default_spring"]["config"]
+        return {key: config[key] for key in ("damping", "mass", "stiffness")}
+
+    def entrance_frames(self, config: Dict[str, Any]) -> int:
+        """Frames a spring entrance takes to settle at this frame rate."""
+        return measure_spring(config, self.fps)["settle_frames"]
+
+    def _title_spring(self, animation: str) -> Optional[Dict[str, Any]]:
+        """Spring a TitleScene animation uses, if any."""
+        spring = TITLE_SPRINGS.get(animation)
+        return self.theme_spring() if spring == "theme" else spring
+
     def create_code_block_instance(
         self,
         code: str,
@@ -68,6 +176,9 @@ class CompositionBuilder:
             props={
                 "code": code,
                 "language": language,
+                # Tokenized once here (and again by refresh_derived_props());
+                # None keeps in-browser highlighting
+                "code_tokens": tokenize_code(code, language),
                 "title": title,
                 "variant": variant,
                 "animation": animation,
@@ -80,7 +191,7 @@ class CompositionBuilder:
         self,
         text: str,
         subtitle: Optional[str] = None,
-        duration_seconds: float = 3.0,
+        duration_seconds: Optional[float] = 3.0,
         variant: str = "bold",
         animation: str = "fade_zoom"
     ) -> 'CompositionBuilder':
@@ -90,17 +201,30 @@ class CompositionBuilder:
         Args:
             text: Main title text
             subtitle: Optional subtitle
-            duration_seconds: Duration in seconds
+            duration_seconds: Duration in seconds; None sizes the scene to
+                its entrance settling, ENTRANCE_HOLD_SECONDS and the fade out
             variant: Style variant
             animation: Animation style
 
         Returns:
             Self for chaining
         """
+        spring = self._title_spring(animation)
+        if duration_seconds is None:
+            entrance = (
+                self.entrance_frames(spring) if spring
+                else TITLE_ENTRANCE_FRAMES.get(animation, DEFAULT_TITLE_ENTRANCE_FRAMES)
+            )
+            duration_frames = (
+                entrance + self.seconds_to_frames(ENTRANCE_HOLD_SECONDS) + TITLE_EXIT_FRAMES
+            )
+        else:
+            duration_frames = self.seconds_to_frames(duration_seconds)
+
         component = ComponentInstance(
             component_type="TitleScene",
             start_frame=self._get_next_start_frame(),
-            duration_frames=self.seconds_to_frames(duration_seconds),
+            duration_frames=duration_frames,
             props={
                 "text": text,
                 "subtitle": subtitle,
@@ -114,36 +238,91 @@ class CompositionBuilder:
 
     def add_line_chart(
         self,
-        data: list,
+        data: Union[list, str],
         title: Optional[str] = None,
         xlabel: Optional[str] = None,
         ylabel: Optional[str] = None,
         start_time: float = 0.0,
-        duration: float = 4.0
+        duration: float = 4.0,
+        downsample: Optional[str] = "lttb",
+        max_points: Optional[int] = None
     ) -> 'CompositionBuilder':
         """
         Add an animated line chart to the composition.
 
+        Series longer than the chart's pixel width are downsampled; the
+        geometry prop records source_points and emitted_points. data may be
+        a [[ column ]] placeholder: the geometry is computed once the
+        placeholder is substituted (see refresh_derived_props).
+
         Args:
-            data: List of [x, y] data points
+            data: List of [x, y] data points (or a placeholder string)
             title: Optional chart title
             xlabel: Optional x-axis label
             ylabel: Optional y-axis label
             start_time: When to show (seconds)
             duration: How long to animate (seconds)
+            downsample: "lttb", "minmax", or None to keep every point
+            max_points: Point budget (default: one per plot pixel column)
 
         Returns:
             Self for chaining
         """
+        duration_frames = self.seconds_to_frames(duration)
+        props: Dict[str, Any] = {"data": data, "downsample": downsample, "max_points": max_points}
+        props.update(self._derived_props("LineChart", props, duration_frames))
+        props.update({"title": title, "xlabel": xlabel, "ylabel": ylabel})
         component = ComponentInstance(
             component_type="LineChart",
             start_frame=self.seconds_to_frames(start_time),
-            duration_frames=self.seconds_to_frames(duration),
+            duration_frames=duration_frames,
+            props=props,
+            layer=5  # Charts render above main content but below overlays
+        )
+        self.components.append(component)
+        return self
+
+    def add_bar_chart_race(
+        self,
+        data: list,
+        title: Optional[str] = None,
+        top_n: int = 10,
+        start_time: float = 0.0,
+        duration: float = 10.0,
+        value_decimals: int = 0,
+        time_key: str = "time",
+        name_key: str = "name",
+        value_key: str = "value"
+    ) -> 'CompositionBuilder':
+        """
+        Add a bar chart race (rankings over time) to the composition.
+
+        Args:
+            data: Long-format rows, [time, name, value] or dicts
+            title: Optional chart title
+            top_n: Number of bars shown
+            start_time: When to show (seconds)
+            duration: How long the race runs (seconds)
+            value_decimals: Decimal places shown on bar values
+            time_key: Dict key holding the time
+            name_key: Dict key holding the series name
+            value_key: Dict key holding the value
+
+        Returns:
+            Self for chaining
+        """
+        duration_frames = self.seconds_to_frames(duration)
+        component = ComponentInstance(
+            component_type="BarChartRace",
+            start_frame=self.seconds_to_frames(start_time),
+            duration_frames=duration_frames,
             props={
-                "data": data,
+                # Interpolation, ranking and bar positions for every frame
+                "race": compute_bar_chart_race(
+                    data, duration_frames, top_n, time_key, name_key, value_key
+                ),
                 "title": title,
-                "xlabel": xlabel,
-                "ylabel": ylabel
+                "value_decimals": value_decimals
             },
             layer=5  # Charts render above main content but below overlays
         )
@@ -155,7 +334,7 @@ class CompositionBuilder:
         name: str,
         title: Optional[str] = None,
         start_time: float = 0.0,
-        duration: float = 5.0,
+        duration: Optional[float] = 5.0,
         variant: str = "glass",
         position: str = "bottom_left"
     ) -> 'CompositionBuilder':
@@ -166,17 +345,28 @@ class CompositionBuilder:
             name: Main name/text
             title: Optional subtitle
             start_time: When to show (seconds)
-            duration: How long to show (seconds)
+            duration: How long to show (seconds); None sizes the overlay to
+                its slide-in settling, ENTRANCE_HOLD_SECONDS and the fade out
             variant: Style variant
             position: Screen position
 
         Returns:
             Self for chaining
         """
+        spring = self.theme_spring()
+        if duration is None:
+            duration_frames = (
+                self.entrance_frames(spring)
+                + self.seconds_to_frames(ENTRANCE_HOLD_SECONDS)
+                + LOWER_THIRD_EXIT_FRAMES
+            )
+        else:
+            duration_frames = self.seconds_to_frames(duration)
+
         component = ComponentInstance(
             component_type="LowerThird",
             start_frame=self.seconds_to_frames(start_time),
-            duration_frames=self.seconds_to_frames(duration),
+            duration_frames=duration_frames,
             props={
                 "name": name,
                 "title": title,
@@ -188,6 +378,189 @@ class CompositionBuilder:
         self.components.append(component)
         return self
 
+    def add_caption_track(
+        self,
+        path: Optional[str] = None,
+        content: Optional[str] = None,
+        start_time: float = 0.0,
+        duration: Optional[float] = None,
+        offset: float = 0.0,
+        variant: str = "boxed",
+        position: str = "bottom"
+    ) -> 'CompositionBuilder':
+        """
+        Add captions from an SRT or VTT file as a single caption track.
+
+        Args:
+            path: Path to a .srt or .vtt file
+            content: SRT or VTT content (instead of path)
+            start_time: When the track starts (seconds); cue times are relative to it
+            duration: How long the track runs (seconds, default: until the last cue ends)
+            offset: Seconds added to every cue time
+            variant: Style variant (boxed, outline, highlight)
+            position: Screen position (bottom, top)
+
+        Returns:
+            Self for chaining
+        """
+        if (path is None) == (content is None):
+            raise ValueError("Pass exactly one of path or content")
+        if path is not None:
+            captions = load_captions(path, self.fps, offset)
+        else:
+            captions = parse_caption_text(content, self.fps, offset)
+
+        if duration is not None:
+            duration_frames = self.seconds_to_frames(duration)
+        else:
+            duration_frames = track_end_frame(captions) or 1
+
+        component = ComponentInstance(
+            component_type="CaptionTrack",
+            start_frame=self.seconds_to_frames(start_time),
+            duration_frames=duration_frames,
+            props={
+                "captions": captions,
+                "variant": variant,
+                "position": position
+            },
+            layer=10  # Overlays render on top
+        )
+        self.components.append(component)
+        return self
+
+    def add_particle_effect(
+        self,
+        effect: str = "confetti",
+        start_time: float = 0.0,
+        duration: float = 3.0,
+        count: int = 120,
+        seed: int = 0,
+        palette: Optional[List[str]] = None,
+        stride: int = 2
+    ) -> 'CompositionBuilder':
+        """
+        Add a particle effect (confetti, sparkle, bokeh) to the composition.
+
+        Args:
+            effect: Effect type (confetti, sparkle, bokeh)
+            start_time: When to start (seconds)
+            duration: How long the effect runs (seconds)
+            count: Number of particles
+            seed: Random seed; the same seed always gives the same effect
+            palette: Particle colors (default: built-in palette)
+            stride: Frames between simulated keyframes
+
+        Returns:
+            Self for chaining
+        """
+        duration_frames = self.seconds_to_frames(duration)
+        component = ComponentInstance(
+            component_type="ParticleEffect",
+            start_frame=self.seconds_to_frames(start_time),
+            duration_frames=duration_frames,
+            props={
+                # Trajectories are simulated here, not per frame in the browser
+                "particles": simulate_particles(
+                    effect,
+                    duration_frames,
+                    count=count,
+                    seed=seed,
+                    width=self.width,
+                    height=self.height,
+                    stride=stride,
+                    palette=palette
+                )
+            },
+            layer=15  # Effects render above overlays
+        )
+        self.components.append(component)
+        return self
+
+    def add_audio_waveform(
+        self,
+        path: str,
+        title: Optional[str] = None,
+        start_time: float = 0.0,
+        duration: Optional[float] = None,
+        offset: float = 0.0,
+        columns: int = 120,
+        cache_dir: Optional[str] = None
+    ) -> 'CompositionBuilder':
+        """
+        Add a waveform scrubber for a WAV file to the composition.
+
+        Args:
+            path: WAV file to visualize
+            title: Optional label above the waveform
+            start_time: When to show (seconds)
+            duration: How long to show (seconds, default: rest of the audio)
+            offset: Position in the audio to start from (seconds)
+            columns: Number of waveform columns
+            cache_dir: Directory for cached audio analysis
+
+        Returns:
+            Self for chaining
+        """
+        audio = self._audio_window(path, offset, duration, 0, cache_dir)
+        component = ComponentInstance(
+            component_type="AudioWaveform",
+            start_frame=self.seconds_to_frames(start_time),
+            duration_frames=audio["frames"],
+            props={
+                "audio": {
+                    "frames": audio["frames"],
+                    "peak": audio["peak"],
+                    "overview": waveform_overview(audio["peak"], columns)
+                },
+                "title": title
+            },
+            layer=10  # Overlays render on top
+        )
+        self.components.append(component)
+        return self
+
+    def add_audio_bars(
+        self,
+        path: str,
+        start_time: float = 0.0,
+        duration: Optional[float] = None,
+        offset: float = 0.0,
+        bands: int = 16,
+        variant: str = "bars",
+        cache_dir: Optional[str] = None
+    ) -> 'CompositionBuilder':
+        """
+        Add an audio-reactive frequency bar visualizer to the composition.
+
+        Args:
+            path: WAV file to visualize
+            start_time: When to show (seconds)
+            duration: How long to show (seconds, default: rest of the audio)
+            offset: Position in the audio to start from (seconds)
+            bands: Number of frequency bands
+            variant: Style variant (bars, mirror)
+            cache_dir: Directory for cached audio analysis
+
+        Returns:
+            Self for chaining
+        """
+        audio = self._audio_window(path, offset, duration, bands, cache_dir)
+        component = ComponentInstance(
+            component_type="AudioBars",
+            start_frame=self.seconds_to_frames(start_time),
+            duration_frames=audio["frames"],
+            props={
+                "audio": {
+                    key: audio[key] for key in ("frames", "rms", "peak", "band_count", "bands")
+                },
+                "variant": variant
+            },
+            layer=5  # Visualizers render with charts
+        )
+        self.components.append(component)
+        return self
+
     def add_code_block(
         self,
         code: str,
@@ -222,6 +595,7 @@ class CompositionBuilder:
             props={
                 "code": code,
                 "language": language,
+                "code_tokens": tokenize_code(code, language),
                 "title": title,
                 "variant": variant,
                 "animation": animation,
@@ -241,8 +615,11 @@ class CompositionBuilder:
         duration: float = 10.0,
         variant: str = "editor",
         cursor_style: str = "line",
-        typing_speed: str = "normal",
-        show_line_numbers: bool = True
+        typing_speed: Union[str, float] = "normal",
+        show_line_numbers: bool = True,
+        line_pause: float = 0.0,
+        jitter: float = 0.0,
+        seed: Optional[int] = None
     ) -> 'CompositionBuilder':
         """
         Add an animated typing code effect to the composition.
@@ -255,25 +632,40 @@ class CompositionBuilder:
             duration: How long to type (seconds)
             variant: Style variant (minimal, terminal, editor, hacker)
             cursor_style: Cursor appearance (block, line, underline, none)
-            typing_speed: Typing speed (slow, normal, fast, instant)
+            typing_speed: Typing speed (slow, normal, fast, instant) or chars per second
             show_line_numbers: Show line numbers
+            line_pause: Extra pause at the end of each line (seconds)
+            jitter: Random keystroke timing variation (0-1) for human-like typing
+            seed: Jitter RNG seed (default: derived from the code)
 
         Returns:
             Self for chaining
         """
+        duration_frames = self.seconds_to_frames(duration)
+        props: Dict[str, Any] = {
+            "code": code,
+            "language": language,
+            # Settings the reveal table is built from, kept for variants
+            "typing": {
+                "speed": typing_speed,
+                "line_pause": line_pause,
+                "jitter": jitter,
+                "seed": seed
+            }
+        }
+        # code_tokens, the reveal table and typing_speed
+        props.update(self._derived_props("TypingCode", props, duration_frames))
+        props.update({
+            "title": title,
+            "variant": variant,
+            "cursor_style": cursor_style,
+            "show_line_numbers": show_line_numbers
+        })
         component = ComponentInstance(
             component_type="TypingCode",
             start_frame=self.seconds_to_frames(start_time),
-            duration_frames=self.seconds_to_frames(duration),
-            props={
-                "code": code,
-                "language": language,
-                "title": title,
-                "variant": variant,
-                "cursor_style": cursor_style,
-                "typing_speed": typing_speed,
-                "show_line_numbers": show_line_numbers
-            },
+            duration_frames=duration_frames,
+            props=props,
             layer=5  # Code blocks render with charts
         )
         self.components.append(component)
@@ -919,6 +1311,23 @@ class CompositionBuilder:
             divider_width=divider_width
         )
 
+    def _audio_window(
+        self,
+        path: str,
+        offset: float,
+        duration: Optional[float],
+        bands: int,
+        cache_dir: Optional[str]
+    ) -> Dict[str, Any]:
+        """Analyse a WAV file and cut out the frames a component shows."""
+        table = analyze_audio(path, fps=self.fps, bands=bands, cache_dir=cache_dir)
+        start = self.seconds_to_frames(offset)
+        if duration is None:
+            frames = max(1, table["frames"] - start)
+        else:
+            frames = self.seconds_to_frames(duration)
+        return slice_table(table, start, frames)
+
     def _get_next_start_frame(self) -> int:
         """Get the start frame for the next sequential component."""
         if not self.components:
@@ -942,6 +1351,10 @@ class CompositionBuilder:
         """Get total duration of the composition in seconds."""
         return self.frames_to_seconds(self.get_total_duration_frames())
 
+    def get_component_types(self) -> List[str]:
+        """Get all component types used by the composition, including nested children."""
+        return sorted(self._find_all_component_types(self.components))
+
     def generate_composition_tsx(self) -> str:
         """
         Generate the main VideoComposition.tsx component.
@@ -949,6 +1362,9 @@ class CompositionBuilder:
         Returns:
             TSX code for the complete composition
         """
+        # Large prop values hoisted while rendering JSX below
+        self.data_files = {}
+
         # Sort components by layer (lower layers first)
         sorted_components = sorted(self.components, key=lambda c: c.layer)
 
@@ -974,6 +1390,12 @@ class CompositionBuilder:
 
         components_jsx_str = "\n".join(components_jsx)
 
+        if self.data_files:
+            imports += "\n" + "\n".join([
+                f"import {Path(filename).stem.replace('-', '_')} from './data/{filename}';"
+                for filename in sorted(self.data_files)
+            ])
+
         # Background color: transparent or black
         background_color = 'transparent' if self.transparent else '#000'
 
@@ -1126,7 +1548,10 @@ export const VideoComposition: React.FC<VideoCompositionProps> = ({{ theme }}) =
 
         # Format props (exclude children-related props)
         props_lines = []
+        source_props = SOURCE_PROPS.get(comp.component_type, ())
         for key, value in comp.props.items():
+            if key in source_props:
+                continue
             if key not in ['children', 'left', 'right', 'top', 'bottom'] and value is not None:
                 props_lines.append(f"{spaces}  {key}={self._format_prop_value(value)}")
         props_str = "\n".join(props_lines) if props_lines else ""
@@ -1349,8 +1774,33 @@ export const VideoComposition: React.FC<VideoCompositionProps> = ({{ theme }}) =
         # Fallback
         return self._render_simple_component(comp, indent)
 
+    def _hoist_prop_value(self, value: Any) -> Optional[str]:
+        """
+        Move a large prop value into a content-hashed JSON data module.
+
+        Identical values share one file. The module is recorded in
+        self.data_files and imported by the generated composition.
+
+        Returns:
+            Identifier the value is imported as, or None if it stays inline
+        """
+        if not self.hoist_threshold or not isinstance(value, (str, list, dict)):
+            return None
+
+        content = json.dumps(value, separators=(",", ":"))
+        if len(content.encode()) <= self.hoist_threshold:
+            return None
+
+        digest = hashlib.sha256(content.encode()).hexdigest()[:16]
+        self.data_files[f"data-{digest}.json"] = content
+        return f"data_{digest}"
+
     def _format_prop_value(self, value: Any) -> str:
         """Format a prop value for JSX."""
+        hoisted = self._hoist_prop_value(value)
+        if hoisted:
+            return "{" + hoisted + "}"
+
         if isinstance(value, str):
             return f'"{value}"'
         elif isinstance(value, bool):
@@ -1359,39 +1809,236 @@ export const VideoComposition: React.FC<VideoCompositionProps> = ({{ theme }}) =
             return "{" + str(value) + "}"
         elif isinstance(value, dict):
             # Format dict as JS object literal
-            import json
             return "{" + json.dumps(value) + "}"
         elif isinstance(value, list):
             # Format list as JS array
-            import json
             return "{" + json.dumps(value) + "}"
         else:
             return f'{{{value}}}'
 
+    def generate_timeline_composition_tsx(self, component_types: Optional[List[str]] = None) -> str:
+        """
+        Generate a data-driven TimelineComposition.tsx component.
+
+        Unlike generate_composition_tsx, the timeline is not baked into the
+        code: the composition interprets the serialized to_dict() timeline it
+        receives as props (inputProps at render time). The same bundle can
+        then render any timeline that only uses the bundled component types.
+
+        Args:
+            component_types: Component types to bundle (default: types used
+                by this composition, including nested children)
+
+        Returns:
+            TSX code for the timeline interpreter composition
+        """
+        if component_types is None:
+            component_types = self.get_component_types()
+        component_types = sorted(set(component_types))
+
+        imports = "\n".join([
+            f"import {{ {comp_type} }} from './components/{comp_type}';"
+            for comp_type in component_types
+        ])
+        registry = "\n".join([f"  {comp_type}," for comp_type in component_types])
+
+        tsx = f"""import React from 'react';
+import {{ AbsoluteFill }} from 'remotion';
+{imports}
+
+// Component types this bundle can render
+const COMPONENTS: Record<string, React.ComponentType<any>> = {{
+{registry}
+}};
+
+export type TimelineNode = {{
+  type: string;
+  start_frame: number;
+  duration_frames: number;
+  layer?: number;
+  props: Record<string, unknown>;
+}};
+
+export type TimelineCompositionProps = {{
+  fps: number;
+  width: number;
+  height: number;
+  theme: string;
+  transparent?: boolean;
+  duration_frames: number;
+  components: TimelineNode[];
+}};
+
+const isTimelineNode = (value: unknown): value is TimelineNode =>
+  typeof value === 'object' &&
+  value !== null &&
+  'type' in value &&
+  'start_frame' in value &&
+  'duration_frames' in value &&
+  'props' in value;
+
+const renderNode = (node: TimelineNode, key: React.Key): React.ReactNode => {{
+  const Component = COMPONENTS[node.type];
+  if (!Component) {{
+    throw new Error(`Component "${{node.type}}" is not included in this bundle`);
+  }}
+
+  const props: Record<string, unknown> = {{}};
+  for (const [name, value] of Object.entries(node.props)) {{
+    if (value === null || value === undefined) {{
+      continue;
+    }}
+    if (isTimelineNode(value)) {{
+      props[name] = renderNode(value, name);
+    }} else if (Array.isArray(value) && value.length > 0 && value.every(isTimelineNode)) {{
+      props[name] = value.map((child, index) => renderNode(child, index));
+    }} else {{
+      props[name] = value;
+    }}
+  }}
+
+  return (
+    <Component
+      key={{key}}
+      startFrame={{node.start_frame}}
+      durationInFrames={{node.duration_frames}}
+      {{...props}}
+    />
+  );
+}};
+
+export const TimelineComposition: React.FC<TimelineCompositionProps> = ({{ components, transparent }}) => {{
+  // Lower layers first, keeping timeline order within a layer
+  const sorted = [...components].sort((a, b) => (a.layer ?? 0) - (b.layer ?? 0));
+
+  return (
+    <AbsoluteFill style={{{{ backgroundColor: transparent ? 'transparent' : '#000' }}}}>
+      {{sorted.map((node, index) => renderNode(node, index))}}
+    </AbsoluteFill>
+  );
+}};
+"""
+        return tsx
+
+    def _serialize_component(self, comp: ComponentInstance) -> Dict[str, Any]:
+        """Serialize a component, including nested children, to JSON-compatible data."""
+        def dump_prop(value: Any) -> Any:
+            if isinstance(value, ComponentInstance):
+                return self._serialize_component(value)
+            if isinstance(value, list):
+                return [dump_prop(item) for item in value]
+            return value
+
+        return {
+            "type": comp.component_type,
+            "start_frame": comp.start_frame,
+            "duration_frames": comp.duration_frames,
+            "start_time": self.frames_to_seconds(comp.start_frame),
+            "duration": self.frames_to_seconds(comp.duration_frames),
+            "layer": comp.layer,
+            "props": {key: dump_prop(value) for key, value in comp.props.items()}
+        }
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Export composition as dictionary.
 
+        Nested layout children are serialized inside their parent's props,
+        so the result is JSON-serializable and can be fed to the
+        TimelineComposition as inputProps.
+
         Returns:
             Dictionary representation of the composition
         """
+        nested_children = self._find_nested_children(self.components)
+
         return {
             "fps": self.fps,
             "width": self.width,
             "height": self.height,
             "theme": self.theme,
+            "transparent": self.transparent,
             "duration_frames": self.get_total_duration_frames(),
             "duration_seconds": self.get_total_duration_seconds(),
             "components": [
-                {
-                    "type": c.component_type,
-                    "start_frame": c.start_frame,
-                    "duration_frames": c.duration_frames,
-                    "start_time": self.frames_to_seconds(c.start_frame),
-                    "duration": self.frames_to_seconds(c.duration_frames),
-                    "layer": c.layer,
-                    "props": c.props
-                }
+                self._serialize_component(c)
                 for c in self.components
+                if id(c) not in nested_children
             ]
         }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompositionBuilder':
+        """
+        Create a composition from a dictionary produced by to_dict().
+
+        Args:
+            data: Serialized composition
+
+        Returns:
+            CompositionBuilder with the deserialized timeline
+        """
+        builder = cls(
+            fps=data.get("fps", 30),
+            width=data.get("width", 1920),
+            height=data.get("height", 1080),
+            transparent=data.get("transparent", False)
+        )
+        builder.theme = data.get("theme", builder.theme)
+        builder.components = [_component_from_dict(c) for c in data.get("components", [])]
+        # Placeholders may have been substituted since the props were derived
+        builder.refresh_derived_props()
+        return builder
+
+    def refresh_derived_props(self):
+        """
+        Recompute props derived from other props (e.g. code_tokens from code).
+
+        Derived props are computed when a component is added; a timeline
+        whose source props changed afterwards (such as a batch variant with
+        [[ column ]] placeholders substituted) needs them rebuilt.
+        """
+        pending = list(self.components)
+        while pending:
+            comp = pending.pop()
+            comp.props.update(self._derived_props(comp.component_type, comp.props, comp.duration_frames))
+            pending.extend(iter_child_components(comp))
+
+    def _derived_props(self, component_type: str, props: Dict[str, Any], duration_frames: int) -> Dict[str, Any]:
+        """Props computed from a component's source props."""
+        derived: Dict[str, Any] = {}
+        if component_type in ("CodeBlock", "TypingCode") and isinstance(props.get("code"), str):
+            derived["code_tokens"] = tokenize_code(props["code"], props.get("language", "javascript"))
+        if component_type == "TypingCode" and "code_tokens" in derived and "typing" in props:
+            code, typing = props["code"], props["typing"]
+            speed = chars_per_second(typing["speed"])
+            # Frame-by-frame reveal schedule; the template just indexes it
+            derived["reveal"] = build_reveal_table(
+                code,
+                self.fps,
+                duration_frames,
+                typing_speed=speed,
+                code_tokens=derived["code_tokens"],
+                line_pause=typing["line_pause"],
+                jitter=typing["jitter"],
+                seed=typing["seed"]
+            )
+            # Chars per frame, for renders without the reveal table
+            derived["typing_speed"] = (len(code) or 1) if math.isinf(speed) else speed / self.fps
+        if component_type == "LineChart" and "data" in props:
+            data = props["data"]
+            if isinstance(data, str):
+                # A JSON array, e.g. a CSV cell substituted into a placeholder
+                try:
+                    data = json.loads(data)
+                except ValueError:
+                    pass
+            # Scaled points, path and lengths are computed here rather than
+            # per frame in the browser; None while data is still a placeholder
+            derived["geometry"] = (
+                compute_line_geometry(
+                    data, downsample=props.get("downsample", "lttb"), max_points=props.get("max_points")
+                )
+                if isinstance(data, list) else None
+            )
+        return derived
@@ -0,0 +1,149 @@
+"""
+Easing - Lookup tables for the cubic-bezier easing curve tokens.
+
+MOTION_TOKENS["easing_curves"] stores CSS-style control points
+(x1, y1, x2, y2). Evaluating such a curve means inverting x(t) for every
+frame, and Easing.bezier() does that in the browser with its own float
+iterations. The tables here sample each curve once at evenly spaced
+progress values, so easing in a component is a lookup plus a linear
+interpolation and gives the same result in every renderer.
+
+x(t) is monotone for control points with x in [0, 1], so each progress
+value has exactly one t. All samples are solved together: Newton steps,
+with bisection whenever a step leaves the bracket around the root. The
+solve runs on NumPy arrays when NumPy is installed, and per sample on
+floats otherwise.
+"""
+import math
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ..tokens.motion import MOTION_TOKENS
+
+# Tables have at least one sample per frame for eases up to this long
+EASING_TABLE_SECONDS = 4
+
+# Fewest intervals per table, whatever the frame rate
+MIN_EASING_INTERVALS = 120
+
+# Decimal places kept, so the emitted tables are stable text
+EASING_DECIMALS = 6
+
+# Solver settings: x(t) is solved to within SOLVE_EPSILON
+SOLVE_EPSILON = 1e-9
+MAX_ITERATIONS = 60
+
+# Coefficients (a, b, c) of one axis: ((a t + b) t + c) t
+Cubic = Tuple[float, float, float]
+
+
+def _coefficients(curve: Sequence[float]) -> Tuple[Cubic, Cubic]:
+    """Polynomial coefficients of x(t) and y(t)."""
+    if len(curve) != 4:
+        raise ValueError("Easing curve needs 4 control values (x1, y1, x2, y2)")
+    x1, y1, x2, y2 = (float(value) for value in curve)
+    if not (0 <= x1 <= 1 and 0 <= x2 <= 1):
+        raise ValueError("Easing curve x control values must be between 0 and 1")
+
+    def axis(p1: float, p2: float) -> Cubic:
+        c = 3 * p1
+        b = 3 * (p2 - p1) - c
+        return 1 - c - b, b, c
+
+    return axis(x1, x2), axis(y1, y2)
+
+
+def _solve_numpy(cx: Cubic, xs: Any) -> Any:
+    """t with x(t) = x for all samples at once."""
+    a, b, c = cx
+    t = xs.copy()
+    lo, hi = np.zeros_like(xs), np.ones_like(xs)
+    for _ in range(MAX_ITERATIONS):
+        error = ((a * t + b) * t + c) * t - xs
+        if np.all(np.abs(error) < SOLVE_EPSILON):
+            break
+        # Keep a bracket around the root for the bisection fallback
+        lo = np.where(error < 0, t, lo)
+        hi = np.where(error > 0, t, hi)
+        slope = (3 * a * t + 2 * b) * t + c
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = t - error / slope
+        inside = (np.abs(slope) > 1e-12) & (newton > lo) & (newton < hi)
+        t = np.where(np.abs(error) < SOLVE_EPSILON, t, np.where(inside, newton, (lo + hi) / 2))
+    return t
+
+
+def _solve_python(cx: Cubic, x: float) -> float:
+    """t with x(t) = x for one sample."""
+    a, b, c = cx
+    t, lo, hi = x, 0.0, 1.0
+    for _ in range(MAX_ITERATIONS):
+        error = ((a * t + b) * t + c) * t - x
+        if abs(error) < SOLVE_EPSILON:
+            break
+        if error < 0:
+            lo = t
+        else:
+            hi = t
+        slope = (3 * a * t + 2 * b) * t + c
+        newton = t - error / slope if abs(slope) > 1e-12 else lo
+        t = newton if lo < newton < hi else (lo + hi) / 2
+    return t
+
+
+def easing_table(curve: Sequence[float], intervals: int) -> List[float]:
+    """
+    Sample a cubic-bezier easing curve at evenly spaced progress values.
+
+    Args:
+        curve: Control values (x1, y1, x2, y2), as in CSS cubic-bezier()
+        intervals: Number of intervals (the table has intervals + 1 values)
+
+    Returns:
+        Eased value at progress 0, 1 / intervals, ..., 1
+    """
+    if intervals < 1:
+        raise ValueError("intervals must be at least 1")
+    cx, (a, b, c) = _coefficients(curve)
+
+    if np is not None:
+        xs = np.linspace(0.0, 1.0, intervals + 1)
+        t = _solve_numpy(cx, xs)
+        values = (((a * t + b) * t + c) * t).tolist()
+    else:
+        values = []
+        for index in range(intervals + 1):
+            t = _solve_python(cx, index / intervals)
+            values.append(((a * t + b) * t + c) * t)
+
+    # The end points are exact whatever the solver's tolerance
+    values[0], values[-1] = 0.0, 1.0
+    return [round(value, EASING_DECIMALS) + 0.0 for value in values]
+
+
+def easing_intervals(fps: int) -> int:
+    """Intervals per table at a frame rate (one per frame of an EASING_TABLE_SECONDS ease)."""
+    return max(MIN_EASING_INTERVALS, math.ceil(EASING_TABLE_SECONDS * fps))
+
+
+def easing_tables(
+    fps: int,
+    easing_curves: Optional[Mapping[str, Mapping[str, Any]]] = None
+) -> Dict[str, List[float]]:
+    """
+    Tables for every easing curve token at one frame rate.
+
+    Args:
+        fps: Frames per second
+        easing_curves: Easing tokens (default: MOTION_TOKENS["easing_curves"])
+
+    Returns:
+        Curve name -> easing_table()
+    """
+    easing_curves = MOTION_TOKENS["easing_curves"] if easing_curves is None else easing_curves
+    intervals = easing_intervals(fps)
+    return {name: easing_table(token["curve"], intervals) for name, token in easing_curves.items()}
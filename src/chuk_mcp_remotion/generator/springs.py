@@ -0,0 +1,277 @@
+"""
+Springs - Settle times and precomputed progress tables for spring configs.
+
+MOTION_TOKENS["spring_configs"] only gives damping, mass and stiffness, so
+durations were guessed, and templates evaluated spring() on every frame of
+every render worker. A spring from 0 to 1 only depends on its config and
+the frame rate, so it is evaluated here once over the frame grid:
+
+- measure_spring() gives the frame after which the spring stays within a
+  threshold of its target (like Remotion's measureSpring) and its overshoot
+- spring_table() quantizes the progress per frame into a compact table;
+  spring_key_tables() gives the tables of a set of springs keyed by
+  spring_key(), for src/theme/motion.ts, whose springProgress() helper the
+  templates call instead of spring()
+
+Progress uses the closed-form damped oscillator that Remotion's spring()
+steps through frame by frame (each step is at most 64 ms, which only
+matters below 16 fps), so the tables match spring() exactly apart from
+quantization. The whole frame grid is evaluated as one NumPy array when
+NumPy is installed, and frame by frame on floats otherwise.
+"""
+import math
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ..tokens.motion import MOTION_TOKENS
+
+# measureSpring's default: settled once within 0.5% of the distance travelled
+SETTLE_THRESHOLD = 0.005
+
+# Tables run until the spring is within 0.1%; later frames sample as 1
+TABLE_THRESHOLD = 0.001
+
+# Springs that have not settled after this long are cut off
+MAX_SECONDS = 30.0
+
+# Progress is stored as integers in units of 1 / TABLE_SCALE
+TABLE_SCALE = 10000
+
+# Remotion advances springs in steps of at most this many milliseconds
+MAX_STEP_MS = 64.0
+
+# Entrance spring of the chart and code block templates
+SMOOTH_SPRING = {"damping": 200, "mass": 0.5, "stiffness": 200}
+
+# TitleScene's blur_in spring
+BLUR_IN_SPRING = {"damping": 150, "mass": 0.5, "stiffness": 150}
+
+# Springs hard-coded in templates (the others come from the theme)
+TEMPLATE_SPRINGS = {"smooth": SMOOTH_SPRING, "blur_in": BLUR_IN_SPRING}
+
+# (damping, mass, stiffness, overshootClamping)
+SpringKey = Tuple[float, float, float, bool]
+
+
+def _spring_key(config: Mapping[str, Any]) -> SpringKey:
+    """Validated, hashable spring parameters (Remotion's defaults for missing ones)."""
+    damping = float(config.get("damping", 10))
+    mass = float(config.get("mass", 1))
+    stiffness = float(config.get("stiffness", 100))
+    if damping < 0 or mass <= 0 or stiffness <= 0:
+        raise ValueError("Spring needs damping >= 0 and positive mass and stiffness")
+    return damping, mass, stiffness, bool(config.get("overshootClamping", False))
+
+
+def _displacement(key: SpringKey, t: Any, exp: Callable, cos: Callable, sin: Callable) -> Any:
+    """Distance left to the target (1 at t=0) after t milliseconds."""
+    damping, mass, stiffness, _ = key
+    zeta = damping / (2 * math.sqrt(stiffness * mass))
+    omega0 = math.sqrt(stiffness / mass) / 1000
+
+    if zeta < 1:
+        omega1 = omega0 * math.sqrt(1 - zeta * zeta)
+        envelope = exp(-zeta * omega0 * t)
+        return envelope * (cos(omega1 * t) + zeta * omega0 / omega1 * sin(omega1 * t))
+    if zeta == 1:
+        return exp(-omega0 * t) * (1 + omega0 * t)
+    # Overdamped: cosh/sinh written as exponentials so long tails do not overflow
+    omega2 = omega0 * math.sqrt(zeta * zeta - 1)
+    slow, fast = -zeta * omega0 + omega2, -zeta * omega0 - omega2
+    return (
+        exp(slow * t) * (omega2 + zeta * omega0) + exp(fast * t) * (omega2 - zeta * omega0)
+    ) / (2 * omega2)
+
+
+def _progress_numpy(key: SpringKey, step: float, frames: int) -> List[float]:
+    """All frames as one array."""
+    progress = 1 - _displacement(key, np.arange(frames) * step, np.exp, np.cos, np.sin)
+    if key[3]:
+        # Remotion snaps to the target from the first frame that passes it
+        progress[np.maximum.accumulate(progress >= 1)] = 1.0
+    return progress.tolist()
+
+
+def _progress_python(key: SpringKey, step: float, frames: int) -> List[float]:
+    """Frame by frame on floats."""
+    progress = []
+    for frame in range(frames):
+        value = 1 - _displacement(key, frame * step, math.exp, math.cos, math.sin)
+        if key[3] and (value >= 1 or (progress and progress[-1] == 1.0)):
+            value = 1.0
+        progress.append(value)
+    return progress
+
+
+@lru_cache(maxsize=256)
+def _progress(key: SpringKey, fps: float, frames: int) -> Tuple[float, ...]:
+    step = min(1000 / fps, MAX_STEP_MS)
+    compute = _progress_numpy if np is not None else _progress_python
+    return tuple(compute(key, step, frames))
+
+
+def spring_progress(config: Mapping[str, Any], fps: float, frames: int) -> List[float]:
+    """
+    Progress (0 -> 1) of a spring on each of the first `frames` frames.
+
+    Args:
+        config: Spring config (damping, mass, stiffness, overshootClamping)
+        fps: Frames per second
+        frames: Number of frames
+
+    Returns:
+        Progress per frame, as spring({frame, fps, config}) returns it
+    """
+    if fps <= 0:
+        raise ValueError("fps must be positive")
+    return list(_progress(_spring_key(config), float(fps), max(0, int(frames))))
+
+
+def _settle_index(progress: Tuple[float, ...], threshold: float) -> int:
+    """First frame from which every later frame is within threshold of 1."""
+    for frame in range(len(progress) - 1, -1, -1):
+        if abs(1 - progress[frame]) >= threshold:
+            return frame + 1
+    return 0
+
+
+def measure_spring(
+    config: Mapping[str, Any],
+    fps: float,
+    threshold: float = SETTLE_THRESHOLD,
+    max_seconds: float = MAX_SECONDS
+) -> Dict[str, Any]:
+    """
+    Measure how long a spring takes to settle and how far it overshoots.
+
+    Args:
+        config: Spring config (damping, mass, stiffness, overshootClamping)
+        fps: Frames per second
+        threshold: Settled once the distance to the target stays below this
+            fraction of the distance travelled
+        max_seconds: Longest time simulated
+
+    Returns:
+        Dictionary with "settle_frames", "settle_seconds", "overshoot"
+        (peak past the target, as a fraction of the distance travelled)
+        and "settled" (False if the spring was cut off at max_seconds)
+    """
+    frames = max(1, math.ceil(max_seconds * fps)) + 1
+    progress = spring_progress(config, fps, frames)
+    settle = _settle_index(tuple(progress), threshold)
+    return {
+        "settle_frames": settle,
+        "settle_seconds": round(settle / fps, 3),
+        "overshoot": round(max(0.0, max(progress) - 1), 4),
+        "settled": settle < frames
+    }
+
+
+def spring_table(
+    config: Mapping[str, Any],
+    fps: int,
+    threshold: float = TABLE_THRESHOLD,
+    max_seconds: float = MAX_SECONDS
+) -> Dict[str, Any]:
+    """
+    Quantized per-frame progress of a spring, for templates to sample.
+
+    Frames past the end of "values" are settled and sample as 1.
+
+    Args:
+        config: Spring config (damping, mass, stiffness, overshootClamping)
+        fps: Frames per second the table is valid for
+        threshold: Distance to the target below which the table ends
+        max_seconds: Longest table
+
+    Returns:
+        Dictionary with "fps", "config" (damping, mass, stiffness; the
+        template checks it matches its own spring), "scale" and "values"
+        (progress per frame as integers, divide by scale)
+    """
+    damping, mass, stiffness, clamping = _spring_key(config)
+    frames = max(1, math.ceil(max_seconds * fps)) + 1
+    progress = _progress(_spring_key(config), float(fps), frames)
+    length = _settle_index(progress, threshold)
+
+    table_config: Dict[str, Any] = {
+        "damping": config.get("damping", 10),
+        "mass": config.get("mass", 1),
+        "stiffness": config.get("stiffness", 100)
+    }
+    if clamping:
+        table_config["overshootClamping"] = True
+    return {
+        "fps": fps,
+        "config": table_config,
+        "scale": TABLE_SCALE,
+        "values": [round(value * TABLE_SCALE) for value in progress[:length]]
+    }
+
+
+def spring_tables(
+    fps: int,
+    spring_configs: Optional[Mapping[str, Mapping[str, Any]]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Tables for every spring config token at one frame rate.
+
+    Args:
+        fps: Frames per second
+        spring_configs: Spring tokens (default: MOTION_TOKENS["spring_configs"])
+
+    Returns:
+        Spring name -> spring_table() plus its measure_spring() results
+    """
+    spring_configs = MOTION_TOKENS["spring_configs"] if spring_configs is None else spring_configs
+    return {
+        name: {**spring_table(token["config"], fps), **measure_spring(token["config"], fps)}
+        for name, token in spring_configs.items()
+    }
+
+
+def _js_number(value: float) -> str:
+    """A number as JavaScript prints it (1 rather than 1.0)."""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def spring_key(config: Mapping[str, Any]) -> str:
+    """
+    Name of a spring's table in src/theme/motion.ts.
+
+    springKey() in the module builds the same string from the config a
+    template passes, e.g. "200/0.5/200" or "300/0.3/400/clamped".
+
+    Args:
+        config: Spring config (damping, mass, stiffness, overshootClamping)
+
+    Returns:
+        "damping/mass/stiffness", plus "/clamped" for clamped springs
+    """
+    damping, mass, stiffness, clamping = _spring_key(config)
+    key = "/".join(_js_number(value) for value in (damping, mass, stiffness))
+    return key + "/clamped" if clamping else key
+
+
+def spring_key_tables(configs: Iterable[Mapping[str, Any]], fps: int) -> Dict[str, List[int]]:
+    """
+    Table values of several springs, one per distinct spring.
+
+    Args:
+        configs: Spring configs
+        fps: Frames per second the tables are valid for
+
+    Returns:
+        spring_key() -> spring_table() values, in first-seen order
+    """
+    tables: Dict[str, List[int]] = {}
+    for config in configs:
+        key = spring_key(config)
+        if key not in tables:
+            tables[key] = spring_table(config, fps)["values"]
+    return tables
@@ -0,0 +1,290 @@
+"""
+Syntax - Generation-time tokenizer for code components.
+
+CodeBlock and TypingCode used to run prism-react-renderer inside the
+component, re-tokenizing the same code on every frame of every render
+worker (TypingCode on a growing substring). The code is known when the
+composition is generated, so it is tokenized once here with a small bundled
+set of regex lexers and passed to the templates as compact per-line arrays.
+
+Token type names follow Prism's, so the templates color them with the same
+prism-react-renderer theme. Languages without a bundled lexer keep the
+in-browser Highlight path.
+"""
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Token types; ids in the encoded arrays index this tuple
+TOKEN_TYPES = (
+    "plain",
+    "comment",
+    "string",
+    "keyword",
+    "boolean",
+    "number",
+    "function",
+    "class-name",
+    "builtin",
+    "constant",
+    "operator",
+    "punctuation",
+    "property",
+    "variable",
+    "tag",
+    "attr-name",
+    "attr-value",
+    "selector"
+)
+
+_TYPE_IDS = {name: index for index, name in enumerate(TOKEN_TYPES)}
+
+
+def _words(words: str) -> str:
+    """Build a whole-word alternation from a space-separated list."""
+    return r"\b(?:" + "|".join(sorted(words.split(), key=len, reverse=True)) + r")\b"
+
+
+_C_COMMENT = r"//[^\n]*|/\*[\s\S]*?\*/"
+_QUOTED = r'"(?:\\.|[^"\\\n])*"' + r"|'(?:\\.|[^'\\\n])*'"
+_NUMBER = r"\b0[xXbBoO][\da-fA-F_]+\b|(?:\b\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?\b"
+_FUNCTION = r"\b[A-Za-z_$][\w$]*(?=\s*\()"
+_CLASS_NAME = r"\b[A-Z][\w$]*\b"
+_IDENTIFIER = r"[A-Za-z_$][\w$]*"
+_OPERATOR = r"[-+*/%=!<>&|^~?:]+"
+_PUNCTUATION = r"[{}\[\]();,.@#]"
+
+_JS_KEYWORDS = (
+    "as async await break case catch class const continue debugger default delete do else "
+    "export extends finally for from function get if import in instanceof let new of return "
+    "set static super switch this throw try typeof var void while with yield"
+)
+_TS_KEYWORDS = (
+    _JS_KEYWORDS + " abstract declare enum implements interface keyof namespace private "
+    "protected public readonly type"
+)
+
+
+def _c_like(keywords: str, builtins: str = "", constants: str = "null undefined") -> List[Tuple[str, str]]:
+    """Rules for languages with C-style comments, strings and operators."""
+    rules = [
+        ("comment", _C_COMMENT),
+        ("string", _QUOTED + r"|`(?:\\[\s\S]|[^`\\])*`"),
+        ("keyword", _words(keywords)),
+        ("boolean", _words("true false")),
+        ("constant", _words(constants)),
+    ]
+    if builtins:
+        rules.append(("builtin", _words(builtins)))
+    return rules + [
+        ("number", _NUMBER),
+        ("function", _FUNCTION),
+        ("class-name", _CLASS_NAME),
+        ("plain", _IDENTIFIER),
+        ("operator", _OPERATOR),
+        ("punctuation", _PUNCTUATION),
+    ]
+
+
+LEXERS: Dict[str, List[Tuple[str, str]]] = {
+    "javascript": _c_like(_JS_KEYWORDS),
+    "typescript": _c_like(_TS_KEYWORDS, "any boolean never number object string symbol unknown void"),
+    "java": _c_like(
+        "abstract assert break case catch class continue default do else enum extends final "
+        "finally for if implements import instanceof interface new package private protected "
+        "public return static super switch synchronized this throw throws try var void while",
+        "boolean byte char double float int long short String",
+        "null"
+    ),
+    "go": _c_like(
+        "break case chan const continue default defer else fallthrough for func go goto if "
+        "import interface map package range return select struct switch type var",
+        "bool byte error float32 float64 int int32 int64 rune string uint uint8 uint32 uint64 "
+        "append cap close len make new panic print println recover",
+        "nil iota"
+    ),
+    "rust": [("function", r"\b[a-z_]\w*!")] + _c_like(
+        "as async await break const continue crate dyn else enum extern fn for if impl in let "
+        "loop match mod move mut pub ref return self Self static struct super trait type unsafe "
+        "use where while",
+        "bool char f32 f64 i8 i16 i32 i64 isize str u8 u16 u32 u64 usize Option Result Some Ok Err",
+        "None"
+    ),
+    "python": [
+        ("comment", r"#[^\n]*"),
+        ("string", r'(?i:[rbuf]{0,2})(?:"""[\s\S]*?"""|' + r"'''[\s\S]*?'''|" + _QUOTED + ")"),
+        ("function", r"@[\w.]+|(?<=\bdef )[A-Za-z_]\w*"),
+        ("class-name", r"(?<=\bclass )[A-Za-z_]\w*"),
+        ("keyword", _words(
+            "and as assert async await break class continue def del elif else except finally for "
+            "from global if import in is lambda nonlocal not or pass raise return try while with yield"
+        )),
+        ("boolean", _words("True False")),
+        ("constant", _words("None")),
+        ("builtin", _words(
+            "abs all any bool dict enumerate float int isinstance len list map max min open print "
+            "range repr set sorted str sum super tuple type zip"
+        )),
+        ("number", _NUMBER),
+        ("function", r"\b[A-Za-z_]\w*(?=\s*\()"),
+        ("plain", r"[A-Za-z_]\w*"),
+        ("operator", r"[-+*/%=!<>&|^~]+"),
+        ("punctuation", r"[{}\[\]();,.:]"),
+    ],
+    "json": [
+        ("property", r'"(?:\\.|[^"\\\n])*"(?=\s*:)'),
+        ("string", r'"(?:\\.|[^"\\\n])*"'),
+        ("number", r"-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?"),
+        ("boolean", _words("true false")),
+        ("keyword", _words("null")),
+        ("punctuation", r"[{}\[\],:]"),
+    ],
+    "bash": [
+        ("comment", r"(?<![\w$])#[^\n]*"),
+        ("string", r'"(?:\\.|[^"\\])*"' + r"|'[^']*'"),
+        ("variable", r"\$(?:\{[^}\n]*\}|[\w@#?$!*-]+)"),
+        ("keyword", _words(
+            "case do done elif else esac export fi for function if in local return select then "
+            "until while"
+        )),
+        ("builtin", _words(
+            "alias cat cd chmod cp curl echo exit git grep ls mkdir mv npm npx pip printf pwd "
+            "python read rm sed source sudo"
+        )),
+        ("number", r"\b\d+\b"),
+        ("plain", r"[\w./-]+"),
+        ("operator", r"&&|\|\||[|&;<>!=]+"),
+        ("punctuation", r"[{}\[\]()]"),
+    ],
+    "css": [
+        ("comment", r"/\*[\s\S]*?\*/"),
+        ("keyword", r"@[\w-]+"),
+        ("selector", r"[^{}\s;][^{};]*?(?=\s*\{)"),
+        ("property", r"[-\w]+(?=\s*:)"),
+        ("string", _QUOTED),
+        ("function", r"[-\w]+(?=\()"),
+        ("number", r"#[\da-fA-F]{3,8}\b|-?(?:\d+\.?\d*|\.\d+)(?:%|[a-zA-Z]+)?"),
+        ("plain", r"[-\w]+"),
+        ("punctuation", r"[{}();:,]"),
+    ],
+    "html": [
+        ("comment", r"<!--[\s\S]*?-->"),
+        ("tag", r"</?[A-Za-z][\w:-]*|/?>"),
+        ("attr-name", r"[\w:-]+(?=\s*=\s*[\"'])"),
+        ("attr-value", r'"[^"]*"' + r"|'[^']*'"),
+        ("punctuation", r"="),
+    ],
+    "sql": [
+        ("comment", r"--[^\n]*|/\*[\s\S]*?\*/"),
+        ("string", _QUOTED),
+        ("keyword", r"(?i:" + _words(
+            "add alter and as asc between by case create delete desc distinct drop else end exists "
+            "from group having in index inner insert into is join key left like limit not null on "
+            "or order outer primary references right select set table then union update values "
+            "when where with"
+        ) + ")"),
+        ("boolean", r"(?i:\b(?:true|false)\b)"),
+        ("number", _NUMBER),
+        ("function", r"\b\w+(?=\s*\()"),
+        ("plain", r"\w+"),
+        ("operator", r"[-+*/%=<>!|]+"),
+        ("punctuation", r"[();,.]"),
+    ],
+}
+
+ALIASES = {
+    "js": "javascript",
+    "jsx": "javascript",
+    "ts": "typescript",
+    "tsx": "typescript",
+    "py": "python",
+    "sh": "bash",
+    "shell": "bash",
+    "zsh": "bash",
+    "markup": "html",
+    "xml": "html",
+    "golang": "go",
+    "rs": "rust",
+}
+
+SUPPORTED_LANGUAGES = tuple(sorted(LEXERS))
+
+
+def resolve_language(language: str) -> Optional[str]:
+    """Get the bundled lexer name for a language or alias (None if unsupported)."""
+    name = ALIASES.get(language.lower(), language.lower())
+    return name if name in LEXERS else None
+
+
+@lru_cache(maxsize=None)
+def _compile(language: str) -> Tuple["re.Pattern[str]", Tuple[int, ...]]:
+    """Compile a lexer's rules into one alternation and its group type ids."""
+    rules = LEXERS[language]
+    pattern = "|".join(f"({regex})" for _, regex in rules)
+    # Group numbers of each rule's outer group, skipping any inner groups
+    compiled = re.compile(pattern)
+    type_ids = []
+    for token_type, regex in rules:
+        type_ids.append(_TYPE_IDS[token_type])
+        type_ids.extend([-1] * re.compile(regex).groups)
+    return compiled, tuple(type_ids)
+
+
+def _lex(code: str, language: str) -> List[Tuple[int, int]]:
+    """Lex code into (type id, end offset) spans covering the whole string."""
+    pattern, type_ids = _compile(language)
+    spans: List[Tuple[int, int]] = []
+    position = 0
+    for match in pattern.finditer(code):
+        if match.start() > position:
+            spans.append((0, match.start()))
+        spans.append((type_ids[match.lastindex - 1], match.end()))
+        position = match.end()
+    if position < len(code):
+        spans.append((0, len(code)))
+    return spans
+
+
+def tokenize_code(code: str, language: str) -> Optional[Dict[str, object]]:
+    """
+    Tokenize code into compact per-line token arrays.
+
+    Each line is encoded as [line_start, type_id, end, type_id, end, ...]:
+    tokens are contiguous, so each one runs from the previous end (or the
+    line start) to its own end. Offsets index the original code string and
+    exclude the newline, and type ids index the returned "types" list.
+
+    Args:
+        code: Source code
+        language: Language name or alias (e.g., "python", "tsx")
+
+    Returns:
+        Dictionary with "types" and "lines", or None when the language has
+        no bundled lexer
+    """
+    name = resolve_language(language)
+    if name is None:
+        return None
+
+    lines: List[List[int]] = [[0]]
+    start = 0
+    for type_id, end in _lex(code, name):
+        # Split tokens spanning newlines (block comments, template strings)
+        while start < end:
+            newline = code.find("\n", start, end)
+            piece_end = end if newline == -1 else newline
+            if piece_end > start:
+                line = lines[-1]
+                text = code[start:piece_end]
+                if len(line) > 1 and (line[-2] == type_id or text.isspace()):
+                    # Merge with the previous token; whitespace takes any color
+                    line[-1] = piece_end
+                else:
+                    line.extend((type_id, piece_end))
+            if newline == -1:
+                start = end
+            else:
+                start = newline + 1
+                lines.append([start])
+
+    return {"language": name, "types": list(TOKEN_TYPES), "lines": lines}
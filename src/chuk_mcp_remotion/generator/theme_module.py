@@ -0,0 +1,460 @@
+"""
+Theme Module - Shared theme values for generated components.
+
+Components used to have the theme's colors, typography and motion baked
+into their source, so switching a project's theme meant regenerating and
+rebundling every component. Instead, each theme can be emitted once as
+src/theme/<theme>.ts, with src/theme/index.ts re-exporting the active one,
+and components read `theme.colors.primary[0]` etc. from it. A theme switch
+then only rewrites index.ts.
+
+Templates are rendered unchanged, with ThemeRef placeholders in place of
+the theme values (font lists go through the font_stack filter). Each
+placeholder renders as a marker holding the JS expression for the value,
+and link_theme_references rewrites the markers into that expression,
+turning the string literals that contain one into template literals (or
+plain expressions) as needed.
+
+Next to the themes, src/theme/motion.ts holds lookup tables for the
+project's frame rate:
+- every spring the templates can animate with (spring tokens, the springs
+  hard-coded in templates and the theme's default spring; see springs.py),
+  sampled by springProgress(), which the spring templates import
+- the easing curve tokens (see easing.py), with an ease() helper; the
+  built-in templates do not use easing curves (they animate with springs
+  and linear interpolate()), so ease() is only imported by custom components
+"""
+import json
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .easing import easing_tables
+from .springs import TABLE_SCALE, TEMPLATE_SPRINGS, spring_key_tables
+from ..tokens.motion import MOTION_TOKENS
+from ..themes.resolved import builtin_theme
+
+# Directory (relative to src/) holding the theme modules
+THEME_DIRNAME = "theme"
+
+# Import added to components that reference the theme (components live in src/components/)
+THEME_IMPORT = "import { theme } from '../theme';"
+
+# Spring and easing tables module in the theme directory
+MOTION_MODULE = "motion.ts"
+
+# Delimits a theme expression in rendered TSX; never valid in templates
+MARKER = "\x00"
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_$][A-Za-z0-9_$]*$")
+
+
+def resolve_theme(theme_name: str) -> Dict[str, Any]:
+    """
+    Get a theme's values with the font sizes for its default resolution.
+
+    Args:
+        theme_name: Theme name (unknown names fall back to "tech")
+
+    Returns:
+        Theme dictionary with an added "font_sizes" entry
+    """
+    return builtin_theme(theme_name).to_dict()
+
+
+def _member(expression: str, key: Any) -> str:
+    """JS member access for a key."""
+    if isinstance(key, int):
+        return f"{expression}[{key}]"
+    if _IDENTIFIER.match(key):
+        return f"{expression}.{key}"
+    return f"{expression}[{json.dumps(key)}]"
+
+
+class ThemeRef(str):
+    """
+    Placeholder for a theme value while rendering a template.
+
+    Renders as a marker around the JS expression reading the value from the
+    shared theme module. Attribute and item access return placeholders for
+    the nested values, so template expressions like colors.primary[0] and
+    typography.get("fonts", {}) keep working.
+    """
+
+    def __new__(cls, value: Any, expression: str = "theme"):
+        ref = super().__new__(cls, f"{MARKER}{expression}{MARKER}")
+        ref._value = value
+        ref._expression = expression
+        return ref
+
+    def __getattribute__(self, name: str):
+        # Theme keys win over str methods of the same name
+        if not name.startswith("_"):
+            value = object.__getattribute__(self, "_value")
+            if isinstance(value, dict) and name in value:
+                return ThemeRef(value[name], _member(object.__getattribute__(self, "_expression"), name))
+        return super().__getattribute__(name)
+
+    def __getattr__(self, name: str):
+        raise AttributeError(name)
+
+    def __getitem__(self, key):
+        value = self._value
+        if isinstance(value, dict) and key in value:
+            return ThemeRef(value[key], _member(self._expression, key))
+        if isinstance(value, list) and isinstance(key, int) and -len(value) <= key < len(value):
+            return ThemeRef(value[key], _member(self._expression, key % len(value)))
+        return super().__getitem__(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """dict.get for placeholders of dictionaries."""
+        if isinstance(self._value, dict) and key in self._value:
+            return self[key]
+        return default
+
+    def __iter__(self) -> Iterator[Any]:
+        if isinstance(self._value, list):
+            return (self[i] for i in range(len(self._value)))
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        if isinstance(self._value, (list, dict)):
+            return len(self._value)
+        return super().__len__()
+
+
+def font_stack(fonts: Any) -> str:
+    """
+    Format a font list as a quoted CSS font stack ('Inter', 'SF Pro', ...).
+
+    Registered as the `font_stack` template filter; for theme placeholders
+    it produces the equivalent expression over the theme module's list.
+    """
+    if isinstance(fonts, ThemeRef):
+        return f"{MARKER}\"'\" + {fonts._expression}.join(\"', '\") + \"'\"{MARKER}"
+    return "'" + "', '".join(fonts) + "'"
+
+
+def theme_context(values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Template variables reading from the shared theme module.
+
+    Args:
+        values: Resolved theme values backing the placeholders (as
+            returned by resolve_theme)
+
+    Returns:
+        Render variables: theme, colors, typography, motion, font_sizes
+    """
+    theme = ThemeRef(values)
+    return {
+        "theme": theme,
+        "colors": theme.colors,
+        "typography": theme.typography,
+        "motion": theme.motion,
+        "font_sizes": theme.font_sizes
+    }
+
+
+def _string_end(source: str, start: int) -> int:
+    """End of the quoted string starting at start (stopping at a newline)."""
+    quote = source[start]
+    i = start + 1
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == MARKER:
+            i = source.index(MARKER, i + 1) + 1
+            continue
+        if char == quote:
+            return i + 1
+        if char == "\n":
+            return i
+        i += 1
+    return i
+
+
+def _split_markers(text: str) -> List[Tuple[bool, str]]:
+    """Split text into (is_expression, part) pairs."""
+    parts = text.split(MARKER)
+    if len(parts) % 2 == 0:
+        raise ValueError("Unbalanced theme reference in rendered component")
+    return [(i % 2 == 1, part) for i, part in enumerate(parts)]
+
+
+def _rewrite_literal(literal: str, jsx_attribute: bool) -> str:
+    """Rewrite a quoted string literal containing theme references."""
+    quote = literal[0]
+    closed = len(literal) > 1 and literal[-1] == quote
+    body = literal[1:-1] if closed else literal[1:]
+    parts = _split_markers(body)
+
+    if len(parts) == 3 and not parts[0][1] and not parts[2][1]:
+        # The whole literal is one theme value
+        expression = parts[1][1]
+    else:
+        pieces = []
+        for is_expression, part in parts:
+            if is_expression:
+                pieces.append("${" + part + "}")
+            else:
+                part = part.replace("\\" + quote, quote)
+                pieces.append(part.replace("`", "\\`").replace("${", "\\${"))
+        expression = "`" + "".join(pieces) + "`"
+
+    return "{" + expression + "}" if jsx_attribute else expression
+
+
+def link_theme_references(tsx: str) -> str:
+    """
+    Rewrite theme markers in rendered TSX into theme module expressions.
+
+    Markers in code become the bare expression; in template literals they
+    become ${...} substitutions; string literals holding a marker become the
+    expression itself (a whole-string value) or a template literal, wrapped
+    in braces when they are JSX attribute values.
+
+    Args:
+        tsx: TSX rendered with theme_context placeholders
+
+    Returns:
+        TSX importing `theme` from the shared theme module
+    """
+    if MARKER not in tsx:
+        return tsx
+
+    out: List[str] = []
+    # Stack of contexts: ["code", open braces] or ["template"]
+    stack: List[list] = [["code", 0]]
+    i, n = 0, len(tsx)
+    while i < n:
+        context = stack[-1]
+        char = tsx[i]
+
+        if char == MARKER:
+            end = tsx.index(MARKER, i + 1)
+            expression = tsx[i + 1:end]
+            out.append(expression if context[0] == "code" else "${" + expression + "}")
+            i = end + 1
+            continue
+
+        if context[0] == "template":
+            if char == "\\":
+                out.append(tsx[i:i + 2])
+                i += 2
+                continue
+            if char == "`":
+                stack.pop()
+            elif tsx.startswith("${", i):
+                stack.append(["code", 0])
+                out.append("${")
+                i += 2
+                continue
+            out.append(char)
+            i += 1
+            continue
+
+        if tsx.startswith("//", i) or tsx.startswith("/*", i):
+            if tsx[i + 1] == "/":
+                end = tsx.find("\n", i)
+            else:
+                end = tsx.find("*/", i + 2)
+                end = end + 2 if end != -1 else -1
+            end = n if end == -1 else end
+            # Comments keep the expression as plain text
+            out.append(tsx[i:end].replace(MARKER, ""))
+            i = end
+            continue
+
+        if char in "'\"":
+            end = _string_end(tsx, i)
+            literal = tsx[i:end]
+            if MARKER in literal:
+                jsx_attribute = i >= 2 and tsx[i - 1] == "=" and (tsx[i - 2].isalnum() or tsx[i - 2] == "-")
+                literal = _rewrite_literal(literal, jsx_attribute)
+            out.append(literal)
+            i = end
+            continue
+
+        if char == "`":
+            stack.append(["template"])
+        elif char == "{":
+            context[1] += 1
+        elif char == "}":
+            if context[1] == 0 and len(stack) > 1:
+                # End of a ${...} substitution
+                stack.pop()
+            else:
+                context[1] -= 1
+        out.append(char)
+        i += 1
+
+    return _add_theme_import("".join(out))
+
+
+def _add_theme_import(tsx: str) -> str:
+    """Insert the theme import after the component's imports."""
+    lines = tsx.split("\n")
+    last_import = -1
+    in_import = False
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith("import "):
+            in_import = True
+        if in_import and stripped.endswith(";"):
+            last_import = index
+            in_import = False
+        elif not in_import and stripped and not stripped.startswith("//") and last_import >= 0:
+            break
+    lines.insert(last_import + 1, THEME_IMPORT)
+    return "\n".join(lines)
+
+
+def build_theme_module(theme_name: str, values: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Generate the TypeScript module for one theme.
+
+    Args:
+        theme_name: Theme name
+        values: Resolved theme values (default: the built-in theme's)
+
+    Returns:
+        Source of src/theme/<theme_name>.ts
+    """
+    values = json.dumps(values or resolve_theme(theme_name), indent=2)
+    return (
+        f"// Generated from the '{theme_name}' theme. Components import the active\n"
+        f"// theme through ./index.ts.\n"
+        f"export const theme = {values} as const;\n\n"
+        f"export type Theme = typeof theme;\n"
+    )
+
+
+def build_theme_index(theme_name: str) -> str:
+    """
+    Generate src/theme/index.ts selecting the active theme.
+
+    Args:
+        theme_name: Active theme
+
+    Returns:
+        Source of src/theme/index.ts
+    """
+    return f"export {{ theme }} from './{theme_name}';\n"
+
+
+def motion_springs(
+    spring_configs: Optional[Dict[str, Any]] = None,
+    theme_values: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Springs tabulated in src/theme/motion.ts.
+
+    Args:
+        spring_configs: Spring tokens (default: MOTION_TOKENS["spring_configs"])
+        theme_values: Resolved values of the project's theme, whose default
+            spring the templates animate with
+
+    Returns:
+        Spring configs: the tokens, TEMPLATE_SPRINGS and the theme's default
+        spring as templates pass it (damping, mass and stiffness only)
+    """
+    spring_configs = MOTION_TOKENS["spring_configs"] if spring_configs is None else spring_configs
+    springs = [token["config"] for token in spring_configs.values()] + list(TEMPLATE_SPRINGS.values())
+    config = ((theme_values or {}).get("motion") or {}).get("default_spring", {}).get("config")
+    if config:
+        springs.append({key: config[key] for key in ("damping", "mass", "stiffness") if key in config})
+    return springs
+
+
+def build_motion_module(
+    fps: int,
+    easing_curves: Optional[Dict[str, Any]] = None,
+    springs: Optional[List[Dict[str, Any]]] = None
+) -> str:
+    """
+    Generate src/theme/motion.ts with spring and easing lookup tables.
+
+    Args:
+        fps: Project frame rate the tables are sampled for
+        easing_curves: Easing tokens (default: MOTION_TOKENS["easing_curves"])
+        springs: Spring configs to tabulate (default: motion_springs())
+
+    Returns:
+        Source of src/theme/motion.ts
+    """
+    spring_tables = ",\n".join(
+        f"  {json.dumps(key)}: {json.dumps(values)}"
+        for key, values in spring_key_tables(motion_springs() if springs is None else springs, fps).items()
+    )
+    easing = ",\n".join(
+        f"  {json.dumps(name)}: {json.dumps(table)}"
+        for name, table in easing_tables(fps, easing_curves).items()
+    )
+    return (
+        f"// Generated spring and easing tables for {fps} fps.\n"
+        f"import {{ spring }} from 'remotion';\n\n"
+        f"export const MOTION_FPS = {fps};\n\n"
+        f"export interface SpringConfig {{\n"
+        f"  damping: number;\n"
+        f"  mass: number;\n"
+        f"  stiffness: number;\n"
+        f"  overshootClamping?: boolean;\n"
+        f"}}\n\n"
+        f"// Spring progress per frame in units of 1 / SPRING_SCALE, by springKey();\n"
+        f"// frames past the end of a table have settled\n"
+        f"export const SPRING_SCALE = {TABLE_SCALE};\n\n"
+        f"export const springTables: Record<string, readonly number[]> = {{\n{spring_tables}\n}};\n\n"
+        f"const springKey = (config: SpringConfig): string =>\n"
+        f"  `${{config.damping}}/${{config.mass}}/${{config.stiffness}}${{config.overshootClamping ? '/clamped' : ''}}`;\n\n"
+        f"// spring({{frame, fps, config}}) from the table when there is one for this fps\n"
+        f"// and spring, otherwise computed\n"
+        f"export const springProgress = (frame: number, fps: number, config: SpringConfig): number => {{\n"
+        f"  const table = fps === MOTION_FPS && Number.isInteger(frame) ? springTables[springKey(config)] : undefined;\n"
+        f"  if (!table) {{\n"
+        f"    return spring({{ frame, fps, config }});\n"
+        f"  }}\n"
+        f"  const index = Math.max(0, frame);\n"
+        f"  return index < table.length ? table[index] / SPRING_SCALE : 1;\n"
+        f"}};\n\n"
+        f"// Each easing curve sampled at evenly spaced progress values\n"
+        f"export const easingTables = {{\n{easing}\n}} as const;\n\n"
+        f"export type EasingName = keyof typeof easingTables;\n\n"
+        f"// Eased progress (0-1): a table lookup plus linear interpolation, so\n"
+        f"// every renderer gets the same value\n"
+        f"export const ease = (name: EasingName, progress: number): number => {{\n"
+        f"  const table: readonly number[] = easingTables[name];\n"
+        f"  const position = Math.min(1, Math.max(0, progress)) * (table.length - 1);\n"
+        f"  const index = Math.min(table.length - 2, Math.floor(position));\n"
+        f"  return table[index] + (table[index + 1] - table[index]) * (position - index);\n"
+        f"}};\n"
+    )
+
+
+def theme_files(
+    theme_name: str,
+    values: Optional[Dict[str, Any]] = None,
+    fps: int = 30,
+    easing_curves: Optional[Dict[str, Any]] = None,
+    spring_configs: Optional[Dict[str, Any]] = None
+) -> Dict[str, str]:
+    """
+    Files to write under src/theme/ for a project using a theme.
+
+    Args:
+        theme_name: Active theme
+        values: Resolved theme values (default: the built-in theme's)
+        fps: Project frame rate, for the spring and easing tables
+        easing_curves: Merged easing tokens (default: MOTION_TOKENS["easing_curves"])
+        spring_configs: Merged spring tokens (default: MOTION_TOKENS["spring_configs"])
+
+    Returns:
+        {filename: source} for the theme's module, index.ts and motion.ts
+    """
+    values = values or resolve_theme(theme_name)
+    return {
+        f"{theme_name}.ts": build_theme_module(theme_name, values),
+        "index.ts": build_theme_index(theme_name),
+        MOTION_MODULE: build_motion_module(fps, easing_curves, motion_springs(spring_configs, values))
+    }
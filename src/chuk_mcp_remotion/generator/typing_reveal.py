@@ -0,0 +1,131 @@
+"""
+Typing Reveal - Precomputed frame-by-frame reveal tables for TypingCode.
+
+TypingCode used to derive the number of visible characters from a fixed
+chars-per-frame rate, then rebuild and re-highlight the visible code on
+every frame. The reveal schedule only depends on the code and the typing
+settings, so it is computed once here: for each frame, the number of
+visible characters and the cursor's line and token. The template indexes
+the table, and since the table (including any seeded jitter) travels in the
+props, chunked parallel renders all see the same typing.
+"""
+import math
+import random
+import zlib
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Union
+
+# Named typing speeds in characters per second
+TYPING_SPEEDS = {
+    "slow": 20.0,
+    "normal": 45.0,
+    "fast": 90.0,
+    "instant": math.inf
+}
+
+# Frames before the first character appears, matching TypingCode.tsx.j2
+START_DELAY_FRAMES = 10
+
+
+def chars_per_second(typing_speed: Union[str, float]) -> float:
+    """Resolve a named speed or a number of characters per second."""
+    if isinstance(typing_speed, str):
+        if typing_speed not in TYPING_SPEEDS:
+            raise ValueError(
+                f"Unknown typing speed '{typing_speed}'. Use one of: {', '.join(TYPING_SPEEDS)}"
+            )
+        return TYPING_SPEEDS[typing_speed]
+    if typing_speed <= 0:
+        raise ValueError(f"typing_speed must be positive, got {typing_speed}")
+    return float(typing_speed)
+
+
+def _reveal_times(
+    code: str, fps: int, speed: float, line_pause: float, jitter: float, rng: random.Random
+) -> List[float]:
+    """Frame (after the start delay) at which each character appears."""
+    frames_per_char = fps / speed
+    pause_frames = line_pause * fps
+    times = []
+    t = 0.0
+    for char in code:
+        if char == "\n":
+            # Linger at the end of the line before moving to the next
+            t += pause_frames
+        if jitter:
+            t += frames_per_char * (1 + rng.uniform(-jitter, jitter))
+        else:
+            t += frames_per_char
+        times.append(t)
+    return times
+
+
+def build_reveal_table(
+    code: str,
+    fps: int,
+    duration_frames: int,
+    typing_speed: Union[str, float] = "normal",
+    code_tokens: Optional[Dict[str, Any]] = None,
+    line_pause: float = 0.0,
+    jitter: float = 0.0,
+    seed: Optional[int] = None,
+    start_delay: int = START_DELAY_FRAMES
+) -> Dict[str, Any]:
+    """
+    Build the reveal table for a TypingCode component.
+
+    Args:
+        code: Code being typed
+        fps: Composition frame rate
+        duration_frames: Component duration in frames
+        typing_speed: Named speed (slow, normal, fast, instant) or chars per second
+        code_tokens: Output of tokenize_code, to include the cursor's token index
+        line_pause: Extra pause at the end of each line (seconds)
+        jitter: Random variation of each keystroke's duration (0-1, e.g. 0.3 = ±30%)
+        seed: RNG seed for the jitter (default: derived from the code, so the
+            same code always types the same way)
+        start_delay: Frames before typing starts
+
+    Returns:
+        Dictionary with start_delay and per-frame "chars", "lines" and, when
+        code_tokens is given, "tokens" arrays. Frame i of the table is
+        relative frame start_delay + i; later frames use the last entry.
+    """
+    if not 0 <= jitter < 1:
+        raise ValueError(f"jitter must be in [0, 1), got {jitter}")
+
+    speed = chars_per_second(typing_speed)
+    available = max(1, duration_frames - start_delay)
+
+    if math.isinf(speed) or not code:
+        chars = [len(code)]
+    else:
+        rng = random.Random(zlib.crc32(code.encode()) if seed is None else seed)
+        times = _reveal_times(code, fps, speed, line_pause, jitter, rng)
+        frame_count = min(available, math.ceil(times[-1]) + 1)
+        chars = [bisect_right(times, frame) for frame in range(frame_count)]
+
+    # Cursor position: the line holding the next character, and how many of
+    # that line's tokens are at least partly visible
+    if code_tokens is not None:
+        line_starts = [line[0] for line in code_tokens["lines"]]
+        token_starts = [
+            [line[0]] + line[2:-1:2] if len(line) > 1 else []
+            for line in code_tokens["lines"]
+        ]
+    else:
+        line_starts = [0] + [i + 1 for i, char in enumerate(code) if char == "\n"]
+        token_starts = None
+
+    lines = []
+    tokens = []
+    for count in chars:
+        line = bisect_right(line_starts, count) - 1
+        lines.append(line)
+        if token_starts is not None:
+            tokens.append(bisect_left(token_starts[line], count))
+
+    table: Dict[str, Any] = {"start_delay": start_delay, "chars": chars, "lines": lines}
+    if token_starts is not None:
+        table["tokens"] = tokens
+    return table
@@ -243,6 +243,210 @@ COMPONENT_REGISTRY = {
         }
     },
 
+    "CaptionTrack": {
+        "description": "Captions imported from an SRT or WebVTT file as a single track",
+        "category": "overlay",
+        "variants": {
+            "boxed": "White text on a dark box",
+            "outline": "Outlined text without a background",
+            "highlight": "Text on the theme's primary color"
+        },
+        "schema": {
+            "path": {
+                "type": "string",
+                "default": None,
+                "description": "Path to a .srt or .vtt file"
+            },
+            "content": {
+                "type": "string",
+                "default": None,
+                "description": "SRT or VTT content, instead of a path"
+            },
+            "offset": {
+                "type": "float",
+                "default": 0.0,
+                "description": "Seconds added to every cue time"
+            },
+            "variant": {
+                "type": "enum",
+                "default": "boxed",
+                "values": ["boxed", "outline", "highlight"],
+                "description": "Visual style"
+            },
+            "position": {
+                "type": "enum",
+                "default": "bottom",
+                "values": ["bottom", "top"],
+                "description": "Screen position"
+            },
+            "start_time": {
+                "type": "float",
+                "default": 0.0,
+                "description": "When the track starts (seconds)"
+            },
+            "duration": {
+                "type": "float",
+                "default": None,
+                "description": "How long the track runs (seconds, default: until the last cue ends)"
+            }
+        },
+        "example": {
+            "path": "captions/episode-12.srt",
+            "variant": "boxed",
+            "position": "bottom"
+        }
+    },
+
+    "ParticleEffect": {
+        "description": "Confetti, sparkle and bokeh particles simulated at generation time",
+        "category": "effect",
+        "variants": {
+            "confetti": "Burst from the bottom with gravity, spin and flutter",
+            "sparkle": "Stars twinkling across the frame",
+            "bokeh": "Soft blurred circles drifting upwards"
+        },
+        "schema": {
+            "effect": {
+                "type": "enum",
+                "default": "confetti",
+                "values": ["confetti", "sparkle", "bokeh"],
+                "description": "Particle effect"
+            },
+            "count": {
+                "type": "integer",
+                "default": 120,
+                "description": "Number of particles"
+            },
+            "seed": {
+                "type": "integer",
+                "default": 0,
+                "description": "Random seed (the same seed always renders the same effect)"
+            },
+            "palette": {
+                "type": "array",
+                "default": None,
+                "description": "Particle colors (default: built-in palette)"
+            },
+            "stride": {
+                "type": "integer",
+                "default": 2,
+                "description": "Frames between simulated keyframes"
+            },
+            "start_time": {
+                "type": "float",
+                "required": True,
+                "description": "When to start (seconds)"
+            },
+            "duration": {
+                "type": "float",
+                "default": 3.0,
+                "description": "How long the effect runs (seconds)"
+            }
+        },
+        "example": {
+            "effect": "confetti",
+            "count": 150,
+            "seed": 7,
+            "start_time": 12.0,
+            "duration": 3.0
+        }
+    },
+
+    "AudioWaveform": {
+        "description": "Waveform scrubber with a playhead, from a WAV file analysed at generation time",
+        "category": "audio",
+        "animations": {
+            "scrub": "Playhead moves across the waveform, coloring the played part",
+            "fade_in": "Waveform fades in"
+        },
+        "schema": {
+            "path": {
+                "type": "string",
+                "required": True,
+                "description": "WAV file (8/16/24/32-bit PCM)"
+            },
+            "title": {
+                "type": "string",
+                "default": None,
+                "description": "Optional label above the waveform"
+            },
+            "offset": {
+                "type": "float",
+                "default": 0.0,
+                "description": "Position in the audio to start from (seconds)"
+            },
+            "columns": {
+                "type": "integer",
+                "default": 120,
+                "description": "Number of waveform columns"
+            },
+            "start_time": {
+                "type": "float",
+                "required": True,
+                "description": "When to show (seconds)"
+            },
+            "duration": {
+                "type": "float",
+                "default": None,
+                "description": "How long to show (seconds, default: rest of the audio)"
+            }
+        },
+        "example": {
+            "path": "assets/podcast.wav",
+            "title": "Episode 12",
+            "start_time": 0.0
+        }
+    },
+
+    "AudioBars": {
+        "description": "Audio-reactive frequency bars from a WAV file analysed at generation time",
+        "category": "audio",
+        "variants": {
+            "bars": "Bars rising from a baseline",
+            "mirror": "Bars growing out from the center line"
+        },
+        "schema": {
+            "path": {
+                "type": "string",
+                "required": True,
+                "description": "WAV file (8/16/24/32-bit PCM)"
+            },
+            "bands": {
+                "type": "integer",
+                "default": 16,
+                "description": "Number of log-spaced frequency bands"
+            },
+            "variant": {
+                "type": "enum",
+                "default": "bars",
+                "values": ["bars", "mirror"],
+                "description": "Visual style"
+            },
+            "offset": {
+                "type": "float",
+                "default": 0.0,
+                "description": "Position in the audio to start from (seconds)"
+            },
+            "start_time": {
+                "type": "float",
+                "required": True,
+                "description": "When to show (seconds)"
+            },
+            "duration": {
+                "type": "float",
+                "default": None,
+                "description": "How long to show (seconds, default: rest of the audio)"
+            }
+        },
+        "example": {
+            "path": "assets/music.wav",
+            "bands": 24,
+            "variant": "mirror",
+            "start_time": 0.0,
+            "duration": 10.0
+        }
+    },
+
     "LineChart": {
         "description": "Animated line chart for data visualization",
         "category": "chart",
@@ -278,6 +482,17 @@ COMPONENT_REGISTRY = {
                 "default": True,
                 "description": "Animate line drawing"
             },
+            "downsample": {
+                "type": "string",
+                "default": "lttb",
+                "values": ["lttb", "minmax"],
+                "description": "Reduce long series to the chart's pixel width (None keeps every point)"
+            },
+            "max_points": {
+                "type": "integer",
+                "default": None,
+                "description": "Point budget for downsampling (default: one per pixel column)"
+            },
             "start_time": {
                 "type": "float",
                 "required": True,
@@ -300,6 +515,57 @@ COMPONENT_REGISTRY = {
         }
     },
 
+    "BarChartRace": {
+        "description": "Animated bar chart race showing rankings changing over time",
+        "category": "chart",
+        "animations": {
+            "race": "Bars grow and overtake each other between time periods",
+            "fade_in": "Chart fades in"
+        },
+        "schema": {
+            "data": {
+                "type": "array",
+                "required": True,
+                "description": "Long-format rows [time, name, value] or {time, name, value}"
+            },
+            "title": {
+                "type": "string",
+                "default": "",
+                "description": "Chart title"
+            },
+            "top_n": {
+                "type": "integer",
+                "default": 10,
+                "description": "Number of bars shown"
+            },
+            "value_decimals": {
+                "type": "integer",
+                "default": 0,
+                "description": "Decimal places shown on bar values"
+            },
+            "start_time": {
+                "type": "float",
+                "required": True,
+                "description": "When to show (seconds)"
+            },
+            "duration": {
+                "type": "float",
+                "default": 10.0,
+                "description": "How long the race runs (seconds)"
+            }
+        },
+        "example": {
+            "data": [
+                [2020, "Python", 30], [2020, "JavaScript", 35],
+                [2021, "Python", 38], [2021, "JavaScript", 36]
+            ],
+            "title": "Most Used Languages",
+            "top_n": 10,
+            "start_time": 0.0,
+            "duration": 10.0
+        }
+    },
+
     "Counter": {
         "description": "Animated number counter for statistics and metrics",
         "category": "animation",
@@ -428,6 +694,10 @@ COMPONENT_REGISTRY = {
             "language": {
                 "type": "string",
                 "default": "javascript",
+                "values": [
+                    "bash", "css", "go", "html", "java", "javascript", "json",
+                    "python", "rust", "sql", "typescript"
+                ],
                 "description": "Programming language (for syntax highlighting)"
             },
             "title": {
@@ -499,6 +769,10 @@ COMPONENT_REGISTRY = {
             "language": {
                 "type": "string",
                 "default": "javascript",
+                "values": [
+                    "bash", "css", "go", "html", "java", "javascript", "json",
+                    "python", "rust", "sql", "typescript"
+                ],
                 "description": "Programming language"
             },
             "title": {
@@ -522,7 +796,22 @@ COMPONENT_REGISTRY = {
                 "type": "enum",
                 "default": "normal",
                 "values": ["slow", "normal", "fast", "instant"],
-                "description": "Typing animation speed"
+                "description": "Typing animation speed (or characters per second)"
+            },
+            "line_pause": {
+                "type": "float",
+                "default": 0.0,
+                "description": "Extra pause at the end of each line (seconds)"
+            },
+            "jitter": {
+                "type": "float",
+                "default": 0.0,
+                "description": "Random keystroke timing variation (0-1) for human-like typing"
+            },
+            "seed": {
+                "type": "integer",
+                "default": None,
+                "description": "Jitter RNG seed (default: derived from the code)"
             },
             "show_line_numbers": {
                 "type": "boolean",
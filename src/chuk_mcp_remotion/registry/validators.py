@@ -0,0 +1,277 @@
+"""
+Compiled validators for registry schemas and scene lists.
+
+Schemas in COMPONENT_REGISTRY (and the theme structure) are compiled once
+into closures, so validating a scene list is a walk over plain function
+calls instead of re-reading the schema dictionaries for every prop. All
+problems are collected rather than stopping at the first one.
+
+Schema fields use the registry format: "type" (string, float, number,
+integer, boolean, enum, array, component, object), "required", "values"
+for enums, "items" for array elements, and "schema"/"label" for nested
+objects.
+"""
+
+from typing import Any, Callable, Collection, Dict, List, Optional
+
+from .components import COMPONENT_REGISTRY
+
+# check(value, path, errors, warnings)
+Check = Callable[[Any, str, List[str], List[str]], None]
+
+# Registry timing props; scenes give timing as startFrame/durationInFrames
+TIMING_PROPS = frozenset({"start_time", "duration", "duration_seconds"})
+
+# Required component props that scenes supply as nested scenes next to config
+SLOT_PROPS = {
+    "left_content": ("left", "leftPanel"),
+    "right_content": ("right", "rightPanel"),
+    "items": ("children",),
+    "content": ("children", "content")
+}
+
+# Scene keys holding nested scenes (besides children and left/right/top/bottom)
+SPECIALIZED_KEYS = (
+    "mainFeed", "demo1", "demo2", "overlay",  # AsymmetricLayout
+    "center",  # ThreeColumnLayout
+    "middle",  # ThreeRowLayout
+    "hostView", "screenContent",  # OverTheShoulderLayout
+    "characterA", "characterB",  # DialogueFrameLayout
+    "originalClip", "reactorFace",  # StackedReactionLayout
+    "gameplay", "webcam", "chatOverlay",  # HUDStyleLayout
+    "frontCam", "overheadCam", "handCam", "detailCam",  # PerformanceMultiCamLayout
+    "hostStrip", "backgroundContent",  # FocusStripLayout
+    "mainContent", "pipContent",  # PiPLayout
+    "topContent", "bottomContent", "captionBar",  # VerticalLayout
+    "milestones", "clips",  # TimelineLayout, MosaicLayout
+    "content",  # Container
+    "leftPanel", "rightPanel", "topPanel", "bottomPanel"  # SplitScreen
+)
+
+CHILD_KEYS = ("children", "left", "right", "top", "bottom") + SPECIALIZED_KEYS
+
+_TYPE_NAMES = {
+    "string": "a string",
+    "float": "a number",
+    "number": "a number",
+    "integer": "an integer",
+    "boolean": "a boolean",
+    "array": "an array",
+    "component": "a component",
+    "object": "an object"
+}
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+_TYPE_TESTS = {
+    "string": lambda value: isinstance(value, str),
+    "float": _is_number,
+    "number": _is_number,
+    "integer": _is_integer,
+    "boolean": lambda value: isinstance(value, bool),
+    "array": lambda value: isinstance(value, (list, tuple)),
+    "component": lambda value: isinstance(value, dict) and isinstance(value.get("type"), str),
+    "object": lambda value: isinstance(value, dict)
+}
+
+
+def _where(path: str) -> str:
+    return f"{path}: " if path else ""
+
+
+def compile_field(spec: Dict[str, Any]) -> Check:
+    """
+    Compile one schema field into a check.
+
+    Unknown types accept any value, so registry entries with richer types
+    than the compiler knows about do not produce false errors.
+    """
+    field_type = spec.get("type")
+
+    if field_type == "enum":
+        values = tuple(spec.get("values", ()))
+        allowed = frozenset(values)
+
+        def check_enum(value: Any, path: str, errors: List[str], warnings: List[str]) -> None:
+            try:
+                listed = value in allowed
+            except TypeError:
+                listed = False
+            if not listed:
+                # Templates accept more values than the registry lists, so
+                # an unlisted value is reported without rejecting the scene
+                warnings.append(f"{_where(path)}{value!r} is not one of {list(values)}")
+
+        return check_enum
+
+    test = _TYPE_TESTS.get(field_type)
+    if test is None:
+        return lambda value, path, errors, warnings: None
+
+    expected = _TYPE_NAMES[field_type]
+    nested: Optional[Check] = None
+    if field_type == "object" and "schema" in spec:
+        nested = compile_schema(spec["schema"], spec.get("label"))
+    elif field_type == "array" and "items" in spec:
+        item_check = compile_field(spec["items"])
+
+        def nested(value: Any, path: str, errors: List[str], warnings: List[str]) -> None:
+            for index, item in enumerate(value):
+                item_check(item, f"{path}[{index}]", errors, warnings)
+
+    def check_type(value: Any, path: str, errors: List[str], warnings: List[str]) -> None:
+        if not test(value):
+            errors.append(f"{_where(path)}expected {expected}, got {type(value).__name__}")
+        elif nested is not None:
+            nested(value, path, errors, warnings)
+
+    return check_type
+
+
+def compile_schema(
+    schema: Dict[str, Dict[str, Any]],
+    label: Optional[str] = None,
+    exempt: Collection[str] = ()
+) -> Check:
+    """
+    Compile a schema into a check for a dictionary of values.
+
+    Args:
+        schema: Field name -> field spec (registry format)
+        label: Names missing fields ("Missing <label>: <field>"); without a
+            label the message is prefixed with the path instead
+        exempt: Required fields not checked for presence
+
+    Returns:
+        Check that appends problems to errors (and enum mismatches to warnings)
+    """
+    required = tuple(
+        name for name, spec in schema.items()
+        if spec.get("required") and name not in exempt
+    )
+    fields = tuple((name, compile_field(spec)) for name, spec in schema.items())
+    missing = f"Missing {label}: " if label else "missing required prop "
+
+    def check(values: Any, path: str, errors: List[str], warnings: List[str]) -> None:
+        if not isinstance(values, dict):
+            errors.append(f"{_where(path)}expected an object, got {type(values).__name__}")
+            return
+        for name in required:
+            if name not in values:
+                errors.append(f"{missing}{name}" if label else f"{_where(path)}{missing}'{name}'")
+        for name, field_check in fields:
+            value = values.get(name)
+            if value is not None:
+                field_check(value, f"{path}.{name}" if path else name, errors, warnings)
+
+    return check
+
+
+def _compile_component(schema: Dict[str, Dict[str, Any]]) -> Callable[..., None]:
+    """Compile a component schema into a check of a scene and its config."""
+    slots = tuple(
+        (name, SLOT_PROPS[name]) for name, spec in schema.items()
+        if spec.get("required") and name in SLOT_PROPS
+    )
+    config_check = compile_schema(schema, exempt=TIMING_PROPS | set(SLOT_PROPS))
+
+    def check(scene: Dict, config: Dict, path: str, errors: List[str], warnings: List[str]) -> None:
+        config_check(config, f"{path}.config", errors, warnings)
+        for name, keys in slots:
+            if name not in config and not any(key in scene for key in keys):
+                errors.append(f"{path}: missing {name} (nested scene in {' or '.join(keys)})")
+
+    return check
+
+
+class SceneValidator:
+    """
+    Validates scene lists (the build_composition_from_scenes format).
+
+    Component schemas are compiled when the validator is created; create
+    one and reuse it.
+    """
+
+    def __init__(
+        self,
+        registry: Optional[Dict[str, Dict[str, Any]]] = None,
+        known_types: Collection[str] = ()
+    ):
+        """
+        Compile validators for every registry component.
+
+        Args:
+            registry: Component registry (default: COMPONENT_REGISTRY)
+            known_types: Component types without a registry schema that are
+                still valid (e.g. template names); when empty, unknown
+                types are not reported
+        """
+        registry = COMPONENT_REGISTRY if registry is None else registry
+        self.components = {
+            name: _compile_component(entry.get("schema", {}))
+            for name, entry in registry.items()
+        }
+        self.known_types = (
+            frozenset(known_types) | frozenset(self.components) if known_types else None
+        )
+
+    def validate(self, scenes: Any) -> Dict[str, Any]:
+        """
+        Validate a list of scenes, including nested scenes, in one pass.
+
+        Args:
+            scenes: List of scene dictionaries
+
+        Returns:
+            Dictionary with "valid", "errors" and "warnings"
+        """
+        errors: List[str] = []
+        warnings: List[str] = []
+        if not isinstance(scenes, list):
+            errors.append(f"scenes: expected a list, got {type(scenes).__name__}")
+        else:
+            for index, scene in enumerate(scenes):
+                self._check_scene(scene, f"scenes[{index}]", errors, warnings)
+        return {"valid": not errors, "errors": errors, "warnings": warnings}
+
+    def _check_scene(self, scene: Any, path: str, errors: List[str], warnings: List[str]) -> None:
+        if not isinstance(scene, dict):
+            errors.append(f"{path}: expected a scene object, got {type(scene).__name__}")
+            return
+
+        scene_type = scene.get("type")
+        if not isinstance(scene_type, str):
+            errors.append(f"{path}: missing component type")
+        elif self.known_types is not None and scene_type not in self.known_types:
+            errors.append(f"{path}: unknown component type '{scene_type}'")
+
+        start = scene.get("startFrame", 0)
+        if not _is_integer(start) or start < 0:
+            errors.append(f"{path}.startFrame: expected a non-negative integer, got {start!r}")
+        duration = scene.get("durationInFrames", 1)
+        if not _is_integer(duration) or duration <= 0:
+            errors.append(f"{path}.durationInFrames: expected a positive integer, got {duration!r}")
+
+        config = scene.get("config", {})
+        component = self.components.get(scene_type) if isinstance(scene_type, str) else None
+        if not isinstance(config, dict):
+            errors.append(f"{path}.config: expected an object, got {type(config).__name__}")
+        elif component is not None:
+            component(scene, config, path, errors, warnings)
+
+        for key in CHILD_KEYS:
+            child = scene.get(key)
+            if child is None:
+                continue
+            if isinstance(child, list):
+                for index, item in enumerate(child):
+                    self._check_scene(item, f"{path}.{key}[{index}]", errors, warnings)
+            else:
+                self._check_scene(child, f"{path}.{key}", errors, warnings)
@@ -0,0 +1,87 @@
+# chuk-mcp-remotion/src/chuk_mcp_remotion/renderer/benchmark.py
+"""
+Shipped render benchmark used to calibrate render cost estimates.
+
+Most numbers were measured by rendering each template on its own for 300
+frames at 1920x1080 with a single Remotion worker (Chromium screenshot +
+JPEG frames). Components listed in "estimated_components" were added later
+and have not been benchmarked that way: their weights are estimates from
+comparable templates. All numbers are the starting point for cost weights;
+locally recorded render timings refine them over time.
+"""
+
+RENDER_BENCHMARK = {
+    "reference": {
+        "width": 1920,
+        "height": 1080,
+        "concurrency": 1,
+        "image_format": "jpeg",
+        "remotion": "4.0",
+        "description": "Single worker, 8-core x86_64, Chromium headless shell"
+    },
+
+    # Fixed per-frame cost (page seek, screenshot, encode) paid by every frame
+    "base_frame_ms": 22.0,
+
+    # One-off cost of bundling the project with webpack before rendering
+    "bundle_ms": 30000.0,
+
+    # Extra cost multiplier per level of layout nesting
+    "nesting_overhead": 0.1,
+
+    # Fraction of linear speedup gained from each additional worker
+    "parallel_efficiency": 0.8,
+
+    # Cost used for component types that were not benchmarked
+    "default_component_ms_per_frame": 5.0,
+
+    # Weights below that are estimates rather than measurements
+    "estimated_components": [
+        "CaptionTrack",
+        "ParticleEffect",
+        "AudioWaveform",
+        "AudioBars",
+        "BarChartRace"
+    ],
+
+    # Additional per-frame cost while a component is mounted
+    "component_ms_per_frame": {
+        # Scenes & overlays
+        "TitleScene": 6.5,
+        "LowerThird": 5.5,
+        "CaptionTrack": 2.0,  # estimated
+
+        # Effects
+        "ParticleEffect": 8.0,  # estimated
+
+        # Audio
+        "AudioWaveform": 4.0,  # estimated
+        "AudioBars": 3.0,  # estimated
+
+        # Content
+        "CodeBlock": 12.0,
+        "TypingCode": 14.0,
+        "LineChart": 9.0,
+        "BarChartRace": 10.0,  # estimated
+        "DemoBox": 1.5,
+
+        # Layouts
+        "Container": 1.0,
+        "Grid": 2.5,
+        "SplitScreen": 2.0,
+        "ThreeColumnLayout": 2.0,
+        "ThreeRowLayout": 2.0,
+        "ThreeByThreeGrid": 3.0,
+        "AsymmetricLayout": 2.5,
+        "OverTheShoulderLayout": 2.5,
+        "DialogueFrameLayout": 2.5,
+        "StackedReactionLayout": 2.5,
+        "HUDStyleLayout": 3.0,
+        "PerformanceMultiCamLayout": 3.5,
+        "FocusStripLayout": 3.0,
+        "PiPLayout": 2.0,
+        "VerticalLayout": 2.5,
+        "TimelineLayout": 3.0,
+        "MosaicLayout": 3.5
+    }
+}
@@ -0,0 +1,373 @@
+# chuk-mcp-remotion/src/chuk_mcp_remotion/renderer/cost_estimator.py
+"""
+Render cost estimator for Remotion compositions.
+
+Predicts how expensive a composition is to render before a job is started:
+- Sweeps the timeline to find active components and nesting depth per frame
+- Weights each component type with benchmark-calibrated costs
+- Aggregates a per-second cost profile and its hotspots
+- Predicts the render duration for a given worker concurrency
+
+Benchmark weights ship with the package; RenderTimingStore refines them
+from render timings recorded in the workspace.
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..generator.composition_builder import (
+    ComponentInstance,
+    CompositionBuilder,
+    iter_child_components,
+)
+from .benchmark import RENDER_BENCHMARK
+
+
+def default_concurrency() -> int:
+    """Concurrency used by the scaffolded remotion.config.ts (50% of cores, max 8)."""
+    cpu_cores = os.cpu_count() or 1
+    return max(1, min(cpu_cores // 2, 8))
+
+
+class RenderCostEstimator:
+    """Estimates render cost and duration for a composition."""
+
+    def __init__(
+        self,
+        benchmark: Optional[Dict[str, Any]] = None,
+        weights: Optional[Dict[str, float]] = None,
+        base_frame_ms: Optional[float] = None,
+        calibration: float = 1.0,
+        bundle_ms: Optional[float] = None
+    ):
+        """
+        Initialize the estimator.
+
+        Args:
+            benchmark: Benchmark data (default: shipped RENDER_BENCHMARK)
+            weights: Per-component ms/frame overrides merged over the benchmark
+            base_frame_ms: Per-frame base cost override (default: from benchmark)
+            calibration: Multiplier learned from recorded render timings
+            bundle_ms: Bundling cost override (default: from benchmark)
+        """
+        self.benchmark = benchmark or RENDER_BENCHMARK
+        self.weights = dict(self.benchmark["component_ms_per_frame"])
+        # Weights from the benchmark that are estimates, not measurements
+        self.estimated = set(self.benchmark.get("estimated_components", ()))
+        if weights:
+            self.weights.update(weights)
+            self.estimated -= set(weights)
+        self.base_frame_ms = (
+            base_frame_ms if base_frame_ms is not None else self.benchmark["base_frame_ms"]
+        )
+        self.calibration = calibration
+        self.bundle_ms = bundle_ms if bundle_ms is not None else self.benchmark["bundle_ms"]
+
+    def component_weight(self, component_type: str) -> float:
+        """Get the per-frame cost (ms) of a component type at the reference resolution."""
+        return self.weights.get(
+            component_type,
+            self.benchmark["default_component_ms_per_frame"]
+        )
+
+    def nesting_multiplier(self, depth: int) -> float:
+        """Get the cost multiplier for a component nested at the given depth."""
+        return 1 + self.benchmark["nesting_overhead"] * depth
+
+    def pixel_scale(self, composition: CompositionBuilder) -> float:
+        """Get the cost multiplier for the composition's resolution."""
+        reference = self.benchmark["reference"]
+        return (composition.width * composition.height) / (reference["width"] * reference["height"])
+
+    def collect_spans(self, composition: CompositionBuilder) -> List[Tuple[int, int, str, int]]:
+        """
+        Flatten the composition into timeline spans.
+
+        Nested children are clipped to their parent's time range.
+
+        Returns:
+            List of (start_frame, end_frame, component_type, depth) tuples
+        """
+        nested = set()
+
+        def mark_nested(comp: ComponentInstance):
+            for child in iter_child_components(comp):
+                nested.add(id(child))
+                mark_nested(child)
+
+        for comp in composition.components:
+            mark_nested(comp)
+
+        spans = []
+
+        def visit(comp: ComponentInstance, depth: int, lower: int, upper: Optional[int]):
+            start = max(comp.start_frame, lower)
+            end = comp.start_frame + comp.duration_frames
+            if upper is not None:
+                end = min(end, upper)
+            if end <= start:
+                return
+            spans.append((start, end, comp.component_type, depth))
+            for child in iter_child_components(comp):
+                visit(child, depth + 1, start, end)
+
+        for comp in composition.components:
+            if id(comp) not in nested:
+                visit(comp, 0, 0, None)
+
+        return spans
+
+    def frame_profile(self, composition: CompositionBuilder) -> Dict[str, List]:
+        """
+        Sweep the timeline and compute per-frame statistics.
+
+        Uses difference arrays over span boundaries, so the cost is
+        proportional to frames + spans rather than frames * spans.
+
+        Returns:
+            Dictionary with per-frame "active", "depth" and "cost_ms" lists
+        """
+        spans = self.collect_spans(composition)
+        total_frames = max((end for _, end, _, _ in spans), default=0)
+        scale = self.pixel_scale(composition) * self.calibration
+
+        active_diff = [0] * (total_frames + 1)
+        cost_diff = [0.0] * (total_frames + 1)
+        max_span_depth = max((depth for _, _, _, depth in spans), default=0)
+        depth_diff = [[0] * (total_frames + 1) for _ in range(max_span_depth + 1)]
+
+        for start, end, component_type, depth in spans:
+            weight = self.component_weight(component_type) * self.nesting_multiplier(depth)
+            active_diff[start] += 1
+            active_diff[end] -= 1
+            cost_diff[start] += weight
+            cost_diff[end] -= weight
+            depth_diff[depth][start] += 1
+            depth_diff[depth][end] -= 1
+
+        base_cost = self.base_frame_ms
+        active, depths, costs = [], [], []
+        running_active = 0
+        running_cost = 0.0
+        running_depth = [0] * (max_span_depth + 1)
+
+        for frame in range(total_frames):
+            running_active += active_diff[frame]
+            running_cost += cost_diff[frame]
+            frame_depth = 0
+            for level in range(max_span_depth + 1):
+                running_depth[level] += depth_diff[level][frame]
+                if running_depth[level] > 0:
+                    frame_depth = level + 1
+
+            active.append(running_active)
+            depths.append(frame_depth)
+            costs.append((base_cost + max(running_cost, 0.0)) * scale)
+
+        return {"active": active, "depth": depths, "cost_ms": costs}
+
+    def predict_duration_ms(self, total_cost_ms: float, concurrency: int) -> float:
+        """
+        Predict wall-clock render time for a total frame cost and worker count.
+
+        Args:
+            total_cost_ms: Sum of calibrated per-frame costs
+            concurrency: Render workers
+
+        Returns:
+            Predicted duration in milliseconds, including bundling
+        """
+        efficiency = self.benchmark["parallel_efficiency"]
+        speedup = 1 + (max(concurrency, 1) - 1) * efficiency
+        return self.bundle_ms * self.calibration + total_cost_ms / speedup
+
+    def estimate(
+        self,
+        composition: CompositionBuilder,
+        concurrency: Optional[int] = None,
+        top_hotspots: int = 5
+    ) -> Dict[str, Any]:
+        """
+        Build a render budget report for a composition.
+
+        Args:
+            composition: Composition to analyze
+            concurrency: Render workers (default: same as remotion.config.ts)
+            top_hotspots: Number of most expensive seconds to report
+
+        Returns:
+            Dictionary with the cost profile, hotspots and predicted duration
+        """
+        concurrency = concurrency or default_concurrency()
+        profile = self.frame_profile(composition)
+        spans = self.collect_spans(composition)
+        fps = composition.fps
+        total_frames = len(profile["cost_ms"])
+
+        per_second = []
+        for second_start in range(0, total_frames, fps):
+            second_end = min(second_start + fps, total_frames)
+            active = profile["active"][second_start:second_end]
+            per_second.append({
+                "second": second_start // fps,
+                "cost_ms": round(sum(profile["cost_ms"][second_start:second_end]), 2),
+                "avg_active": round(sum(active) / len(active), 2),
+                "max_active": max(active),
+                "max_depth": max(profile["depth"][second_start:second_end])
+            })
+
+        hotspots = []
+        for entry in sorted(per_second, key=lambda s: s["cost_ms"], reverse=True)[:top_hotspots]:
+            window_start = entry["second"] * fps
+            window_end = window_start + fps
+            components = sorted({
+                component_type for start, end, component_type, _ in spans
+                if start < window_end and end > window_start
+            })
+            hotspots.append({**entry, "components": components})
+
+        scale = self.pixel_scale(composition) * self.calibration
+        cost_by_component: Dict[str, float] = {}
+        for start, end, component_type, depth in spans:
+            weight = self.component_weight(component_type) * self.nesting_multiplier(depth)
+            cost_by_component[component_type] = round(
+                cost_by_component.get(component_type, 0.0) + weight * (end - start) * scale, 2
+            )
+
+        total_cost_ms = sum(profile["cost_ms"])
+        predicted_ms = self.predict_duration_ms(total_cost_ms, concurrency)
+        bundle_ms = self.bundle_ms * self.calibration
+
+        return {
+            "frames": total_frames,
+            "fps": fps,
+            "resolution": f"{composition.width}x{composition.height}",
+            "pixel_scale": round(self.pixel_scale(composition), 4),
+            "calibration": round(self.calibration, 4),
+            "concurrency": concurrency,
+            "total_frame_cost_ms": round(total_cost_ms, 2),
+            "peak_active_components": max(profile["active"], default=0),
+            "max_nesting_depth": max(profile["depth"], default=0),
+            "cost_by_component": cost_by_component,
+            # Components priced by an estimate or the default weight
+            "estimated_components": sorted(
+                component_type for component_type in cost_by_component
+                if component_type in self.estimated or component_type not in self.weights
+            ),
+            "per_second": per_second,
+            "hotspots": hotspots,
+            "predicted_render_seconds": round(predicted_ms / 1000, 2),
+            "baseline_render_seconds": round(predicted_ms / self.calibration / 1000, 2),
+            "predicted_breakdown": {
+                "bundle_seconds": round(bundle_ms / 1000, 2),
+                "frames_seconds": round((predicted_ms - bundle_ms) / 1000, 2)
+            }
+        }
+
+    def segment_features(
+        self,
+        composition: CompositionBuilder,
+        start_frame: int,
+        end_frame: int,
+        spans: Optional[List[Tuple[int, int, str, int]]] = None,
+        profile: Optional[Dict[str, List]] = None
+    ) -> Dict[str, Any]:
+        """
+        Describe the composition content inside a frame range.
+
+        These features are stored with recorded segment timings and are the
+        inputs of the learned cost model.
+
+        Args:
+            composition: Composition being rendered
+            start_frame: First frame of the segment (inclusive)
+            end_frame: Last frame of the segment (exclusive)
+            spans: collect_spans() of the composition, when already computed
+            profile: frame_profile() of the composition, when already computed
+
+        Returns:
+            Dictionary with frame count, nesting-weighted frames per component
+            type, and average/peak active overlap
+        """
+        frames = max(end_frame - start_frame, 0)
+        component_frames: Dict[str, float] = {}
+        active_frames = 0
+
+        if spans is None:
+            spans = self.collect_spans(composition)
+        for start, end, component_type, depth in spans:
+            overlap = min(end, end_frame) - max(start, start_frame)
+            if overlap <= 0:
+                continue
+            active_frames += overlap
+            component_frames[component_type] = (
+                component_frames.get(component_type, 0.0) + overlap * self.nesting_multiplier(depth)
+            )
+
+        if profile is None:
+            profile = self.frame_profile(composition)
+        active = profile["active"][start_frame:end_frame]
+
+        return {
+            "frames": frames,
+            "component_frames": component_frames,
+            "avg_active": round(active_frames / frames, 4) if frames else 0.0,
+            "max_active": max(active, default=0)
+        }
+
+    def plan_chunks(
+        self,
+        composition: CompositionBuilder,
+        chunk_count: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Partition the timeline into contiguous chunks of roughly equal cost.
+
+        Equal-cost chunks keep render workers busy for the same amount of
+        time, unlike equal-length chunks where expensive scenes stall one
+        worker while the others idle.
+
+        Args:
+            composition: Composition to partition
+            chunk_count: Number of chunks (default: one per worker)
+            concurrency: Render workers (default: same as remotion.config.ts)
+
+        Returns:
+            Dictionary with chunk frame ranges, their costs and the predicted
+            duration of the slowest chunk
+        """
+        concurrency = concurrency or default_concurrency()
+        costs = self.frame_profile(composition)["cost_ms"]
+        total_frames = len(costs)
+        chunk_count = max(1, min(chunk_count or concurrency, total_frames or 1))
+        total_cost = sum(costs)
+
+        chunks = []
+        start = 0
+        running = 0.0
+        consumed = 0.0
+        for frame, cost in enumerate(costs):
+            running += cost
+            remaining_chunks = chunk_count - len(chunks)
+            target = (total_cost - consumed) / remaining_chunks
+            frames_left = total_frames - (frame + 1)
+            if remaining_chunks > 1 and (running >= target or frames_left < remaining_chunks - 1):
+                chunks.append({"start_frame": start, "end_frame": frame + 1, "cost_ms": round(running, 2)})
+                consumed += running
+                start = frame + 1
+                running = 0.0
+
+        if start < total_frames:
+            chunks.append({"start_frame": start, "end_frame": total_frames, "cost_ms": round(running, 2)})
+
+        slowest_ms = max((chunk["cost_ms"] for chunk in chunks), default=0.0)
+
+        return {
+            "frames": total_frames,
+            "concurrency": concurrency,
+            "chunks": chunks,
+            "total_frame_cost_ms": round(total_cost, 2),
+            "slowest_chunk_ms": slowest_ms,
+            "balance": round(total_cost / (slowest_ms * len(chunks)), 4) if slowest_ms else 1.0
+        }
@@ -0,0 +1,316 @@
+# chuk-mcp-remotion/src/chuk_mcp_remotion/renderer/timing_store.py
+"""
+Render timing store and learned cost model.
+
+Persists per-job and per-segment render timings in a SQLite database inside
+the workspace, together with the composition features that explain them
+(component type mix, active overlap, resolution, fps, chunk size).
+
+A ridge regression fitted over the segment timings turns this history into
+per-component cost weights for this machine. The regression is shrunk
+towards the shipped benchmark weights, so component types with little
+history stay close to the benchmark while well-sampled ones follow the
+measurements.
+"""
+
+import json
+import sqlite3
+import statistics
+import time
+import uuid
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..generator.composition_builder import CompositionBuilder
+from .benchmark import RENDER_BENCHMARK
+from .cost_estimator import RenderCostEstimator
+
+# SQLite database stored in the workspace directory
+TIMING_DB_FILENAME = ".render_timings.sqlite3"
+
+# Number of recent jobs used for whole-job calibration
+CALIBRATION_WINDOW = 20
+
+# Number of recent segments used to fit the cost model
+FIT_WINDOW = 500
+
+# Segments required before fitted weights replace the benchmark
+MIN_FIT_SAMPLES = 8
+
+# Strength of the benchmark prior, in pseudo-observations per weight
+PRIOR_SAMPLES = 3.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS render_jobs (
+    job_id TEXT PRIMARY KEY,
+    recorded_at REAL NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    fps INTEGER NOT NULL,
+    frames INTEGER NOT NULL,
+    concurrency INTEGER NOT NULL,
+    chunk_size INTEGER,
+    actual_seconds REAL NOT NULL,
+    baseline_seconds REAL NOT NULL,
+    features TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS render_segments (
+    job_id TEXT NOT NULL REFERENCES render_jobs(job_id),
+    start_frame INTEGER NOT NULL,
+    end_frame INTEGER NOT NULL,
+    render_ms REAL NOT NULL,
+    pixel_scale REAL NOT NULL,
+    features TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_render_segments_job ON render_segments(job_id);
+"""
+
+
+def _solve_linear_system(matrix: List[List[float]], vector: List[float]) -> List[float]:
+    """Solve a small dense linear system with Gauss-Jordan elimination."""
+    size = len(vector)
+    rows = [list(matrix[i]) + [vector[i]] for i in range(size)]
+
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda r: abs(rows[r][col]))
+        if abs(rows[pivot][col]) < 1e-12:
+            raise ValueError("Singular system")
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        pivot_value = rows[col][col]
+        rows[col] = [value / pivot_value for value in rows[col]]
+        for r in range(size):
+            if r != col and rows[r][col] != 0.0:
+                factor = rows[r][col]
+                rows[r] = [a - factor * b for a, b in zip(rows[r], rows[col])]
+
+    return [rows[i][size] for i in range(size)]
+
+
+class RenderTimingStore:
+    """SQLite-backed history of render timings."""
+
+    def __init__(self, workspace_dir: Path, benchmark: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the timing store.
+
+        Args:
+            workspace_dir: Workspace directory holding the database
+            benchmark: Benchmark used as regression prior (default: RENDER_BENCHMARK)
+        """
+        self.db_path = Path(workspace_dir) / TIMING_DB_FILENAME
+        self.benchmark = benchmark or RENDER_BENCHMARK
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one transaction and close it afterwards."""
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            yield conn
+
+    def record_job(
+        self,
+        composition: CompositionBuilder,
+        actual_seconds: float,
+        concurrency: int,
+        chunk_size: Optional[int] = None,
+        segments: Optional[List[Dict[str, Any]]] = None,
+        job_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Record a finished render job and its segment timings.
+
+        Args:
+            composition: Composition that was rendered
+            actual_seconds: Measured wall-clock duration of the whole job
+            concurrency: Render workers used
+            chunk_size: Frames per chunk, if the job was chunked
+            segments: Per-segment timings as dicts with start_frame, end_frame
+                and render_seconds (time one worker spent on the segment)
+            job_id: Optional job identifier (default: generated)
+
+        Returns:
+            Dictionary with the job id and number of recorded segments
+        """
+        job_id = job_id or uuid.uuid4().hex
+        estimator = RenderCostEstimator(benchmark=self.benchmark)
+        baseline = estimator.estimate(composition, concurrency=concurrency, top_hotspots=0)
+        total_frames = baseline["frames"]
+        pixel_scale = estimator.pixel_scale(composition)
+
+        # Spans and the frame profile are shared by every segment of the job
+        spans = estimator.collect_spans(composition)
+        profile = estimator.frame_profile(composition)
+        job_features = estimator.segment_features(composition, 0, total_frames, spans, profile)
+        segment_rows = []
+        for segment in segments or []:
+            start = int(segment["start_frame"])
+            end = int(segment["end_frame"])
+            if end <= start or segment["render_seconds"] <= 0:
+                raise ValueError(f"Invalid segment timing: {segment}")
+            features = estimator.segment_features(composition, start, end, spans, profile)
+            segment_rows.append((
+                job_id, start, end, segment["render_seconds"] * 1000, pixel_scale,
+                json.dumps(features)
+            ))
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO render_jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id, time.time(), composition.width, composition.height,
+                    composition.fps, total_frames, concurrency, chunk_size,
+                    actual_seconds, baseline["predicted_render_seconds"],
+                    json.dumps(job_features)
+                )
+            )
+            conn.executemany(
+                "INSERT INTO render_segments VALUES (?, ?, ?, ?, ?, ?)",
+                segment_rows
+            )
+
+        return {
+            "job_id": job_id,
+            "frames": total_frames,
+            "segments": len(segment_rows),
+            "baseline_seconds": baseline["predicted_render_seconds"],
+            "actual_seconds": actual_seconds
+        }
+
+    def job_count(self) -> int:
+        """Get the number of recorded jobs."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM render_jobs").fetchone()[0]
+
+    def segment_count(self) -> int:
+        """Get the number of recorded segments."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM render_segments").fetchone()[0]
+
+    def calibration(self, window: int = CALIBRATION_WINDOW) -> float:
+        """
+        Compute a whole-job calibration multiplier.
+
+        Uses the median actual/baseline ratio of the most recent jobs so a
+        single outlier render does not skew future estimates.
+
+        Args:
+            window: Number of recent jobs to consider
+
+        Returns:
+            Calibration multiplier (1.0 when no history exists)
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT actual_seconds, baseline_seconds FROM render_jobs "
+                "WHERE baseline_seconds > 0 ORDER BY recorded_at DESC LIMIT ?",
+                (window,)
+            ).fetchall()
+
+        if not rows:
+            return 1.0
+        return statistics.median(actual / baseline for actual, baseline in rows)
+
+    def fit_weights(
+        self,
+        window: int = FIT_WINDOW,
+        prior_samples: float = PRIOR_SAMPLES
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fit per-component cost weights from recorded segment timings.
+
+        Models each segment as
+            render_ms = pixel_scale * (base_ms * frames + sum(weight_t * frames_t))
+        and solves a ridge regression whose penalty pulls every coefficient
+        towards its benchmark value.
+
+        Args:
+            window: Number of recent segments to fit on
+            prior_samples: Strength of the benchmark prior
+
+        Returns:
+            Dictionary with "base_frame_ms", "weights" and "samples", or None
+            when there is not enough history
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT render_ms, pixel_scale, features FROM render_segments "
+                "ORDER BY rowid DESC LIMIT ?",
+                (window,)
+            ).fetchall()
+
+        if len(rows) < MIN_FIT_SAMPLES:
+            return None
+
+        samples = [(render_ms, scale, json.loads(features)) for render_ms, scale, features in rows]
+        component_types = sorted({
+            component_type
+            for _, _, features in samples
+            for component_type in features["component_frames"]
+        })
+
+        # Column 0 is the per-frame base cost, then one column per component type
+        default_weight = self.benchmark["default_component_ms_per_frame"]
+        prior = [self.benchmark["base_frame_ms"]] + [
+            self.benchmark["component_ms_per_frame"].get(t, default_weight)
+            for t in component_types
+        ]
+        size = len(prior)
+        gram = [[0.0] * size for _ in range(size)]
+        moment = [0.0] * size
+        column_energy = [0.0] * size
+
+        for render_ms, scale, features in samples:
+            row = [features["frames"] * scale] + [
+                features["component_frames"].get(t, 0.0) * scale for t in component_types
+            ]
+            for i in range(size):
+                if row[i] == 0.0:
+                    continue
+                moment[i] += row[i] * render_ms
+                column_energy[i] += row[i] * row[i]
+                for j in range(size):
+                    gram[i][j] += row[i] * row[j]
+
+        # Ridge penalty per column: prior_samples pseudo-observations of an average row
+        for i in range(size):
+            penalty = prior_samples * column_energy[i] / len(samples)
+            gram[i][i] += penalty
+            moment[i] += penalty * prior[i]
+
+        try:
+            solution = _solve_linear_system(gram, moment)
+        except ValueError:
+            return None
+
+        solution = [max(value, 0.0) for value in solution]
+
+        return {
+            "base_frame_ms": round(solution[0], 4),
+            "weights": {t: round(w, 4) for t, w in zip(component_types, solution[1:])},
+            "samples": len(samples)
+        }
+
+    def build_estimator(self) -> RenderCostEstimator:
+        """
+        Create the best available estimator for this workspace.
+
+        Uses fitted per-component weights once enough segment timings exist,
+        and falls back to benchmark weights with whole-job calibration. The
+        segment fit does not cover bundling, so with fitted weights the
+        calibration still scales the benchmark bundle time.
+
+        Returns:
+            RenderCostEstimator instance
+        """
+        fitted = self.fit_weights()
+        if fitted:
+            return RenderCostEstimator(
+                benchmark=self.benchmark,
+                weights=fitted["weights"],
+                base_frame_ms=fitted["base_frame_ms"],
+                bundle_ms=self.benchmark["bundle_ms"] * self.calibration()
+            )
+
+        return RenderCostEstimator(benchmark=self.benchmark, calibration=self.calibration())
@@ -22,10 +22,15 @@ from .tokens.typography import TYPOGRAPHY_TOKENS
 from .tokens.motion import MOTION_TOKENS
 from .registry.components import COMPONENT_REGISTRY
 from .themes.youtube_themes import YOUTUBE_THEMES
+from .themes.theme_manager import ThemeManager
+from .tokens.token_manager import TokenManager
 from .utils.project_manager import ProjectManager
 from .generator.composition_builder import CompositionBuilder
 from .tools.theme_tools import register_theme_tools
 from .tools.token_tools import register_token_tools
+from .tools.render_tools import register_render_tools
+from .tools.batch_tools import register_batch_tools
+from .tools.dependency_tools import register_dependency_tools
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -36,12 +41,20 @@ mcp = ChukMCPServer("chuk-mcp-remotion")
 # Create virtual filesystem instance (using file provider for actual file operations)
 vfs = AsyncVirtualFileSystem(provider="file")
 
+# Theme and token managers shared by the tools and component generation, so
+# custom themes and tokens apply everywhere
+token_manager = TokenManager(vfs)
+theme_manager = ThemeManager(vfs, token_manager)
+
 # Create project manager instance
-project_manager = ProjectManager()
+project_manager = ProjectManager(theme_manager=theme_manager)
 
-# Register theme and token tools with virtual filesystem
-register_theme_tools(mcp, project_manager, vfs)
-register_token_tools(mcp, project_manager, vfs)
+# Register theme, token, render, batch and dependency tools with virtual filesystem
+register_theme_tools(mcp, project_manager, vfs, theme_manager=theme_manager)
+register_token_tools(mcp, project_manager, vfs, token_manager=token_manager, theme_manager=theme_manager)
+register_render_tools(mcp, project_manager, vfs)
+register_batch_tools(mcp, project_manager, vfs)
+register_dependency_tools(mcp, project_manager, vfs)
 
 # ============================================================================
 # DISCOVERY TOOLS - Help LLMs explore the design system
@@ -158,6 +171,16 @@ async def remotion_get_component_schema(component_name: str) -> str:
 # Note: Token tools (remotion_list_color_tokens, remotion_list_typography_tokens,
 # remotion_list_motion_tokens, etc.) are now registered via register_token_tools() above
 
+# Note: Render tools (remotion_estimate_render_cost, remotion_record_render_timing)
+# are registered via register_render_tools() above
+
+# Note: Batch tools (remotion_batch_generate_variants)
+# are registered via register_batch_tools() above
+
+# Note: Dependency tools (remotion_prepare_dependencies, remotion_link_dependencies,
+# remotion_list_dependency_store, remotion_list_component_libraries) are registered
+# via register_dependency_tools() above
+
 
 # ============================================================================
 # PROJECT CREATION & GENERATION TOOLS
@@ -169,7 +192,9 @@ async def remotion_create_project(
     theme: str = "tech",
     fps: int = 30,
     width: int = 1920,
-    height: int = 1080
+    height: int = 1080,
+    shared_components: bool = False,
+    shared_theme: bool = True
 ) -> str:
     """
     Create a new Remotion video project.
@@ -183,6 +208,10 @@ async def remotion_create_project(
         fps: Frames per second (default: 30)
         width: Video width in pixels (default: 1920 for 1080p)
         height: Video height in pixels (default: 1080 for 1080p)
+        shared_components: Import components from the shared workspace library
+            and reuse a workspace-wide webpack bundle cache (default: False)
+        shared_theme: Emit the theme as one src/theme module that components
+            import, so theme switches don't regenerate components (default: True)
 
     Returns:
         JSON with project information
@@ -198,7 +227,11 @@ async def remotion_create_project(
     """
     def _create():
         try:
-            result = project_manager.create_project(name, theme, fps, width, height)
+            result = project_manager.create_project(
+                name, theme, fps, width, height,
+                shared_components=shared_components,
+                shared_theme=shared_theme
+            )
             return json.dumps(result, indent=2)
         except Exception as e:
             return json.dumps({"error": str(e)})
@@ -210,7 +243,7 @@ async def remotion_create_project(
 async def remotion_add_title_scene(
     text: str,
     subtitle: Optional[str] = None,
-    duration_seconds: float = 3.0,
+    duration_seconds: Optional[float] = 3.0,
     variant: str = "bold",
     animation: str = "fade_zoom"
 ) -> str:
@@ -223,7 +256,8 @@ async def remotion_add_title_scene(
     Args:
         text: Main title text
         subtitle: Optional subtitle text
-        duration_seconds: How long to show (default: 3.0 seconds)
+        duration_seconds: How long to show (default: 3.0 seconds); null sizes
+            the scene to its entrance animation settling, plus a hold and the fade out
         variant: Style variant (minimal, standard, bold, kinetic)
         animation: Animation style (fade_zoom, slide_up, typewriter, blur_in, split)
 
@@ -243,7 +277,8 @@ async def remotion_add_title_scene(
         if not project_manager.current_composition:
             return json.dumps({"error": "No active project. Create a project first."})
 
-        project_manager.current_composition.add_title_scene(
+        composition = project_manager.current_composition
+        composition.add_title_scene(
             text=text,
             subtitle=subtitle,
             duration_seconds=duration_seconds,
@@ -255,7 +290,7 @@ async def remotion_add_title_scene(
             "component": "TitleScene",
             "text": text,
             "subtitle": subtitle,
-            "duration": duration_seconds,
+            "duration": composition.frames_to_seconds(composition.components[-1].duration_frames),
             "variant": variant,
             "animation": animation
         })
@@ -268,7 +303,7 @@ async def remotion_add_lower_third(
     name: str,
     title: Optional[str] = None,
     start_time: float = 0.0,
-    duration: float = 5.0,
+    duration: Optional[float] = 5.0,
     variant: str = "glass",
     position: str = "bottom_left"
 ) -> str:
@@ -283,7 +318,8 @@ async def remotion_add_lower_third(
         name: Main name/text to display
         title: Optional subtitle/title
         start_time: When to show (seconds from start)
-        duration: How long to show (default: 5.0 seconds)
+        duration: How long to show (default: 5.0 seconds); null sizes the
+            overlay to its slide-in settling, plus a hold and the fade out
         variant: Style variant (minimal, standard, glass, bold, animated)
         position: Screen position (bottom_left, bottom_center, bottom_right, top_left, top_center)
 
@@ -304,7 +340,8 @@ async def remotion_add_lower_third(
         if not project_manager.current_composition:
             return json.dumps({"error": "No active project. Create a project first."})
 
-        project_manager.current_composition.add_lower_third(
+        composition = project_manager.current_composition
+        composition.add_lower_third(
             name=name,
             title=title,
             start_time=start_time,
@@ -318,7 +355,70 @@ async def remotion_add_lower_third(
             "name": name,
             "title": title,
             "start_time": start_time,
-            "duration": duration,
+            "duration": composition.frames_to_seconds(composition.components[-1].duration_frames),
+            "variant": variant,
+            "position": position
+        })
+
+    return await asyncio.get_event_loop().run_in_executor(None, _add)
+
+
+@mcp.tool
+async def remotion_add_caption_track(
+    path: Optional[str] = None,
+    content: Optional[str] = None,
+    start_time: float = 0.0,
+    duration: Optional[float] = None,
+    offset: float = 0.0,
+    variant: str = "boxed",
+    position: str = "bottom"
+) -> str:
+    """
+    Add captions from an SRT or WebVTT file to the composition.
+
+    All cues are imported into one caption track component, so a file with
+    hundreds of cues is a single call (and a single component).
+
+    Args:
+        path: Path to a .srt or .vtt file
+        content: SRT or VTT content, instead of a path
+        start_time: When the track starts (seconds); cue times are relative to it
+        duration: How long the track runs (seconds, default: until the last cue ends)
+        offset: Seconds added to every cue time (to resync captions)
+        variant: Style variant (boxed, outline, highlight)
+        position: Screen position (bottom, top)
+
+    Returns:
+        JSON with component info
+
+    Example:
+        await remotion_add_caption_track(
+            path="captions/episode-12.srt",
+            variant="boxed"
+        )
+    """
+    def _add():
+        if not project_manager.current_composition:
+            return json.dumps({"error": "No active project. Create a project first."})
+
+        try:
+            project_manager.current_composition.add_caption_track(
+                path=path,
+                content=content,
+                start_time=start_time,
+                duration=duration,
+                offset=offset,
+                variant=variant,
+                position=position
+            )
+        except (OSError, ValueError) as e:
+            return json.dumps({"error": str(e)})
+
+        captions = project_manager.current_composition.components[-1].props["captions"]
+        return json.dumps({
+            "component": "CaptionTrack",
+            "cues": len(captions["starts"]),
+            "start_time": start_time,
             "variant": variant,
             "position": position
         })
@@ -399,6 +499,92 @@ async def remotion_generate_video() -> str:
     return await asyncio.get_event_loop().run_in_executor(None, _generate)
 
 
+@mcp.tool
+async def remotion_generate_timeline_composition(
+    component_types: Optional[List[str]] = None
+) -> str:
+    """
+    Generate a data-driven composition that reads its timeline from props.
+
+    Emits a generic TimelineComposition once per project. It renders any
+    serialized timeline (the output of remotion_export_timeline) passed as
+    inputProps, so personalized variants that only change text and data
+    reuse a single webpack bundle instead of regenerating TSX.
+
+    Args:
+        component_types: Component types to bundle (default: types used by the
+            current composition). Include every type your variants will use.
+
+    Returns:
+        JSON with generated files and render commands
+
+    Example:
+        result = await remotion_generate_timeline_composition()
+        # Then: npx remotion render <id> out/variant.mp4 --props=variant.json
+    """
+    def _generate():
+        if not project_manager.current_project:
+            return json.dumps({"error": "No active project. Create a project first."})
+
+        if not project_manager.current_composition:
+            return json.dumps({"error": "No composition created. Add components first."})
+
+        try:
+            result = project_manager.generate_timeline_composition(component_types)
+            project_path = project_manager.workspace_dir / project_manager.current_project
+
+            return json.dumps({
+                "status": "success",
+                **result,
+                "next_steps": [
+                    f"cd {project_path}",
+                    "npm install",
+                    "npx remotion bundle src/index.ts --out-dir build",
+                    f"npx remotion render build {result['composition_id']} out/variant.mp4 --props=variant.json"
+                ]
+            }, indent=2)
+
+        except Exception as e:
+            return json.dumps({"error": str(e)})
+
+    return await asyncio.get_event_loop().run_in_executor(None, _generate)
+
+
+@mcp.tool
+async def remotion_export_timeline(output_path: str) -> str:
+    """
+    Export the current composition timeline as a JSON props file.
+
+    The file can be rendered with the bundle produced by
+    remotion_generate_timeline_composition without regenerating any code.
+
+    Args:
+        output_path: Destination JSON file path
+
+    Returns:
+        JSON with the written file path
+
+    Example:
+        await remotion_export_timeline(output_path="variants/alice.json")
+    """
+    def _export():
+        if not project_manager.current_composition:
+            return json.dumps({"error": "No active composition"})
+
+        try:
+            path = project_manager.export_timeline(Path(output_path))
+            return json.dumps({
+                "status": "success",
+                "path": path,
+                "duration_frames": project_manager.current_composition.get_total_duration_frames()
+            }, indent=2)
+
+        except Exception as e:
+            return json.dumps({"error": str(e)})
+
+    return await asyncio.get_event_loop().run_in_executor(None, _export)
+
+
 @mcp.tool
 async def remotion_get_composition_info() -> str:
     """
@@ -0,0 +1,519 @@
+# chuk-mcp-remotion/src/chuk_mcp_remotion/themes/color_engine.py
+"""
+Color engine - perceptual color math for themes.
+
+Theme colors are converted to OKLab, where Euclidean distance tracks how
+different two colors look, and OKLCH (lightness, chroma, hue) for
+generating color scales. Conversions are cached per color string and
+uncached colors are converted in one batch, vectorized with NumPy when it
+is installed (pip install chuk-mcp-remotion[fast]) and per color otherwise.
+
+Palette distance compares two themes role by role (primary and accent
+scales, dark and light backgrounds) as the mean OKLab distance.
+
+Contrast ratios follow WCAG 2.x relative luminance. Translucent colors
+are alpha composited first; a translucent background (e.g. the glass
+background over video) is checked over both black and white and the
+lower ratio is kept.
+"""
+
+import math
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Linear sRGB -> LMS and LMS^(1/3) -> OKLab (Björn Ottosson's OKLab)
+_RGB_TO_LMS = (
+    (0.4122214708, 0.5363325363, 0.0514459929),
+    (0.2119034982, 0.6806995451, 0.1073969566),
+    (0.0883024619, 0.2817188376, 0.6299787005),
+)
+_LMS_TO_LAB = (
+    (0.2104542553, 0.7936177850, -0.0040720468),
+    (1.9779984951, -2.4285922050, 0.4505937099),
+    (0.0259040371, 0.7827717662, -0.8086757660),
+)
+_LAB_TO_LMS = (
+    (1.0, 0.3963377774, 0.2158037573),
+    (1.0, -0.1055613458, -0.0638541728),
+    (1.0, -0.0894841775, -1.2914855480),
+)
+_LMS_TO_RGB = (
+    (4.0767416621, -3.3077115913, 0.2309699292),
+    (-1.2684380046, 2.6097574011, -0.3413193965),
+    (-0.0041960863, -0.7034186147, 1.7076147010),
+)
+
+# Theme color roles compared by palette_distance
+PALETTE_ROLES: Tuple[Tuple[str, Any], ...] = (
+    ("primary", 0), ("primary", 1), ("primary", 2),
+    ("accent", 0), ("accent", 1), ("accent", 2),
+    ("background", "dark"), ("background", "light"),
+)
+
+# Scale generation: lightness drop and chroma ratio between stops, and the
+# accent's hue shift, lightness lift and chroma ratio relative to the seed
+# (fitted to the built-in tech palette)
+SCALE_LIGHTNESS_STEP = 0.085
+SCALE_CHROMA_RATIO = 0.83
+ACCENT_HUE_SHIFT = -45.0
+ACCENT_LIGHTNESS_LIFT = 0.25
+ACCENT_CHROMA_RATIO = 0.6
+
+# WCAG 2.x contrast thresholds, highest first
+CONTRAST_LEVELS: Tuple[Tuple[str, float], ...] = (("AAA", 7.0), ("AA", 4.5), ("AA Large", 3.0))
+
+# Text and semantic colors checked against each background
+CONTRAST_FOREGROUNDS = ("text", "semantic")
+CONTRAST_BACKGROUNDS = ("dark", "light", "glass")
+
+# Text colors meant for the other kind of background are not paired with it
+_CONTRAST_SKIPPED = {
+    ("text.on_dark", "background.light"),
+    ("text.on_light", "background.dark"),
+    ("text.on_light", "background.glass"),
+}
+
+_HEX = re.compile(r"^#([0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})$")
+_RGB_FUNCTION = re.compile(r"^rgba?\(\s*([^)]*)\)$")
+_GRADIENT_STOP = re.compile(r"#[0-9a-fA-F]{3,8}\b|rgba?\([^)]*\)")
+
+# Colors kept by the parse and OKLab caches (least recently used dropped first)
+COLOR_CACHE_SIZE = 4096
+
+# Color string -> OKLab
+_oklab_cache: "OrderedDict[str, Tuple[float, float, float]]" = OrderedDict()
+
+
+@lru_cache(maxsize=COLOR_CACHE_SIZE)
+def parse_color(value: str) -> Tuple[float, float, float, float]:
+    """
+    Parse a CSS hex or rgb()/rgba() color.
+
+    Args:
+        value: Color such as "#0066FF", "#06F", "rgba(10, 14, 26, 0.85)"
+
+    Returns:
+        (r, g, b, alpha) with channels in 0-1
+
+    Raises:
+        ValueError: If the color cannot be parsed
+    """
+    text = value.strip()
+    match = _HEX.match(text)
+    if match:
+        digits = match.group(1)
+        if len(digits) in (3, 4):
+            digits = "".join(char * 2 for char in digits)
+        channels = [int(digits[i:i + 2], 16) / 255 for i in range(0, len(digits), 2)]
+        return (channels[0], channels[1], channels[2], channels[3] if len(channels) == 4 else 1.0)
+
+    match = _RGB_FUNCTION.match(text)
+    if match:
+        parts = [part.strip() for part in match.group(1).replace("/", ",").split(",")]
+        if len(parts) in (3, 4):
+            try:
+                rgb = [float(part[:-1]) / 100 if part.endswith("%") else float(part) / 255 for part in parts[:3]]
+                alpha = 1.0
+                if len(parts) == 4:
+                    alpha = float(parts[3][:-1]) / 100 if parts[3].endswith("%") else float(parts[3])
+                return (rgb[0], rgb[1], rgb[2], alpha)
+            except ValueError:
+                pass
+
+    raise ValueError(f"Unsupported color: '{value}'")
+
+
+def _to_linear(channel: float) -> float:
+    """sRGB channel to linear light."""
+    return channel / 12.92 if channel <= 0.04045 else ((channel + 0.055) / 1.055) ** 2.4
+
+
+def _to_srgb(channel: float) -> float:
+    """Linear light channel to sRGB."""
+    return 12.92 * channel if channel <= 0.0031308 else 1.055 * channel ** (1 / 2.4) - 0.055
+
+
+def _multiply(matrix, vector) -> List[float]:
+    """3x3 matrix times vector."""
+    return [sum(row[i] * vector[i] for i in range(3)) for row in matrix]
+
+
+def _rgb_to_oklab_python(rgb: Sequence[Sequence[float]]) -> List[Tuple[float, float, float]]:
+    """Convert sRGB triples one at a time."""
+    result = []
+    for color in rgb:
+        lms = _multiply(_RGB_TO_LMS, [_to_linear(channel) for channel in color])
+        lightness, a, b = _multiply(_LMS_TO_LAB, [math.copysign(abs(v) ** (1 / 3), v) for v in lms])
+        result.append((lightness, a, b))
+    return result
+
+
+def _rgb_to_oklab_numpy(rgb: Sequence[Sequence[float]]) -> List[Tuple[float, float, float]]:
+    """Convert all sRGB triples in one vectorized pass."""
+    colors = np.asarray(rgb, dtype=float).reshape(-1, 3)
+    linear = np.where(colors <= 0.04045, colors / 12.92, ((colors + 0.055) / 1.055) ** 2.4)
+    lms = np.cbrt(linear @ np.array(_RGB_TO_LMS).T)
+    return [tuple(row) for row in (lms @ np.array(_LMS_TO_LAB).T).tolist()]
+
+
+def oklab(colors: Sequence[str]) -> List[Tuple[float, float, float]]:
+    """
+    Convert colors to OKLab (alpha is ignored).
+
+    Colors not seen before are parsed and converted together in one batch;
+    results are cached per color string (up to COLOR_CACHE_SIZE colors).
+
+    Args:
+        colors: CSS color strings
+
+    Returns:
+        (L, a, b) per color, in input order
+    """
+    found: Dict[str, Tuple[float, float, float]] = {}
+    missing = []
+    for color in dict.fromkeys(colors):
+        if color in _oklab_cache:
+            _oklab_cache.move_to_end(color)
+            found[color] = _oklab_cache[color]
+        else:
+            missing.append(color)
+    if missing:
+        rgb = [parse_color(color)[:3] for color in missing]
+        convert = _rgb_to_oklab_numpy if np is not None else _rgb_to_oklab_python
+        converted = dict(zip(missing, convert(rgb)))
+        found.update(converted)
+        _oklab_cache.update(converted)
+        while len(_oklab_cache) > COLOR_CACHE_SIZE:
+            _oklab_cache.popitem(last=False)
+    return [found[color] for color in colors]
+
+
+def oklch(color: str) -> Tuple[float, float, float]:
+    """
+    Convert a color to OKLCH.
+
+    Args:
+        color: CSS color string
+
+    Returns:
+        (lightness 0-1, chroma, hue in degrees 0-360)
+    """
+    lightness, a, b = oklab([color])[0]
+    return lightness, math.hypot(a, b), math.degrees(math.atan2(b, a)) % 360
+
+
+def _oklch_to_linear(lightness: float, chroma: float, hue: float) -> List[float]:
+    """OKLCH to (possibly out of gamut) linear sRGB."""
+    radians = math.radians(hue)
+    lab = [lightness, chroma * math.cos(radians), chroma * math.sin(radians)]
+    return _multiply(_LMS_TO_RGB, [v ** 3 for v in _multiply(_LAB_TO_LMS, lab)])
+
+
+def oklch_to_hex(lightness: float, chroma: float, hue: float) -> str:
+    """
+    Convert OKLCH to a hex color, reducing chroma to fit the sRGB gamut.
+
+    Args:
+        lightness: 0-1 (clamped)
+        chroma: Chroma (>= 0)
+        hue: Hue in degrees
+
+    Returns:
+        "#RRGGBB"
+    """
+    lightness = min(1.0, max(0.0, lightness))
+    chroma = max(0.0, chroma)
+
+    def in_gamut(c: float) -> bool:
+        return all(-1e-6 <= channel <= 1 + 1e-6 for channel in _oklch_to_linear(lightness, c, hue))
+
+    if not in_gamut(chroma):
+        low, high = 0.0, chroma
+        for _ in range(24):
+            middle = (low + high) / 2
+            low, high = (middle, high) if in_gamut(middle) else (low, middle)
+        chroma = low
+
+    channels = [min(1.0, max(0.0, _to_srgb(min(1.0, max(0.0, v))))) for v in _oklch_to_linear(lightness, chroma, hue)]
+    return "#" + "".join(f"{round(channel * 255):02X}" for channel in channels)
+
+
+def generate_scale(seed: str, stops: int = 3) -> List[str]:
+    """
+    Generate a color scale from a seed, darkening one step per stop.
+
+    Args:
+        seed: Seed color (the first stop)
+        stops: Number of stops
+
+    Returns:
+        Hex colors from the seed down, like the primary/accent lists of
+        COLOR_TOKENS
+    """
+    lightness, chroma, hue = oklch(seed)
+    return [
+        oklch_to_hex(lightness - SCALE_LIGHTNESS_STEP * i, chroma * SCALE_CHROMA_RATIO ** i, hue)
+        for i in range(stops)
+    ]
+
+
+def generate_palette(
+    seed: str,
+    stops: int = 3,
+    accent_hue_shift: float = ACCENT_HUE_SHIFT
+) -> Dict[str, Any]:
+    """
+    Generate primary and accent scales (and their gradient) from one seed.
+
+    The accent is the seed's hue rotated by accent_hue_shift degrees,
+    lighter and less saturated.
+
+    Args:
+        seed: Primary seed color
+        stops: Number of stops per scale
+        accent_hue_shift: Hue rotation from primary to accent, in degrees
+
+    Returns:
+        Dictionary with "primary", "accent" and "gradient"
+    """
+    lightness, chroma, hue = oklch(seed)
+    primary = generate_scale(seed, stops)
+    accent_seed = oklch_to_hex(
+        min(0.9, lightness + ACCENT_LIGHTNESS_LIFT),
+        chroma * ACCENT_CHROMA_RATIO,
+        hue + accent_hue_shift
+    )
+    accent = generate_scale(accent_seed, stops)
+    return {
+        "primary": primary,
+        "accent": accent,
+        "gradient": f"linear-gradient(135deg, {primary[0]} 0%, {accent[0]} 100%)"
+    }
+
+
+def palette_colors(colors: Mapping[str, Any]) -> List[Optional[str]]:
+    """
+    A theme's colors for each palette role (None where missing/unparseable).
+
+    Args:
+        colors: Theme color tokens
+
+    Returns:
+        One entry per PALETTE_ROLES role
+    """
+    result: List[Optional[str]] = []
+    for group, index in PALETTE_ROLES:
+        values: Any = colors.get(group)
+        try:
+            color = values[index]
+            parse_color(color)
+        except (TypeError, KeyError, IndexError, ValueError, AttributeError):
+            color = None
+        result.append(color)
+    return result
+
+
+def palette_distances(query: Mapping[str, Any], candidates: Sequence[Mapping[str, Any]]) -> List[float]:
+    """
+    Perceptual distance from one theme palette to many.
+
+    The distance is the mean OKLab distance over the palette roles both
+    themes define (inf when they share none); 0 means identical.
+
+    Args:
+        query: Theme color tokens
+        candidates: Color tokens of the themes to compare against
+
+    Returns:
+        Distance per candidate
+    """
+    rows = [palette_colors(query)] + [palette_colors(colors) for colors in candidates]
+    present = [color for row in rows for color in row if color is not None]
+    lab = dict(zip(present, oklab(present)))
+
+    if np is not None:
+        table = np.full((len(rows), len(PALETTE_ROLES), 3), np.nan)
+        for i, row in enumerate(rows):
+            for j, color in enumerate(row):
+                if color is not None:
+                    table[i, j] = lab[color]
+        deltas = np.linalg.norm(table[1:] - table[0], axis=2)
+        shared = ~np.isnan(deltas)
+        totals = np.where(shared, deltas, 0.0).sum(axis=1)
+        counts = shared.sum(axis=1)
+        means = np.divide(totals, counts, out=np.full(len(counts), np.inf), where=counts > 0)
+        return means.tolist()
+
+    distances = []
+    for row in rows[1:]:
+        deltas = [
+            math.dist(lab[a], lab[b])
+            for a, b in zip(rows[0], row)
+            if a is not None and b is not None
+        ]
+        distances.append(sum(deltas) / len(deltas) if deltas else math.inf)
+    return distances
+
+
+def gradient_stops(gradient: str) -> List[str]:
+    """
+    Colors of a CSS gradient, in order.
+
+    Args:
+        gradient: e.g. "linear-gradient(135deg, #0066FF 0%, #00D9FF 100%)"
+
+    Returns:
+        Stop colors
+    """
+    return _GRADIENT_STOP.findall(gradient or "")
+
+
+def _parses(color: str) -> bool:
+    """Whether parse_color supports a color."""
+    try:
+        parse_color(color)
+    except ValueError:
+        return False
+    return True
+
+
+def _candidate_pairs(colors: Mapping[str, Any]) -> List[Tuple[str, str, str, str]]:
+    """All foreground/background combinations of a theme, parseable or not."""
+    foregrounds = [
+        (f"{group}.{name}", value)
+        for group in CONTRAST_FOREGROUNDS
+        for name, value in (colors.get(group) or {}).items()
+        if isinstance(value, str)
+    ]
+    backgrounds = [
+        (f"background.{name}", (colors.get("background") or {}).get(name))
+        for name in CONTRAST_BACKGROUNDS
+    ]
+    backgrounds += [
+        (f"gradient[{index}]", stop) for index, stop in enumerate(gradient_stops(colors.get("gradient", "")))
+    ]
+    return [
+        (fg_role, fg, bg_role, bg)
+        for fg_role, fg in foregrounds
+        for bg_role, bg in backgrounds
+        if isinstance(bg, str) and (fg_role, bg_role) not in _CONTRAST_SKIPPED
+    ]
+
+
+def contrast_pairs(colors: Mapping[str, Any]) -> List[Tuple[str, str, str, str]]:
+    """
+    Foreground/background combinations of a theme to check for contrast.
+
+    Every text and semantic color is paired with the dark, light and glass
+    backgrounds and with each gradient stop, except on_dark/on_light text
+    with the background it is not meant for. Pairs with a color
+    parse_color does not support (named colors, hsl(), ...) are left out;
+    see unparsed_contrast_pairs.
+
+    Args:
+        colors: Theme color tokens
+
+    Returns:
+        (foreground role, foreground color, background role, background
+        color) tuples, e.g. ("text.on_dark", "#FFFFFF", "background.dark",
+        "#0A0E1A")
+    """
+    return [pair for pair in _candidate_pairs(colors) if _parses(pair[1]) and _parses(pair[3])]
+
+
+def unparsed_contrast_pairs(colors: Mapping[str, Any]) -> List[Tuple[str, str, str, str]]:
+    """
+    The pairs contrast_pairs leaves out because a color cannot be parsed.
+
+    Args:
+        colors: Theme color tokens
+
+    Returns:
+        Tuples in the contrast_pairs layout
+    """
+    return [pair for pair in _candidate_pairs(colors) if not (_parses(pair[1]) and _parses(pair[3]))]
+
+
+def _luminance_python(r: float, g: float, b: float) -> float:
+    """WCAG relative luminance of an sRGB color."""
+    return 0.2126 * _to_linear(r) + 0.7152 * _to_linear(g) + 0.0722 * _to_linear(b)
+
+
+def _contrast_python(foregrounds, backgrounds) -> List[float]:
+    """Contrast ratios one pair at a time."""
+    ratios = []
+    for fg, bg in zip(foregrounds, backgrounds):
+        worst = math.inf
+        # Translucent backgrounds: worst case over a black and a white backdrop
+        for backdrop in ((0.0, 1.0) if bg[3] < 1 else (0.0,)):
+            base = [c * bg[3] + backdrop * (1 - bg[3]) for c in bg[:3]]
+            top = [f * fg[3] + c * (1 - fg[3]) for f, c in zip(fg[:3], base)]
+            light, dark = sorted((_luminance_python(*top), _luminance_python(*base)), reverse=True)
+            worst = min(worst, (light + 0.05) / (dark + 0.05))
+        ratios.append(worst)
+    return ratios
+
+
+def _contrast_numpy(foregrounds, backgrounds) -> List[float]:
+    """Contrast ratios for all pairs in one vectorized pass."""
+    fg = np.asarray(foregrounds, dtype=float).reshape(-1, 4)
+    bg = np.asarray(backgrounds, dtype=float).reshape(-1, 4)
+    weights = np.array([0.2126, 0.7152, 0.0722])
+
+    def luminance(rgb):
+        linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+        return linear @ weights
+
+    worst = np.full(len(fg), np.inf)
+    for backdrop in (0.0, 1.0):
+        # Opaque backgrounds are unaffected by the backdrop
+        base = bg[:, :3] * bg[:, 3:] + backdrop * (1 - bg[:, 3:])
+        top = fg[:, :3] * fg[:, 3:] + base * (1 - fg[:, 3:])
+        top_luminance, base_luminance = luminance(top), luminance(base)
+        ratios = (np.maximum(top_luminance, base_luminance) + 0.05) / (np.minimum(top_luminance, base_luminance) + 0.05)
+        worst = np.minimum(worst, ratios)
+    return worst.tolist()
+
+
+def contrast_ratios(pairs: Sequence[Tuple[str, str]]) -> List[float]:
+    """
+    WCAG contrast ratios of (foreground, background) color pairs.
+
+    All pairs are computed together (vectorized with NumPy when
+    available). Translucent foregrounds are composited over their
+    background; translucent backgrounds count at their worst over black
+    or white.
+
+    Args:
+        pairs: (foreground, background) CSS colors
+
+    Returns:
+        Ratio per pair, from 1 to 21
+    """
+    if not pairs:
+        return []
+    foregrounds = [parse_color(fg) for fg, _ in pairs]
+    backgrounds = [parse_color(bg) for _, bg in pairs]
+    compute = _contrast_numpy if np is not None else _contrast_python
+    return compute(foregrounds, backgrounds)
+
+
+def contrast_level(ratio: float) -> str:
+    """WCAG level met by a contrast ratio: "AAA", "AA", "AA Large" or "Fail"."""
+    for level, threshold in CONTRAST_LEVELS:
+        if ratio >= threshold:
+            return level
+    return "Fail"
+
+
+def clear_cache() -> None:
+    """Drop cached conversions."""
+    _oklab_cache.clear()
+    parse_color.cache_clear()
@@ -0,0 +1,303 @@
+# chuk-mcp-remotion/src/chuk_mcp_remotion/themes/resolved.py
+"""
+Resolved themes - flattened, immutable theme snapshots.
+
+A theme's typography and motion entries are copies of token definitions
+(TYPOGRAPHY_TOKENS["font_families"]["display"], MOTION_TOKENS["spring_configs"]
+["smooth"], ...), and TokenManager's layered token store can override those
+definitions, a theme's colors and the font sizes of its resolution.
+Resolving a theme looks up the token each entry came from (recorded in the
+theme's "token_keys", or the token definition object the entry is), looks
+up the token's merged value, adds the font sizes for the theme's default
+resolution and freezes the result.
+
+ResolvedThemeCache computes each snapshot once and records the theme and
+tokens it was built from. Registering a theme or importing/clearing custom
+tokens invalidates exactly the snapshots depending on what changed.
+Snapshots are read-only; to_dict() gives a plain, JSON-serializable copy.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..tokens.token_manager import TokenManager
+
+from .youtube_themes import YOUTUBE_THEMES
+from ..tokens.typography import TYPOGRAPHY_TOKENS
+from ..tokens.motion import MOTION_TOKENS
+from ..tokens.token_store import deep_merge
+
+# A dependency or change: (source, category, key). Sources are "theme"
+# (category = theme key), "colors" (category = theme key), "typography" and
+# "motion" (token category and key). A change with key None covers the
+# whole category.
+Dependency = Tuple[str, str, Optional[str]]
+
+# Theme fields that are copies of token definitions: field -> token category
+TOKEN_REFERENCES = {
+    "typography": {
+        "primary_font": "font_families",
+        "body_font": "font_families",
+        "code_font": "font_families"
+    },
+    "motion": {
+        "default_spring": "spring_configs",
+        "default_easing": "easing_curves",
+        "default_duration": "durations"
+    }
+}
+
+DEFAULT_TOKENS: Dict[str, Dict[str, Any]] = {
+    "typography": TYPOGRAPHY_TOKENS,
+    "motion": MOTION_TOKENS
+}
+
+DEFAULT_RESOLUTION = "video_1080p"
+
+# Built-in theme used for unknown theme names
+FALLBACK_THEME = "tech"
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Inverse of freeze: plain dicts and lists."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
+class ResolvedTheme:
+    """Immutable snapshot of a theme with token references resolved."""
+    key: str
+    name: str
+    description: str
+    colors: Mapping[str, Any]
+    typography: Mapping[str, Any]
+    motion: Mapping[str, Any]
+    use_cases: Tuple[str, ...]
+    font_sizes: Mapping[str, Any]
+    dependencies: FrozenSet[Dependency] = field(default_factory=frozenset, compare=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain copy in theme dictionary layout, plus "font_sizes"."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "colors": thaw(self.colors),
+            "typography": thaw(self.typography),
+            "motion": thaw(self.motion),
+            "use_cases": list(self.use_cases),
+            "font_sizes": thaw(self.font_sizes)
+        }
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """SHA-256 of the resolved values (changes whenever they do)."""
+        return hashlib.sha256(json.dumps(self.to_dict(), sort_keys=True).encode()).hexdigest()
+
+
+def token_keys(data: Mapping[str, Any]) -> Dict[str, Dict[str, str]]:
+    """
+    Token each of a theme's token-backed fields was copied from.
+
+    Keys recorded in the theme's "token_keys" entry are used as given;
+    other fields refer to a token only when they are that token's
+    definition object (as in YOUTUBE_THEMES). Fields merely equal to a
+    token are not matched, since several tokens can share a definition.
+
+    Args:
+        data: Theme dictionary
+
+    Returns:
+        {"typography"/"motion": {field: token key}}
+    """
+    recorded = data.get("token_keys") or {}
+    keys: Dict[str, Dict[str, str]] = {}
+    for source, fields in TOKEN_REFERENCES.items():
+        section = data.get(source) or {}
+        for field_name, category in fields.items():
+            tokens = DEFAULT_TOKENS[source][category]
+            key = recorded.get(source, {}).get(field_name)
+            if key is None and field_name in section:
+                key = next((name for name, token in tokens.items() if token is section[field_name]), None)
+            if key in tokens:
+                keys.setdefault(source, {})[field_name] = key
+    return keys
+
+
+def _resolve_references(
+    source: str,
+    values: Mapping[str, Any],
+    keys: Mapping[str, str],
+    token_manager: Optional["TokenManager"],
+    dependencies: set
+) -> Dict[str, Any]:
+    """Resolve a theme section's token references to their merged values."""
+    resolved = dict(values)
+    for field_name, category in TOKEN_REFERENCES[source].items():
+        key = keys.get(field_name)
+        if field_name not in values or key is None:
+            # Not a token definition (e.g. set directly on a custom theme)
+            continue
+        dependencies.add((source, category, key))
+        if token_manager is not None:
+            path = f"{source}.{category}.{key}"
+            resolved[field_name] = token_manager.tokens.get(path, values[field_name])
+    return resolved
+
+
+def resolve(theme_key: str, theme: Any, token_manager: Optional["TokenManager"] = None) -> ResolvedTheme:
+    """
+    Resolve a theme into an immutable snapshot.
+
+    Args:
+        theme_key: Key the theme is registered under
+        theme: Theme object or theme dictionary
+        token_manager: Source of custom tokens (optional)
+
+    Returns:
+        ResolvedTheme, with the dependencies it was built from
+    """
+    data = theme.to_dict() if hasattr(theme, "to_dict") else theme
+    dependencies = {("theme", theme_key, None), ("colors", theme_key, None)}
+
+    colors = dict(data["colors"])
+    if token_manager is not None:
+        colors = deep_merge(colors, token_manager.tokens.overrides("colors", theme_key))
+
+    keys = token_keys(data)
+    typography = _resolve_references(
+        "typography", data["typography"], keys.get("typography", {}), token_manager, dependencies
+    )
+    motion = _resolve_references("motion", data["motion"], keys.get("motion", {}), token_manager, dependencies)
+
+    resolution = typography.get("default_resolution", DEFAULT_RESOLUTION)
+    dependencies.add(("typography", "font_sizes", resolution))
+    font_sizes = None
+    if token_manager is not None:
+        font_sizes = token_manager.tokens.get(f"typography.font_sizes.{resolution}")
+    if font_sizes is None:
+        default_sizes = DEFAULT_TOKENS["typography"]["font_sizes"]
+        font_sizes = default_sizes.get(resolution, default_sizes[DEFAULT_RESOLUTION])
+
+    return ResolvedTheme(
+        key=theme_key,
+        name=data["name"],
+        description=data["description"],
+        colors=freeze(colors),
+        typography=freeze(typography),
+        motion=freeze(motion),
+        use_cases=freeze(data.get("use_cases", [])),
+        font_sizes=freeze(font_sizes),
+        dependencies=frozenset(dependencies)
+    )
+
+
+def _affects(change: Dependency, dependency: Dependency) -> bool:
+    """Whether a change touches a dependency."""
+    return change[:2] == dependency[:2] and (change[2] is None or change[2] == dependency[2])
+
+
+class ResolvedThemeCache:
+    """
+    Resolved snapshots of a set of themes, computed on first use.
+
+    Themes are read from the given mapping (theme key -> Theme or theme
+    dictionary), which the owner keeps up to date and reports changes to
+    with invalidate(). Custom token changes are picked up from the token
+    manager's change notifications.
+    """
+
+    def __init__(self, themes: Mapping[str, Any], token_manager: Optional["TokenManager"] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            themes: Registered themes by key
+            token_manager: Source of custom tokens (optional)
+        """
+        self.themes = themes
+        self.token_manager = token_manager
+        self._snapshots: Dict[str, ResolvedTheme] = {}
+        if token_manager is not None:
+            token_manager.add_change_listener(self.invalidate)
+
+    def get(self, theme_key: str) -> Optional[ResolvedTheme]:
+        """
+        Get a theme's snapshot, resolving it if needed.
+
+        Args:
+            theme_key: Theme identifier
+
+        Returns:
+            ResolvedTheme or None if the theme is not registered
+        """
+        snapshot = self._snapshots.get(theme_key)
+        if snapshot is None:
+            theme = self.themes.get(theme_key)
+            if theme is None:
+                return None
+            snapshot = resolve(theme_key, theme, self.token_manager)
+            self._snapshots[theme_key] = snapshot
+        return snapshot
+
+    def invalidate(self, changes: Iterable[Dependency]) -> None:
+        """
+        Drop the snapshots depending on any of the changes.
+
+        Args:
+            changes: Changed dependencies, e.g. ("theme", "tech", None) or
+                ("motion", "spring_configs", "smooth")
+        """
+        changes = list(changes)
+        stale = [
+            key for key, snapshot in self._snapshots.items()
+            if any(_affects(change, dependency) for change in changes for dependency in snapshot.dependencies)
+        ]
+        for key in stale:
+            del self._snapshots[key]
+
+    def clear(self) -> None:
+        """Drop all snapshots."""
+        self._snapshots.clear()
+
+
+_builtin_cache = ResolvedThemeCache(YOUTUBE_THEMES)
+
+
+def builtin_theme(theme_key: str, fallback: Optional[str] = FALLBACK_THEME) -> ResolvedTheme:
+    """
+    Resolved built-in theme without custom tokens.
+
+    Args:
+        theme_key: Theme name
+        fallback: Built-in theme used when theme_key is unknown (None to raise)
+
+    Returns:
+        ResolvedTheme
+
+    Raises:
+        KeyError: If neither theme_key nor fallback is a built-in theme
+    """
+    snapshot = _builtin_cache.get(theme_key)
+    if snapshot is None and fallback is not None:
+        snapshot = _builtin_cache.get(fallback)
+    if snapshot is None:
+        raise KeyError(f"Unknown theme '{theme_key}'")
+    return snapshot
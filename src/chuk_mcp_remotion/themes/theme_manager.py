@@ -9,6 +9,7 @@ The theme system provides:
 - Theme discovery and comparison
 - Theme validation
 - Export/import for sharing
+- Resolved (token-merged, immutable) theme snapshots
 """
 
 from typing import Dict, Any, Optional, List, TYPE_CHECKING
@@ -17,11 +18,67 @@ from pathlib import Path
 
 if TYPE_CHECKING:
     from chuk_virtual_fs import AsyncVirtualFileSystem
+    from ..tokens.token_manager import TokenManager
 
 from .youtube_themes import YOUTUBE_THEMES
-from ..tokens.colors import COLOR_TOKENS
-from ..tokens.typography import TYPOGRAPHY_TOKENS
-from ..tokens.motion import MOTION_TOKENS
+from ..utils.async_batch import DEFAULT_CONCURRENCY, gather_bounded, join_path
+from .resolved import TOKEN_REFERENCES, ResolvedTheme, ResolvedThemeCache, token_keys
+from .color_engine import (
+    contrast_level,
+    contrast_pairs,
+    contrast_ratios,
+    generate_palette,
+    palette_distances,
+    unparsed_contrast_pairs
+)
+from ..registry.validators import compile_schema
+
+_STRING = {"type": "string"}
+_OBJECT = {"type": "object", "required": True}
+
+# Theme structure in the registry schema format; missing nested tokens are
+# reported as "Missing <label>: <key>"
+THEME_SCHEMA = {
+    "name": {"type": "string", "required": True},
+    "description": {"type": "string", "required": True},
+    "colors": {
+        "type": "object",
+        "required": True,
+        "label": "color token",
+        "schema": {
+            "primary": {"type": "array", "required": True, "items": _STRING},
+            "accent": {"type": "array", "required": True, "items": _STRING},
+            "gradient": _STRING,
+            "background": _OBJECT,
+            "text": _OBJECT,
+            "semantic": _OBJECT
+        }
+    },
+    "typography": {
+        "type": "object",
+        "required": True,
+        "label": "typography token",
+        "schema": {
+            "primary_font": _OBJECT,
+            "body_font": _OBJECT,
+            "code_font": {"type": "object"},
+            "default_resolution": _STRING
+        }
+    },
+    "motion": {
+        "type": "object",
+        "required": True,
+        "label": "motion token",
+        "schema": {
+            "default_spring": _OBJECT,
+            "default_easing": _OBJECT,
+            "default_duration": _OBJECT
+        }
+    },
+    "use_cases": {"type": "array", "items": _STRING}
+}
+
+_validate_theme_data = compile_schema(THEME_SCHEMA, "required key")
 
 
 class Theme:
@@ -39,7 +96,8 @@ class Theme:
         colors: Dict[str, Any],
         typography: Dict[str, Any],
         motion: Dict[str, Any],
-        use_cases: Optional[List[str]] = None
+        use_cases: Optional[List[str]] = None,
+        token_keys: Optional[Dict[str, Dict[str, str]]] = None
     ):
         """
         Initialize a theme.
@@ -51,6 +109,9 @@ class Theme:
             typography: Typography token dictionary
             motion: Motion design token dictionary
             use_cases: List of recommended use cases
+            token_keys: Token each typography/motion field was copied from,
+                e.g. {"motion": {"default_spring": "smooth"}}, so token
+                overrides reach the theme
         """
         self.name = name
         self.description = description
@@ -58,10 +119,11 @@ class Theme:
         self.typography = typography
         self.motion = motion
         self.use_cases = use_cases or []
+        self.token_keys = token_keys or {}
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert theme to dictionary."""
-        return {
+        data = {
             "name": self.name,
             "description": self.description,
             "colors": self.colors,
@@ -69,6 +131,11 @@ class Theme:
             "motion": self.motion,
             "use_cases": self.use_cases
         }
+        # Record token references so they survive export and import
+        keys = token_keys({**data, "token_keys": self.token_keys})
+        if keys:
+            data["token_keys"] = keys
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Theme":
@@ -79,7 +146,8 @@ class Theme:
             colors=data["colors"],
             typography=data["typography"],
             motion=data["motion"],
-            use_cases=data.get("use_cases", [])
+            use_cases=data.get("use_cases", []),
+            token_keys=data.get("token_keys")
         )
 
 
@@ -89,16 +157,21 @@ class ThemeManager:
     Provides theme registration, selection, discovery, and application.
     """
 
-    def __init__(self, vfs: "AsyncVirtualFileSystem"):
+    def __init__(self, vfs: "AsyncVirtualFileSystem", token_manager: Optional["TokenManager"] = None):
         """
         Initialize theme manager with built-in themes.
 
         Args:
             vfs: Virtual filesystem for file operations
+            token_manager: Custom tokens merged into resolved themes (optional)
         """
         self.vfs = vfs
+        self.token_manager = token_manager
         self.themes: Dict[str, Theme] = {}
         self.current_theme: Optional[str] = None
+        self.resolved = ResolvedThemeCache(self.themes, token_manager)
+        # Contrast audit pairs and unparsed pairs by resolved theme fingerprint
+        self._contrast_cache: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
         self._register_builtin_themes()
 
     def _register_builtin_themes(self):
@@ -118,11 +191,16 @@ class ThemeManager:
         """
         Register a custom theme.
 
+        Replaces any theme registered under the same key. Themes are
+        treated as immutable once registered: register a new Theme object
+        instead of editing one in place, so its resolved snapshot is rebuilt.
+
         Args:
             theme_key: Unique identifier for the theme
             theme: Theme object to register
         """
         self.themes[theme_key] = theme
+        self.resolved.invalidate([("theme", theme_key, None)])
 
     def list_themes(self) -> List[str]:
         """
@@ -145,6 +223,22 @@ class ThemeManager:
         """
         return self.themes.get(theme_key)
 
+    def resolve_theme(self, theme_key: str) -> Optional[ResolvedTheme]:
+        """
+        Get a theme's resolved snapshot.
+
+        Token references are resolved and custom tokens from the token
+        manager merged in. Snapshots are cached until the theme or a token
+        they use changes.
+
+        Args:
+            theme_key: Theme identifier
+
+        Returns:
+            ResolvedTheme or None if not found
+        """
+        return self.resolved.get(theme_key)
+
     def get_theme_info(self, theme_key: str) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about a theme.
@@ -155,33 +249,35 @@ class ThemeManager:
         Returns:
             Dictionary with theme information or None
         """
-        theme = self.get_theme(theme_key)
-        if not theme:
+        resolved = self.resolve_theme(theme_key)
+        if not resolved:
             return None
 
+        theme = resolved.to_dict()
+        colors, typography, motion = theme["colors"], theme["typography"], theme["motion"]
         return {
-            "name": theme.name,
-            "description": theme.description,
+            "name": theme["name"],
+            "description": theme["description"],
             "colors": {
-                "primary": theme.colors.get("primary", []),
-                "accent": theme.colors.get("accent", []),
-                "gradient": theme.colors.get("gradient", ""),
-                "background": theme.colors.get("background", {}),
-                "text": theme.colors.get("text", {}),
-                "semantic": theme.colors.get("semantic", {})
+                "primary": colors.get("primary", []),
+                "accent": colors.get("accent", []),
+                "gradient": colors.get("gradient", ""),
+                "background": colors.get("background", {}),
+                "text": colors.get("text", {}),
+                "semantic": colors.get("semantic", {})
             },
             "typography": {
-                "primary_font": theme.typography.get("primary_font", {}),
-                "body_font": theme.typography.get("body_font", {}),
-                "code_font": theme.typography.get("code_font", {}),
-                "default_resolution": theme.typography.get("default_resolution", "video_1080p")
+                "primary_font": typography.get("primary_font", {}),
+                "body_font": typography.get("body_font", {}),
+                "code_font": typography.get("code_font", {}),
+                "default_resolution": typography.get("default_resolution", "video_1080p")
             },
             "motion": {
-                "default_spring": theme.motion.get("default_spring", {}),
-                "default_easing": theme.motion.get("default_easing", {}),
-                "default_duration": theme.motion.get("default_duration", {})
+                "default_spring": motion.get("default_spring", {}),
+                "default_easing": motion.get("default_easing", {}),
+                "default_duration": motion.get("default_duration", {})
             },
-            "use_cases": theme.use_cases
+            "use_cases": theme["use_cases"]
         }
 
     def set_current_theme(self, theme_key: str) -> bool:
@@ -219,36 +315,139 @@ class ThemeManager:
         Returns:
             Dictionary with comparison data
         """
-        theme1 = self.get_theme(theme_key1)
-        theme2 = self.get_theme(theme_key2)
+        resolved1 = self.resolve_theme(theme_key1)
+        resolved2 = self.resolve_theme(theme_key2)
 
-        if not theme1 or not theme2:
+        if not resolved1 or not resolved2:
             return {"error": "One or both themes not found"}
 
+        theme1, theme2 = resolved1.to_dict(), resolved2.to_dict()
         return {
             "themes": [theme_key1, theme_key2],
             "comparison": {
-                "names": [theme1.name, theme2.name],
-                "descriptions": [theme1.description, theme2.description],
+                "names": [theme1["name"], theme2["name"]],
+                "descriptions": [theme1["description"], theme2["description"]],
                 "primary_colors": [
-                    theme1.colors.get("primary", []),
-                    theme2.colors.get("primary", [])
+                    theme1["colors"].get("primary", []),
+                    theme2["colors"].get("primary", [])
                 ],
                 "accent_colors": [
-                    theme1.colors.get("accent", []),
-                    theme2.colors.get("accent", [])
+                    theme1["colors"].get("accent", []),
+                    theme2["colors"].get("accent", [])
                 ],
+                "palette_distance": round(palette_distances(theme1["colors"], [theme2["colors"]])[0], 4),
                 "motion_feel": [
-                    theme1.motion.get("default_spring", {}).get("name", "Unknown"),
-                    theme2.motion.get("default_spring", {}).get("name", "Unknown")
+                    theme1["motion"].get("default_spring", {}).get("name", "Unknown"),
+                    theme2["motion"].get("default_spring", {}).get("name", "Unknown")
                 ],
                 "use_cases": [
-                    theme1.use_cases,
-                    theme2.use_cases
+                    theme1["use_cases"],
+                    theme2["use_cases"]
                 ]
             }
         }
 
+    def find_similar_themes(self, theme_key: str, limit: int = 3) -> List[Dict[str, Any]]:
+        """
+        Find the themes whose palettes look most like a theme's.
+
+        Palettes are compared perceptually (mean OKLab distance between
+        the primary, accent and background colors of both themes).
+
+        Args:
+            theme_key: Theme identifier
+            limit: Maximum number of themes to return
+
+        Returns:
+            Themes ordered by ascending "distance", each with "key", "name"
+            and "distance" (empty if the theme is not found)
+        """
+        resolved = self.resolve_theme(theme_key)
+        if not resolved:
+            return []
+
+        others = [
+            theme for theme in (self.resolve_theme(key) for key in self.themes if key != theme_key)
+            if theme is not None
+        ]
+        distances = palette_distances(resolved.colors, [theme.colors for theme in others])
+        ranked = sorted(zip(distances, (theme.key for theme in others), (theme.name for theme in others)))
+        return [
+            {"key": key, "name": name, "distance": round(distance, 4)}
+            for distance, key, name in ranked[:max(0, limit)]
+        ]
+
+    def audit_theme_contrast(
+        self,
+        theme_keys: Optional[List[str]] = None,
+        min_ratio: float = 4.5
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Check text-on-background contrast for every token pair of themes.
+
+        Every text and semantic color is checked against the dark, light
+        and glass backgrounds and each gradient stop (see
+        color_engine.contrast_pairs). Pairs of all themes not audited yet
+        are computed in one batch, and results are cached per theme
+        version, so only new or changed themes are recomputed.
+
+        Args:
+            theme_keys: Themes to audit (default: all registered themes;
+                unknown keys are skipped)
+            min_ratio: Ratio below which a pair is reported as a failure
+                (4.5 = WCAG AA for body text)
+
+        Returns:
+            Per theme key: "version", "pairs" (foreground, background,
+            colors, "ratio" and WCAG "level"), "failures" (pairs below
+            min_ratio), "unparsed" (pairs with a color that is not hex or
+            rgb()/rgba(), so not checked), "passed" and "total"
+        """
+        resolved = [
+            theme for theme in (self.resolve_theme(key) for key in (theme_keys or self.list_themes()))
+            if theme is not None
+        ]
+
+        pending = {
+            theme.fingerprint: theme.colors for theme in resolved if theme.fingerprint not in self._contrast_cache
+        }
+        if pending:
+            theme_pairs = {version: contrast_pairs(colors) for version, colors in pending.items()}
+            ratios = iter(contrast_ratios([
+                (fg, bg) for pairs in theme_pairs.values() for _, fg, _, bg in pairs
+            ]))
+            for version, pairs in theme_pairs.items():
+                self._contrast_cache[version] = {
+                    "pairs": [
+                        {
+                            "foreground": fg_role,
+                            "background": bg_role,
+                            "colors": [fg, bg],
+                            "ratio": round(ratio, 2),
+                            "level": contrast_level(ratio)
+                        }
+                        for (fg_role, fg, bg_role, bg), ratio in zip(pairs, ratios)
+                    ],
+                    "unparsed": [
+                        {"foreground": fg_role, "background": bg_role, "colors": [fg, bg]}
+                        for fg_role, fg, bg_role, bg in unparsed_contrast_pairs(pending[version])
+                    ]
+                }
+
+        report = {}
+        for theme in resolved:
+            audit = self._contrast_cache[theme.fingerprint]
+            failures = [pair for pair in audit["pairs"] if pair["ratio"] < min_ratio]
+            report[theme.key] = {
+                "version": theme.fingerprint[:12],
+                "pairs": audit["pairs"],
+                "failures": failures,
+                "unparsed": audit["unparsed"],
+                "passed": len(audit["pairs"]) - len(failures),
+                "total": len(audit["pairs"])
+            }
+        return report
+
     def search_themes(self, query: str) -> List[str]:
         """
         Search themes by name, description, or use case.
@@ -297,45 +496,18 @@ class ThemeManager:
         """
         Validate theme data structure.
 
+        Checks required keys and tokens and the types of known fields
+        against THEME_SCHEMA, collecting every problem.
+
         Args:
             theme_data: Theme dictionary to validate
 
         Returns:
             Dictionary with validation results
         """
-        required_keys = ["name", "description", "colors", "typography", "motion"]
-        missing_keys = [key for key in required_keys if key not in theme_data]
-
-        if missing_keys:
-            return {
-                "valid": False,
-                "errors": [f"Missing required key: {key}" for key in missing_keys]
-            }
-
-        errors = []
-
-        # Validate colors
-        required_color_keys = ["primary", "accent", "background", "text", "semantic"]
-        for key in required_color_keys:
-            if key not in theme_data["colors"]:
-                errors.append(f"Missing color token: {key}")
-
-        # Validate typography
-        required_typo_keys = ["primary_font", "body_font"]
-        for key in required_typo_keys:
-            if key not in theme_data["typography"]:
-                errors.append(f"Missing typography token: {key}")
-
-        # Validate motion
-        required_motion_keys = ["default_spring", "default_easing", "default_duration"]
-        for key in required_motion_keys:
-            if key not in theme_data["motion"]:
-                errors.append(f"Missing motion token: {key}")
-
-        if errors:
-            return {"valid": False, "errors": errors}
-
-        return {"valid": True, "errors": []}
+        errors: List[str] = []
+        _validate_theme_data(theme_data, "", errors, [])
+        return {"valid": not errors, "errors": errors}
 
     async def export_theme(self, theme_key: str, file_path: Optional[str] = None) -> str:
         """
@@ -394,6 +566,122 @@ class ThemeManager:
         except Exception as e:
             return f"Error importing theme: {str(e)}"
 
+    async def export_themes(
+        self,
+        directory: str,
+        theme_keys: Optional[List[str]] = None,
+        concurrency: int = DEFAULT_CONCURRENCY
+    ) -> Dict[str, Any]:
+        """
+        Export themes to a directory, writing files concurrently.
+
+        Each theme is written to <directory>/<theme_key>_theme.json (the
+        export_theme default name), at most `concurrency` writes at a time.
+
+        Args:
+            directory: Output directory (created if missing)
+            theme_keys: Themes to export (default: all registered themes)
+            concurrency: Maximum number of files written at once
+
+        Returns:
+            Dictionary with "directory", "exported" ({theme_key: path}) and
+            "failed" ({theme_key: error}); failures do not stop the batch
+        """
+        try:
+            await self.vfs.mkdir(directory)
+        except Exception:
+            # Directory may already exist, which is fine
+            pass
+
+        keys = theme_keys if theme_keys is not None else self.list_themes()
+
+        async def write(theme_key: str) -> str:
+            theme = self.get_theme(theme_key)
+            if not theme:
+                raise ValueError(f"Theme '{theme_key}' not found")
+            path = join_path(directory, f"{theme_key}_theme.json")
+            if await self.vfs.write_file(path, json.dumps(theme.to_dict(), indent=2)) is False:
+                raise IOError(f"Could not write {path}")
+            return path
+
+        results = await gather_bounded(keys, write, concurrency)
+
+        report: Dict[str, Any] = {"directory": directory, "exported": {}, "failed": {}}
+        for theme_key, result in zip(keys, results):
+            if isinstance(result, Exception):
+                report["failed"][theme_key] = str(result)
+            else:
+                report["exported"][theme_key] = result
+        return report
+
+    async def import_themes(
+        self,
+        directory: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        all_or_nothing: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Import every theme JSON file in a directory.
+
+        Files are read concurrently (at most `concurrency` at a time), then
+        validated together. Valid themes are registered in one step once all
+        files have been read, so the registry never holds a partial batch
+        while reads are in flight; each theme's key is derived from its name
+        as in import_theme. A key claimed by two files keeps the first file
+        (in name order) and reports the other.
+
+        Args:
+            directory: Directory holding *.json theme files
+            concurrency: Maximum number of files read at once
+            all_or_nothing: Register nothing if any file fails
+
+        Returns:
+            Dictionary with "directory", "imported" ({file: theme_key}) and
+            "failed" ({file: error}); failures do not stop the batch
+        """
+        try:
+            names = sorted(name for name in await self.vfs.ls(directory) if name.endswith(".json"))
+        except Exception as e:
+            return {"directory": directory, "imported": {}, "failed": {directory: f"Error listing directory: {e}"}}
+
+        async def read(name: str) -> Dict[str, Any]:
+            content = await self.vfs.read_text(join_path(directory, name))
+            if content is None:
+                raise FileNotFoundError(f"Could not read {name}")
+            return json.loads(content)
+
+        results = await gather_bounded(names, read, concurrency)
+
+        report: Dict[str, Any] = {"directory": directory, "imported": {}, "failed": {}}
+        batch: Dict[str, Theme] = {}
+        for name, data in zip(names, results):
+            if isinstance(data, Exception):
+                report["failed"][name] = f"Error importing theme: {data}"
+                continue
+            if not isinstance(data, dict):
+                report["failed"][name] = "Error: Invalid theme - expected a JSON object"
+                continue
+            validation = self.validate_theme(data)
+            if not validation["valid"]:
+                report["failed"][name] = f"Error: Invalid theme - {', '.join(validation['errors'])}"
+                continue
+            theme = Theme.from_dict(data)
+            key = theme.name.lower().replace(" ", "_")
+            if key in batch:
+                report["failed"][name] = f"Error: Theme key '{key}' already imported from another file"
+                continue
+            batch[key] = theme
+            report["imported"][name] = key
+
+        if all_or_nothing and report["failed"]:
+            report["imported"] = {}
+            return report
+
+        # Register the whole batch at once
+        self.themes.update(batch)
+        self.resolved.invalidate([("theme", key, None) for key in batch])
+        return report
+
     def create_custom_theme(
         self,
         name: str,
@@ -401,7 +689,8 @@ class ThemeManager:
         base_theme: Optional[str] = None,
         color_overrides: Optional[Dict[str, Any]] = None,
         typography_overrides: Optional[Dict[str, Any]] = None,
-        motion_overrides: Optional[Dict[str, Any]] = None
+        motion_overrides: Optional[Dict[str, Any]] = None,
+        seed_color: Optional[str] = None
     ) -> str:
         """
         Create a custom theme, optionally based on an existing theme.
@@ -413,6 +702,8 @@ class ThemeManager:
             color_overrides: Color tokens to override
             typography_overrides: Typography tokens to override
             motion_overrides: Motion tokens to override
+            seed_color: Generate the primary and accent scales (and the
+                gradient) from this color; color_overrides still win
 
         Returns:
             Theme key of created theme or error message
@@ -423,12 +714,19 @@ class ThemeManager:
             colors = base.colors.copy()
             typography = base.typography.copy()
             motion = base.motion.copy()
+            base_keys = base.to_dict().get("token_keys", {})
         else:
+            base_keys = {}
             colors = {"primary": [], "accent": [], "background": {}, "text": {}, "semantic": {}}
             typography = {"primary_font": {}, "body_font": {}, "default_resolution": "video_1080p"}
             motion = {"default_spring": {}, "default_easing": {}, "default_duration": {}}
 
         # Apply overrides
+        if seed_color:
+            try:
+                colors.update(generate_palette(seed_color))
+            except ValueError as e:
+                return f"Error: {e}"
         if color_overrides:
             colors.update(color_overrides)
         if typography_overrides:
@@ -436,13 +734,24 @@ class ThemeManager:
         if motion_overrides:
             motion.update(motion_overrides)
 
+        # Keep the base theme's token references for fields not overridden
+        overridden = {"typography": typography_overrides or {}, "motion": motion_overrides or {}}
+        keys = {
+            source: {
+                field_name: key for field_name, key in base_keys.get(source, {}).items()
+                if field_name not in overridden[source]
+            }
+            for source in TOKEN_REFERENCES
+        }
+
         # Create theme
         theme = Theme(
             name=name,
             description=description,
             colors=colors,
             typography=typography,
-            motion=motion
+            motion=motion,
+            token_keys=keys
         )
 
         # Validate
@@ -0,0 +1,183 @@
+# chuk-mcp-remotion/src/chuk_mcp_remotion/tokens/exporters.py
+"""
+Token exporters for front-end pipelines.
+
+Render merged token trees as:
+- css: CSS custom properties on :root (--colors-tech-primary-0: #0066FF;)
+- ts: a typed TypeScript module (export const colors = {...} as const)
+- style-dictionary: Style Dictionary source JSON ({"value": ..., "comment": ...})
+
+CSS and Style Dictionary output share one list of token entries per token
+type: nested keys become the token path, font lists become font stacks,
+easing curves become cubic-bezier() and other lists are numbered.
+Descriptive keys (description, usage, tips, name) are not tokens; the
+description becomes the Style Dictionary comment. The TypeScript module
+keeps the full tree.
+"""
+
+import json
+import re
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# Keys describing a token rather than holding a value
+META_KEYS = frozenset({"description", "usage", "tips", "name"})
+
+# CSS generic font families (never quoted)
+GENERIC_FONTS = frozenset({
+    "serif", "sans-serif", "monospace", "cursive", "fantasy", "system-ui",
+    "ui-serif", "ui-sans-serif", "ui-monospace", "ui-rounded", "emoji", "math"
+})
+
+TS_NAMES = {
+    "typography": ("typography", "TypographyTokens"),
+    "colors": ("colors", "ColorTokens"),
+    "motion": ("motion", "MotionTokens")
+}
+
+# (path, value, description)
+TokenEntry = Tuple[Tuple[str, ...], Any, Optional[str]]
+
+
+def _font_stack(fonts: Iterable[str]) -> str:
+    return ", ".join(font if font in GENERIC_FONTS else f'"{font}"' for font in fonts)
+
+
+def _number(value: float) -> str:
+    return f"{value:g}"
+
+
+def token_entries(
+    tree: Mapping[str, Any],
+    path: Tuple[str, ...] = (),
+    description: Optional[str] = None
+) -> List[TokenEntry]:
+    """
+    Flatten a token tree into (path, value, description) entries.
+
+    Values are strings, numbers or booleans; nested dicts and lists are
+    expanded into further path segments. Each entry carries the nearest
+    enclosing description.
+    """
+    entries: List[TokenEntry] = []
+    if isinstance(tree.get("description"), str):
+        description = tree["description"]
+    for key, value in tree.items():
+        if key in META_KEYS:
+            continue
+        key_path = path + (str(key),)
+        if isinstance(value, Mapping):
+            entries.extend(token_entries(value, key_path, description))
+        elif isinstance(value, (list, tuple)):
+            if key == "fonts" and all(isinstance(font, str) for font in value):
+                entries.append((key_path, _font_stack(value), description))
+            elif key == "curve" and len(value) == 4:
+                curve = ", ".join(_number(point) for point in value)
+                entries.append((key_path, f"cubic-bezier({curve})", description))
+            else:
+                entries.extend(token_entries(dict(enumerate(value)), key_path, description))
+        elif value is not None:
+            entries.append((key_path, value, description))
+    return entries
+
+
+def css_name(path: Iterable[str]) -> str:
+    """Custom property name for a token path (camelCase and snake_case to kebab-case)."""
+    parts = (re.sub(r"(?<=[a-z0-9])([A-Z])", r"-\1", part) for part in path)
+    return "--" + "-".join(part.lower().replace("_", "-") for part in parts)
+
+
+def _css_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return _number(value)
+    return str(value)
+
+
+def to_css(
+    token_type: str,
+    tree: Mapping[str, Any],
+    entries: Optional[List[TokenEntry]] = None
+) -> str:
+    """Render tokens as CSS custom properties on :root."""
+    entries = token_entries(tree) if entries is None else entries
+    lines = [f"/* {token_type} tokens - generated, do not edit */", ":root {"]
+    lines.extend(
+        f"  {css_name((token_type,) + path)}: {_css_value(value)};"
+        for path, value, _ in entries
+    )
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def to_typescript(
+    token_type: str,
+    tree: Mapping[str, Any],
+    entries: Optional[List[TokenEntry]] = None
+) -> str:
+    """Render tokens as a TypeScript module with a readonly, typed constant."""
+    const_name, type_name = TS_NAMES.get(token_type, (token_type, f"{token_type.title()}Tokens"))
+    return (
+        f"// {token_type} tokens - generated, do not edit\n"
+        f"export const {const_name} = {json.dumps(tree, indent=2)} as const;\n"
+        f"\n"
+        f"export type {type_name} = typeof {const_name};\n"
+    )
+
+
+def to_style_dictionary(
+    token_type: str,
+    tree: Mapping[str, Any],
+    entries: Optional[List[TokenEntry]] = None
+) -> str:
+    """Render tokens as Style Dictionary source JSON."""
+    entries = token_entries(tree) if entries is None else entries
+    root: Dict[str, Any] = {}
+    for path, value, description in entries:
+        node = root.setdefault(token_type, {})
+        for part in path[:-1]:
+            node = node.setdefault(part, {})
+        token: Dict[str, Any] = {"value": value}
+        if description:
+            token["comment"] = description
+        node[path[-1]] = token
+    return json.dumps(root, indent=2) + "\n"
+
+
+# Format -> (file suffix, renderer)
+EXPORT_FORMATS: Dict[str, Tuple[str, Callable[..., str]]] = {
+    "css": (".css", to_css),
+    "ts": (".ts", to_typescript),
+    "style-dictionary": (".tokens.json", to_style_dictionary)
+}
+
+
+def render_token_files(
+    snapshot: Mapping[str, Mapping[str, Any]],
+    formats: Iterable[str]
+) -> Dict[str, str]:
+    """
+    Render every requested format for every token type in a snapshot.
+
+    Args:
+        snapshot: Merged token trees by token type
+        formats: Keys of EXPORT_FORMATS
+
+    Returns:
+        File name -> content, e.g. {"colors.css": ..., "colors.ts": ...}
+    """
+    formats = list(formats)
+    unknown = [name for name in formats if name not in EXPORT_FORMATS]
+    if unknown:
+        raise ValueError(
+            f"Unknown export format(s): {', '.join(unknown)} "
+            f"(available: {', '.join(EXPORT_FORMATS)})"
+        )
+
+    files: Dict[str, str] = {}
+    for token_type, tree in snapshot.items():
+        entries = token_entries(tree)
+        for name in formats:
+            suffix, render = EXPORT_FORMATS[name]
+            files[f"{token_type}{suffix}"] = render(token_type, tree, entries)
+    return files
@@ -6,11 +6,15 @@ Provides import/export and customization for:
 - Typography tokens (font families, sizes, weights, styles)
 - Color tokens (palettes, themes)
 - Motion tokens (springs, easings, durations, presets)
+
+Custom tokens are layered over the defaults in a TokenStore: imported
+token sets, then the active project's overrides.
 """
 
+import hashlib
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional, List, TYPE_CHECKING
+from typing import Callable, Dict, Any, Optional, List, Set, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from chuk_virtual_fs import AsyncVirtualFileSystem
@@ -18,6 +22,12 @@ if TYPE_CHECKING:
 from .colors import COLOR_TOKENS
 from .typography import TYPOGRAPHY_TOKENS
 from .motion import MOTION_TOKENS
+from .token_store import TokenChange, TokenStore, deep_merge
+from .exporters import EXPORT_FORMATS, render_token_files
+from ..utils.async_batch import DEFAULT_CONCURRENCY, gather_bounded, join_path
+
+# Content hashes of the files written by export_token_formats
+EXPORT_MANIFEST = ".tokens-manifest.json"
 
 
 class TokenManager:
@@ -35,9 +45,113 @@ class TokenManager:
             vfs: Virtual filesystem for file operations
         """
         self.vfs = vfs
-        self.custom_typography_tokens = {}
-        self.custom_color_tokens = {}
-        self.custom_motion_tokens = {}
+        self.tokens = TokenStore()
+        # Per-project overrides: project -> token type -> tokens
+        self.project_tokens: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.active_project: Optional[str] = None
+        self._change_listeners: List[Callable[[Set[TokenChange]], None]] = []
+
+    # Imported token sets (the "imported" layer of the store)
+
+    @property
+    def custom_typography_tokens(self) -> Dict[str, Any]:
+        """Imported typography tokens; assigning replaces them."""
+        return self.tokens.layers["imported"]["typography"]
+
+    @custom_typography_tokens.setter
+    def custom_typography_tokens(self, tokens: Dict[str, Any]) -> None:
+        self._set_custom_tokens("typography", tokens)
+
+    @property
+    def custom_color_tokens(self) -> Dict[str, Any]:
+        """Imported color tokens; assigning replaces them."""
+        return self.tokens.layers["imported"]["colors"]
+
+    @custom_color_tokens.setter
+    def custom_color_tokens(self, tokens: Dict[str, Any]) -> None:
+        self._set_custom_tokens("colors", tokens)
+
+    @property
+    def custom_motion_tokens(self) -> Dict[str, Any]:
+        """Imported motion tokens; assigning replaces them."""
+        return self.tokens.layers["imported"]["motion"]
+
+    @custom_motion_tokens.setter
+    def custom_motion_tokens(self, tokens: Dict[str, Any]) -> None:
+        self._set_custom_tokens("motion", tokens)
+
+    def add_change_listener(self, listener: Callable[[Set[TokenChange]], None]) -> None:
+        """
+        Call a function whenever merged token values change.
+
+        Values change when tokens are imported or cleared, when project
+        overrides are set and when another project is activated.
+
+        The listener receives the set of changed tokens as (token type,
+        category, key) tuples: ("colors", theme_name, None) for a theme's
+        color tokens, ("typography"/"motion", category, key) for a single
+        token and key None when a whole category was replaced.
+
+        Args:
+            listener: Function taking the set of changes
+        """
+        self._change_listeners.append(listener)
+
+    def _notify(self, changes: Set[TokenChange]) -> None:
+        """Pass token changes to the listeners."""
+        if changes:
+            for listener in self._change_listeners:
+                listener(changes)
+
+    def _set_custom_tokens(self, token_type: str, tokens: Dict[str, Any]) -> None:
+        """Replace one type of imported tokens and notify listeners of the changes."""
+        self._notify(self.tokens.set_layer("imported", token_type, tokens))
+
+    # ========================================================================
+    # PROJECT OVERRIDES
+    # ========================================================================
+
+    def set_project_tokens(
+        self,
+        project: str,
+        token_type: str,
+        tokens: Dict[str, Any],
+        merge: bool = True
+    ) -> None:
+        """
+        Set token overrides for one project.
+
+        Project overrides sit above imported tokens and apply while the
+        project is active.
+
+        Args:
+            project: Project name
+            token_type: "typography", "colors" or "motion"
+            tokens: Overrides, nested like the default tokens
+            merge: Deep-merge with the project's existing overrides (default: True)
+        """
+        if token_type not in self.tokens.defaults:
+            raise ValueError(f"Unknown token type '{token_type}'")
+        project_tokens = self.project_tokens.setdefault(project, {})
+        if merge:
+            tokens = deep_merge(project_tokens.get(token_type, {}), tokens)
+        project_tokens[token_type] = tokens
+        if project == self.active_project:
+            self._notify(self.tokens.set_layer("project", token_type, tokens))
+
+    def activate_project(self, project: Optional[str]) -> None:
+        """
+        Apply a project's overrides (None for no project overrides).
+
+        Args:
+            project: Project name
+        """
+        self.active_project = project
+        project_tokens = self.project_tokens.get(project, {}) if project else {}
+        changes: Set[TokenChange] = set()
+        for token_type in self.tokens.defaults:
+            changes |= self.tokens.set_layer("project", token_type, project_tokens.get(token_type, {}))
+        self._notify(changes)
 
     # ========================================================================
     # TYPOGRAPHY TOKEN MANAGEMENT
@@ -100,7 +214,7 @@ class TokenManager:
 
         Args:
             file_path: Path to JSON file
-            merge: Merge with existing custom tokens (default: True)
+            merge: Deep-merge with existing custom tokens (default: True)
 
         Returns:
             Success message or error
@@ -116,10 +230,10 @@ class TokenManager:
 
             if merge:
                 # Merge with existing custom tokens
-                self.custom_typography_tokens.update(imported_data)
+                self._set_custom_tokens("typography", deep_merge(self.custom_typography_tokens, imported_data))
             else:
                 # Replace custom tokens
-                self.custom_typography_tokens = imported_data
+                self._set_custom_tokens("typography", imported_data)
 
             return f"Successfully imported typography tokens from {file_path}"
 
@@ -138,27 +252,13 @@ class TokenManager:
         Args:
             category: Token category (font_families, font_sizes, etc.)
             key: Optional specific key within category
-            use_custom: Check custom tokens first (default: True)
+            use_custom: Include imported and project tokens (default: True)
 
         Returns:
             Token value or None
         """
-        # Check custom tokens first if enabled
-        if use_custom and category in self.custom_typography_tokens:
-            custom_value = self.custom_typography_tokens[category]
-            if key and isinstance(custom_value, dict):
-                return custom_value.get(key)
-            return custom_value
-
-        # Fall back to default tokens
-        if category not in TYPOGRAPHY_TOKENS:
-            return None
-
-        value = TYPOGRAPHY_TOKENS[category]
-        if key and isinstance(value, dict):
-            return value.get(key)
-
-        return value
+        path = f"typography.{category}.{key}" if key else f"typography.{category}"
+        return self.tokens.get(path, use_custom=use_custom)
 
     # ========================================================================
     # COLOR TOKEN MANAGEMENT
@@ -214,7 +314,7 @@ class TokenManager:
 
         Args:
             file_path: Path to JSON file
-            merge: Merge with existing custom tokens (default: True)
+            merge: Deep-merge with existing custom tokens (default: True)
 
         Returns:
             Success message or error
@@ -229,9 +329,9 @@ class TokenManager:
                 return "Error: Invalid color token format"
 
             if merge:
-                self.custom_color_tokens.update(imported_data)
+                self._set_custom_tokens("colors", deep_merge(self.custom_color_tokens, imported_data))
             else:
-                self.custom_color_tokens = imported_data
+                self._set_custom_tokens("colors", imported_data)
 
             return f"Successfully imported color tokens from {file_path}"
 
@@ -250,27 +350,13 @@ class TokenManager:
         Args:
             theme_name: Theme name
             color_type: Optional color type (primary, accent, etc.)
-            use_custom: Check custom tokens first (default: True)
+            use_custom: Include imported and project tokens (default: True)
 
         Returns:
             Token value or None
         """
-        # Check custom tokens first
-        if use_custom and theme_name in self.custom_color_tokens:
-            custom_theme = self.custom_color_tokens[theme_name]
-            if color_type:
-                return custom_theme.get(color_type)
-            return custom_theme
-
-        # Fall back to default tokens
-        if theme_name not in COLOR_TOKENS:
-            return None
-
-        theme = COLOR_TOKENS[theme_name]
-        if color_type:
-            return theme.get(color_type)
-
-        return theme
+        path = f"colors.{theme_name}.{color_type}" if color_type else f"colors.{theme_name}"
+        return self.tokens.get(path, use_custom=use_custom)
 
     # ========================================================================
     # MOTION TOKEN MANAGEMENT
@@ -335,7 +421,7 @@ class TokenManager:
 
         Args:
             file_path: Path to JSON file
-            merge: Merge with existing custom tokens (default: True)
+            merge: Deep-merge with existing custom tokens (default: True)
 
         Returns:
             Success message or error
@@ -350,9 +436,9 @@ class TokenManager:
                 return "Error: Invalid motion token format"
 
             if merge:
-                self.custom_motion_tokens.update(imported_data)
+                self._set_custom_tokens("motion", deep_merge(self.custom_motion_tokens, imported_data))
             else:
-                self.custom_motion_tokens = imported_data
+                self._set_custom_tokens("motion", imported_data)
 
             return f"Successfully imported motion tokens from {file_path}"
 
@@ -371,27 +457,13 @@ class TokenManager:
         Args:
             category: Token category (spring_configs, easing_curves, etc.)
             key: Optional specific key within category
-            use_custom: Check custom tokens first (default: True)
+            use_custom: Include imported and project tokens (default: True)
 
         Returns:
             Token value or None
         """
-        # Check custom tokens first
-        if use_custom and category in self.custom_motion_tokens:
-            custom_value = self.custom_motion_tokens[category]
-            if key and isinstance(custom_value, dict):
-                return custom_value.get(key)
-            return custom_value
-
-        # Fall back to default tokens
-        if category not in MOTION_TOKENS:
-            return None
-
-        value = MOTION_TOKENS[category]
-        if key and isinstance(value, dict):
-            return value.get(key)
-
-        return value
+        path = f"motion.{category}.{key}" if key else f"motion.{category}"
+        return self.tokens.get(path, use_custom=use_custom)
 
     # ========================================================================
     # UTILITY METHODS
@@ -417,19 +489,16 @@ class TokenManager:
         Args:
             token_type: Type to clear (typography, colors, motion), or None for all
         """
-        if token_type == "typography" or token_type is None:
-            self.custom_typography_tokens = {}
-
-        if token_type == "colors" or token_type is None:
-            self.custom_color_tokens = {}
-
-        if token_type == "motion" or token_type is None:
-            self.custom_motion_tokens = {}
+        for cleared in ("typography", "colors", "motion"):
+            if token_type == cleared or token_type is None:
+                self._set_custom_tokens(cleared, {})
 
     async def export_all_tokens(self, output_dir: str) -> Dict[str, str]:
         """
         Export all token types to separate files.
 
+        The three files are written concurrently.
+
         Args:
             output_dir: Directory to save token files
 
@@ -444,16 +513,106 @@ class TokenManager:
             # Directory may already exist, which is fine
             pass
 
-        results = {
-            "typography": await self.export_typography_tokens(
-                f"{output_dir}/typography_tokens.json"
-            ),
-            "colors": await self.export_color_tokens(
-                f"{output_dir}/color_tokens.json"
-            ),
-            "motion": await self.export_motion_tokens(
-                f"{output_dir}/motion_tokens.json"
-            )
+        exports = {
+            "typography": self.export_typography_tokens,
+            "colors": self.export_color_tokens,
+            "motion": self.export_motion_tokens
+        }
+        filenames = {
+            "typography": "typography_tokens.json",
+            "colors": "color_tokens.json",
+            "motion": "motion_tokens.json"
         }
+        results = await gather_bounded(
+            list(exports),
+            lambda token_type: exports[token_type](join_path(output_dir, filenames[token_type]))
+        )
 
-        return results
+        return {
+            token_type: str(result) if isinstance(result, Exception) else result
+            for token_type, result in zip(exports, results)
+        }
+
+    async def export_token_formats(
+        self,
+        output_dir: str,
+        formats: Optional[List[str]] = None,
+        token_types: Optional[List[str]] = None,
+        concurrency: int = DEFAULT_CONCURRENCY
+    ) -> Dict[str, Any]:
+        """
+        Export merged tokens as CSS, TypeScript and Style Dictionary files.
+
+        All files are rendered from one snapshot of the merged tokens and
+        written concurrently. Content hashes from the previous export are
+        kept in the directory's manifest, so files whose content has not
+        changed (and that still exist) are not rewritten.
+
+        Args:
+            output_dir: Directory for the token files
+            formats: Formats to export (default: all of css, ts, style-dictionary)
+            token_types: Token types to export (default: typography, colors, motion)
+            concurrency: Maximum number of files written at once
+
+        Returns:
+            Dictionary with "directory", "written" and "unchanged" (file
+            paths) and "failed" ({file path: error})
+        """
+        token_types = list(token_types) if token_types else list(self.tokens.defaults)
+        unknown = [name for name in token_types if name not in self.tokens.defaults]
+        if unknown:
+            raise ValueError(f"Unknown token type(s): {', '.join(unknown)}")
+
+        snapshot = {token_type: self.tokens.tree(token_type) for token_type in token_types}
+        files = render_token_files(snapshot, formats or list(EXPORT_FORMATS))
+        hashes = {
+            name: hashlib.sha256(content.encode()).hexdigest() for name, content in files.items()
+        }
+
+        try:
+            await self.vfs.mkdir(output_dir)
+        except Exception:
+            # Directory may already exist, which is fine
+            pass
+
+        existing = set(await self.vfs.ls(output_dir) or [])
+        manifest: Dict[str, str] = {}
+        if EXPORT_MANIFEST in existing:
+            try:
+                content = await self.vfs.read_text(join_path(output_dir, EXPORT_MANIFEST))
+                manifest = json.loads(content or "{}")
+            except (TypeError, ValueError):
+                manifest = {}
+
+        changed = [
+            name for name in files
+            if name not in existing or manifest.get(name) != hashes[name]
+        ]
+
+        async def write(name: str) -> None:
+            if await self.vfs.write_file(join_path(output_dir, name), files[name]) is False:
+                raise IOError(f"Could not write {name}")
+
+        results = await gather_bounded(changed, write, concurrency)
+
+        report: Dict[str, Any] = {
+            "directory": output_dir,
+            "written": [],
+            "unchanged": [join_path(output_dir, name) for name in files if name not in changed],
+            "failed": {}
+        }
+        for name, result in zip(changed, results):
+            if isinstance(result, Exception):
+                report["failed"][join_path(output_dir, name)] = str(result)
+                # Forget the hash so the next export retries the file
+                manifest.pop(name, None)
+            else:
+                report["written"].append(join_path(output_dir, name))
+                manifest[name] = hashes[name]
+
+        if changed:
+            await self.vfs.write_file(
+                join_path(output_dir, EXPORT_MANIFEST),
+                json.dumps(manifest, indent=2, sort_keys=True)
+            )
+        return report
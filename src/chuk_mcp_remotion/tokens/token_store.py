@@ -0,0 +1,191 @@
+# chuk-mcp-remotion/src/chuk_mcp_remotion/tokens/token_store.py
+"""
+Layered token store.
+
+Token values come from three layers, later layers winning:
+
+    defaults (COLOR_TOKENS, TYPOGRAPHY_TOKENS, MOTION_TOKENS)
+      -> imported token sets (TokenManager.import_*_tokens)
+        -> per-project overrides (TokenManager.set_project_tokens)
+
+Layers are deep-merged: an override of one key inside a nested dict keeps
+the key's siblings. Whenever a layer changes, the merged tree of that token
+type is rebuilt once and flattened into a map from dotted paths
+("motion.spring_configs.smooth.config") to values, so every lookup is a
+single dictionary access. Rebuilding also reports which tokens changed, as
+the (token type, category, key) tuples ResolvedThemeCache invalidates on.
+"""
+
+from typing import Any, Dict, Mapping, Optional, Set, Tuple
+
+from .colors import COLOR_TOKENS
+from .typography import TYPOGRAPHY_TOKENS
+from .motion import MOTION_TOKENS
+
+DEFAULT_TOKENS = {
+    "typography": TYPOGRAPHY_TOKENS,
+    "colors": COLOR_TOKENS,
+    "motion": MOTION_TOKENS
+}
+
+# Override layers, lowest first (defaults sit below all of them)
+LAYERS = ("imported", "project")
+
+# (token type, category, key); key None covers the whole category
+TokenChange = Tuple[str, str, Optional[str]]
+
+_MISSING = object()
+
+
+def deep_merge(base: Mapping[str, Any], override: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Merge override into base without modifying either.
+
+    Nested dicts are merged key by key; any other value replaces the base
+    value. Subtrees the override does not touch are shared with base.
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        current = merged.get(key)
+        if isinstance(current, Mapping) and isinstance(value, Mapping):
+            merged[key] = deep_merge(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def flatten(tree: Mapping[str, Any], prefix: str = "", into: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Map every node of a nested dict (interior nodes included) by dotted path.
+
+    Args:
+        tree: Nested dictionary
+        prefix: Path of tree itself ("" for the root)
+        into: Dictionary to add to (default: a new one)
+
+    Returns:
+        Dictionary of path -> value
+    """
+    flat = {} if into is None else into
+    for key, value in tree.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        flat[path] = value
+        if isinstance(value, Mapping):
+            flatten(value, path, flat)
+    return flat
+
+
+def _changes(token_type: str, before: Dict[str, Any], after: Dict[str, Any]) -> Set[TokenChange]:
+    """Tokens whose values differ between two flattened trees of one type."""
+    changes: Set[TokenChange] = set()
+    for path in before.keys() | after.keys():
+        old, new = before.get(path, _MISSING), after.get(path, _MISSING)
+        if old is new or old == new:
+            continue
+        parts = path.split(".")
+        if token_type == "colors":
+            # Color tokens are per theme
+            changes.add((token_type, parts[0], None))
+        elif len(parts) > 1:
+            changes.add((token_type, parts[0], parts[1]))
+        elif not (isinstance(old, Mapping) and isinstance(new, Mapping)):
+            # A category replaced by (or with) a non-dict value; changes
+            # inside dict categories are reported per key above
+            changes.add((token_type, parts[0], None))
+    return changes
+
+
+class TokenStore:
+    """
+    Defaults, imported sets and project overrides, merged and flattened.
+
+    Layers are replaced with set_layer(), which rebuilds only the affected
+    token type. Lookups never walk the layers.
+    """
+
+    def __init__(self, defaults: Optional[Mapping[str, Mapping[str, Any]]] = None):
+        """
+        Initialize the store with empty override layers.
+
+        Args:
+            defaults: Default tokens by token type (default: DEFAULT_TOKENS)
+        """
+        self.defaults = DEFAULT_TOKENS if defaults is None else defaults
+        self.layers: Dict[str, Dict[str, Dict[str, Any]]] = {
+            layer: {token_type: {} for token_type in self.defaults} for layer in LAYERS
+        }
+        self._default_flat = {
+            token_type: flatten(tokens) for token_type, tokens in self.defaults.items()
+        }
+        self._trees: Dict[str, Mapping[str, Any]] = dict(self.defaults)
+        self._overrides: Dict[str, Dict[str, Any]] = {token_type: {} for token_type in self.defaults}
+        self._flat: Dict[str, Dict[str, Any]] = dict(self._default_flat)
+
+    def set_layer(self, layer: str, token_type: str, tokens: Mapping[str, Any]) -> Set[TokenChange]:
+        """
+        Replace one layer of one token type.
+
+        Args:
+            layer: "imported" or "project"
+            token_type: "typography", "colors" or "motion"
+            tokens: Token overrides (nested like the defaults)
+
+        Returns:
+            The tokens whose merged values changed
+        """
+        self.layers[layer][token_type] = dict(tokens)
+        return self._rebuild(token_type)
+
+    def _rebuild(self, token_type: str) -> Set[TokenChange]:
+        """Re-merge and re-flatten one token type."""
+        overrides: Dict[str, Any] = {}
+        for layer in LAYERS:
+            overrides = deep_merge(overrides, self.layers[layer][token_type])
+
+        previous = self._flat[token_type]
+        self._overrides[token_type] = overrides
+        if overrides:
+            self._trees[token_type] = deep_merge(self.defaults[token_type], overrides)
+            self._flat[token_type] = flatten(self._trees[token_type])
+        else:
+            self._trees[token_type] = self.defaults[token_type]
+            self._flat[token_type] = self._default_flat[token_type]
+        return _changes(token_type, previous, self._flat[token_type])
+
+    def get(self, path: str, default: Any = None, use_custom: bool = True) -> Any:
+        """
+        Look up a token by dotted path.
+
+        Args:
+            path: Token type followed by keys, e.g. "colors.tech.primary"
+            default: Returned when the path does not exist
+            use_custom: Include imported and project layers (default: True)
+
+        Returns:
+            Token value (a dict for interior paths) or default
+        """
+        token_type, _, rest = path.partition(".")
+        flat = (self._flat if use_custom else self._default_flat).get(token_type)
+        if flat is None:
+            return default
+        if not rest:
+            return self._trees[token_type] if use_custom else self.defaults[token_type]
+        return flat.get(rest, default)
+
+    def tree(self, token_type: str) -> Mapping[str, Any]:
+        """Merged tokens of one type, nested like the defaults."""
+        return self._trees[token_type]
+
+    def overrides(self, token_type: str, category: str) -> Mapping[str, Any]:
+        """
+        Merged imported and project overrides of one category, without defaults.
+
+        Args:
+            token_type: Token type
+            category: Top-level key, e.g. a theme name for colors
+
+        Returns:
+            Overrides (empty if the category is not overridden)
+        """
+        value = self._overrides[token_type].get(category)
+        return value if isinstance(value, Mapping) else {}
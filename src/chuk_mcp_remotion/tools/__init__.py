@@ -3,4 +3,8 @@ MCP Tools for Remotion video generation.
 
 This package contains tool definitions organized by functionality:
 - theme_tools: Theme management and discovery
+- token_tools: Design token access and import/export
+- render_tools: Render cost estimation and timing history
+- batch_tools: Batch generation of personalized variants
+- dependency_tools: Shared node_modules store across projects
 """
@@ -0,0 +1,86 @@
+"""
+Batch Tools for Remotion MCP Server
+
+Provides async MCP tools for generating personalized video variants in bulk
+from a CSV or JSON Lines row source.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from chuk_virtual_fs import AsyncVirtualFileSystem
+
+from ..generator.batch import VariantBatch, iter_rows
+
+
+def register_batch_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
+    """
+    Register batch variant generation tools with the MCP server.
+
+    Args:
+        mcp: ChukMCPServer instance
+        project_manager: ProjectManager instance holding the base composition
+        vfs: Virtual filesystem instance for file operations
+    """
+
+    @mcp.tool
+    async def remotion_batch_generate_variants(
+        rows_path: str,
+        output_dir: str,
+        mode: str = "props",
+        workers: Optional[int] = None,
+        name_column: Optional[str] = None
+    ) -> str:
+        """
+        Generate one personalized variant of the current composition per row.
+
+        String props of the current composition may contain [[ column ]]
+        placeholders that are filled from each row. Rows are streamed and
+        generated across a process pool.
+
+        Args:
+            rows_path: Path to a .csv (with header) or .jsonl row file
+            output_dir: Directory for the generated variants
+            mode: "props" writes a timeline JSON per row for the data-driven
+                TimelineComposition; "project" writes a full project per row
+            workers: Worker processes (default: CPU count)
+            name_column: Row column used to name variants
+
+        Returns:
+            JSON report with variant counts, variants/sec and per-stage timings
+
+        Example:
+            await remotion_add_title_scene(text="Hello [[ name ]]")
+            report = await remotion_batch_generate_variants(
+                rows_path="customers.csv",
+                output_dir="variants",
+                name_column="name"
+            )
+        """
+        def _generate():
+            if not project_manager.current_composition:
+                return json.dumps({"error": "No active project. Create a project first."})
+
+            rows_file = Path(rows_path)
+            if not rows_file.exists():
+                return json.dumps({"error": f"Row source not found: {rows_path}"})
+
+            try:
+                batch = VariantBatch(
+                    project_manager.current_composition.to_dict(),
+                    Path(output_dir),
+                    mode=mode,
+                    workers=workers,
+                    name_column=name_column,
+                    project_name=project_manager.current_project or "variant"
+                )
+                report = batch.run(iter_rows(rows_file))
+                return json.dumps(report, indent=2)
+
+            except Exception as e:
+                return json.dumps({"error": str(e)})
+
+        return await asyncio.get_event_loop().run_in_executor(None, _generate)
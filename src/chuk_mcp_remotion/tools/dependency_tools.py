@@ -0,0 +1,131 @@
+"""
+Dependency Tools for Remotion MCP Server
+
+Provides async MCP tools for dependencies shared across workspace projects:
+the node_modules store, which replaces a per-project npm install, and the
+shared component library.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from chuk_virtual_fs import AsyncVirtualFileSystem
+
+
+def register_dependency_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
+    """
+    Register dependency store tools with the MCP server.
+
+    Args:
+        mcp: ChukMCPServer instance
+        project_manager: ProjectManager instance owning the dependency store
+        vfs: Virtual filesystem instance for file operations
+    """
+
+    @mcp.tool
+    async def remotion_prepare_dependencies(
+        seed_from: Optional[str] = None,
+        offline: bool = False,
+        strategy: str = "symlink"
+    ) -> str:
+        """
+        Populate the shared dependency store and link the current project.
+
+        Runs npm once per dependency set; later projects with the same
+        package.json link to the stored node_modules when they are created.
+
+        Args:
+            seed_from: Existing node_modules directory to seed the store from
+                (no npm, no network)
+            offline: Install from the npm cache only (npm install --offline)
+            strategy: How to link the project: "symlink" or "hardlink"
+
+        Returns:
+            JSON with the store entry and link result
+
+        Example:
+            await remotion_prepare_dependencies(seed_from="/opt/remotion/node_modules")
+        """
+        def _prepare():
+            if not project_manager.current_project:
+                return json.dumps({"error": "No active project. Create a project first."})
+
+            project_dir = project_manager.workspace_dir / project_manager.current_project
+            try:
+                entry = project_manager.dependency_store.populate(
+                    project_dir,
+                    seed_from=Path(seed_from) if seed_from else None,
+                    offline=offline
+                )
+                link = project_manager.dependency_store.link(project_dir, strategy)
+                return json.dumps({"status": "success", "entry": entry, "link": link}, indent=2)
+
+            except Exception as e:
+                return json.dumps({"error": str(e)})
+
+        return await asyncio.get_event_loop().run_in_executor(None, _prepare)
+
+    @mcp.tool
+    async def remotion_link_dependencies(strategy: str = "symlink") -> str:
+        """
+        Link the current project's node_modules to the dependency store.
+
+        Args:
+            strategy: "symlink" (instant) or "hardlink" (per-file links)
+
+        Returns:
+            JSON with the link result; "linked" is false when the store has no
+            entry for the project's dependencies yet
+
+        Example:
+            await remotion_link_dependencies()
+        """
+        def _link():
+            if not project_manager.current_project:
+                return json.dumps({"error": "No active project. Create a project first."})
+
+            project_dir = project_manager.workspace_dir / project_manager.current_project
+            try:
+                return json.dumps(project_manager.dependency_store.link(project_dir, strategy), indent=2)
+            except Exception as e:
+                return json.dumps({"error": str(e)})
+
+        return await asyncio.get_event_loop().run_in_executor(None, _link)
+
+    @mcp.tool
+    async def remotion_list_dependency_store() -> str:
+        """
+        List populated entries of the workspace dependency store.
+
+        Returns:
+            JSON array of entries with key, path and population source
+
+        Example:
+            entries = await remotion_list_dependency_store()
+        """
+        def _list():
+            return json.dumps(project_manager.dependency_store.list_entries(), indent=2)
+
+        return await asyncio.get_event_loop().run_in_executor(None, _list)
+
+    @mcp.tool
+    async def remotion_list_component_libraries() -> str:
+        """
+        List shared component library versions in the workspace.
+
+        Projects created with shared_components=True import their components
+        from these libraries, one per (template version, theme).
+
+        Returns:
+            JSON array of libraries with id, path and component names
+
+        Example:
+            libraries = await remotion_list_component_libraries()
+        """
+        def _list():
+            return json.dumps(project_manager.component_library.list_libraries(), indent=2)
+
+        return await asyncio.get_event_loop().run_in_executor(None, _list)
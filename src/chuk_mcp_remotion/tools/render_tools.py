@@ -0,0 +1,165 @@
+"""
+Render Tools for Remotion MCP Server
+
+Provides async MCP tools for planning renders: cost estimation, render
+budget reports, chunk planning, and recording observed render timings.
+"""
+
+import asyncio
+import json
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from chuk_virtual_fs import AsyncVirtualFileSystem
+
+from ..renderer.cost_estimator import RenderCostEstimator, default_concurrency
+from ..renderer.timing_store import RenderTimingStore
+
+
+def register_render_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
+    """
+    Register render planning tools with the MCP server.
+
+    Args:
+        mcp: ChukMCPServer instance
+        project_manager: ProjectManager instance holding the current composition
+        vfs: Virtual filesystem instance for file operations
+    """
+
+    def _store() -> RenderTimingStore:
+        return RenderTimingStore(project_manager.workspace_dir)
+
+    def _estimator() -> RenderCostEstimator:
+        return _store().build_estimator()
+
+    @mcp.tool
+    async def remotion_estimate_render_cost(
+        concurrency: Optional[int] = None,
+        top_hotspots: int = 5
+    ) -> str:
+        """
+        Estimate the render cost of the current composition.
+
+        Sweeps the timeline to compute active components and nesting depth
+        per frame, weights them with costs learned from recorded renders
+        (or the shipped benchmark), and predicts how long rendering will
+        take before committing a job.
+
+        Args:
+            concurrency: Render workers (default: same as remotion.config.ts)
+            top_hotspots: Number of most expensive seconds to report (default: 5)
+
+        Returns:
+            JSON with per-second cost profile, hotspots and predicted duration
+
+        Example:
+            report = await remotion_estimate_render_cost(concurrency=8)
+            # Returns predicted_render_seconds, per_second profile, hotspots
+        """
+        def _estimate():
+            if not project_manager.current_composition:
+                return json.dumps({"error": "No active project. Create a project first."})
+
+            report = _estimator().estimate(
+                project_manager.current_composition,
+                concurrency=concurrency,
+                top_hotspots=top_hotspots
+            )
+            return json.dumps(report, indent=2)
+
+        return await asyncio.get_event_loop().run_in_executor(None, _estimate)
+
+    @mcp.tool
+    async def remotion_plan_render_chunks(
+        chunk_count: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ) -> str:
+        """
+        Split the current composition into render chunks of equal predicted cost.
+
+        Uses the learned cost model so that expensive scenes get shorter
+        chunks and every worker finishes at about the same time.
+
+        Args:
+            chunk_count: Number of chunks (default: one per worker)
+            concurrency: Render workers (default: same as remotion.config.ts)
+
+        Returns:
+            JSON with chunk frame ranges, per-chunk cost and balance
+
+        Example:
+            plan = await remotion_plan_render_chunks(concurrency=8)
+            # Returns chunks: [{"start_frame": 0, "end_frame": 212, ...}, ...]
+        """
+        def _plan():
+            if not project_manager.current_composition:
+                return json.dumps({"error": "No active project. Create a project first."})
+
+            plan = _estimator().plan_chunks(
+                project_manager.current_composition,
+                chunk_count=chunk_count,
+                concurrency=concurrency
+            )
+            return json.dumps(plan, indent=2)
+
+        return await asyncio.get_event_loop().run_in_executor(None, _plan)
+
+    @mcp.tool
+    async def remotion_record_render_timing(
+        render_seconds: float,
+        concurrency: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        segments: Optional[str] = None
+    ) -> str:
+        """
+        Record how long rendering the current composition actually took.
+
+        Timings are stored in a SQLite database in the workspace together with
+        the composition features of each segment. Whole-job timings calibrate
+        future estimates; segment timings train per-component cost weights.
+
+        Args:
+            render_seconds: Measured wall-clock render duration in seconds
+            concurrency: Render workers used (default: same as remotion.config.ts)
+            chunk_size: Frames per chunk, if the render was chunked
+            segments: Optional JSON list of per-segment timings, e.g.
+                '[{"start_frame": 0, "end_frame": 120, "render_seconds": 14.2}]'
+
+        Returns:
+            JSON with the recorded job and the updated cost model
+
+        Example:
+            await remotion_record_render_timing(render_seconds=184.2, concurrency=8)
+        """
+        def _record():
+            if not project_manager.current_composition:
+                return json.dumps({"error": "No active project. Create a project first."})
+
+            if render_seconds <= 0:
+                return json.dumps({"error": "render_seconds must be positive"})
+
+            try:
+                segment_timings = json.loads(segments) if segments else []
+            except json.JSONDecodeError as e:
+                return json.dumps({"error": f"Invalid segments JSON: {str(e)}"})
+
+            store = _store()
+            try:
+                entry = store.record_job(
+                    project_manager.current_composition,
+                    actual_seconds=render_seconds,
+                    concurrency=concurrency or default_concurrency(),
+                    chunk_size=chunk_size,
+                    segments=segment_timings
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                return json.dumps({"error": f"Invalid segment timing: {str(e)}"})
+
+            return json.dumps({
+                "status": "success",
+                "recorded": entry,
+                "calibration": store.calibration(),
+                "fitted_model": store.fit_weights()
+            }, indent=2)
+
+        return await asyncio.get_event_loop().run_in_executor(None, _record)
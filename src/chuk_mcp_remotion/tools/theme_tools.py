@@ -15,7 +15,12 @@ if TYPE_CHECKING:
 from ..themes.theme_manager import ThemeManager
 
 
-def register_theme_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
+def register_theme_tools(
+    mcp,
+    project_manager,
+    vfs: "AsyncVirtualFileSystem",
+    theme_manager: Optional[ThemeManager] = None
+):
     """
     Register all theme-related tools with the MCP server.
 
@@ -23,10 +28,13 @@ def register_theme_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
         mcp: ChukMCPServer instance
         project_manager: ProjectManager instance for applying themes
         vfs: Virtual filesystem instance for file operations
+        theme_manager: Theme manager shared with the other tools (default:
+            a new one)
     """
 
     # Create a single theme manager instance with virtual filesystem
-    theme_manager = ThemeManager(vfs)
+    if theme_manager is None:
+        theme_manager = ThemeManager(vfs)
 
     @mcp.tool
     async def remotion_list_themes() -> str:
@@ -48,15 +56,15 @@ def register_theme_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
             theme_list = []
 
             for key in theme_keys:
-                theme = theme_manager.get_theme(key)
+                theme = theme_manager.resolve_theme(key)
                 if theme:
                     theme_list.append({
                         "key": key,
                         "name": theme.name,
                         "description": theme.description,
-                        "primary_color": theme.colors.get("primary", ["N/A"])[0],
-                        "accent_color": theme.colors.get("accent", ["N/A"])[0],
-                        "use_cases": theme.use_cases[:3]  # First 3 use cases
+                        "primary_color": (theme.colors.get("primary") or ["N/A"])[0],
+                        "accent_color": (theme.colors.get("accent") or ["N/A"])[0],
+                        "use_cases": list(theme.use_cases[:3])  # First 3 use cases
                     })
 
             return json.dumps({"themes": theme_list}, indent=2)
@@ -158,6 +166,89 @@ def register_theme_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
 
         return await asyncio.get_event_loop().run_in_executor(None, _compare)
 
+    @mcp.tool
+    async def remotion_find_similar_themes(theme_name: str, limit: int = 3) -> str:
+        """
+        Find themes with palettes that look like a given theme's.
+
+        Compares primary, accent and background colors perceptually (OKLab
+        distance), so it finds themes that look alike even when their hex
+        values differ.
+
+        Args:
+            theme_name: Theme identifier
+            limit: Maximum number of themes to return (default: 3)
+
+        Returns:
+            JSON with similar themes ordered by palette distance (0 = identical)
+
+        Example:
+            similar = await remotion_find_similar_themes(theme_name="tech")
+            # Returns business first (navy/teal is close to blue/cyan)
+        """
+        def _find():
+            if not theme_manager.get_theme(theme_name):
+                return json.dumps({
+                    "error": f"Theme '{theme_name}' not found",
+                    "available_themes": theme_manager.list_themes()
+                })
+
+            return json.dumps({
+                "theme": theme_name,
+                "similar": theme_manager.find_similar_themes(theme_name, limit)
+            }, indent=2)
+
+        return await asyncio.get_event_loop().run_in_executor(None, _find)
+
+    @mcp.tool
+    async def remotion_audit_theme_contrast(
+        theme_name: Optional[str] = None,
+        min_ratio: float = 4.5,
+        include_pairs: bool = False
+    ) -> str:
+        """
+        Audit text-on-background contrast (WCAG) for themes.
+
+        Checks every text and semantic color against the dark, light and
+        glass backgrounds and the gradient stops. Translucent backgrounds
+        such as glass are checked at their worst over black or white video.
+
+        Args:
+            theme_name: Theme to audit (default: all themes)
+            min_ratio: Minimum contrast ratio (4.5 = WCAG AA, 3.0 = AA large
+                text, 7.0 = AAA)
+            include_pairs: Include every checked pair, not just failures
+
+        Returns:
+            JSON with per-theme pass counts and failing pairs
+
+        Example:
+            audit = await remotion_audit_theme_contrast(theme_name="tech")
+            # Lists pairs such as text.muted on background.light below 4.5:1
+        """
+        def _audit():
+            if theme_name and not theme_manager.get_theme(theme_name):
+                return json.dumps({
+                    "error": f"Theme '{theme_name}' not found",
+                    "available_themes": theme_manager.list_themes()
+                })
+
+            report = theme_manager.audit_theme_contrast(
+                [theme_name] if theme_name else None, min_ratio
+            )
+            if not include_pairs:
+                report = {
+                    key: {name: value for name, value in result.items() if name != "pairs"}
+                    for key, result in report.items()
+                }
+
+            return json.dumps({
+                "min_ratio": min_ratio,
+                "themes": report
+            }, indent=2)
+
+        return await asyncio.get_event_loop().run_in_executor(None, _audit)
+
     @mcp.tool
     async def remotion_set_current_theme(theme_name: str) -> str:
         """
@@ -226,6 +317,33 @@ def register_theme_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
 
         return await asyncio.get_event_loop().run_in_executor(None, _get)
 
+    @mcp.tool
+    async def remotion_switch_project_theme(theme_name: str) -> str:
+        """
+        Switch the theme of the current project.
+
+        Projects created with a shared theme module (the default) only get
+        src/theme/<theme>.ts written and src/theme/index.ts repointed, so
+        the preview hot-reloads without regenerating any component.
+
+        Args:
+            theme_name: Built-in theme to switch to
+
+        Returns:
+            JSON with the theme and the files written
+
+        Example:
+            result = await remotion_switch_project_theme(theme_name="gaming")
+        """
+        def _switch():
+            try:
+                result = project_manager.set_project_theme(theme_name)
+            except ValueError as e:
+                return json.dumps({"status": "error", "message": str(e)})
+            return json.dumps({"status": "success", **result}, indent=2)
+
+        return await asyncio.get_event_loop().run_in_executor(None, _switch)
+
     @mcp.tool
     async def remotion_validate_theme(theme_data: str) -> str:
         """
@@ -263,14 +381,16 @@ def register_theme_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
         description: str,
         base_theme: Optional[str] = None,
         primary_colors: Optional[str] = None,
-        accent_colors: Optional[str] = None
+        accent_colors: Optional[str] = None,
+        seed_color: Optional[str] = None
     ) -> str:
         """
         Create a custom theme based on an existing theme.
 
         Creates a new theme by starting with an existing theme and applying
-        custom color overrides. More advanced customization can be done by
-        exporting, editing, and importing the theme JSON.
+        custom color overrides. A single seed color can generate the primary
+        and accent scales instead. More advanced customization can be done
+        by exporting, editing, and importing the theme JSON.
 
         Args:
             name: Custom theme name
@@ -278,6 +398,8 @@ def register_theme_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
             base_theme: Base theme to start from (default: "tech")
             primary_colors: JSON array of primary colors (optional)
             accent_colors: JSON array of accent colors (optional)
+            seed_color: Brand color to generate 3-stop primary and accent
+                scales from (optional; explicit color arrays take precedence)
 
         Returns:
             JSON with created theme key and details
@@ -290,6 +412,12 @@ def register_theme_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
                 primary_colors='["#FF0000", "#CC0000", "#990000"]',
                 accent_colors='["#00FF00", "#00CC00", "#009900"]'
             )
+
+            theme = await remotion_create_custom_theme(
+                name="Seeded",
+                description="Palette from one brand color",
+                seed_color="#E91E63"
+            )
         """
         def _create():
             try:
@@ -304,7 +432,8 @@ def register_theme_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
                     name=name,
                     description=description,
                     base_theme=base_theme or "tech",
-                    color_overrides=color_overrides if color_overrides else None
+                    color_overrides=color_overrides if color_overrides else None,
+                    seed_color=seed_color
                 )
 
                 # Check if result is an error message
@@ -395,6 +524,81 @@ def register_theme_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
             "message": result
         }, indent=2)
 
+    @mcp.tool
+    async def remotion_export_themes(
+        directory: str,
+        theme_names: Optional[str] = None,
+        concurrency: int = 16
+    ) -> str:
+        """
+        Export many themes to a directory at once.
+
+        Writes <directory>/<theme>_theme.json for each theme, several files
+        at a time. A failed file is reported without stopping the others.
+
+        Args:
+            directory: Output directory
+            theme_names: JSON array of theme keys (default: all themes)
+            concurrency: Maximum number of files written at once (default: 16)
+
+        Returns:
+            JSON with exported file paths and per-theme failures
+
+        Example:
+            result = await remotion_export_themes(
+                directory="brand_themes",
+                theme_names='["tech", "my_brand"]'
+            )
+        """
+        try:
+            keys = json.loads(theme_names) if theme_names else None
+        except json.JSONDecodeError as e:
+            return json.dumps({"error": f"Invalid theme_names JSON: {str(e)}"})
+        if keys is not None and not isinstance(keys, list):
+            return json.dumps({"error": "theme_names must be a JSON array of theme keys"})
+
+        report = await theme_manager.export_themes(directory, keys, concurrency)
+
+        return json.dumps({
+            "status": "success" if not report["failed"] else "partial",
+            **report
+        }, indent=2)
+
+    @mcp.tool
+    async def remotion_import_themes(
+        directory: str,
+        concurrency: int = 16,
+        all_or_nothing: bool = False
+    ) -> str:
+        """
+        Import every theme JSON file in a directory at once.
+
+        Reads files several at a time, validates them together and registers
+        the valid themes in one step. Invalid or unreadable files are
+        reported per file without stopping the batch.
+
+        Args:
+            directory: Directory holding theme .json files
+            concurrency: Maximum number of files read at once (default: 16)
+            all_or_nothing: Register nothing if any file fails (default: False)
+
+        Returns:
+            JSON with the theme key per imported file and per-file errors
+
+        Example:
+            result = await remotion_import_themes(directory="brand_themes")
+        """
+        report = await theme_manager.import_themes(directory, concurrency, all_or_nothing)
+
+        if report["failed"] and not report["imported"]:
+            status = "error"
+        elif report["failed"]:
+            status = "partial"
+        else:
+            status = "success"
+
+        return json.dumps({"status": status, **report}, indent=2)
+
     @mcp.tool
     async def remotion_get_theme_for_content(content_type: str) -> str:
         """
@@ -12,13 +12,17 @@ from typing import Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from chuk_virtual_fs import AsyncVirtualFileSystem
 
-from ..tokens.colors import COLOR_TOKENS
-from ..tokens.typography import TYPOGRAPHY_TOKENS
-from ..tokens.motion import MOTION_TOKENS
 from ..tokens.token_manager import TokenManager
+from ..themes.theme_manager import ThemeManager
 
 
-def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
+def register_token_tools(
+    mcp,
+    project_manager,
+    vfs: "AsyncVirtualFileSystem",
+    token_manager: Optional[TokenManager] = None,
+    theme_manager: Optional[ThemeManager] = None
+):
     """
     Register design token tools with the MCP server.
 
@@ -26,10 +30,21 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
         mcp: ChukMCPServer instance
         project_manager: ProjectManager instance (for consistency)
         vfs: Virtual filesystem instance for file operations
+        token_manager: Token manager shared with the other tools (default:
+            a new one)
+        theme_manager: Theme manager resolving theme colors (default: a new
+            one using token_manager)
     """
 
     # Create token manager instance with virtual filesystem
-    token_manager = TokenManager(vfs)
+    if token_manager is None:
+        token_manager = TokenManager(vfs)
+    if theme_manager is None:
+        theme_manager = ThemeManager(vfs, token_manager)
+
+    def merged(token_type: str):
+        """Tokens of one type with imported tokens and project overrides applied."""
+        return token_manager.tokens.tree(token_type)
 
     # ========================================================================
     # COLOR TOKEN TOOLS
@@ -51,7 +66,7 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
             # Returns all color tokens across all themes
         """
         def _list():
-            return json.dumps(COLOR_TOKENS, indent=2)
+            return json.dumps(merged("colors"), indent=2)
 
         return await asyncio.get_event_loop().run_in_executor(None, _list)
 
@@ -74,15 +89,16 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
             # Returns tech theme colors only
         """
         def _get():
-            if theme_name not in COLOR_TOKENS:
+            theme = theme_manager.resolve_theme(theme_name)
+            if not theme:
                 return json.dumps({
                     "error": f"Theme '{theme_name}' not found",
-                    "available_themes": list(COLOR_TOKENS.keys())
+                    "available_themes": theme_manager.list_themes()
                 })
 
             return json.dumps({
                 "theme": theme_name,
-                "colors": COLOR_TOKENS[theme_name]
+                "colors": theme.to_dict()["colors"]
             }, indent=2)
 
         return await asyncio.get_event_loop().run_in_executor(None, _get)
@@ -116,10 +132,11 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
             # Returns "#0066FF"
         """
         def _get():
-            if theme_name not in COLOR_TOKENS:
+            theme = theme_manager.resolve_theme(theme_name)
+            if not theme:
                 return json.dumps({"error": f"Theme '{theme_name}' not found"})
 
-            theme_colors = COLOR_TOKENS[theme_name]
+            theme_colors = theme.to_dict()["colors"]
 
             if color_type not in theme_colors:
                 return json.dumps({
@@ -188,7 +205,7 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
             # Returns font families, sizes, weights, text styles
         """
         def _list():
-            return json.dumps(TYPOGRAPHY_TOKENS, indent=2)
+            return json.dumps(merged("typography"), indent=2)
 
         return await asyncio.get_event_loop().run_in_executor(None, _list)
 
@@ -209,7 +226,7 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
         """
         def _get():
             return json.dumps({
-                "font_families": TYPOGRAPHY_TOKENS["font_families"]
+                "font_families": merged("typography")["font_families"]
             }, indent=2)
 
         return await asyncio.get_event_loop().run_in_executor(None, _get)
@@ -233,15 +250,15 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
             # Returns sizes optimized for 1080p video
         """
         def _get():
-            if resolution not in TYPOGRAPHY_TOKENS["font_sizes"]:
+            if resolution not in merged("typography")["font_sizes"]:
                 return json.dumps({
                     "error": f"Resolution '{resolution}' not found",
-                    "available_resolutions": list(TYPOGRAPHY_TOKENS["font_sizes"].keys())
+                    "available_resolutions": list(merged("typography")["font_sizes"].keys())
                 })
 
             return json.dumps({
                 "resolution": resolution,
-                "font_sizes": TYPOGRAPHY_TOKENS["font_sizes"][resolution]
+                "font_sizes": merged("typography")["font_sizes"][resolution]
             }, indent=2)
 
         return await asyncio.get_event_loop().run_in_executor(None, _get)
@@ -265,15 +282,15 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
             # Returns hero title style (4xl, black weight, tight line height)
         """
         def _get():
-            if style_name not in TYPOGRAPHY_TOKENS["text_styles"]:
+            if style_name not in merged("typography")["text_styles"]:
                 return json.dumps({
                     "error": f"Style '{style_name}' not found",
-                    "available_styles": list(TYPOGRAPHY_TOKENS["text_styles"].keys())
+                    "available_styles": list(merged("typography")["text_styles"].keys())
                 })
 
             return json.dumps({
                 "style_name": style_name,
-                "style": TYPOGRAPHY_TOKENS["text_styles"][style_name]
+                "style": merged("typography")["text_styles"][style_name]
             }, indent=2)
 
         return await asyncio.get_event_loop().run_in_executor(None, _get)
@@ -298,7 +315,7 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
             # Returns springs, easings, durations, animation presets
         """
         def _list():
-            return json.dumps(MOTION_TOKENS, indent=2)
+            return json.dumps(merged("motion"), indent=2)
 
         return await asyncio.get_event_loop().run_in_executor(None, _list)
 
@@ -319,7 +336,7 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
         """
         def _get():
             return json.dumps({
-                "spring_configs": MOTION_TOKENS["spring_configs"]
+                "spring_configs": merged("motion")["spring_configs"]
             }, indent=2)
 
         return await asyncio.get_event_loop().run_in_executor(None, _get)
@@ -343,15 +360,15 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
             # Returns bouncy spring config with playful overshoot
         """
         def _get():
-            if spring_name not in MOTION_TOKENS["spring_configs"]:
+            if spring_name not in merged("motion")["spring_configs"]:
                 return json.dumps({
                     "error": f"Spring '{spring_name}' not found",
-                    "available_springs": list(MOTION_TOKENS["spring_configs"].keys())
+                    "available_springs": list(merged("motion")["spring_configs"].keys())
                 })
 
             return json.dumps({
                 "spring_name": spring_name,
-                "config": MOTION_TOKENS["spring_configs"][spring_name]
+                "config": merged("motion")["spring_configs"][spring_name]
             }, indent=2)
 
         return await asyncio.get_event_loop().run_in_executor(None, _get)
@@ -373,7 +390,7 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
         """
         def _get():
             return json.dumps({
-                "easing_curves": MOTION_TOKENS["easing_curves"]
+                "easing_curves": merged("motion")["easing_curves"]
             }, indent=2)
 
         return await asyncio.get_event_loop().run_in_executor(None, _get)
@@ -397,15 +414,15 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
             # Returns ease_out_back with overshoot effect
         """
         def _get():
-            if easing_name not in MOTION_TOKENS["easing_curves"]:
+            if easing_name not in merged("motion")["easing_curves"]:
                 return json.dumps({
                     "error": f"Easing '{easing_name}' not found",
-                    "available_easings": list(MOTION_TOKENS["easing_curves"].keys())
+                    "available_easings": list(merged("motion")["easing_curves"].keys())
                 })
 
             return json.dumps({
                 "easing_name": easing_name,
-                "curve": MOTION_TOKENS["easing_curves"][easing_name]
+                "curve": merged("motion")["easing_curves"][easing_name]
             }, indent=2)
 
         return await asyncio.get_event_loop().run_in_executor(None, _get)
@@ -427,7 +444,7 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
         """
         def _get():
             return json.dumps({
-                "durations": MOTION_TOKENS["durations"]
+                "durations": merged("motion")["durations"]
             }, indent=2)
 
         return await asyncio.get_event_loop().run_in_executor(None, _get)
@@ -450,15 +467,15 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
             # Returns 20 frames / 0.667 seconds
         """
         def _get():
-            if duration_name not in MOTION_TOKENS["durations"]:
+            if duration_name not in merged("motion")["durations"]:
                 return json.dumps({
                     "error": f"Duration '{duration_name}' not found",
-                    "available_durations": list(MOTION_TOKENS["durations"].keys())
+                    "available_durations": list(merged("motion")["durations"].keys())
                 })
 
             return json.dumps({
                 "duration_name": duration_name,
-                "duration": MOTION_TOKENS["durations"][duration_name]
+                "duration": merged("motion")["durations"][duration_name]
             }, indent=2)
 
         return await asyncio.get_event_loop().run_in_executor(None, _get)
@@ -480,7 +497,7 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
         """
         def _get():
             return json.dumps({
-                "animation_presets": MOTION_TOKENS["animation_presets"]
+                "animation_presets": merged("motion")["animation_presets"]
             }, indent=2)
 
         return await asyncio.get_event_loop().run_in_executor(None, _get)
@@ -504,15 +521,15 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
             # Returns fade_in animation: opacity 0 → 1, ease_out, normal duration
         """
         def _get():
-            if preset_name not in MOTION_TOKENS["animation_presets"]:
+            if preset_name not in merged("motion")["animation_presets"]:
                 return json.dumps({
                     "error": f"Preset '{preset_name}' not found",
-                    "available_presets": list(MOTION_TOKENS["animation_presets"].keys())
+                    "available_presets": list(merged("motion")["animation_presets"].keys())
                 })
 
             return json.dumps({
                 "preset_name": preset_name,
-                "preset": MOTION_TOKENS["animation_presets"][preset_name]
+                "preset": merged("motion")["animation_presets"][preset_name]
             }, indent=2)
 
         return await asyncio.get_event_loop().run_in_executor(None, _get)
@@ -534,7 +551,7 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
         """
         def _get():
             return json.dumps({
-                "youtube_optimizations": MOTION_TOKENS["youtube_optimizations"]
+                "youtube_optimizations": merged("motion")["youtube_optimizations"]
             }, indent=2)
 
         return await asyncio.get_event_loop().run_in_executor(None, _get)
@@ -778,6 +795,111 @@ def register_token_tools(mcp, project_manager, vfs: "AsyncVirtualFileSystem"):
             "message": result
         }, indent=2)
 
+    @mcp.tool
+    async def remotion_set_project_tokens(
+        token_type: str,
+        tokens: str,
+        merge: bool = True
+    ) -> str:
+        """
+        Override tokens for the current project only.
+
+        Project overrides are layered above the defaults and imported
+        tokens, apply while the project is current and are used by theme
+        lookups and component generation; the project's shared theme module
+        (src/theme/<theme>.ts) is rewritten with them.
+
+        Args:
+            token_type: Token type (typography, colors, motion)
+            tokens: JSON object of overrides, nested like the default tokens
+            merge: Merge with the project's existing overrides (default: True)
+
+        Returns:
+            JSON with status
+
+        Example:
+            result = await remotion_set_project_tokens(
+                token_type="colors",
+                tokens='{"tech": {"primary": ["#FF0066", "#CC0052", "#99003D"]}}'
+            )
+        """
+        if not project_manager.current_project:
+            return json.dumps({"error": "No active project. Create a project first."})
+
+        try:
+            overrides = json.loads(tokens)
+        except json.JSONDecodeError as e:
+            return json.dumps({"error": f"Invalid tokens JSON: {str(e)}"})
+        if not isinstance(overrides, dict):
+            return json.dumps({"error": "tokens must be a JSON object"})
+
+        project = project_manager.current_project
+        try:
+            token_manager.set_project_tokens(project, token_type, overrides, merge)
+        except ValueError as e:
+            return json.dumps({"error": str(e)})
+
+        if token_manager.active_project != project:
+            token_manager.activate_project(project)
+
+        return json.dumps({
+            "status": "success",
+            "project": project,
+            "token_type": token_type,
+            "overrides": token_manager.project_tokens[project][token_type]
+        }, indent=2)
+
+    @mcp.tool
+    async def remotion_export_token_formats(
+        output_dir: str,
+        formats: Optional[str] = None,
+        token_types: Optional[str] = None,
+        concurrency: int = 16
+    ) -> str:
+        """
+        Export tokens for front-end pipelines as CSS, TypeScript and Style Dictionary.
+
+        Writes <token_type>.css (custom properties), <token_type>.ts (typed
+        module) and <token_type>.tokens.json (Style Dictionary source) from
+        the merged tokens, including imported and project overrides. Files
+        whose content has not changed since the last export are skipped.
+
+        Args:
+            output_dir: Directory for the token files
+            formats: JSON array of formats: css, ts, style-dictionary (default: all)
+            token_types: JSON array of token types: typography, colors, motion (default: all)
+            concurrency: Maximum number of files written at once (default: 16)
+
+        Returns:
+            JSON with written, unchanged and failed file paths
+
+        Example:
+            result = await remotion_export_token_formats(
+                output_dir="src/tokens",
+                formats='["css", "ts"]'
+            )
+        """
+        selected = {}
+        for name, value in (("formats", formats), ("token_types", token_types)):
+            try:
+                selected[name] = json.loads(value) if value else None
+            except json.JSONDecodeError as e:
+                return json.dumps({"error": f"Invalid {name} JSON: {str(e)}"})
+            if selected[name] is not None and not isinstance(selected[name], list):
+                return json.dumps({"error": f"{name} must be a JSON array"})
+
+        try:
+            report = await token_manager.export_token_formats(
+                output_dir, selected["formats"], selected["token_types"], concurrency
+            )
+        except ValueError as e:
+            return json.dumps({"error": str(e)})
+
+        return json.dumps({
+            "status": "success" if not report["failed"] else "partial",
+            **report
+        }, indent=2)
+
     @mcp.tool
     async def remotion_export_all_tokens(output_dir: str) -> str:
         """
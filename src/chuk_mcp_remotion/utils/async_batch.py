@@ -0,0 +1,46 @@
+"""
+Async Batch - Bounded concurrency for bulk virtual filesystem operations.
+
+Moving hundreds of files one awaited call at a time is dominated by round
+trips when the virtual filesystem is remote. gather_bounded runs them
+concurrently, capped so a large batch does not open hundreds of requests
+at once.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+# Default number of operations in flight
+DEFAULT_CONCURRENCY = 16
+
+
+async def gather_bounded(
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[Any]],
+    concurrency: int = DEFAULT_CONCURRENCY
+) -> List[Any]:
+    """
+    Run worker(item) for every item, at most `concurrency` at a time.
+
+    Args:
+        items: Items to process
+        worker: Async function called with each item
+        concurrency: Maximum number of workers running at once (at least 1)
+
+    Returns:
+        Results in item order; a worker that raised has its exception in
+        place of its result, so one failure does not abort the batch
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(item: T) -> Any:
+        async with semaphore:
+            return await worker(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+
+
+def join_path(directory: str, name: str) -> str:
+    """Join a virtual filesystem directory and a file name."""
+    return f"{directory.rstrip('/')}/{name}" if directory else name
@@ -0,0 +1,240 @@
+"""
+Dependency Store - Shares installed node_modules across Remotion projects.
+
+Every scaffolded project has the same package.json dependencies, so a full
+`npm install` per project downloads and writes the same few hundred MB over
+and over. The store keeps one installed node_modules per dependency set,
+keyed by a hash of the package.json dependencies, and links projects to it
+with a symlink or hardlinks instead of installing. The lockfile an entry was
+installed from is part of the entry, not of its key: linking copies it into
+projects that have none, which must not move them to a different entry.
+
+Entries can be populated with npm (optionally --offline, from the npm cache)
+or seeded from an existing node_modules directory with no network at all.
+"""
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Store directory inside the workspace
+STORE_DIRNAME = ".remotion-deps"
+
+# Marker written once an entry is fully populated
+COMPLETE_MARKER = ".complete"
+
+LINK_STRATEGIES = ("symlink", "hardlink")
+
+# Timeout for populating an entry with npm (seconds)
+NPM_INSTALL_TIMEOUT = 900
+
+
+def dependency_hash(package_json: Dict[str, Any]) -> str:
+    """
+    Compute the store key for a dependency set.
+
+    The project name and other metadata are ignored, so every project
+    scaffolded from the same template shares one entry. The lockfile is
+    not part of the key (see the module docstring).
+
+    Args:
+        package_json: Parsed package.json
+
+    Returns:
+        Hex digest identifying the dependency set
+    """
+    key: Dict[str, Any] = {
+        "dependencies": package_json.get("dependencies", {}),
+        "devDependencies": package_json.get("devDependencies", {})
+    }
+    canonical = json.dumps(key, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    """Read a JSON file if it exists."""
+    return json.loads(path.read_text()) if path.exists() else None
+
+
+def _hardlink_tree(source: Path, destination: Path):
+    """Mirror a directory tree using hardlinks (copying across filesystems)."""
+    for root, dirs, files in os.walk(source):
+        relative = Path(root).relative_to(source)
+        target_root = destination / relative
+        target_root.mkdir(parents=True, exist_ok=True)
+
+        # os.walk does not follow directory symlinks; recreate them as links
+        for name in list(dirs):
+            if (Path(root) / name).is_symlink():
+                os.symlink(os.readlink(Path(root) / name), target_root / name)
+                dirs.remove(name)
+
+        for name in files:
+            source_file = Path(root) / name
+            target_file = target_root / name
+            if source_file.is_symlink():
+                os.symlink(os.readlink(source_file), target_file)
+                continue
+            try:
+                os.link(source_file, target_file)
+            except OSError:
+                shutil.copy2(source_file, target_file)
+
+
+class DependencyStore:
+    """Content-addressed store of installed node_modules directories."""
+
+    def __init__(self, workspace_dir: Path):
+        """
+        Initialize the dependency store.
+
+        Args:
+            workspace_dir: Workspace directory holding the store
+        """
+        self.store_dir = Path(workspace_dir) / STORE_DIRNAME
+
+    def key_for_project(self, project_dir: Path) -> str:
+        """Get the store key for a project's package.json dependencies."""
+        package_json = _read_json(Path(project_dir) / "package.json")
+        if package_json is None:
+            raise ValueError(f"No package.json in {project_dir}")
+        return dependency_hash(package_json)
+
+    def entry_dir(self, key: str) -> Path:
+        """Get the directory of a store entry."""
+        return self.store_dir / key
+
+    def has(self, key: str) -> bool:
+        """Check whether a fully populated entry exists."""
+        return (self.entry_dir(key) / COMPLETE_MARKER).exists()
+
+    def populate(
+        self,
+        project_dir: Path,
+        seed_from: Optional[Path] = None,
+        offline: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Populate the store entry for a project's dependencies.
+
+        Args:
+            project_dir: Project whose package.json defines the entry (its
+                lockfile, if any, is installed from and kept in the entry)
+            seed_from: Existing node_modules directory to copy instead of running npm
+            offline: Install with `npm install --offline` (npm cache only, no network)
+
+        Returns:
+            Dictionary with the entry key, path and how it was populated
+        """
+        project_dir = Path(project_dir)
+        key = self.key_for_project(project_dir)
+        if self.has(key):
+            return {"key": key, "path": str(self.entry_dir(key)), "source": "existing"}
+
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        # Build in a temporary directory and rename, so a failed or concurrent
+        # install never leaves a half-populated entry behind
+        staging = Path(tempfile.mkdtemp(prefix=f"{key[:12]}-", dir=self.store_dir))
+        try:
+            package_json = _read_json(project_dir / "package.json")
+            package_json["name"] = f"remotion-deps-{key[:12]}"
+            (staging / "package.json").write_text(json.dumps(package_json, indent=2))
+            if (project_dir / "package-lock.json").exists():
+                shutil.copy2(project_dir / "package-lock.json", staging / "package-lock.json")
+
+            if seed_from is not None:
+                seed_from = Path(seed_from)
+                if not seed_from.is_dir():
+                    raise ValueError(f"Seed directory not found: {seed_from}")
+                shutil.copytree(seed_from, staging / "node_modules", symlinks=True)
+                source = "seed"
+            else:
+                self._npm_install(staging, offline)
+                source = "npm-offline" if offline else "npm"
+
+            (staging / COMPLETE_MARKER).write_text(source)
+            try:
+                staging.rename(self.entry_dir(key))
+            except OSError:
+                # Another process populated the same entry first
+                if not self.has(key):
+                    raise
+                shutil.rmtree(staging, ignore_errors=True)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        return {"key": key, "path": str(self.entry_dir(key)), "source": source}
+
+    def _npm_install(self, directory: Path, offline: bool):
+        """Install dependencies into a staging directory with npm."""
+        npm = shutil.which("npm")
+        if npm is None:
+            raise RuntimeError("npm not found. Seed the store from an existing node_modules instead.")
+
+        command = [npm, "ci" if (directory / "package-lock.json").exists() else "install",
+                   "--no-audit", "--no-fund"]
+        if offline:
+            command.append("--offline")
+
+        result = subprocess.run(
+            command, cwd=directory, capture_output=True, text=True, timeout=NPM_INSTALL_TIMEOUT
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"npm install failed: {result.stderr.strip()[-2000:]}")
+
+    def link(self, project_dir: Path, strategy: str = "symlink") -> Dict[str, Any]:
+        """
+        Link a project's node_modules to its store entry.
+
+        Args:
+            project_dir: Project directory
+            strategy: "symlink" (one link, instant) or "hardlink" (per-file links,
+                for tools that do not follow a symlinked node_modules)
+
+        Returns:
+            Dictionary with the linked entry, or "linked": False when the store
+            has no entry for the project's dependencies
+        """
+        if strategy not in LINK_STRATEGIES:
+            raise ValueError(f"Unknown link strategy '{strategy}'. Use one of: {', '.join(LINK_STRATEGIES)}")
+
+        project_dir = Path(project_dir)
+        key = self.key_for_project(project_dir)
+        if not self.has(key):
+            return {"linked": False, "key": key}
+
+        entry = self.entry_dir(key)
+        target = project_dir / "node_modules"
+        if target.is_symlink() or target.is_file():
+            target.unlink()
+        elif target.exists():
+            shutil.rmtree(target)
+
+        if strategy == "symlink":
+            target.symlink_to(entry / "node_modules", target_is_directory=True)
+        else:
+            _hardlink_tree(entry / "node_modules", target)
+
+        # Keep the lockfile the store was installed from alongside the project;
+        # the key ignores lockfiles, so later links find the same entry
+        if (entry / "package-lock.json").exists() and not (project_dir / "package-lock.json").exists():
+            shutil.copy2(entry / "package-lock.json", project_dir / "package-lock.json")
+
+        return {"linked": True, "key": key, "strategy": strategy, "store_path": str(entry)}
+
+    def list_entries(self) -> List[Dict[str, Any]]:
+        """List store entries and how they were populated."""
+        if not self.store_dir.exists():
+            return []
+
+        entries = []
+        for entry in sorted(self.store_dir.iterdir()):
+            marker = entry / COMPLETE_MARKER
+            if entry.is_dir() and marker.exists():
+                entries.append({"key": entry.name, "path": str(entry), "source": marker.read_text()})
+        return entries
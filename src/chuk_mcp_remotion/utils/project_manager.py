@@ -6,22 +6,52 @@ Handles project scaffolding, file generation, and project state.
 import json
 import shutil
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, TYPE_CHECKING
 from jinja2 import Template
 
 from ..generator.component_builder import ComponentBuilder
+from ..generator.component_library import ComponentLibrary
 from ..generator.composition_builder import CompositionBuilder
+from ..generator.theme_module import THEME_DIRNAME, theme_files
+from ..registry.validators import SPECIALIZED_KEYS, SceneValidator
+from ..themes.youtube_themes import YOUTUBE_THEMES
+from .dependency_store import DependencyStore
+
+if TYPE_CHECKING:
+    from ..themes.theme_manager import ThemeManager
+
+
+def write_data_files(data_dir: Path, data_files: Dict[str, str]):
+    """
+    Write hoisted prop data modules and remove ones no longer referenced.
+
+    Files are content-hashed, so existing files are left untouched and
+    unchanged data does not trigger a rebuild.
+    """
+    if data_files:
+        data_dir.mkdir(parents=True, exist_ok=True)
+        for filename, content in data_files.items():
+            path = data_dir / filename
+            if not path.exists():
+                path.write_text(content)
+
+    if data_dir.exists():
+        for stale in data_dir.glob("data-*.json"):
+            if stale.name not in data_files:
+                stale.unlink()
 
 
 class ProjectManager:
     """Manages Remotion video projects."""
 
-    def __init__(self, workspace_dir: Optional[Path] = None):
+    def __init__(self, workspace_dir: Optional[Path] = None, theme_manager: Optional["ThemeManager"] = None):
         """
         Initialize project manager.
 
         Args:
             workspace_dir: Directory for projects (default: ./remotion-projects)
+            theme_manager: Resolves themes for generated components, including
+                custom themes and tokens (default: built-in themes only)
         """
         if workspace_dir is None:
             workspace_dir = Path.cwd() / "remotion-projects"
@@ -29,17 +59,30 @@ class ProjectManager:
         self.workspace_dir = Path(workspace_dir)
         self.workspace_dir.mkdir(exist_ok=True, parents=True)
 
-        self.component_builder = ComponentBuilder()
+        self.theme_manager = theme_manager
+        self.component_builder = ComponentBuilder(theme_manager)
+        self.dependency_store = DependencyStore(self.workspace_dir)
+        self.component_library = ComponentLibrary(self.workspace_dir, self.component_builder)
+        self.scene_validator = SceneValidator(known_types=self.component_builder.template_names())
+        self.shared_components = False
+        self.shared_theme = False
         self.current_project: Optional[str] = None
         self.current_composition: Optional[CompositionBuilder] = None
 
+        # Keep the current project's theme module in step with its tokens
+        if theme_manager is not None and theme_manager.token_manager is not None:
+            theme_manager.token_manager.add_change_listener(self._tokens_changed)
+
     def create_project(
         self,
         name: str,
         theme: str = "tech",
         fps: int = 30,
         width: int = 1920,
-        height: int = 1080
+        height: int = 1080,
+        link_dependencies: bool = True,
+        shared_components: bool = False,
+        shared_theme: bool = True
     ) -> Dict[str, str]:
         """
         Create a new Remotion project.
@@ -50,6 +93,14 @@ class ProjectManager:
             fps: Frames per second
             width: Video width
             height: Video height
+            link_dependencies: Link node_modules from the dependency store
+                when it holds this project's dependency set
+            shared_components: Import components from the workspace component
+                library and share webpack's bundle cache with other projects
+            shared_theme: Emit the theme as src/theme/<theme>.ts and have
+                components import it instead of baking theme values in (not
+                available with shared_components, whose library components
+                live outside the project)
 
         Returns:
             Dictionary with project info
@@ -75,7 +126,17 @@ class ProjectManager:
         )
 
         # Copy config files
-        shutil.copy(template_dir / "remotion.config.ts", project_dir / "remotion.config.ts")
+        shared_config = {}
+        if shared_components:
+            shared_config = {
+                "component_library": self.component_library.root.resolve().as_posix(),
+                "bundle_cache_dir": self.component_library.bundle_cache_dir.resolve().as_posix()
+            }
+        self._copy_template(
+            template_dir / "remotion.config.ts",
+            project_dir / "remotion.config.ts",
+            shared_config
+        )
         shutil.copy(template_dir / "tsconfig.json", project_dir / "tsconfig.json")
         shutil.copy(template_dir / ".gitignore", project_dir / ".gitignore")
 
@@ -101,17 +162,38 @@ class ProjectManager:
             project_dir / "src" / "index.ts"
         )
 
+        # Reuse installed dependencies instead of a per-project npm install
+        dependencies = "install required"
+        if link_dependencies and self.dependency_store.link(project_dir)["linked"]:
+            dependencies = "linked"
+
         # Create initial composition
+        shared_theme = shared_theme and not shared_components
         self.current_project = name
-        self.current_composition = CompositionBuilder(fps=fps, width=width, height=height)
+        self.shared_components = shared_components
+        self.shared_theme = shared_theme
+        self.current_composition = CompositionBuilder(
+            fps=fps, width=width, height=height, theme_resolver=self.component_builder.resolve_theme
+        )
         self.current_composition.theme = theme
 
+        # Apply this project's token overrides before generating anything from them
+        if self.theme_manager is not None and self.theme_manager.token_manager is not None:
+            self.theme_manager.token_manager.activate_project(name)
+
+        # Theme values live in one module that components import
+        if shared_theme:
+            self._write_theme_files(project_dir, theme, fps)
+
         return {
             "name": name,
             "path": str(project_dir),
             "theme": theme,
             "fps": str(fps),
-            "resolution": f"{width}x{height}"
+            "resolution": f"{width}x{height}",
+            "dependencies": dependencies,
+            "shared_components": shared_components,
+            "shared_theme": shared_theme
         }
 
     def _copy_template(self, src: Path, dest: Path, variables: Dict[str, any]):
@@ -133,6 +215,83 @@ class ProjectManager:
         rendered = template.render(**variables)
         dest.write_text(rendered)
 
+    def _build_component_code(self, component_type: str, config: Dict, theme: str) -> str:
+        """
+        Build the TSX written to a project's src/components directory.
+
+        Projects using the shared component library get a re-export of the
+        library component; its props come from the composition, so config
+        is not baked in.
+        """
+        if self.shared_components:
+            return self.component_library.build_stub(component_type, theme)
+        return self.component_builder.build_component(
+            component_type, config, theme, shared_theme=self.shared_theme
+        )
+
+    def _write_theme_files(self, project_dir: Path, theme: str, fps: int):
+        """
+        Write src/theme/: the theme's module, index.ts pointing at it and
+        motion.ts for the project's fps, all from the merged tokens.
+
+        Files whose content is unchanged are left untouched.
+        """
+        easing_curves = spring_configs = None
+        if self.theme_manager is not None and self.theme_manager.token_manager is not None:
+            tokens = self.theme_manager.token_manager.tokens
+            easing_curves = tokens.get("motion.easing_curves")
+            spring_configs = tokens.get("motion.spring_configs")
+        files = theme_files(
+            theme, self.component_builder.resolve_theme(theme).to_dict(), fps, easing_curves, spring_configs
+        )
+
+        theme_dir = project_dir / "src" / THEME_DIRNAME
+        theme_dir.mkdir(parents=True, exist_ok=True)
+        for filename, source in files.items():
+            path = theme_dir / filename
+            if not path.exists() or path.read_text() != source:
+                path.write_text(source)
+
+    def _tokens_changed(self, changes) -> None:
+        """Rewrite the current project's theme files when merged token values change."""
+        if self.current_project and self.current_composition and self.shared_theme:
+            composition = self.current_composition
+            self._write_theme_files(self.workspace_dir / self.current_project, composition.theme, composition.fps)
+
+    def set_project_theme(self, theme: str) -> Dict:
+        """
+        Switch the current project's theme.
+
+        With a shared theme module this only writes src/theme/<theme>.ts
+        (once) and repoints src/theme/index.ts, so components are not
+        regenerated. Otherwise components pick up the new theme the next
+        time they are generated.
+
+        Args:
+            theme: Theme name
+
+        Returns:
+            Dictionary with the theme and the files written
+        """
+        if not self.current_project or not self.current_composition:
+            raise ValueError("No active project")
+        available = self.theme_manager.list_themes() if self.theme_manager else list(YOUTUBE_THEMES)
+        if theme not in available:
+            raise ValueError(f"Unknown theme '{theme}'. Available: {', '.join(available)}")
+
+        self.current_composition.theme = theme
+        if not self.shared_theme:
+            return {"theme": theme, "files": [], "regenerate_components": True}
+
+        project_dir = self.workspace_dir / self.current_project
+        self._write_theme_files(project_dir, theme, self.current_composition.fps)
+        theme_dir = project_dir / "src" / THEME_DIRNAME
+        return {
+            "theme": theme,
+            "files": [str(theme_dir / f"{theme}.ts"), str(theme_dir / "index.ts")],
+            "regenerate_components": False
+        }
+
     def add_component_to_project(
         self,
         component_type: str,
@@ -157,7 +316,7 @@ class ProjectManager:
         components_dir = project_dir / "src" / "components"
 
         # Generate component code
-        tsx_code = self.component_builder.build_component(component_type, config, theme)
+        tsx_code = self._build_component_code(component_type, config, theme)
 
         # Write component file
         component_file = components_dir / f"{component_type}.tsx"
@@ -183,9 +342,10 @@ class ProjectManager:
         # Generate composition TSX
         composition_tsx = self.current_composition.generate_composition_tsx()
 
-        # Write composition file
+        # Write composition file and the data modules it imports
         composition_file = project_dir / "src" / "VideoComposition.tsx"
         composition_file.write_text(composition_tsx)
+        write_data_files(project_dir / "src" / "data", self.current_composition.data_files)
 
         # Update Root.tsx with correct duration
         duration_frames = self.current_composition.get_total_duration_frames()
@@ -209,6 +369,100 @@ class ProjectManager:
 
         return str(composition_file)
 
+    def generate_timeline_composition(
+        self,
+        component_types: Optional[List[str]] = None
+    ) -> Dict:
+        """
+        Generate a data-driven composition for the current project.
+
+        Writes TimelineComposition.tsx, which interprets a serialized timeline
+        at render time, the component files it needs, the current timeline as
+        src/timeline.json (the default props), and a Root.tsx that derives
+        duration and resolution from the props. Content changes then only
+        need a new props JSON file instead of a new bundle.
+
+        Args:
+            component_types: Component types to include in the bundle
+                (default: types used by the current composition)
+
+        Returns:
+            Dictionary with generated files and bundled component types
+        """
+        if not self.current_project:
+            raise ValueError("No active project")
+
+        if not self.current_composition:
+            raise ValueError("No composition created")
+
+        project_dir = self.workspace_dir / self.current_project
+        components_dir = project_dir / "src" / "components"
+        composition = self.current_composition
+
+        if component_types is None:
+            component_types = composition.get_component_types()
+        component_types = sorted(set(component_types))
+
+        generated_files = []
+        for component_type in component_types:
+            # Props come from the timeline at render time
+            tsx_code = self._build_component_code(component_type, {}, composition.theme)
+            component_file = components_dir / f"{component_type}.tsx"
+            component_file.write_text(tsx_code)
+            generated_files.append(str(component_file))
+
+        composition_file = project_dir / "src" / "TimelineComposition.tsx"
+        composition_file.write_text(composition.generate_timeline_composition_tsx(component_types))
+        generated_files.append(str(composition_file))
+
+        timeline_file = self.export_timeline(project_dir / "src" / "timeline.json")
+        generated_files.append(timeline_file)
+
+        # Remotion composition IDs can only contain a-z, A-Z, 0-9, and hyphens
+        composition_id = self.current_project.replace('_', '-')
+
+        self._copy_template(
+            Path(__file__).parent.parent.parent.parent / "remotion-templates" / "src" / "TimelineRoot.tsx",
+            project_dir / "src" / "Root.tsx",
+            {
+                "composition_id": composition_id,
+                "duration_in_frames": max(composition.get_total_duration_frames(), 1),
+                "fps": composition.fps,
+                "width": composition.width,
+                "height": composition.height
+            }
+        )
+
+        return {
+            "project": self.current_project,
+            "composition_id": composition_id,
+            "composition_file": str(composition_file),
+            "timeline_file": timeline_file,
+            "generated_files": generated_files,
+            "component_types": component_types
+        }
+
+    def export_timeline(self, output_path: Path) -> str:
+        """
+        Write the current composition's serialized timeline to a JSON file.
+
+        The file can be passed to `remotion render --props=<file>` to render
+        it with a bundle generated by generate_timeline_composition().
+
+        Args:
+            output_path: Destination JSON file
+
+        Returns:
+            Path to the written file
+        """
+        if not self.current_composition:
+            raise ValueError("No composition created")
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(self.current_composition.to_dict(), indent=2))
+        return str(output_path)
+
     def get_project_info(self) -> Dict:
         """Get information about the current project."""
         if not self.current_project or not self.current_composition:
@@ -238,27 +492,34 @@ class ProjectManager:
     def build_composition_from_scenes(
         self,
         scenes: list,
-        theme: str = "tech"
+        theme: str = "tech",
+        validate: bool = True
     ) -> Dict[str, str]:
         """
         Build a complete composition from scene configurations.
 
         This method takes a list of scene dictionaries and:
-        1. Converts them to ComponentInstance objects
-        2. Generates TSX files for each component type
-        3. Builds the final VideoComposition.tsx
+        1. Validates them against the component registry schemas
+        2. Converts them to ComponentInstance objects
+        3. Generates TSX files for each component type
+        4. Builds the final VideoComposition.tsx
 
         Args:
             scenes: List of scene dictionaries with type, config, startFrame, durationInFrames
             theme: Theme to use for generation
+            validate: Reject invalid scenes before anything is generated
 
         Returns:
-            Dictionary with paths to generated files
+            Dictionary with paths to generated files and validation warnings
+
+        Raises:
+            ValueError: If there is no active project, or scenes are invalid
+                (the message lists every problem found)
 
         Example scene format:
             {
                 "type": "TitleScene",
-                "config": {"title": "Hello", "subtitle": "World"},
+                "config": {"text": "Hello", "subtitle": "World"},
                 "startFrame": 0,
                 "durationInFrames": 90
             }
@@ -266,6 +527,13 @@ class ProjectManager:
         if not self.current_project or not self.current_composition:
             raise ValueError("No active project. Create a project first.")
 
+        warnings: List[str] = []
+        if validate:
+            validation = self.scene_validator.validate(scenes)
+            if not validation["valid"]:
+                raise ValueError("Invalid scenes:\n" + "\n".join(validation["errors"]))
+            warnings = validation["warnings"]
+
         from ..generator.composition_builder import ComponentInstance
 
         project_dir = self.workspace_dir / self.current_project
@@ -303,7 +571,7 @@ class ProjectManager:
         for component_type in component_types_needed:
             try:
                 # Generate component code
-                tsx_code = self.component_builder.build_component(
+                tsx_code = self._build_component_code(
                     component_type,
                     {},  # Empty config - templates handle props from VideoComposition
                     theme
@@ -326,7 +594,8 @@ class ProjectManager:
             "composition_file": composition_file,
             "component_files": generated_files,
             "component_types": list(component_types_needed),
-            "total_frames": self.current_composition.get_total_duration_frames()
+            "total_frames": self.current_composition.get_total_duration_frames(),
+            "warnings": warnings
         }
 
     def _process_nested_children(
@@ -395,24 +664,7 @@ class ProjectManager:
                     self._process_nested_children(child, child_instance, component_types_needed)
 
         # Specialized layout components
-        specialized_keys = [
-            "mainFeed", "demo1", "demo2", "overlay",  # AsymmetricLayout
-            "center",  # ThreeColumnLayout
-            "middle",  # ThreeRowLayout
-            "hostView", "screenContent",  # OverTheShoulderLayout
-            "characterA", "characterB",  # DialogueFrameLayout
-            "originalClip", "reactorFace",  # StackedReactionLayout
-            "gameplay", "webcam", "chatOverlay",  # HUDStyleLayout
-            "frontCam", "overheadCam", "handCam", "detailCam",  # PerformanceMultiCamLayout
-            "hostStrip", "backgroundContent",  # FocusStripLayout
-            "mainContent", "pipContent",  # PiPLayout
-            "topContent", "bottomContent", "captionBar",  # VerticalLayout
-            "milestones", "clips",  # TimelineLayout, MosaicLayout
-            "content",  # Container
-            "leftPanel", "rightPanel", "topPanel", "bottomPanel"  # SplitScreen
-        ]
-
-        for key in specialized_keys:
+        for key in SPECIALIZED_KEYS:
             if key in scene:
                 child = scene[key]
                 if isinstance(child, dict) and "type" in child:
@@ -0,0 +1,54 @@
+"""
+Tests for AudioBars template generation.
+"""
+
+from ..conftest import (
+    assert_valid_typescript,
+    assert_has_interface,
+    assert_has_timing_props,
+    assert_has_visibility_check
+)
+
+
+class TestAudioBarsBasic:
+    """Basic AudioBars generation tests."""
+
+    def test_basic_generation(self, component_builder, theme_name):
+        """Test basic AudioBars generation."""
+        tsx = component_builder.build_component('AudioBars', {}, theme_name)
+
+        assert 'AudioBars' in tsx
+        assert_valid_typescript(tsx)
+        assert_has_interface(tsx, 'AudioBars')
+        assert_has_timing_props(tsx)
+        assert_has_visibility_check(tsx)
+
+    def test_all_themes(self, component_builder, all_themes):
+        """Test AudioBars builds with every theme."""
+        for theme in all_themes:
+            assert_valid_typescript(component_builder.build_component('AudioBars', {}, theme))
+
+    def test_theme_colors(self, component_builder, theme_name):
+        """Test theme colors are substituted."""
+        tsx = component_builder.build_component('AudioBars', {}, theme_name)
+
+        assert '[[' not in tsx
+        assert 'colors.primary' not in tsx
+
+
+class TestAudioBarsTable:
+    """Tests for reading the precomputed level table."""
+
+    def test_row_lookup(self, component_builder, theme_name):
+        """Test each frame only reads its row of band levels."""
+        tsx = component_builder.build_component('AudioBars', {}, theme_name)
+
+        assert 'interface AudioTable' in tsx
+        assert 'const rowStart = row * audio.band_count;' in tsx
+        assert 'AudioContext' not in tsx
+
+    def test_mirror_variant(self, component_builder, theme_name):
+        """Test the mirror variant centers the bars."""
+        tsx = component_builder.build_component('AudioBars', {}, theme_name)
+
+        assert "variant === 'mirror'" in tsx
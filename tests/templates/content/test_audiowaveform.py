@@ -0,0 +1,53 @@
+"""
+Tests for AudioWaveform template generation.
+"""
+
+from ..conftest import (
+    assert_valid_typescript,
+    assert_has_interface,
+    assert_has_timing_props,
+    assert_has_visibility_check
+)
+
+
+class TestAudioWaveformBasic:
+    """Basic AudioWaveform generation tests."""
+
+    def test_basic_generation(self, component_builder, theme_name):
+        """Test basic AudioWaveform generation."""
+        tsx = component_builder.build_component('AudioWaveform', {}, theme_name)
+
+        assert 'AudioWaveform' in tsx
+        assert_valid_typescript(tsx)
+        assert_has_interface(tsx, 'AudioWaveform')
+        assert_has_timing_props(tsx)
+        assert_has_visibility_check(tsx)
+
+    def test_all_themes(self, component_builder, all_themes):
+        """Test AudioWaveform builds with every theme."""
+        for theme in all_themes:
+            assert_valid_typescript(component_builder.build_component('AudioWaveform', {}, theme))
+
+    def test_theme_colors(self, component_builder, theme_name):
+        """Test theme colors are substituted."""
+        tsx = component_builder.build_component('AudioWaveform', {}, theme_name)
+
+        assert '[[' not in tsx
+        assert 'colors.primary' not in tsx
+
+
+class TestAudioWaveformScrubber:
+    """Tests for the waveform overview and playhead."""
+
+    def test_overview_columns(self, component_builder, theme_name):
+        """Test the waveform is drawn from the precomputed overview."""
+        tsx = component_builder.build_component('AudioWaveform', {}, theme_name)
+
+        assert 'overview: number[];' in tsx
+        assert 'audio.overview.map(' in tsx
+
+    def test_playhead(self, component_builder, theme_name):
+        """Test the playhead follows the current frame."""
+        tsx = component_builder.build_component('AudioWaveform', {}, theme_name)
+
+        assert 'const playhead = progress * width;' in tsx
@@ -0,0 +1,57 @@
+"""
+Tests for BarChartRace template generation.
+"""
+
+from ..conftest import (
+    assert_valid_typescript,
+    assert_has_interface,
+    assert_has_timing_props,
+    assert_has_visibility_check
+)
+
+
+class TestBarChartRaceBasic:
+    """Basic BarChartRace generation tests."""
+
+    def test_basic_generation(self, component_builder, theme_name):
+        """Test basic BarChartRace generation."""
+        tsx = component_builder.build_component('BarChartRace', {}, theme_name)
+
+        assert 'BarChartRace' in tsx
+        assert_valid_typescript(tsx)
+        assert_has_interface(tsx, 'BarChartRace')
+        assert_has_timing_props(tsx)
+        assert_has_visibility_check(tsx)
+
+    def test_all_themes(self, component_builder, all_themes):
+        """Test BarChartRace builds with every theme."""
+        for theme in all_themes:
+            assert_valid_typescript(component_builder.build_component('BarChartRace', {}, theme))
+
+
+class TestBarChartRaceTable:
+    """Tests for reading the precomputed race table."""
+
+    def test_columnar_table(self, component_builder, theme_name):
+        """Test the template declares the columnar race table."""
+        tsx = component_builder.build_component('BarChartRace', {}, theme_name)
+
+        assert 'interface RaceTable' in tsx
+        assert 'race?: RaceTable' in tsx
+        for column in ('id', 'value', 'position', 'width', 'label'):
+            assert f'  {column}: number[];' in tsx
+
+    def test_row_lookup(self, component_builder, theme_name):
+        """Test each frame only indexes its row."""
+        tsx = component_builder.build_component('BarChartRace', {}, theme_name)
+
+        assert 'const rowStart = row * race.slots;' in tsx
+        assert 'sort(' not in tsx
+
+    def test_animations(self, component_builder, theme_name):
+        """Test entrance, exit and overtaking animations."""
+        tsx = component_builder.build_component('BarChartRace', {}, theme_name)
+
+        assert 'entranceProgress' in tsx
+        assert 'exitProgress' in tsx
+        assert 'translateY(${bar.y}px)' in tsx
@@ -166,6 +166,18 @@ class TestCodeBlockSyntaxHighlighting:
         assert 'Highlight' in tsx
         assert 'themes' in tsx
 
+    def test_precomputed_tokens(self, component_builder, theme_name):
+        """Test generator-tokenized code is used when provided."""
+        tsx = component_builder.build_component(
+            'CodeBlock',
+            {'code': 'test'},
+            theme_name
+        )
+
+        assert 'code_tokens?: CodeTokens' in tsx
+        assert 'useMemo' in tsx
+        assert 'decodeTokens' in tsx
+
     def test_language_support(self, component_builder, theme_name):
         """Test language prop is used."""
         tsx = component_builder.build_component(
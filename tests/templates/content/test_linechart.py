@@ -176,6 +176,19 @@ class TestLineChartPath:
         assert 'scaleX' in tsx
         assert 'scaleY' in tsx
 
+    def test_precomputed_geometry(self, component_builder, theme_name):
+        """Test the line is drawn from precomputed geometry with a stroke offset."""
+        tsx = component_builder.build_component(
+            'LineChart',
+            {'data_points': [1, 2, 3]},
+            theme_name
+        )
+
+        assert 'geometry?: LineGeometry' in tsx
+        assert 'useMemo' in tsx
+        assert 'strokeDashoffset={strokeDashoffset}' in tsx
+        assert 'Math.min(...' not in tsx
+
 
 class TestLineChartAnimation:
     """Tests for chart animations."""
@@ -214,7 +227,7 @@ class TestLineChartAnimation:
 
         assert 'lineProgress' in tsx
         assert 'numPointsToShow' in tsx
-        assert 'visiblePoints' in tsx
+        assert 'visibleMarkers' in tsx
 
     def test_data_points_pulse(self, component_builder, theme_name):
         """Test data points have pulse animation."""
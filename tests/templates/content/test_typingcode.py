@@ -195,6 +195,29 @@ class TestTypingCodeSyntaxHighlighting:
         assert 'Highlight' in tsx
         assert 'themes' in tsx
 
+    def test_precomputed_tokens(self, component_builder, theme_name):
+        """Test generator-tokenized code is used when provided."""
+        tsx = component_builder.build_component(
+            'TypingCode',
+            {'code': 'test'},
+            theme_name
+        )
+
+        assert 'code_tokens?: CodeTokens' in tsx
+        assert 'useMemo' in tsx
+        assert 'revealTokens(code, decodedLines, charsToShow, cursor)' in tsx
+
+    def test_reveal_table(self, component_builder, theme_name):
+        """Test the precomputed reveal table is indexed per frame."""
+        tsx = component_builder.build_component(
+            'TypingCode',
+            {'code': 'test'},
+            theme_name
+        )
+
+        assert 'reveal?: RevealTable' in tsx
+        assert 'reveal.chars[revealIndex]' in tsx
+
     def test_language_support(self, component_builder, theme_name):
         """Test language prop is used."""
         tsx = component_builder.build_component(
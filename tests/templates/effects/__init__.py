@@ -0,0 +1,3 @@
+"""
+Effect component template tests.
+"""
@@ -0,0 +1,60 @@
+"""
+Tests for ParticleEffect template generation.
+"""
+
+from ..conftest import (
+    assert_valid_typescript,
+    assert_has_interface,
+    assert_has_timing_props,
+    assert_has_visibility_check
+)
+
+
+class TestParticleEffectBasic:
+    """Basic ParticleEffect generation tests."""
+
+    def test_basic_generation(self, component_builder, theme_name):
+        """Test basic ParticleEffect generation."""
+        tsx = component_builder.build_component('ParticleEffect', {}, theme_name)
+
+        assert 'ParticleEffect' in tsx
+        assert_valid_typescript(tsx)
+        assert_has_interface(tsx, 'ParticleEffect')
+        assert_has_timing_props(tsx)
+        assert_has_visibility_check(tsx)
+
+    def test_all_themes(self, component_builder, all_themes):
+        """Test ParticleEffect builds with every theme."""
+        for theme in all_themes:
+            assert_valid_typescript(component_builder.build_component('ParticleEffect', {}, theme))
+
+    def test_found_in_effects_category(self, component_builder):
+        """Test the template lives in the effects category."""
+        assert component_builder._find_template('ParticleEffect') == 'effects/ParticleEffect.tsx.j2'
+
+
+class TestParticleEffectBuffer:
+    """Tests for sampling the precomputed keyframe buffer."""
+
+    def test_buffer_decoded_once(self, component_builder, theme_name):
+        """Test the base64 buffer is decoded into an Int16Array in useMemo."""
+        tsx = component_builder.build_component('ParticleEffect', {}, theme_name)
+
+        assert 'interface ParticleBuffer' in tsx
+        assert 'new Int16Array(bytes.buffer)' in tsx
+        assert 'useMemo(' in tsx
+
+    def test_keyframe_interpolation(self, component_builder, theme_name):
+        """Test frames blend between keyframes instead of simulating."""
+        tsx = component_builder.build_component('ParticleEffect', {}, theme_name)
+
+        assert 'const blend = position - current;' in tsx
+        assert 'Math.random' not in tsx
+
+    def test_effect_shapes(self, component_builder, theme_name):
+        """Test each effect has its own shape."""
+        tsx = component_builder.build_component('ParticleEffect', {}, theme_name)
+
+        assert 'sparklePath' in tsx
+        assert '<circle' in tsx
+        assert '<rect' in tsx
@@ -0,0 +1,54 @@
+"""
+Tests for CaptionTrack template generation.
+"""
+
+from ..conftest import (
+    assert_valid_typescript,
+    assert_has_interface,
+    assert_has_timing_props,
+    assert_has_visibility_check
+)
+
+
+class TestCaptionTrackBasic:
+    """Basic CaptionTrack generation tests."""
+
+    def test_basic_generation(self, component_builder, theme_name):
+        """Test basic CaptionTrack generation."""
+        tsx = component_builder.build_component('CaptionTrack', {}, theme_name)
+
+        assert 'CaptionTrack' in tsx
+        assert_valid_typescript(tsx)
+        assert_has_interface(tsx, 'CaptionTrack')
+        assert_has_timing_props(tsx)
+        assert_has_visibility_check(tsx)
+
+    def test_all_themes(self, component_builder, all_themes):
+        """Test CaptionTrack builds with every theme."""
+        for theme in all_themes:
+            assert_valid_typescript(component_builder.build_component('CaptionTrack', {}, theme))
+
+
+class TestCaptionTrackLookup:
+    """Tests for finding the active cue."""
+
+    def test_binary_search(self, component_builder, theme_name):
+        """Test the active cue is found with a binary search."""
+        tsx = component_builder.build_component('CaptionTrack', {}, theme_name)
+
+        assert 'const findCue = (starts: number[], frame: number): number =>' in tsx
+        assert 'const mid = (low + high) >> 1;' in tsx
+        assert '.find(' not in tsx
+
+    def test_text_offsets(self, component_builder, theme_name):
+        """Test cue text is sliced out of the concatenated string."""
+        tsx = component_builder.build_component('CaptionTrack', {}, theme_name)
+
+        assert 'captions.text.slice(captions.offsets[index], captions.offsets[index + 1])' in tsx
+
+    def test_variants(self, component_builder, theme_name):
+        """Test the caption style variants."""
+        tsx = component_builder.build_component('CaptionTrack', {}, theme_name)
+
+        for variant in ('boxed', 'outline', 'highlight'):
+            assert f'{variant}: {{' in tsx
@@ -0,0 +1,54 @@
+"""
+Tests for bounded async batches.
+"""
+
+import asyncio
+
+import pytest
+
+from chuk_mcp_remotion.utils.async_batch import gather_bounded, join_path
+
+
+@pytest.mark.asyncio
+class TestGatherBounded:
+    """Test gather_bounded."""
+
+    async def test_results_in_order(self):
+        """Test results come back in item order."""
+        async def double(value):
+            await asyncio.sleep(0.001 * (5 - value))
+            return value * 2
+
+        assert await gather_bounded(range(5), double) == [0, 2, 4, 6, 8]
+
+    async def test_concurrency_bound(self):
+        """Test no more than `concurrency` workers run at once."""
+        running = peak = 0
+
+        async def work(_):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+        await gather_bounded(range(20), work, concurrency=3)
+        assert peak == 3
+
+    async def test_exceptions_returned(self):
+        """Test a failing worker does not abort the batch."""
+        async def work(value):
+            if value == 1:
+                raise ValueError("bad")
+            return value
+
+        results = await gather_bounded([0, 1, 2], work)
+        assert results[0] == 0 and results[2] == 2
+        assert isinstance(results[1], ValueError)
+
+
+def test_join_path():
+    """Test directory joining."""
+    assert join_path("themes", "a.json") == "themes/a.json"
+    assert join_path("themes/", "a.json") == "themes/a.json"
+    assert join_path("", "a.json") == "a.json"
@@ -0,0 +1,171 @@
+"""
+Tests for per-frame audio analysis.
+"""
+
+import math
+import struct
+import wave
+
+import pytest
+
+from chuk_mcp_remotion.generator import audio_analysis
+from chuk_mcp_remotion.generator.audio_analysis import (
+    analyze_audio,
+    slice_table,
+    waveform_overview
+)
+from chuk_mcp_remotion.generator.composition_builder import CompositionBuilder
+
+pytestmark = pytest.mark.skipif(audio_analysis.np is None, reason="NumPy not installed")
+
+
+def write_wav(path, seconds=2.0, frequency=440.0, amplitude=0.5, rate=8000, width=2, channels=1):
+    """Write a tone for the first half of the file, then silence."""
+    total = int(seconds * rate)
+    data = bytearray()
+    for i in range(total):
+        value = amplitude * math.sin(2 * math.pi * frequency * i / rate) if i < total // 2 else 0.0
+        if width == 1:
+            sample = bytes([int(value * 127) + 128])
+        elif width == 2:
+            sample = struct.pack("<h", int(value * 32767))
+        elif width == 3:
+            sample = int(value * 8388607).to_bytes(3, "little", signed=True)
+        else:
+            sample = struct.pack("<i", int(value * 2147483647))
+        data += sample * channels
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(width)
+        wav.setframerate(rate)
+        wav.writeframes(bytes(data))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty in-memory cache."""
+    audio_analysis._memory_cache.clear()
+
+
+class TestAnalyzeAudio:
+    """Tests for the per-frame level tables."""
+
+    @pytest.mark.parametrize("width", [1, 2, 3, 4])
+    def test_levels(self, tmp_path, width):
+        """Test RMS and peak levels of a tone followed by silence."""
+        table = analyze_audio(write_wav(tmp_path / "tone.wav", width=width, channels=2), fps=30, bands=0)
+
+        assert table["frames"] == 60
+        assert table["channels"] == 2
+        # A sine at half scale: peak 0.5, RMS 0.5 / sqrt(2)
+        assert abs(table["peak"][10] - 127) <= 2
+        assert abs(table["rms"][10] - 90) <= 2
+        assert table["rms"][50] == 0
+        assert table["bands"] == []
+
+    def test_band_energy(self, tmp_path):
+        """Test a tone lights up the band holding its frequency."""
+        table = analyze_audio(write_wav(tmp_path / "tone.wav", frequency=1000.0), fps=30, bands=8)
+        row = table["bands"][10 * 8:11 * 8]
+
+        assert len(table["bands"]) == 60 * 8
+        assert max(row) == 255
+        assert sorted(row)[-2] < 200
+        assert max(table["bands"][50 * 8:51 * 8]) == 0
+
+    def test_streams_in_chunks(self, tmp_path, monkeypatch):
+        """Test chunked reading gives the same table as one read."""
+        path = write_wav(tmp_path / "tone.wav", seconds=3.0)
+        whole = analyze_audio(path, fps=24, bands=4)
+
+        audio_analysis._memory_cache.clear()
+        monkeypatch.setattr(audio_analysis, "CHUNK_FRAMES", 7)
+        assert analyze_audio(path, fps=24, bands=4) == whole
+
+    def test_cache_by_hash(self, tmp_path, monkeypatch):
+        """Test results are cached on disk by file content."""
+        path = write_wav(tmp_path / "tone.wav")
+        cache = tmp_path / "cache"
+        first = analyze_audio(path, fps=30, bands=4, cache_dir=cache)
+        cached = list(cache.glob("audio-*.json"))
+
+        assert len(cached) == 1
+        assert first["sha256"] in cached[0].name
+
+        # A copy with the same content is served from the disk cache
+        audio_analysis._memory_cache.clear()
+        monkeypatch.setattr(audio_analysis, "_analyse", None)
+        copy = tmp_path / "copy.wav"
+        copy.write_bytes(path.read_bytes())
+        assert analyze_audio(copy, fps=30, bands=4, cache_dir=cache) == first
+
+    def test_memory_cache_bounded(self, tmp_path, monkeypatch):
+        """Test the in-memory cache drops old tables and hands out copies."""
+        monkeypatch.setattr(audio_analysis, "ANALYSIS_CACHE_SIZE", 2)
+        path = write_wav(tmp_path / "tone.wav", seconds=0.5)
+        first = analyze_audio(path, fps=30, bands=0)
+        first["rms"][0] = 999
+
+        assert analyze_audio(path, fps=30, bands=0)["rms"][0] != 999
+        for fps in (24, 25, 60):
+            analyze_audio(path, fps=fps, bands=0)
+        assert len(audio_analysis._memory_cache) == 2
+
+    def test_invalid_files(self, tmp_path):
+        """Test non-WAV input is rejected with a ValueError."""
+        path = tmp_path / "song.wav"
+        path.write_bytes(b"not a wav")
+        with pytest.raises(ValueError, match="Not a readable WAV"):
+            analyze_audio(path)
+
+    def test_requires_numpy(self, tmp_path, monkeypatch):
+        """Test a clear error when NumPy is missing."""
+        monkeypatch.setattr(audio_analysis, "np", None)
+        with pytest.raises(ImportError, match=r"\[audio\]"):
+            analyze_audio(tmp_path / "tone.wav")
+
+
+class TestTableHelpers:
+    """Tests for slicing and overviews."""
+
+    def test_slice_pads_with_silence(self):
+        """Test slices past the end of the audio are silent."""
+        table = {"frames": 3, "rms": [1, 2, 3], "peak": [4, 5, 6], "band_count": 2, "bands": [1, 1, 2, 2, 3, 3]}
+        sliced = slice_table(table, 2, 3)
+
+        assert sliced["frames"] == 3
+        assert sliced["rms"] == [3, 0, 0]
+        assert sliced["bands"] == [3, 3, 0, 0, 0, 0]
+
+    def test_overview(self):
+        """Test the overview keeps the loudest frame of each column."""
+        assert waveform_overview([1, 9, 2, 3, 8, 4], 3) == [9, 3, 8]
+        assert waveform_overview([5], 3) == [5, 5, 5]
+
+
+class TestAudioComponents:
+    """Tests for add_audio_waveform and add_audio_bars."""
+
+    def test_add_audio_bars(self, tmp_path):
+        """Test the bars get the analysed window of the audio."""
+        path = write_wav(tmp_path / "tone.wav")
+        builder = CompositionBuilder(fps=30)
+        builder.add_audio_bars(str(path), offset=0.5, bands=8)
+
+        component = builder.components[0]
+        assert component.component_type == "AudioBars"
+        assert component.duration_frames == 45
+        assert len(component.props["audio"]["bands"]) == 45 * 8
+        assert "<AudioBars" in builder.generate_composition_tsx()
+
+    def test_add_audio_waveform(self, tmp_path):
+        """Test the waveform gets peaks and an overview."""
+        path = write_wav(tmp_path / "tone.wav")
+        builder = CompositionBuilder(fps=30)
+        builder.add_audio_waveform(str(path), duration=1.0, columns=10)
+
+        audio = builder.components[0].props["audio"]
+        assert audio["frames"] == 30
+        assert len(audio["overview"]) == 10
+        assert "bands" not in audio
@@ -0,0 +1,114 @@
+"""
+Tests for precomputed bar chart race tables.
+"""
+
+import pytest
+
+from chuk_mcp_remotion.generator import bar_chart_race
+from chuk_mcp_remotion.generator.bar_chart_race import compute_bar_chart_race, parse_rows
+from chuk_mcp_remotion.generator.composition_builder import CompositionBuilder
+
+
+@pytest.fixture
+def rows():
+    """Two series swapping places between two periods."""
+    return [
+        [2020, "Python", 10], [2020, "JavaScript", 30], [2020, "Go", 5],
+        [2021, "Python", 50], [2021, "JavaScript", 40], [2021, "Go", 5]
+    ]
+
+
+def frame_bars(race, frame):
+    """Decode one frame's row into (name, value, position, width) tuples."""
+    start = frame * race["slots"]
+    return [
+        (race["names"][race["id"][i]], race["value"][i], race["position"][i], race["width"][i])
+        for i in range(start, start + race["slots"])
+    ]
+
+
+class TestParseRows:
+    """Tests for long-format row parsing."""
+
+    def test_lists_and_dicts(self):
+        """Test list rows and dict rows with custom keys."""
+        times, names, values = parse_rows([["b", "x", 1], ["a", "y", 2]])
+        assert times == ["a", "b"]
+        assert names == ["x", "y"]
+        assert values == {(1, 0): 1.0, (0, 1): 2.0}
+
+        times, names, _ = parse_rows([{"year": 1, "team": "A", "pts": 3}], "year", "team", "pts")
+        assert (times, names) == ([1], ["A"])
+
+    def test_missing_key(self):
+        """Test dict rows missing a key raise."""
+        with pytest.raises(ValueError, match="missing"):
+            parse_rows([{"time": 1, "name": "a"}])
+
+
+class TestComputeBarChartRace:
+    """Tests for the per-frame race table."""
+
+    def test_keyframes_ranked(self, rows):
+        """Test the first and last frames rank the keyframe values."""
+        race = compute_bar_chart_race(rows, frames=31, top_n=2)
+
+        assert race["slots"] == 3
+        assert len(race["id"]) == 31 * 3
+        assert frame_bars(race, 0) == [
+            ("JavaScript", 30.0, 0.0, 1.0),
+            ("Python", 10.0, 1.0, 0.3333),
+            ("Go", 5.0, 2.0, 0.1667)
+        ]
+        assert [bar[0] for bar in frame_bars(race, 30)] == ["Python", "JavaScript", "Go"]
+        assert (race["labels"][race["label"][0]], race["labels"][race["label"][30]]) == ("2020", "2021")
+
+    def test_overtaking_is_smooth(self, rows):
+        """Test bars slide between ranks instead of jumping."""
+        race = compute_bar_chart_race(rows, frames=31, top_n=2)
+        middle = dict((name, position) for name, _, position, _ in frame_bars(race, 15))
+
+        assert middle["Python"] == middle["JavaScript"] == 0.5
+        assert frame_bars(race, 15)[0][1] == 30.0  # Python: halfway from 10 to 50
+
+    def test_missing_values_carried_forward(self):
+        """Test series missing at a keyframe keep their last value."""
+        race = compute_bar_chart_race([[1, "a", 5], [1, "b", 3], [2, "a", 9]], frames=2)
+
+        assert dict((name, value) for name, value, _, _ in frame_bars(race, 1)) == {"a": 9.0, "b": 3.0}
+
+    def test_single_keyframe(self):
+        """Test one period renders a static ranking."""
+        race = compute_bar_chart_race([[1, "a", 5], [1, "b", 7]], frames=4)
+
+        assert [bar[0] for bar in frame_bars(race, 3)] == ["b", "a"]
+
+    def test_invalid_arguments(self, rows):
+        """Test empty data and invalid sizes raise."""
+        with pytest.raises(ValueError, match="at least one row"):
+            compute_bar_chart_race([], frames=10)
+        with pytest.raises(ValueError, match="top_n"):
+            compute_bar_chart_race(rows, frames=10, top_n=0)
+
+    @pytest.mark.skipif(bar_chart_race.np is None, reason="numpy not installed")
+    def test_numpy_matches_python(self, monkeypatch):
+        """Test the vectorized and pure-Python paths produce the same table."""
+        rows = [[year, f"s{k}", (k * 37 + year * 11) % 97] for year in range(10) for k in range(15)]
+        vectorized = compute_bar_chart_race(rows, frames=120, top_n=5)
+        monkeypatch.setattr(bar_chart_race, "np", None)
+
+        assert compute_bar_chart_race(rows, frames=120, top_n=5) == vectorized
+
+
+class TestBarChartRaceComponent:
+    """Tests for add_bar_chart_race."""
+
+    def test_race_prop(self, rows):
+        """Test the builder passes a table spanning the component."""
+        builder = CompositionBuilder(fps=30)
+        builder.add_bar_chart_race(rows, title="Languages", duration=2.0, top_n=2)
+        component = builder.components[0]
+
+        assert component.component_type == "BarChartRace"
+        assert component.props["race"]["frames"] == component.duration_frames == 60
+        assert "race={" in builder.generate_composition_tsx()
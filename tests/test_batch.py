@@ -0,0 +1,208 @@
+"""
+Tests for batch variant generation.
+"""
+
+import json
+
+import pytest
+
+from chuk_mcp_remotion.generator.batch import (
+    VariantBatch,
+    compile_timeline,
+    iter_rows,
+    main,
+    render_timeline,
+    variant_name,
+)
+from chuk_mcp_remotion.generator.composition_builder import CompositionBuilder
+from chuk_mcp_remotion.generator.syntax import tokenize_code
+from chuk_mcp_remotion.generator.typing_reveal import build_reveal_table
+
+
+@pytest.fixture
+def base():
+    """Base timeline with placeholders."""
+    builder = CompositionBuilder()
+    builder.add_title_scene("Hello [[ name ]]", subtitle="You scored [[ score ]] points")
+    code = builder.create_code_block_instance("print('[[ name ]]')", start_frame=90, duration_frames=60)
+    builder.add_container(code)
+    return builder.to_dict()
+
+
+@pytest.fixture
+def rows_csv(tmp_path):
+    """CSV row source."""
+    path = tmp_path / "rows.csv"
+    path.write_text("name,score\nAlice,10\nBob Smith,20\nCarol,30\n")
+    return path
+
+
+class TestPlaceholders:
+    """Tests for placeholder compilation and substitution."""
+
+    def test_substitutes_nested_props(self, base):
+        """Test placeholders in nested children are filled."""
+        timeline = render_timeline(compile_timeline(base), {"name": "Alice", "score": "10"})
+
+        assert timeline["components"][0]["props"]["text"] == "Hello Alice"
+        assert timeline["components"][1]["props"]["children"]["props"]["code"] == "print('Alice')"
+
+    def test_single_placeholder_keeps_native_type(self):
+        """Test a prop that is only a placeholder takes the row value as-is."""
+        compiled = compile_timeline({"data": "[[ series ]]"})
+
+        assert render_timeline(compiled, {"series": [1, 2, 3]}) == {"data": [1, 2, 3]}
+
+    def test_missing_column_kept(self, base):
+        """Test placeholders a row has no value for are kept as written."""
+        timeline = render_timeline(compile_timeline(base), {"name": "Alice"})
+
+        assert timeline["components"][0]["props"]["subtitle"] == "You scored [[ score ]] points"
+        assert render_timeline(compile_timeline({"code": "v[[i]]"}), {}) == {"code": "v[[i]]"}
+
+    def test_code_brackets_kept(self):
+        """Test [[ in code that is not a column placeholder is left as written."""
+        code = "x = arr[[0, 1]]\n[% if y %]z[% endif %] # [[ name ]]"
+        compiled = compile_timeline({"code": code})
+
+        assert render_timeline(compiled, {"name": "Alice"}) == {
+            "code": "x = arr[[0, 1]]\n[% if y %]z[% endif %] # Alice"
+        }
+
+    def test_expressions_not_evaluated(self):
+        """Test placeholder-like expressions are never evaluated."""
+        payload = "[[ cycler.__init__.__globals__.os.getcwd() ]]"
+        compiled = compile_timeline({"text": payload, "title": "[[ name.upper() ]]"})
+
+        assert render_timeline(compiled, {}) == {"text": payload, "title": "[[ name.upper() ]]"}
+
+    def test_columns_whitelist(self):
+        """Test only the listed columns are substituted."""
+        compiled = compile_timeline({"code": "v[[i]] = [[ name ]]", "i": "[[i]]"}, columns=["name"])
+
+        assert render_timeline(compiled, {"name": "Alice"}) == {"code": "v[[i]] = Alice", "i": "[[i]]"}
+
+    def test_variant_name(self):
+        """Test variant names are filesystem-safe."""
+        assert variant_name(3, {"name": "Bob Smith!"}, "name") == "00003-bob-smith"
+        assert variant_name(3, {"name": "Bob"}) == "variant-00003"
+
+
+class TestRowSources:
+    """Tests for streaming row sources."""
+
+    def test_csv(self, rows_csv):
+        """Test reading CSV rows."""
+        assert [row["name"] for row in iter_rows(rows_csv)] == ["Alice", "Bob Smith", "Carol"]
+
+    def test_jsonl(self, tmp_path):
+        """Test reading JSON Lines rows."""
+        path = tmp_path / "rows.jsonl"
+        path.write_text('{"name": "Alice"}\n\n{"name": "Bob"}\n')
+
+        assert list(iter_rows(path)) == [{"name": "Alice"}, {"name": "Bob"}]
+
+    def test_unsupported(self, tmp_path):
+        """Test unsupported row sources are rejected."""
+        with pytest.raises(ValueError):
+            list(iter_rows(tmp_path / "rows.xlsx"))
+
+
+class TestVariantBatch:
+    """Tests for the batch engine."""
+
+    def test_props_mode(self, base, rows_csv, tmp_path):
+        """Test a timeline JSON is written per row."""
+        report = VariantBatch(base, tmp_path / "out", workers=1, name_column="name").run(iter_rows(rows_csv))
+        variant = json.loads((tmp_path / "out" / "00001-bob-smith.json").read_text())
+
+        assert report["variants"] == 3
+        assert report["failed"] == 0
+        assert report["variants_per_second"] > 0
+        assert set(report["stage_seconds"]) == {"setup", "substitute", "build", "write"}
+        assert variant["components"][0]["props"]["text"] == "Hello Bob Smith"
+
+    def test_code_tokens_follow_substituted_code(self, tmp_path):
+        """Test highlighting tokens are rebuilt from each row's code, not the placeholder."""
+        builder = CompositionBuilder()
+        builder.add_code_block("[[ snippet ]]", language="python")
+        rows = [{"snippet": "def f(x):\n    return x * 2\n"}]
+        VariantBatch(builder.to_dict(), tmp_path / "out", workers=1).run(rows)
+        props = json.loads((tmp_path / "out" / "variant-00000.json").read_text())["components"][0]["props"]
+
+        assert props["code"] == rows[0]["snippet"]
+        assert props["code_tokens"] == tokenize_code(rows[0]["snippet"], "python")
+        assert len(props["code_tokens"]["lines"]) == 3
+
+    def test_typing_reveal_follows_substituted_code(self, tmp_path):
+        """Test TypingCode's reveal table types each row's full code."""
+        builder = CompositionBuilder()
+        builder.add_typing_code("[[ snippet ]]", language="python", typing_speed=60.0, jitter=0.2, seed=3)
+        snippet = "for i in range(3):\n    print(i)\n"
+        VariantBatch(builder.to_dict(), tmp_path / "out", workers=1).run([{"snippet": snippet}])
+        props = json.loads((tmp_path / "out" / "variant-00000.json").read_text())["components"][0]["props"]
+
+        assert props["reveal"]["chars"][-1] == len(snippet)
+        assert props["reveal"] == build_reveal_table(
+            snippet, 30, 300, typing_speed=60.0, code_tokens=props["code_tokens"], jitter=0.2, seed=3
+        )
+        assert "typing=" not in CompositionBuilder.from_dict(
+            {"components": [builder.to_dict()["components"][0]]}
+        ).generate_composition_tsx()
+
+    def test_project_mode(self, base, rows_csv, tmp_path):
+        """Test a project is generated per row from the shared scaffold."""
+        report = VariantBatch(base, tmp_path / "out", mode="project", workers=1).run(iter_rows(rows_csv))
+        project = tmp_path / "out" / "variant-00002"
+
+        assert report["variants"] == 3
+        assert (project / "package.json").exists()
+        assert (project / "src" / "components" / "CodeBlock.tsx").exists()
+        assert 'text="Hello Carol"' in (project / "src" / "VideoComposition.tsx").read_text()
+
+    def test_process_pool(self, base, tmp_path):
+        """Test rows are generated across worker processes."""
+        rows = ({"name": f"User {i}", "score": str(i)} for i in range(40))
+        report = VariantBatch(base, tmp_path / "out", workers=2, chunk_size=4).run(rows)
+
+        assert report["variants"] == 40
+        assert report["workers"] == 2
+        assert len(list((tmp_path / "out").glob("*.json"))) == 40
+
+    def test_header_columns_by_default(self, tmp_path):
+        """Test only the row source's columns are substituted, so code keeps v[[i]]."""
+        builder = CompositionBuilder()
+        builder.add_code_block("v[[i]] = [[ name ]]", language="python")
+        path = tmp_path / "rows.csv"
+        path.write_text("name\nAlice\n")
+        report = VariantBatch(builder.to_dict(), tmp_path / "out", workers=1).run(iter_rows(path))
+        props = json.loads((tmp_path / "out" / "variant-00000.json").read_text())["components"][0]["props"]
+
+        assert report["failed"] == 0
+        assert props["code"] == "v[[i]] = Alice"
+
+    def test_failed_rows_reported(self, tmp_path):
+        """Test rows that fail are counted without stopping the batch."""
+        builder = CompositionBuilder()
+        builder.add_line_chart("[[ series ]]")
+        # A one-value pair is not a valid data point
+        rows = [{"series": [[0, 1], [1, 2]]}, {"series": [[1]]}]
+        report = VariantBatch(builder.to_dict(), tmp_path / "out", workers=1).run(rows)
+
+        assert report["variants"] == 1
+        assert report["failed"] == 1
+        assert report["errors"][0]["index"] == 1
+
+    def test_unknown_mode(self, base, tmp_path):
+        """Test unknown modes are rejected."""
+        with pytest.raises(ValueError):
+            VariantBatch(base, tmp_path, mode="video")
+
+    def test_cli(self, base, rows_csv, tmp_path, capsys):
+        """Test the command-line entry point."""
+        base_file = tmp_path / "base.json"
+        base_file.write_text(json.dumps(base))
+        exit_code = main([str(base_file), str(rows_csv), "--out", str(tmp_path / "out"), "--workers", "1"])
+
+        assert exit_code == 0
+        assert json.loads(capsys.readouterr().out)["variants"] == 3
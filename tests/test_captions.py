@@ -0,0 +1,162 @@
+"""
+Tests for SRT/VTT caption import.
+"""
+
+from bisect import bisect_right
+
+import pytest
+
+from chuk_mcp_remotion.generator.captions import (
+    Cue,
+    build_caption_track,
+    load_captions,
+    parse_caption_text,
+    parse_captions,
+    parse_timestamp
+)
+from chuk_mcp_remotion.generator.composition_builder import CompositionBuilder
+
+SRT = """1
+00:00:01,000 --> 00:00:02,500
+Hello <i>world</i>
+
+2
+00:00:03,000 --> 00:00:05,000
+{\\an8}Two
+lines
+"""
+
+VTT = """WEBVTT - Episode 12
+
+NOTE
+This is a comment
+00:00:09.000 --> 00:00:10.000
+
+STYLE
+::cue { color: yellow }
+
+intro
+00:01.000 --> 00:02.500 align:start line:90%
+<v Host>Hello &amp; welcome
+
+00:03.000 --> 00:05.000
+Second cue
+"""
+
+
+def cue_text(track, index):
+    """Text of one cue."""
+    return track["text"][track["offsets"][index]:track["offsets"][index + 1]]
+
+
+class TestParseCaptions:
+    """Tests for the streaming parser."""
+
+    def test_timestamps(self):
+        """Test SRT and VTT timestamp forms."""
+        assert parse_timestamp("01:02:03,450") == 3723.45
+        assert parse_timestamp("02:03.5") == 123.5
+
+    def test_srt(self):
+        """Test SRT cues with markup removed."""
+        cues = list(parse_captions(SRT.splitlines()))
+
+        assert [(c.start, c.end) for c in cues] == [(1.0, 2.5), (3.0, 5.0)]
+        assert cues[0].text == "Hello world"
+        assert cues[1].text == "Two\nlines"
+
+    def test_vtt(self):
+        """Test VTT headers, NOTE and STYLE blocks and cue settings are skipped."""
+        cues = list(parse_captions(VTT.splitlines()))
+
+        assert [(c.start, c.end) for c in cues] == [(1.0, 2.5), (3.0, 5.0)]
+        assert cues[0].text == "Hello & welcome"
+
+    def test_streams_lines(self):
+        """Test cues are yielded before the input is exhausted."""
+        lines = iter(SRT.splitlines())
+        first = next(parse_captions(lines))
+
+        assert first.text == "Hello world"
+        assert next(lines) == "2"
+
+
+class TestCaptionTrack:
+    """Tests for the packed cue table."""
+
+    def test_parallel_arrays(self):
+        """Test frames, offsets and text line up."""
+        track = parse_caption_text(SRT, fps=30)
+
+        assert track["starts"] == [30, 90]
+        assert track["ends"] == [75, 150]
+        assert cue_text(track, 0) == "Hello world"
+        assert cue_text(track, 1) == "Two\nlines"
+
+    def test_sorted_by_start(self):
+        """Test out-of-order cues are sorted and offsets follow them."""
+        track = parse_caption_text(SRT.replace("00:00:01,000 --> 00:00:02,500", "00:00:06,000 --> 00:00:07,000"), fps=10)
+
+        assert track["starts"] == [30, 60]
+        assert cue_text(track, 0) == "Two\nlines"
+        assert cue_text(track, 1) == "Hello world"
+
+    def test_overlapping_cues_split(self):
+        """Test a long cue is split around a shorter one inside it."""
+        cues = [Cue(0.0, 10.0, "A"), Cue(1.0, 2.0, "B"), Cue(1.5, 3.0, "C")]
+        track = build_caption_track(cues, fps=10)
+
+        assert track["starts"] == [0, 10, 15, 30]
+        assert track["ends"] == [10, 15, 30, 100]
+        assert [cue_text(track, i) for i in range(4)] == ["A", "B", "C", "A"]
+        # Frame 50 is inside A only, and the last span starting before it is A
+        assert cue_text(track, bisect_right(track["starts"], 50) - 1) == "A"
+
+    def test_touching_cues(self):
+        """Test a cue ending where the next starts stays one span after a split."""
+        cues = [Cue(0.0, 1.0, "A"), Cue(1.0, 2.0, "B"), Cue(0.5, 0.8, "A2")]
+        track = build_caption_track(cues, fps=10)
+
+        assert track["starts"] == [0, 5, 8, 10]
+        assert track["ends"] == [5, 8, 10, 20]
+        assert [cue_text(track, i) for i in range(4)] == ["A", "A2", "A", "B"]
+
+    def test_offset_drops_cues_before_zero(self):
+        """Test a negative offset trims cues that end before the track starts."""
+        track = build_caption_track(parse_captions(SRT.splitlines()), fps=30, offset=-3.0)
+
+        assert track["starts"] == [0]
+        assert cue_text(track, 0) == "Two\nlines"
+
+    def test_load_file(self, tmp_path):
+        """Test loading .srt and .vtt files, including a byte order mark."""
+        path = tmp_path / "captions.vtt"
+        path.write_text("\ufeff" + VTT, encoding="utf-8")
+
+        assert load_captions(path, fps=30)["starts"] == [30, 90]
+        with pytest.raises(ValueError, match="Unsupported caption format"):
+            load_captions(tmp_path / "captions.txt", fps=30)
+
+
+class TestCaptionComponent:
+    """Tests for add_caption_track."""
+
+    def test_single_component(self, tmp_path):
+        """Test every cue goes into one CaptionTrack component."""
+        path = tmp_path / "captions.srt"
+        path.write_text(SRT)
+        builder = CompositionBuilder(fps=30)
+        builder.add_caption_track(str(path), start_time=2.0)
+
+        assert len(builder.components) == 1
+        component = builder.components[0]
+        assert component.component_type == "CaptionTrack"
+        assert component.start_frame == 60
+        # Runs until the last cue ends
+        assert component.duration_frames == 150
+        assert "<CaptionTrack" in builder.generate_composition_tsx()
+
+    def test_path_or_content(self):
+        """Test exactly one source is required."""
+        with pytest.raises(ValueError, match="exactly one"):
+            CompositionBuilder().add_caption_track()
@@ -0,0 +1,193 @@
+"""
+Tests for generation-time chart geometry.
+"""
+
+import pytest
+
+from chuk_mcp_remotion.generator import chart_geometry
+from chuk_mcp_remotion.generator.chart_geometry import (
+    MAX_MARKERS,
+    compute_line_geometry,
+    downsample_points,
+    marker_indices,
+    normalize_points,
+    point_budget
+)
+from chuk_mcp_remotion.generator.composition_builder import CompositionBuilder
+
+
+class TestNormalizePoints:
+    """Tests for accepted data shapes."""
+
+    def test_pairs_dicts_and_values(self):
+        """Test [x, y] pairs, {x, y} dicts and plain y values."""
+        assert normalize_points([[0, 1], [2, 3]]) == ([0.0, 2.0], [1.0, 3.0])
+        assert normalize_points([{"x": 1, "y": 5, "label": "a"}]) == ([1.0], [5.0])
+        assert normalize_points([4, 6]) == ([0.0, 1.0], [4.0, 6.0])
+
+    def test_short_pair_rejected(self):
+        """Test a pair without a y value raises."""
+        with pytest.raises(ValueError, match="must be"):
+            normalize_points([[1]])
+
+
+class TestComputeLineGeometry:
+    """Tests for scaled points, path and lengths."""
+
+    def test_bounds_and_corners(self):
+        """Test the data extremes map to the plot corners."""
+        geometry = compute_line_geometry([[0, 0], [10, 100]], width=800, height=400, padding=60)
+
+        assert geometry["bounds"] == {"x_min": 0.0, "x_max": 10.0, "y_min": 0.0, "y_max": 100.0}
+        # Minimum at bottom-left, maximum at top-right
+        assert geometry["points"] == [[60.0, 340.0], [740.0, 60.0]]
+        assert geometry["path"] == "M 60 340 L 740 60"
+
+    def test_cumulative_lengths(self):
+        """Test lengths accumulate segment by segment."""
+        geometry = compute_line_geometry([[0, 0], [1, 0], [2, 0], [2, 1]], width=220, height=120, padding=10)
+        # Flat segments of 100px, then the vertical jump from bottom to top
+        assert geometry["points"][:3] == [[10.0, 110.0], [110.0, 110.0], [210.0, 110.0]]
+        assert geometry["lengths"] == [0.0, 100.0, 200.0, 300.0]
+        assert geometry["total_length"] == 300.0
+
+    def test_flat_data_centered(self):
+        """Test constant data is drawn through the vertical center."""
+        geometry = compute_line_geometry([5, 5, 5])
+
+        assert {y for _, y in geometry["points"]} == {200.0}
+
+    def test_empty_data(self):
+        """Test empty data produces an empty path."""
+        geometry = compute_line_geometry([])
+
+        assert geometry["bounds"] is None
+        assert geometry["path"] == ""
+        assert geometry["total_length"] == 0.0
+
+    def test_markers_bounded(self):
+        """Test long series mark only the ends and extremes, short ones every point."""
+        data = [(i * 37) % 101 for i in range(500)]
+        geometry = compute_line_geometry(data, downsample=None)
+
+        assert geometry["markers"] == sorted({0, 499, data.index(0), data.index(100)})
+        assert compute_line_geometry([1, 3, 2])["markers"] == [0, 1, 2]
+        assert marker_indices(list(range(MAX_MARKERS + 1))) == [0, MAX_MARKERS]
+
+    @pytest.mark.skipif(chart_geometry.np is None, reason="numpy not installed")
+    def test_numpy_matches_python(self, monkeypatch):
+        """Test the vectorized and pure-Python paths agree."""
+        data = [[i, (i * 37) % 11] for i in range(50)]
+        vectorized = compute_line_geometry(data)
+        monkeypatch.setattr(chart_geometry, "np", None)
+
+        assert compute_line_geometry(data) == vectorized
+
+
+class TestLineChartComponent:
+    """Tests for add_line_chart props."""
+
+    def test_geometry_prop(self):
+        """Test the chart carries precomputed geometry instead of raw data."""
+        builder = CompositionBuilder()
+        builder.add_line_chart(data=[[0, 1], [1, 3]], title="Growth")
+        props = builder.components[0].props
+
+        assert props["data"] == [[0, 1], [1, 3]]
+        assert props["geometry"]["path"] == compute_line_geometry([[0, 1], [1, 3]])["path"]
+        tsx = builder.generate_composition_tsx()
+        assert "geometry={" in tsx
+        assert "data={" not in tsx and "downsample=" not in tsx
+
+    def test_placeholder_data(self):
+        """Test placeholder data gets its geometry once it is substituted."""
+        builder = CompositionBuilder()
+        builder.add_line_chart(data="[[ series ]]", downsample="minmax", max_points=10)
+        timeline = builder.to_dict()
+        assert timeline["components"][0]["props"]["geometry"] is None
+
+        timeline["components"][0]["props"]["data"] = list(range(100))
+        geometry = CompositionBuilder.from_dict(timeline).components[0].props["geometry"]
+        assert geometry == compute_line_geometry(list(range(100)), downsample="minmax", max_points=10)
+
+        timeline["components"][0]["props"]["data"] = "[1, 5, 2]"
+        geometry = CompositionBuilder.from_dict(timeline).components[0].props["geometry"]
+        assert geometry == compute_line_geometry([1, 5, 2], downsample="minmax", max_points=10)
+
+
+class TestDownsampling:
+    """Tests for LTTB and min/max downsampling."""
+
+    def test_point_budget_from_width(self):
+        """Test the budget is one point per plot pixel column."""
+        assert point_budget(800, 60) == 680
+
+    def test_short_series_unchanged(self):
+        """Test series within budget are returned as is."""
+        xs, ys = [0.0, 1.0, 2.0], [3.0, 1.0, 2.0]
+
+        assert downsample_points(xs, ys, 10) == (xs, ys)
+
+    def test_lttb_keeps_endpoints_and_spike(self):
+        """Test LTTB keeps the first and last points and a lone spike."""
+        ys = [0.0] * 1000
+        ys[500] = 100.0
+        xs = [float(i) for i in range(1000)]
+        out_x, out_y = downsample_points(xs, ys, 50, "lttb")
+
+        assert len(out_x) == 50
+        assert out_x[0] == 0.0 and out_x[-1] == 999.0
+        assert 100.0 in out_y
+        assert out_x == sorted(out_x)
+
+    def test_minmax_keeps_extremes(self):
+        """Test min/max keeps every bucket's extremes within budget."""
+        xs = [float(i) for i in range(1000)]
+        ys = [float((i * 7919) % 101) for i in range(1000)]
+        out_x, out_y = downsample_points(xs, ys, 100, "minmax")
+
+        assert len(out_x) <= 100
+        assert min(out_y) == min(ys) and max(out_y) == max(ys)
+        assert out_x[0] == 0.0 and out_x[-1] == 999.0
+
+    def test_unknown_method(self):
+        """Test an unknown method raises."""
+        with pytest.raises(ValueError, match="Unknown downsample method"):
+            downsample_points([0.0] * 10, [0.0] * 10, 5, "average")
+
+    @pytest.mark.parametrize("method", ["lttb", "minmax"])
+    @pytest.mark.skipif(chart_geometry.np is None, reason="numpy not installed")
+    def test_numpy_matches_python(self, method, monkeypatch):
+        """Test the vectorized and pure-Python downsamplers pick the same points."""
+        xs = [float(i) for i in range(5000)]
+        ys = [float((i * 7919) % 1009) for i in range(5000)]
+        vectorized = downsample_points(xs, ys, 200, method)
+        monkeypatch.setattr(chart_geometry, "np", None)
+
+        assert downsample_points(xs, ys, 200, method) == vectorized
+
+    def test_geometry_reports_counts(self):
+        """Test the geometry records source and emitted point counts."""
+        data = [[i, i % 17] for i in range(86_400)]
+        geometry = compute_line_geometry(data)
+
+        assert geometry["source_points"] == 86_400
+        assert geometry["emitted_points"] == point_budget()
+        assert len(geometry["points"]) == point_budget()
+        # Axes still span the full series
+        assert geometry["bounds"]["x_max"] == 86_399.0
+
+    def test_downsampling_disabled(self):
+        """Test downsample=None keeps every point."""
+        geometry = compute_line_geometry(list(range(1000)), downsample=None)
+
+        assert geometry["emitted_points"] == 1000
+
+    def test_add_line_chart_budget(self):
+        """Test add_line_chart passes the point budget through."""
+        builder = CompositionBuilder()
+        builder.add_line_chart(data=list(range(1000)), downsample="minmax", max_points=100)
+        geometry = builder.components[0].props["geometry"]
+
+        assert geometry["source_points"] == 1000
+        assert geometry["emitted_points"] <= 100
@@ -0,0 +1,203 @@
+"""
+Tests for the perceptual color engine.
+"""
+
+import math
+
+import pytest
+
+from chuk_mcp_remotion.themes import color_engine
+from chuk_mcp_remotion.themes.color_engine import (
+    contrast_level,
+    contrast_pairs,
+    contrast_ratios,
+    generate_palette,
+    generate_scale,
+    gradient_stops,
+    oklab,
+    oklch,
+    oklch_to_hex,
+    palette_colors,
+    palette_distances,
+    parse_color,
+    unparsed_contrast_pairs
+)
+from chuk_mcp_remotion.tokens.colors import COLOR_TOKENS
+
+
+class TestParseColor:
+    """Test CSS color parsing."""
+
+    def test_hex_forms(self):
+        """Test long, short and alpha hex colors."""
+        assert parse_color("#FF0000") == (1.0, 0.0, 0.0, 1.0)
+        assert parse_color("#f00") == (1.0, 0.0, 0.0, 1.0)
+        assert parse_color("#FF000080")[3] == pytest.approx(128 / 255)
+
+    def test_rgba(self):
+        """Test rgb()/rgba() colors."""
+        r, g, b, alpha = parse_color("rgba(10, 14, 26, 0.85)")
+        assert (round(r * 255), round(g * 255), round(b * 255)) == (10, 14, 26)
+        assert alpha == 0.85
+        assert parse_color("rgb(100%, 0%, 0%)") == (1.0, 0.0, 0.0, 1.0)
+
+    def test_invalid(self):
+        """Test unsupported colors raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_color("blue")
+
+
+class TestConversions:
+    """Test OKLab/OKLCH conversions."""
+
+    def test_reference_values(self):
+        """Test white, black and red against the published OKLab values."""
+        white, black, red = oklab(["#FFFFFF", "#000000", "#FF0000"])
+        assert white == pytest.approx((1.0, 0.0, 0.0), abs=1e-4)
+        assert black == pytest.approx((0.0, 0.0, 0.0), abs=1e-4)
+        assert red == pytest.approx((0.6280, 0.2249, 0.1258), abs=1e-3)
+
+    def test_results_cached_per_string(self):
+        """Test conversions are cached and reused."""
+        color_engine.clear_cache()
+        oklab(["#123456", "#123456"])
+        assert list(color_engine._oklab_cache) == ["#123456"]
+
+    def test_cache_bounded(self, monkeypatch):
+        """Test the OKLab cache drops the least recently used colors past its size."""
+        color_engine.clear_cache()
+        monkeypatch.setattr(color_engine, "COLOR_CACHE_SIZE", 2)
+        oklab(["#000001", "#000002"])
+        oklab(["#000001"])
+
+        assert oklab(["#000003", "#000004", "#000001"])[2] == oklab(["#000001"])[0]
+        assert len(color_engine._oklab_cache) == 2
+        assert "#000002" not in color_engine._oklab_cache
+
+    def test_hex_roundtrip(self):
+        """Test OKLCH -> hex reproduces in-gamut colors."""
+        for color in ("#0066FF", "#00C853", "#FF6B9D", "#8B92A4"):
+            assert oklch_to_hex(*oklch(color)) == color
+
+    def test_out_of_gamut_chroma_reduced(self):
+        """Test impossible chroma is mapped into sRGB."""
+        lightness, chroma, _ = oklch(oklch_to_hex(0.7, 0.5, 140))
+        assert lightness == pytest.approx(0.7, abs=0.01)
+        assert chroma < 0.5
+
+    @pytest.mark.skipif(color_engine.np is None, reason="NumPy not installed")
+    def test_python_fallback_matches_numpy(self, monkeypatch):
+        """Test the pure-Python path gives the same results."""
+        colors = [color for tokens in COLOR_TOKENS.values() for color in tokens["primary"]]
+        color_engine.clear_cache()
+        vectorized = [value for lab in oklab(colors) for value in lab]
+
+        monkeypatch.setattr(color_engine, "np", None)
+        color_engine.clear_cache()
+        assert [value for lab in oklab(colors) for value in lab] == pytest.approx(vectorized)
+        color_engine.clear_cache()
+
+
+class TestScales:
+    """Test scale and palette generation."""
+
+    def test_scale_darkens(self):
+        """Test scales start at the seed and get darker."""
+        scale = generate_scale("#0066FF")
+        assert scale[0] == "#0066FF"
+        assert len(scale) == 3
+        lightness = [oklch(color)[0] for color in scale]
+        assert lightness == sorted(lightness, reverse=True)
+
+    def test_reproduces_tech_palette(self):
+        """Test the tech seed gives a palette close to the tech tokens."""
+        palette = generate_palette("#0066FF")
+        generated = {"primary": palette["primary"], "accent": palette["accent"], "background": {}}
+        reference = {"primary": COLOR_TOKENS["tech"]["primary"], "accent": COLOR_TOKENS["tech"]["accent"], "background": {}}
+        assert palette_distances(reference, [generated])[0] < 0.02
+        assert palette["gradient"].startswith("linear-gradient(135deg, #0066FF 0%")
+
+    def test_accent_hue_shift(self):
+        """Test the accent hue follows the requested shift."""
+        palette = generate_palette("#0066FF", accent_hue_shift=120)
+        shift = (oklch(palette["accent"][0])[2] - oklch("#0066FF")[2]) % 360
+        assert shift == pytest.approx(120, abs=5)
+
+
+class TestPaletteDistance:
+    """Test perceptual palette distance."""
+
+    def test_identical_is_zero(self):
+        """Test a palette has zero distance to itself."""
+        assert palette_distances(COLOR_TOKENS["tech"], [COLOR_TOKENS["tech"]]) == [0.0]
+
+    def test_similar_themes_closer(self):
+        """Test business (navy/teal) is closer to tech than gaming is."""
+        business, gaming = palette_distances(
+            COLOR_TOKENS["tech"], [COLOR_TOKENS["business"], COLOR_TOKENS["gaming"]]
+        )
+        assert business < gaming
+
+    def test_missing_roles(self):
+        """Test roles missing on either side are skipped."""
+        assert palette_colors({"primary": ["#000000"]})[:2] == ["#000000", None]
+        assert palette_distances({"primary": ["#000000"]}, [{"accent": ["#000000"]}]) == [math.inf]
+
+
+class TestContrast:
+    """Test WCAG contrast ratios."""
+
+    def test_reference_ratios(self):
+        """Test black/white and a known mid-grey ratio."""
+        white_on_black, grey_on_white = contrast_ratios([("#FFFFFF", "#000000"), ("#777777", "#FFFFFF")])
+        assert white_on_black == pytest.approx(21.0)
+        assert grey_on_white == pytest.approx(4.48, abs=0.01)
+
+    def test_ratio_is_symmetric(self):
+        """Test swapping foreground and background gives the same ratio."""
+        forward, backward = contrast_ratios([("#0066FF", "#F5F7FA"), ("#F5F7FA", "#0066FF")])
+        assert forward == pytest.approx(backward)
+
+    def test_translucent_background_worst_case(self):
+        """Test glass backgrounds are checked over black and white."""
+        glass, = contrast_ratios([("#FFFFFF", "rgba(0, 0, 0, 0.5)")])
+        # Over white the background is mid grey, the worse case for white text
+        over_white, = contrast_ratios([("#FFFFFF", "#808080")])
+        assert glass == pytest.approx(over_white, abs=0.05)
+
+    def test_translucent_foreground_composited(self):
+        """Test translucent text is blended into its background."""
+        faded, = contrast_ratios([("rgba(255, 255, 255, 0.5)", "#000000")])
+        assert 1 < faded < 21
+
+    def test_levels(self):
+        """Test WCAG level thresholds."""
+        assert contrast_level(21) == "AAA"
+        assert contrast_level(4.5) == "AA"
+        assert contrast_level(3.2) == "AA Large"
+        assert contrast_level(1.5) == "Fail"
+
+    def test_theme_pairs(self):
+        """Test theme pairs cover text, semantic and gradient combinations."""
+        pairs = contrast_pairs(COLOR_TOKENS["tech"])
+        roles = {(fg, bg) for fg, _, bg, _ in pairs}
+        assert ("text.on_dark", "background.dark") in roles
+        assert ("semantic.error", "background.glass") in roles
+        assert ("text.muted", "gradient[1]") in roles
+        assert ("text.on_dark", "background.light") not in roles
+        assert gradient_stops(COLOR_TOKENS["tech"]["gradient"]) == ["#0066FF", "#00D9FF"]
+
+    def test_unparsed_pairs_split_out(self):
+        """Test pairs with unsupported colors are left out and listed separately."""
+        colors = {"text": {"on_dark": "white", "muted": "#8B92A4"}, "background": {"dark": "#0A0E1A"}}
+
+        assert contrast_pairs(colors) == [("text.muted", "#8B92A4", "background.dark", "#0A0E1A")]
+        assert unparsed_contrast_pairs(colors) == [("text.on_dark", "white", "background.dark", "#0A0E1A")]
+
+    @pytest.mark.skipif(color_engine.np is None, reason="NumPy not installed")
+    def test_python_fallback_matches_numpy(self, monkeypatch):
+        """Test both contrast paths agree."""
+        pairs = [(fg, bg) for _, fg, _, bg in contrast_pairs(COLOR_TOKENS["finance"])]
+        vectorized = contrast_ratios(pairs)
+        monkeypatch.setattr(color_engine, "np", None)
+        assert contrast_ratios(pairs) == pytest.approx(vectorized)
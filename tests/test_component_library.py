@@ -0,0 +1,83 @@
+"""
+Tests for the shared component library.
+"""
+
+import pytest
+
+from chuk_mcp_remotion.generator.component_library import ComponentLibrary, LIBRARY_ALIAS
+from chuk_mcp_remotion.utils.project_manager import ProjectManager
+
+
+@pytest.fixture
+def library(tmp_path):
+    """Component library in a temporary workspace."""
+    return ComponentLibrary(tmp_path)
+
+
+class TestComponentLibrary:
+    """Tests for library versioning and generation."""
+
+    def test_library_id_per_theme(self, library):
+        """Test each theme gets its own library version."""
+        assert library.library_id("tech") != library.library_id("finance")
+        assert library.library_id("tech") == library.library_id("tech")
+        assert library.library_id("tech").startswith("tech-")
+
+    def test_ensure_component_writes_once(self, library):
+        """Test components are rendered into the library once."""
+        path = library.ensure_component("CodeBlock", "tech")
+        path.write_text("// cached")
+
+        assert library.ensure_component("CodeBlock", "tech").read_text() == "// cached"
+
+    def test_stub_reexports_library_component(self, library):
+        """Test project stubs import the component through the library alias."""
+        stub = library.build_stub("LowerThird", "tech")
+
+        assert f"from '{LIBRARY_ALIAS}/{library.library_id('tech')}/LowerThird'" in stub
+        assert "export { LowerThird }" in stub
+        assert (library.library_dir("tech") / "LowerThird.tsx").exists()
+
+    def test_list_libraries(self, library):
+        """Test listing library versions and components."""
+        library.ensure_component("CodeBlock", "tech")
+        library.ensure_component("LowerThird", "tech")
+        libraries = library.list_libraries()
+
+        assert len(libraries) == 1
+        assert libraries[0]["components"] == ["CodeBlock", "LowerThird"]
+
+
+class TestSharedProjects:
+    """Tests for projects using the shared library."""
+
+    def test_shared_project_config(self, tmp_path):
+        """Test shared projects point the bundle cache and alias at the workspace."""
+        manager = ProjectManager(workspace_dir=tmp_path)
+        manager.create_project("shared_demo", shared_components=True)
+        config = (tmp_path / "shared_demo" / "remotion.config.ts").read_text()
+
+        assert f"'{LIBRARY_ALIAS}': '{manager.component_library.root.resolve().as_posix()}'" in config
+        assert manager.component_library.bundle_cache_dir.resolve().as_posix() in config
+        assert "[[" not in config and "[%" not in config
+
+    def test_default_project_config_unchanged(self, tmp_path):
+        """Test projects without the option keep the plain config."""
+        manager = ProjectManager(workspace_dir=tmp_path)
+        manager.create_project("plain_demo")
+        config = (tmp_path / "plain_demo" / "remotion.config.ts").read_text()
+
+        assert "overrideWebpackConfig" not in config
+        assert config.rstrip().endswith("Config.setConcurrency(Math.min(Math.floor(cpuCores * 0.5), 8));")
+
+    def test_shared_project_components_are_stubs(self, tmp_path):
+        """Test shared projects only carry re-exports of library components."""
+        manager = ProjectManager(workspace_dir=tmp_path)
+        manager.create_project("first", shared_components=True)
+        first = manager.add_component_to_project("CodeBlock", {}, "tech")
+        manager.create_project("second", shared_components=True)
+        second = manager.add_component_to_project("CodeBlock", {}, "tech")
+
+        assert open(first).read() == open(second).read()
+        assert LIBRARY_ALIAS in open(first).read()
+        assert len(manager.component_library.list_libraries()) == 1
@@ -0,0 +1,230 @@
+"""
+Tests for the render cost estimator.
+"""
+
+import pytest
+
+from chuk_mcp_remotion.generator.composition_builder import CompositionBuilder
+from chuk_mcp_remotion.renderer.benchmark import RENDER_BENCHMARK
+from chuk_mcp_remotion.renderer.cost_estimator import (
+    RenderCostEstimator,
+    default_concurrency,
+)
+
+
+@pytest.fixture
+def composition():
+    """Composition with a title, an overlapping lower third and a nested layout."""
+    builder = CompositionBuilder(fps=30)
+    builder.add_title_scene("Intro", duration_seconds=2.0)
+    builder.add_lower_third("Host", start_time=1.0, duration=2.0)
+    code = builder.create_code_block_instance("print('hi')", start_frame=60, duration_frames=60)
+    builder.add_container(code)
+    return builder
+
+
+class TestTimelineSweep:
+    """Tests for per-frame timeline statistics."""
+
+    def test_spans_include_nested_children(self, composition):
+        """Test nested children become spans one level deeper."""
+        spans = RenderCostEstimator().collect_spans(composition)
+        types = {(component_type, depth) for _, _, component_type, depth in spans}
+
+        assert ("Container", 0) in types
+        assert ("CodeBlock", 1) in types
+        assert len(spans) == 4
+
+    def test_active_counts(self, composition):
+        """Test active component counts per frame."""
+        profile = RenderCostEstimator().frame_profile(composition)
+
+        assert len(profile["active"]) == 120
+        assert profile["active"][0] == 1   # Title only
+        assert profile["active"][45] == 2  # Title + lower third
+        assert profile["active"][75] == 3  # Lower third + container + code block
+
+    def test_nesting_depth(self, composition):
+        """Test nesting depth per frame."""
+        profile = RenderCostEstimator().frame_profile(composition)
+
+        assert profile["depth"][0] == 1
+        assert profile["depth"][90] == 2
+
+    def test_cost_includes_base_frame_cost(self):
+        """Test frames with no components still pay the base frame cost."""
+        builder = CompositionBuilder()
+        builder.add_lower_third("Host", start_time=1.0, duration=1.0)
+        profile = RenderCostEstimator().frame_profile(builder)
+
+        assert profile["cost_ms"][0] == pytest.approx(RENDER_BENCHMARK["base_frame_ms"])
+        assert profile["cost_ms"][30] > profile["cost_ms"][0]
+
+    def test_empty_composition(self):
+        """Test estimating an empty composition."""
+        report = RenderCostEstimator().estimate(CompositionBuilder(), concurrency=4)
+
+        assert report["frames"] == 0
+        assert report["per_second"] == []
+        assert report["hotspots"] == []
+
+
+class TestEstimate:
+    """Tests for the render budget report."""
+
+    def test_per_second_profile(self, composition):
+        """Test per-second cost buckets."""
+        report = RenderCostEstimator().estimate(composition, concurrency=1)
+
+        assert len(report["per_second"]) == 4
+        assert report["per_second"][2]["max_depth"] == 2
+        assert report["peak_active_components"] == 3
+
+    def test_hotspots_sorted_by_cost(self, composition):
+        """Test hotspots are the most expensive seconds."""
+        report = RenderCostEstimator().estimate(composition, concurrency=1, top_hotspots=2)
+        costs = [h["cost_ms"] for h in report["hotspots"]]
+
+        assert len(costs) == 2
+        assert costs == sorted(costs, reverse=True)
+        assert "CodeBlock" in report["hotspots"][0]["components"]
+
+    def test_concurrency_reduces_duration(self, composition):
+        """Test more workers predict a shorter render."""
+        estimator = RenderCostEstimator()
+        single = estimator.estimate(composition, concurrency=1)
+        parallel = estimator.estimate(composition, concurrency=8)
+
+        assert parallel["predicted_render_seconds"] < single["predicted_render_seconds"]
+        assert parallel["predicted_breakdown"]["bundle_seconds"] == single["predicted_breakdown"]["bundle_seconds"]
+
+    def test_resolution_scales_cost(self):
+        """Test 4K compositions cost four times as much per frame."""
+        hd = CompositionBuilder(width=1920, height=1080)
+        uhd = CompositionBuilder(width=3840, height=2160)
+        for builder in (hd, uhd):
+            builder.add_title_scene("Intro")
+
+        estimator = RenderCostEstimator()
+        hd_cost = estimator.estimate(hd, concurrency=1)["total_frame_cost_ms"]
+        uhd_cost = estimator.estimate(uhd, concurrency=1)["total_frame_cost_ms"]
+
+        assert uhd_cost == pytest.approx(hd_cost * 4)
+
+    def test_weight_overrides(self, composition):
+        """Test per-component weight overrides are applied."""
+        base = RenderCostEstimator().estimate(composition, concurrency=1)
+        heavy = RenderCostEstimator(weights={"TitleScene": 100.0}).estimate(composition, concurrency=1)
+
+        assert heavy["cost_by_component"]["TitleScene"] > base["cost_by_component"]["TitleScene"]
+
+    def test_unknown_component_uses_default_weight(self):
+        """Test unbenchmarked components fall back to the default weight."""
+        estimator = RenderCostEstimator()
+        assert estimator.component_weight("Unknown") == RENDER_BENCHMARK["default_component_ms_per_frame"]
+
+    def test_estimated_components_reported(self, composition):
+        """Test components priced by an estimate are flagged until overridden."""
+        composition.add_particle_effect("confetti", duration=1.0)
+        report = RenderCostEstimator().estimate(composition, concurrency=1)
+        fitted = RenderCostEstimator(weights={"ParticleEffect": 6.0}).estimate(composition, concurrency=1)
+
+        assert report["estimated_components"] == ["ParticleEffect"]
+        assert fitted["estimated_components"] == []
+        assert set(RENDER_BENCHMARK["estimated_components"]) <= set(RENDER_BENCHMARK["component_ms_per_frame"])
+
+    def test_default_concurrency_bounds(self):
+        """Test default concurrency mirrors remotion.config.ts limits."""
+        assert 1 <= default_concurrency() <= 8
+
+
+class TestCalibration:
+    """Tests for calibrated estimates."""
+
+    def test_calibration_scales_prediction(self, composition):
+        """Test calibration multiplies the predicted duration."""
+        base = RenderCostEstimator().estimate(composition, concurrency=2)
+        slow = RenderCostEstimator(calibration=2.0).estimate(composition, concurrency=2)
+
+        assert slow["predicted_render_seconds"] == pytest.approx(base["predicted_render_seconds"] * 2, rel=0.01)
+        assert slow["baseline_render_seconds"] == pytest.approx(base["baseline_render_seconds"], rel=0.01)
+
+    def test_base_frame_override(self):
+        """Test the per-frame base cost can be overridden."""
+        builder = CompositionBuilder()
+        builder.add_lower_third("Host", start_time=1.0, duration=1.0)
+        profile = RenderCostEstimator(base_frame_ms=5.0).frame_profile(builder)
+
+        assert profile["cost_ms"][0] == pytest.approx(5.0)
+
+
+class TestSegmentFeatures:
+    """Tests for segment feature extraction."""
+
+    def test_component_frames_in_range(self, composition):
+        """Test overlap frames per component type are clipped to the segment."""
+        features = RenderCostEstimator().segment_features(composition, 30, 90)
+
+        assert features["frames"] == 60
+        assert features["component_frames"]["TitleScene"] == pytest.approx(30)
+        assert features["component_frames"]["LowerThird"] == pytest.approx(60)
+        assert features["max_active"] == 3
+
+    def test_nested_frames_weighted(self, composition):
+        """Test nested components count with the nesting overhead."""
+        estimator = RenderCostEstimator()
+        features = estimator.segment_features(composition, 60, 120)
+
+        assert features["component_frames"]["CodeBlock"] == pytest.approx(60 * estimator.nesting_multiplier(1))
+
+    def test_precomputed_spans_and_profile(self, composition, monkeypatch):
+        """Test passing spans and profile skips recomputing them per segment."""
+        estimator = RenderCostEstimator()
+        spans = estimator.collect_spans(composition)
+        profile = estimator.frame_profile(composition)
+        expected = estimator.segment_features(composition, 30, 90)
+
+        monkeypatch.setattr(estimator, "collect_spans", None)
+        monkeypatch.setattr(estimator, "frame_profile", None)
+        assert estimator.segment_features(composition, 30, 90, spans, profile) == expected
+
+
+class TestChunkPlanning:
+    """Tests for equal-cost chunk planning."""
+
+    def test_chunks_cover_timeline(self, composition):
+        """Test chunks are contiguous and cover every frame."""
+        plan = RenderCostEstimator().plan_chunks(composition, chunk_count=4)
+        chunks = plan["chunks"]
+
+        assert len(chunks) == 4
+        assert chunks[0]["start_frame"] == 0
+        assert chunks[-1]["end_frame"] == plan["frames"]
+        for previous, current in zip(chunks, chunks[1:]):
+            assert previous["end_frame"] == current["start_frame"]
+
+    def test_expensive_region_gets_shorter_chunks(self):
+        """Test chunks shrink where the timeline is expensive."""
+        builder = CompositionBuilder(fps=30)
+        builder.add_code_block("x = 1", start_time=2.0, duration=2.0)
+        builder.add_lower_third("Host", start_time=0.0, duration=2.0)
+        plan = RenderCostEstimator(weights={"CodeBlock": 200.0}).plan_chunks(builder, chunk_count=2)
+        first, second = plan["chunks"]
+
+        assert (second["end_frame"] - second["start_frame"]) < (first["end_frame"] - first["start_frame"])
+        assert plan["balance"] > 0.9
+
+    def test_more_chunks_than_frames(self):
+        """Test chunk count is capped at the number of frames."""
+        builder = CompositionBuilder()
+        builder.add_lower_third("Host", start_time=0.0, duration=0.1)
+        plan = RenderCostEstimator().plan_chunks(builder, chunk_count=10)
+
+        assert len(plan["chunks"]) == plan["frames"]
+
+    def test_empty_composition(self):
+        """Test planning an empty composition."""
+        plan = RenderCostEstimator().plan_chunks(CompositionBuilder(), chunk_count=4)
+
+        assert plan["chunks"] == []
+        assert plan["balance"] == 1.0
@@ -0,0 +1,154 @@
+"""
+Tests for the shared node_modules dependency store.
+"""
+
+import os
+
+import pytest
+
+from chuk_mcp_remotion.utils.dependency_store import (
+    DependencyStore,
+    STORE_DIRNAME,
+    dependency_hash,
+)
+from chuk_mcp_remotion.utils.project_manager import ProjectManager
+
+
+@pytest.fixture
+def seed_modules(tmp_path):
+    """Fake pre-installed node_modules with a .bin symlink."""
+    modules = tmp_path / "seed" / "node_modules"
+    (modules / "remotion").mkdir(parents=True)
+    (modules / "remotion" / "package.json").write_text('{"name": "remotion"}')
+    (modules / ".bin").mkdir()
+    os.symlink("../remotion/package.json", modules / ".bin" / "remotion")
+    return modules
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Project manager with its own workspace."""
+    return ProjectManager(workspace_dir=tmp_path / "workspace")
+
+
+class TestDependencyHash:
+    """Tests for dependency set keys."""
+
+    def test_ignores_project_name(self):
+        """Test projects with the same dependencies share a key."""
+        deps = {"dependencies": {"remotion": "^4.0.0"}}
+
+        assert dependency_hash({"name": "a", **deps}) == dependency_hash({"name": "b", **deps})
+
+    def test_dependencies_change_key(self):
+        """Test different dependencies produce different keys."""
+        assert dependency_hash({"dependencies": {"remotion": "^4.0.0"}}) != dependency_hash(
+            {"dependencies": {"remotion": "^3.0.0"}}
+        )
+
+    def test_lockfile_not_in_key(self, manager):
+        """Test a project's lockfile does not change its key."""
+        manager.create_project("locked")
+        project_dir = manager.workspace_dir / "locked"
+        before = manager.dependency_store.key_for_project(project_dir)
+        (project_dir / "package-lock.json").write_text('{"lockfileVersion": 3, "packages": {}}')
+
+        assert manager.dependency_store.key_for_project(project_dir) == before
+
+
+class TestDependencyStore:
+    """Tests for populating and linking store entries."""
+
+    def test_seed_and_symlink(self, manager, seed_modules):
+        """Test seeding the store offline and linking a project."""
+        manager.create_project("first")
+        project_dir = manager.workspace_dir / "first"
+        entry = manager.dependency_store.populate(project_dir, seed_from=seed_modules)
+        link = manager.dependency_store.link(project_dir)
+
+        assert entry["source"] == "seed"
+        assert link["linked"] is True
+        assert (project_dir / "node_modules").is_symlink()
+        assert (project_dir / "node_modules" / "remotion" / "package.json").exists()
+
+    def test_populate_is_idempotent(self, manager, seed_modules):
+        """Test populating an existing entry reuses it."""
+        manager.create_project("first")
+        project_dir = manager.workspace_dir / "first"
+        manager.dependency_store.populate(project_dir, seed_from=seed_modules)
+
+        assert manager.dependency_store.populate(project_dir)["source"] == "existing"
+        assert len(manager.dependency_store.list_entries()) == 1
+
+    def test_hardlink(self, manager, seed_modules):
+        """Test hardlinked node_modules share inodes with the store."""
+        manager.create_project("first")
+        project_dir = manager.workspace_dir / "first"
+        entry = manager.dependency_store.populate(project_dir, seed_from=seed_modules)
+        manager.dependency_store.link(project_dir, strategy="hardlink")
+
+        linked = project_dir / "node_modules" / "remotion" / "package.json"
+        stored = manager.dependency_store.entry_dir(entry["key"]) / "node_modules" / "remotion" / "package.json"
+        assert not (project_dir / "node_modules").is_symlink()
+        assert linked.stat().st_ino == stored.stat().st_ino
+        assert (project_dir / "node_modules" / ".bin" / "remotion").is_symlink()
+
+    def test_new_projects_link_automatically(self, manager, seed_modules):
+        """Test projects created after seeding skip npm install."""
+        first = manager.create_project("first")
+        manager.dependency_store.populate(manager.workspace_dir / "first", seed_from=seed_modules)
+        second = manager.create_project("second")
+
+        assert first["dependencies"] == "install required"
+        assert second["dependencies"] == "linked"
+        assert (manager.workspace_dir / "second" / "node_modules").is_symlink()
+
+    def test_relink_after_lockfile_copy(self, manager, seed_modules):
+        """Test the lockfile copied in by link() keeps the project on the same entry."""
+        manager.create_project("first")
+        first = manager.workspace_dir / "first"
+        (first / "package-lock.json").write_text('{"lockfileVersion": 3, "packages": {}}')
+        entry = manager.dependency_store.populate(first, seed_from=seed_modules)
+
+        manager.create_project("second")
+        second = manager.workspace_dir / "second"
+        (second / "node_modules").unlink()
+        (second / "package-lock.json").unlink(missing_ok=True)
+        link = manager.dependency_store.link(second)
+        relink = manager.dependency_store.link(second)
+
+        assert (second / "package-lock.json").exists()
+        assert link["linked"] is True and relink["linked"] is True
+        assert link["key"] == relink["key"] == entry["key"]
+
+    def test_link_without_entry(self, manager):
+        """Test linking reports when the store has no matching entry."""
+        manager.create_project("first")
+        result = manager.dependency_store.link(manager.workspace_dir / "first")
+
+        assert result["linked"] is False
+        assert not (manager.workspace_dir / "first" / "node_modules").exists()
+
+    def test_invalid_seed(self, manager, tmp_path):
+        """Test seeding from a missing directory fails cleanly."""
+        manager.create_project("first")
+        store = manager.dependency_store
+
+        with pytest.raises(ValueError):
+            store.populate(manager.workspace_dir / "first", seed_from=tmp_path / "missing")
+        assert store.list_entries() == []
+        assert list((manager.workspace_dir / STORE_DIRNAME).iterdir()) == []
+
+    def test_unknown_strategy(self, manager):
+        """Test unknown link strategies are rejected."""
+        manager.create_project("first")
+
+        with pytest.raises(ValueError):
+            manager.dependency_store.link(manager.workspace_dir / "first", strategy="copy")
+
+    def test_store_not_listed_as_project(self, manager, seed_modules):
+        """Test the store directory is not reported as a project."""
+        manager.create_project("first")
+        manager.dependency_store.populate(manager.workspace_dir / "first", seed_from=seed_modules)
+
+        assert [p["name"] for p in manager.list_projects()] == ["first"]
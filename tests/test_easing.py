@@ -0,0 +1,95 @@
+"""
+Tests for cubic-bezier easing lookup tables.
+"""
+
+import pytest
+
+from chuk_mcp_remotion.generator import easing
+from chuk_mcp_remotion.generator.easing import (
+    EASING_DECIMALS,
+    MIN_EASING_INTERVALS,
+    easing_intervals,
+    easing_table,
+    easing_tables,
+)
+from chuk_mcp_remotion.tokens.motion import MOTION_TOKENS
+
+CURVES = MOTION_TOKENS["easing_curves"]
+
+
+def reference(curve, x):
+    """Eased value at progress x by plain bisection on x(t)."""
+    x1, y1, x2, y2 = curve
+
+    def point(p1, p2, t):
+        return 3 * (1 - t) ** 2 * t * p1 + 3 * (1 - t) * t * t * p2 + t ** 3
+
+    lo, hi = 0.0, 1.0
+    for _ in range(100):
+        mid = (lo + hi) / 2
+        if point(x1, x2, mid) < x:
+            lo = mid
+        else:
+            hi = mid
+    return point(y1, y2, (lo + hi) / 2)
+
+
+class TestEasingTable:
+    """Tests for sampling one curve."""
+
+    @pytest.mark.parametrize("name", sorted(CURVES))
+    def test_matches_reference(self, name):
+        """Test every token curve is sampled to the stored precision."""
+        curve = CURVES[name]["curve"]
+        table = easing_table(curve, 100)
+
+        assert len(table) == 101
+        assert table[0] == 0.0 and table[-1] == 1.0
+        for index, value in enumerate(table):
+            assert value == pytest.approx(reference(curve, index / 100), abs=10 ** -EASING_DECIMALS)
+
+    def test_linear(self):
+        """Test the linear curve is the identity."""
+        assert easing_table([0.0, 0.0, 1.0, 1.0], 4) == [0.0, 0.25, 0.5, 0.75, 1.0]
+
+    def test_monotone_curves_stay_monotone(self):
+        """Test curves without overshoot give non-decreasing tables."""
+        table = easing_table(CURVES["ease_in_out"]["curve"], 240)
+        assert all(b >= a for a, b in zip(table, table[1:]))
+
+    def test_back_curves_overshoot(self):
+        """Test back curves leave the 0-1 range like CSS cubic-bezier()."""
+        assert min(easing_table(CURVES["ease_in_back"]["curve"], 120)) < 0
+        assert max(easing_table(CURVES["ease_out_back"]["curve"], 120)) > 1
+
+    def test_invalid_curves(self):
+        """Test x control values outside 0-1 and wrong lengths are rejected."""
+        with pytest.raises(ValueError):
+            easing_table([1.5, 0, 0.5, 1], 10)
+        with pytest.raises(ValueError):
+            easing_table([0.5, 0, 1], 10)
+
+    @pytest.mark.skipif(easing.np is None, reason="NumPy not installed")
+    def test_numpy_matches_python(self, monkeypatch):
+        """Test the vectorized and per-sample solvers give the same table."""
+        curve = CURVES["ease_in_out_back"]["curve"]
+        fast = easing_table(curve, 240)
+        monkeypatch.setattr(easing, "np", None)
+
+        assert easing_table(curve, 240) == fast
+
+
+class TestEasingTables:
+    """Tests for the per-fps tables of all tokens."""
+
+    def test_intervals_follow_fps(self):
+        """Test high frame rates get a sample per frame, low ones a minimum."""
+        assert easing_intervals(24) == MIN_EASING_INTERVALS
+        assert easing_intervals(60) == 240
+
+    def test_every_token(self):
+        """Test one table per easing token, sized for the fps."""
+        tables = easing_tables(60)
+
+        assert set(tables) == set(CURVES)
+        assert all(len(table) == 241 for table in tables.values())
@@ -0,0 +1,139 @@
+"""
+Tests for precomputed particle effects.
+"""
+
+import base64
+import struct
+
+import pytest
+
+from chuk_mcp_remotion.generator import particles
+from chuk_mcp_remotion.generator.composition_builder import CompositionBuilder
+from chuk_mcp_remotion.generator.particles import CHANNELS, EFFECTS, simulate_particles
+
+
+def decode(result):
+    """Unpack the base64 buffer into int16 values."""
+    raw = base64.b64decode(result["buffer"])
+    return struct.unpack(f"<{len(raw) // 2}h", raw)
+
+
+def channel(result, keyframe, particle, name):
+    """Read one quantized channel value."""
+    index = (keyframe * result["count"] + particle) * result["channels"] + CHANNELS.index(name)
+    return decode(result)[index]
+
+
+class TestSimulateParticles:
+    """Tests for the keyframe buffer."""
+
+    @pytest.mark.parametrize("effect", sorted(EFFECTS))
+    def test_buffer_layout(self, effect):
+        """Test the buffer holds every channel of every particle at every keyframe."""
+        result = simulate_particles(effect, frames=31, count=12, stride=4)
+
+        # Keyframes 0, 4, ..., 32: the last one is past the last frame (30)
+        assert result["keyframes"] == 9
+        assert len(decode(result)) == 9 * 12 * len(CHANNELS)
+        assert len(result["colors"]) == 12
+        assert all(0 <= c < len(result["palette"]) for c in result["colors"])
+
+    def test_deterministic(self):
+        """Test the same seed gives the same buffer and a new seed does not."""
+        first = simulate_particles("confetti", frames=60, seed=5)
+        assert simulate_particles("confetti", frames=60, seed=5) == first
+        assert simulate_particles("confetti", frames=60, seed=6)["buffer"] != first["buffer"]
+
+    def test_confetti_rises_and_falls(self):
+        """Test confetti bursts upwards, then gravity pulls it back down."""
+        result = simulate_particles("confetti", frames=90, count=5, stride=1)
+        start = channel(result, 0, 0, "y")
+        peak = min(channel(result, k, 0, "y") for k in range(90))
+
+        assert peak < start - 200
+        assert channel(result, 89, 0, "y") > peak
+        assert channel(result, 89, 0, "opacity") == 0
+
+    def test_sparkle_twinkles(self):
+        """Test sparkle opacity goes both on and off."""
+        result = simulate_particles("sparkle", frames=90, count=3, stride=1)
+        values = [channel(result, k, 0, "opacity") for k in range(90)]
+
+        assert max(values) > 200
+        assert min(values) == 0
+
+    def test_keyframes_evenly_spaced(self):
+        """Test keyframe k is frame k * stride, as the template assumes."""
+        coarse = simulate_particles("confetti", frames=31, count=4, stride=4)
+        fine = simulate_particles("confetti", frames=33, count=4, stride=1)
+
+        for keyframe in range(coarse["keyframes"]):
+            assert channel(coarse, keyframe, 2, "y") == channel(fine, keyframe * 4, 2, "y")
+
+    def test_bokeh_wrap(self):
+        """Test bokeh records where y wraps, and only bokeh does."""
+        result = simulate_particles("bokeh", frames=600, count=20, stride=1)
+        wrap = result["wrap_y"]
+        y = decode(result)[CHANNELS.index("y")::len(CHANNELS)]
+        # Keyframe k + 1 of a particle is count values further on
+        steps = [abs(y[index + 20] - y[index]) for index in range(len(y) - 20)]
+
+        assert wrap == 1180
+        # Some particle wraps, jumping by about the full span between keyframes
+        assert max(steps) > wrap / 2
+        assert simulate_particles("confetti", frames=30)["wrap_y"] is None
+
+    def test_long_effect_keeps_rotating(self):
+        """Test rotation wraps at 360 degrees rather than saturating int16."""
+        result = simulate_particles("confetti", frames=3000, count=4, stride=50)
+        rotation = decode(result)[CHANNELS.index("rotation")::len(CHANNELS)]
+        late = rotation[-4 * 10:]
+
+        assert all(0 <= value < 360 for value in rotation)
+        # Still changing near the end (int16 would pin every value at a limit)
+        assert len(set(late)) > 4
+
+    def test_invalid_arguments(self):
+        """Test unknown effects and empty simulations are rejected."""
+        with pytest.raises(ValueError, match="Unknown effect"):
+            simulate_particles("smoke", frames=30)
+        with pytest.raises(ValueError):
+            simulate_particles("confetti", frames=0)
+
+    @pytest.mark.skipif(particles.np is None, reason="NumPy not installed")
+    @pytest.mark.parametrize("effect", sorted(EFFECTS))
+    def test_numpy_matches_python(self, effect, monkeypatch):
+        """Test the vectorized and pure-Python simulations agree."""
+        fast = decode(simulate_particles(effect, frames=45, count=30, seed=2))
+        monkeypatch.setattr(particles, "np", None)
+        slow = decode(simulate_particles(effect, frames=45, count=30, seed=2))
+
+        # sin() may differ in the last bit between libm and NumPy, which can
+        # flip a rounding boundary by one quantum
+        assert len(fast) == len(slow)
+        assert max(abs(a - b) for a, b in zip(fast, slow)) <= 1
+
+
+class TestParticleEffectComponent:
+    """Tests for add_particle_effect."""
+
+    def test_add_particle_effect(self):
+        """Test the effect is simulated for the composition's size and timing."""
+        builder = CompositionBuilder(fps=30, width=1280, height=720)
+        builder.add_particle_effect("sparkle", start_time=1.0, duration=2.0, count=10, seed=3)
+
+        component = builder.components[0]
+        assert component.component_type == "ParticleEffect"
+        assert component.start_frame == 30
+        assert component.props["particles"] == simulate_particles(
+            "sparkle", frames=60, count=10, seed=3, width=1280, height=720
+        )
+        assert all(0 <= channel(component.props["particles"], 0, i, "x") <= 1280 for i in range(10))
+
+    def test_effects_render_on_top(self):
+        """Test effects are layered above overlays."""
+        builder = CompositionBuilder()
+        builder.add_lower_third("Name")
+        builder.add_particle_effect()
+
+        assert builder.components[1].layer > builder.components[0].layer
@@ -0,0 +1,104 @@
+"""
+Tests for hoisting large props out of the generated composition.
+"""
+
+import json
+
+import pytest
+
+from chuk_mcp_remotion.generator.composition_builder import ComponentInstance, CompositionBuilder
+from chuk_mcp_remotion.utils.project_manager import ProjectManager
+
+
+@pytest.fixture
+def large_points():
+    """Line chart data well above the hoisting threshold."""
+    return [i * 2 for i in range(2000)]
+
+
+def add_points(builder, points):
+    """Add a line chart taking raw data points as a prop."""
+    builder.components.append(
+        ComponentInstance(
+            component_type="LineChart",
+            start_frame=0,
+            duration_frames=120,
+            props={"data_points": points}
+        )
+    )
+
+
+class TestPropHoisting:
+    """Tests for data module generation."""
+
+    def test_small_props_stay_inline(self):
+        """Test values under the threshold are inlined as before."""
+        builder = CompositionBuilder()
+        add_points(builder, [1, 2])
+        tsx = builder.generate_composition_tsx()
+
+        assert "data_points={[1, 2]}" in tsx
+        assert builder.data_files == {}
+
+    def test_large_list_hoisted(self, large_points):
+        """Test large lists are imported from a content-hashed JSON module."""
+        builder = CompositionBuilder()
+        add_points(builder, large_points)
+        tsx = builder.generate_composition_tsx()
+        (filename, content), = builder.data_files.items()
+        identifier = filename[:-len(".json")].replace("-", "_")
+
+        assert json.loads(content) == large_points
+        assert f"import {identifier} from './data/{filename}';" in tsx
+        assert f"data_points={{{identifier}}}" in tsx
+        assert "3996, 3998" not in tsx
+
+    def test_large_code_string_hoisted(self):
+        """Test long code strings are hoisted with proper escaping."""
+        code = "\n".join(f'print("line {i}")' for i in range(500))
+        builder = CompositionBuilder()
+        builder.add_code_block(code)
+        builder.generate_composition_tsx()
+
+        assert code in map(json.loads, builder.data_files.values())
+
+    def test_identical_values_share_file(self, large_points):
+        """Test components with the same data reference one module."""
+        builder = CompositionBuilder()
+        add_points(builder, large_points)
+        add_points(builder, large_points)
+        tsx = builder.generate_composition_tsx()
+        (filename,) = builder.data_files
+
+        assert tsx.count(f"./data/{filename}") == 1
+
+    def test_hoisting_disabled(self, large_points):
+        """Test a threshold of None keeps everything inline."""
+        builder = CompositionBuilder()
+        builder.hoist_threshold = None
+        add_points(builder, large_points)
+        tsx = builder.generate_composition_tsx()
+
+        assert builder.data_files == {}
+        assert "3996, 3998" in tsx
+
+
+class TestProjectDataFiles:
+    """Tests for writing data modules into projects."""
+
+    def test_generate_writes_and_prunes_data(self, tmp_path, large_points):
+        """Test data modules are written and stale ones removed."""
+        manager = ProjectManager(workspace_dir=tmp_path)
+        manager.create_project("data_demo")
+        add_points(manager.current_composition, large_points)
+        manager.generate_composition()
+        data_dir = tmp_path / "data_demo" / "src" / "data"
+        first = {p.name for p in data_dir.iterdir()}
+
+        manager.current_composition.components[0].props["data_points"] = large_points[:-1]
+        manager.generate_composition()
+        second = {p.name for p in data_dir.iterdir()}
+
+        assert len(first) == 1
+        assert len(second) == 1
+        assert first != second
@@ -0,0 +1,103 @@
+"""
+Tests for render MCP tools.
+"""
+
+import pytest
+import json
+
+from chuk_mcp_remotion.generator.composition_builder import CompositionBuilder
+from chuk_mcp_remotion.tools.render_tools import register_render_tools
+
+
+@pytest.mark.asyncio
+class TestRenderTools:
+    """Test render MCP tools."""
+
+    @pytest.fixture
+    async def mcp_with_render_tools(self, mock_mcp_server, project_manager, vfs, tmp_path):
+        """Register render tools with an active composition."""
+        project_manager.workspace_dir = tmp_path
+        project_manager.current_composition = CompositionBuilder()
+        project_manager.current_composition.add_title_scene("Intro", duration_seconds=2.0)
+        register_render_tools(mock_mcp_server, project_manager, vfs)
+        return mock_mcp_server
+
+    async def test_tools_registered(self, mcp_with_render_tools):
+        """Test that render tools are registered."""
+        tools = mcp_with_render_tools.tools
+
+        assert "remotion_estimate_render_cost" in tools
+        assert "remotion_plan_render_chunks" in tools
+        assert "remotion_record_render_timing" in tools
+
+    async def test_estimate_render_cost(self, mcp_with_render_tools):
+        """Test estimating the current composition."""
+        tool = mcp_with_render_tools.tools["remotion_estimate_render_cost"]
+        result = json.loads(await tool(concurrency=4))
+
+        assert result["frames"] == 60
+        assert result["concurrency"] == 4
+        assert result["predicted_render_seconds"] > 0
+        assert len(result["per_second"]) == 2
+
+    async def test_estimate_without_project(self, mock_mcp_server, project_manager, vfs, tmp_path):
+        """Test estimating without an active composition."""
+        project_manager.workspace_dir = tmp_path
+        register_render_tools(mock_mcp_server, project_manager, vfs)
+        tool = mock_mcp_server.tools["remotion_estimate_render_cost"]
+        result = json.loads(await tool())
+
+        assert "error" in result
+
+    async def test_record_timing_updates_calibration(self, mcp_with_render_tools):
+        """Test recorded timings calibrate later estimates."""
+        estimate = mcp_with_render_tools.tools["remotion_estimate_render_cost"]
+        record = mcp_with_render_tools.tools["remotion_record_render_timing"]
+
+        before = json.loads(await estimate(concurrency=2))
+        recorded = json.loads(await record(
+            render_seconds=before["baseline_render_seconds"] * 2,
+            concurrency=2
+        ))
+        after = json.loads(await estimate(concurrency=2))
+
+        assert recorded["status"] == "success"
+        assert recorded["calibration"] == pytest.approx(2.0, rel=0.01)
+        assert after["predicted_render_seconds"] == pytest.approx(
+            before["predicted_render_seconds"] * 2, rel=0.01
+        )
+
+    async def test_record_rejects_non_positive(self, mcp_with_render_tools):
+        """Test recording a non-positive duration fails."""
+        record = mcp_with_render_tools.tools["remotion_record_render_timing"]
+        result = json.loads(await record(render_seconds=0))
+
+        assert "error" in result
+
+    async def test_record_segments(self, mcp_with_render_tools):
+        """Test recording per-segment timings."""
+        record = mcp_with_render_tools.tools["remotion_record_render_timing"]
+        segments = json.dumps([
+            {"start_frame": 0, "end_frame": 30, "render_seconds": 1.5},
+            {"start_frame": 30, "end_frame": 60, "render_seconds": 1.6}
+        ])
+        result = json.loads(await record(render_seconds=40.0, concurrency=2, chunk_size=30, segments=segments))
+
+        assert result["status"] == "success"
+        assert result["recorded"]["segments"] == 2
+        assert result["fitted_model"] is None
+
+    async def test_record_invalid_segments(self, mcp_with_render_tools):
+        """Test malformed segment timings are rejected."""
+        record = mcp_with_render_tools.tools["remotion_record_render_timing"]
+
+        assert "error" in json.loads(await record(render_seconds=10.0, segments="not json"))
+        assert "error" in json.loads(await record(render_seconds=10.0, segments='[{"start_frame": 0}]'))
+
+    async def test_plan_render_chunks(self, mcp_with_render_tools):
+        """Test planning render chunks for the current composition."""
+        tool = mcp_with_render_tools.tools["remotion_plan_render_chunks"]
+        result = json.loads(await tool(chunk_count=3))
+
+        assert len(result["chunks"]) == 3
+        assert result["chunks"][-1]["end_frame"] == 60
@@ -0,0 +1,315 @@
+"""
+Tests for resolved theme snapshots and their invalidation.
+"""
+
+import json
+
+import pytest
+
+from chuk_mcp_remotion.generator.component_builder import ComponentBuilder
+from chuk_mcp_remotion.generator.component_library import ComponentLibrary
+from chuk_mcp_remotion.themes.resolved import ResolvedTheme, builtin_theme, resolve
+from chuk_mcp_remotion.themes.theme_manager import Theme, ThemeManager
+from chuk_mcp_remotion.themes.youtube_themes import YOUTUBE_THEMES
+from chuk_mcp_remotion.tokens.motion import MOTION_TOKENS
+from chuk_mcp_remotion.tokens.token_manager import TokenManager
+from chuk_mcp_remotion.tokens.typography import TYPOGRAPHY_TOKENS
+from chuk_mcp_remotion.utils.project_manager import ProjectManager
+
+
+@pytest.fixture
+async def managers(vfs):
+    """Token manager and a theme manager resolving against it."""
+    token_manager = TokenManager(vfs)
+    return token_manager, ThemeManager(vfs, token_manager)
+
+
+async def import_tokens(token_manager, kind, tokens, merge=True):
+    """Write tokens to the virtual filesystem and import them."""
+    path = f"{kind}_tokens.json"
+    await token_manager.vfs.write_file(path, json.dumps(tokens))
+    result = await getattr(token_manager, f"import_{kind}_tokens")(path, merge=merge)
+    assert "Successfully imported" in result
+
+
+class TestResolve:
+    """Test resolving a theme into a snapshot."""
+
+    def test_adds_font_sizes_for_resolution(self):
+        """Test the snapshot carries the font sizes of the default resolution."""
+        resolved = builtin_theme("tech")
+        assert resolved.to_dict()["font_sizes"] == TYPOGRAPHY_TOKENS["font_sizes"]["video_1080p"]
+
+    def test_to_dict_matches_theme(self):
+        """Test to_dict keeps the theme's values and layout."""
+        data = builtin_theme("finance").to_dict()
+        assert {key: value for key, value in data.items() if key != "font_sizes"} == YOUTUBE_THEMES["finance"]
+
+    def test_snapshot_is_immutable(self):
+        """Test snapshots cannot be modified."""
+        resolved = builtin_theme("tech")
+        with pytest.raises(TypeError):
+            resolved.colors["primary"] = ["#000000"]
+        with pytest.raises(AttributeError):
+            resolved.name = "Other"
+        assert isinstance(resolved.colors["primary"], tuple)
+
+    def test_unknown_builtin_falls_back_to_tech(self):
+        """Test unknown names resolve to the tech theme."""
+        assert builtin_theme("nonexistent") is builtin_theme("tech")
+
+    def test_unknown_builtin_without_fallback_raises(self):
+        """Test unknown names raise when no fallback is given."""
+        with pytest.raises(KeyError):
+            builtin_theme("nonexistent", fallback=None)
+
+    def test_equal_tokens_not_guessed(self, sample_theme_data, monkeypatch):
+        """Test a copy equal to a token only follows it when the key is recorded."""
+        spring = dict(MOTION_TOKENS["spring_configs"]["smooth"])
+        # A second token with the same definition as "smooth"
+        monkeypatch.setitem(MOTION_TOKENS["spring_configs"], "calm", dict(spring))
+        data = {**sample_theme_data, "motion": {**sample_theme_data["motion"], "default_spring": spring}}
+
+        assert not any(dependency[0] == "motion" for dependency in resolve("copy", data).dependencies)
+
+        recorded = {**data, "token_keys": {"motion": {"default_spring": "calm"}}}
+        assert ("motion", "spring_configs", "calm") in resolve("copy", recorded).dependencies
+
+    def test_dependencies_follow_token_references(self):
+        """Test the font, spring, easing and duration references are recorded."""
+        dependencies = builtin_theme("gaming").dependencies
+        assert ("theme", "gaming", None) in dependencies
+        assert ("colors", "gaming", None) in dependencies
+        assert ("typography", "font_families", "display") in dependencies
+        assert ("motion", "spring_configs", "elastic") in dependencies
+        assert ("motion", "durations", "fast") in dependencies
+        assert ("typography", "font_sizes", "video_1080p") in dependencies
+
+    def test_literal_values_have_no_token_dependency(self, sample_theme_data):
+        """Test values that are not token definitions are kept as they are."""
+        resolved = resolve("test", sample_theme_data)
+        assert resolved.typography["primary_font"]["fonts"] == ("Inter", "sans-serif")
+        assert not any(dependency[0] == "motion" for dependency in resolved.dependencies)
+
+    def test_fingerprint_follows_values(self):
+        """Test fingerprints are stable and differ between themes."""
+        assert builtin_theme("tech").fingerprint == resolve("tech", YOUTUBE_THEMES["tech"]).fingerprint
+        assert builtin_theme("tech").fingerprint != builtin_theme("finance").fingerprint
+
+
+class TestResolvedThemeCache:
+    """Test caching and invalidation in ThemeManager."""
+
+    def test_snapshot_computed_once(self, theme_manager):
+        """Test repeated lookups return the same snapshot."""
+        resolved = theme_manager.resolve_theme("tech")
+        assert isinstance(resolved, ResolvedTheme)
+        assert theme_manager.resolve_theme("tech") is resolved
+
+    def test_unknown_theme(self, theme_manager):
+        """Test unknown keys resolve to None."""
+        assert theme_manager.resolve_theme("nonexistent") is None
+
+    def test_register_invalidates_only_that_theme(self, theme_manager, sample_theme):
+        """Test re-registering a key rebuilds only its snapshot."""
+        tech = theme_manager.resolve_theme("tech")
+        finance = theme_manager.resolve_theme("finance")
+
+        theme_manager.register_theme("tech", sample_theme)
+
+        assert theme_manager.resolve_theme("tech").name == "Test Theme"
+        assert theme_manager.resolve_theme("tech") is not tech
+        assert theme_manager.resolve_theme("finance") is finance
+
+    def test_create_custom_theme_replaces_snapshot(self, theme_manager):
+        """Test creating a theme over an existing key refreshes its snapshot."""
+        theme_manager.create_custom_theme("Brand", "First", base_theme="tech")
+        assert theme_manager.resolve_theme("brand").description == "First"
+
+        theme_manager.create_custom_theme("Brand", "Second", base_theme="tech")
+        assert theme_manager.resolve_theme("brand").description == "Second"
+
+    @pytest.mark.asyncio
+    async def test_exported_theme_keeps_token_references(self, managers):
+        """Test token references survive export and import."""
+        token_manager, theme_manager = managers
+        path = await theme_manager.export_theme("tech", "tech.json")
+        await theme_manager.import_theme(path, theme_key="copy")
+
+        spring = {"damping": 9, "mass": 1, "stiffness": 90}
+        await import_tokens(token_manager, "motion", {"spring_configs": {"smooth": {"config": spring}}})
+
+        assert theme_manager.resolve_theme("copy").motion["default_spring"]["config"]["damping"] == 9
+
+    @pytest.mark.asyncio
+    async def test_import_theme_replaces_snapshot(self, theme_manager, sample_theme_data):
+        """Test importing a theme over an existing key refreshes its snapshot."""
+        stale = theme_manager.resolve_theme("tech")
+        await theme_manager.vfs.write_file("theme.json", json.dumps(sample_theme_data))
+
+        await theme_manager.import_theme("theme.json", theme_key="tech")
+
+        assert theme_manager.resolve_theme("tech") is not stale
+        assert theme_manager.resolve_theme("tech").name == "Test Theme"
+
+    @pytest.mark.asyncio
+    async def test_color_tokens_merged_and_scoped(self, managers):
+        """Test custom colors apply to their theme and leave others cached."""
+        token_manager, theme_manager = managers
+        tech = theme_manager.resolve_theme("tech")
+        finance = theme_manager.resolve_theme("finance")
+
+        await import_tokens(token_manager, "color", {"tech": {"primary": ["#123456"]}})
+
+        resolved = theme_manager.resolve_theme("tech")
+        assert resolved is not tech
+        assert resolved.colors["primary"] == ("#123456",)
+        assert resolved.colors["accent"] == tech.colors["accent"]
+        assert theme_manager.resolve_theme("finance") is finance
+
+    @pytest.mark.asyncio
+    async def test_motion_tokens_invalidate_dependents_only(self, managers):
+        """Test a custom spring only rebuilds themes using that spring."""
+        token_manager, theme_manager = managers
+        tech = theme_manager.resolve_theme("tech")  # smooth spring
+        gaming = theme_manager.resolve_theme("gaming")  # elastic spring
+        spring = {"name": "Stiff", "config": {"damping": 10, "mass": 1, "stiffness": 400}}
+
+        await import_tokens(token_manager, "motion", {"spring_configs": {"elastic": spring}})
+
+        assert theme_manager.resolve_theme("tech") is tech
+        assert theme_manager.resolve_theme("gaming") is not gaming
+        assert theme_manager.resolve_theme("gaming").motion["default_spring"]["name"] == "Stiff"
+
+    @pytest.mark.asyncio
+    async def test_font_size_tokens(self, managers):
+        """Test custom font sizes for a resolution are merged over the defaults."""
+        token_manager, theme_manager = managers
+        theme_manager.resolve_theme("tech")
+
+        await import_tokens(token_manager, "typography", {"font_sizes": {"video_1080p": {"xl": "99px"}}})
+
+        font_sizes = theme_manager.resolve_theme("tech").font_sizes
+        assert font_sizes["xl"] == "99px"
+        assert font_sizes["base"] == TYPOGRAPHY_TOKENS["font_sizes"]["video_1080p"]["base"]
+
+    @pytest.mark.asyncio
+    async def test_clear_tokens_restores_defaults(self, managers):
+        """Test clearing custom tokens rebuilds affected snapshots."""
+        token_manager, theme_manager = managers
+        await import_tokens(token_manager, "color", {"tech": {"primary": ["#123456"]}})
+        assert theme_manager.resolve_theme("tech").colors["primary"] == ("#123456",)
+
+        token_manager.clear_custom_tokens("colors")
+
+        assert theme_manager.resolve_theme("tech").to_dict() == builtin_theme("tech").to_dict()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_import_keeps_snapshots(self, managers):
+        """Test importing identical tokens again invalidates nothing."""
+        token_manager, theme_manager = managers
+        tokens = {"tech": {"primary": ["#123456"]}}
+        await import_tokens(token_manager, "color", tokens)
+        resolved = theme_manager.resolve_theme("tech")
+
+        await import_tokens(token_manager, "color", tokens)
+
+        assert theme_manager.resolve_theme("tech") is resolved
+
+
+class TestResolvedConsumers:
+    """Test consumers read the resolved snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_theme_info_and_comparison(self, managers):
+        """Test get_theme_info and compare_themes include custom tokens."""
+        token_manager, theme_manager = managers
+        await import_tokens(token_manager, "color", {"tech": {"primary": ["#123456"]}})
+
+        info = theme_manager.get_theme_info("tech")
+        comparison = theme_manager.compare_themes("tech", "finance")
+
+        assert info["colors"]["primary"] == ["#123456"]
+        assert comparison["comparison"]["primary_colors"][0] == ["#123456"]
+        json.dumps(info)
+
+    @pytest.mark.asyncio
+    async def test_component_builder_uses_theme_manager(self, managers):
+        """Test generated components pick up custom tokens."""
+        token_manager, theme_manager = managers
+        builder = ComponentBuilder(theme_manager)
+        await import_tokens(token_manager, "color", {"tech": {"primary": ["#123456", "#123456", "#123456"]}})
+
+        tsx = builder.build_component("TitleScene", {}, "tech")
+
+        assert "#123456" in tsx
+        assert builder.resolve_theme("nonexistent") is builtin_theme("tech")
+
+    @pytest.mark.asyncio
+    async def test_project_overrides_reach_generation(self, managers, tmp_path):
+        """Test a project's token overrides are used for its components."""
+        token_manager, theme_manager = managers
+        manager = ProjectManager(workspace_dir=tmp_path, theme_manager=theme_manager)
+        token_manager.set_project_tokens("branded", "colors", {"tech": {"primary": ["#ABCDEF"] * 3}})
+
+        manager.create_project("plain", shared_theme=False)
+        plain = open(manager.add_component_to_project("TitleScene", {}, "tech")).read()
+        manager.create_project("branded", shared_theme=False)
+        branded = open(manager.add_component_to_project("TitleScene", {}, "tech")).read()
+
+        assert "#ABCDEF" not in plain
+        assert "#ABCDEF" in branded
+
+    @pytest.mark.asyncio
+    async def test_project_overrides_reach_theme_module(self, managers, tmp_path):
+        """Test overrides set on a project rewrite its theme module and stay in that project."""
+        token_manager, theme_manager = managers
+        manager = ProjectManager(workspace_dir=tmp_path, theme_manager=theme_manager)
+        manager.create_project("a")
+        token_manager.set_project_tokens("a", "colors", {"tech": {"primary": ["#FF0066"] * 3}})
+
+        manager.create_project("b")
+
+        assert "#FF0066" in (tmp_path / "a" / "src" / "theme" / "tech.ts").read_text()
+        assert "#FF0066" not in (tmp_path / "b" / "src" / "theme" / "tech.ts").read_text()
+
+    @pytest.mark.asyncio
+    async def test_project_easing_reaches_motion_module(self, managers, tmp_path):
+        """Test a project's easing overrides are tabulated in src/theme/motion.ts."""
+        token_manager, theme_manager = managers
+        manager = ProjectManager(workspace_dir=tmp_path, theme_manager=theme_manager)
+        token_manager.set_project_tokens(
+            "branded", "motion", {"easing_curves": {"brand": {"curve": [0.2, 0.0, 0.0, 1.0]}}}
+        )
+
+        manager.create_project("branded")
+
+        motion = (tmp_path / "branded" / "src" / "theme" / "motion.ts").read_text()
+        assert '"brand": [0.0, ' in motion
+        assert '"ease_out": [0.0, ' in motion
+
+    @pytest.mark.asyncio
+    async def test_motion_module_follows_token_changes(self, managers, tmp_path):
+        """Test easing overrides set after creation rewrite the project's motion module."""
+        token_manager, theme_manager = managers
+        manager = ProjectManager(workspace_dir=tmp_path, theme_manager=theme_manager)
+        manager.create_project("a")
+        motion_file = tmp_path / "a" / "src" / "theme" / "motion.ts"
+        assert '"late"' not in motion_file.read_text()
+
+        token_manager.set_project_tokens("a", "motion", {"easing_curves": {"late": {"curve": [0.9, 0, 1, 0.1]}}})
+        assert '"late": [0.0, ' in motion_file.read_text()
+
+        manager.create_project("b")
+        assert '"late"' not in (tmp_path / "b" / "src" / "theme" / "motion.ts").read_text()
+
+    @pytest.mark.asyncio
+    async def test_library_id_changes_with_tokens(self, managers, tmp_path):
+        """Test library components are not reused after tokens change."""
+        token_manager, theme_manager = managers
+        library = ComponentLibrary(tmp_path, ComponentBuilder(theme_manager))
+        before = library.library_id("tech")
+
+        await import_tokens(token_manager, "color", {"tech": {"primary": ["#123456"]}})
+
+        assert library.library_id("tech") != before
@@ -0,0 +1,205 @@
+"""
+Tests for compiled registry and scene validators.
+"""
+
+import time
+
+import pytest
+
+from chuk_mcp_remotion.registry.components import COMPONENT_REGISTRY
+from chuk_mcp_remotion.registry.validators import SceneValidator, compile_schema
+from chuk_mcp_remotion.utils.project_manager import ProjectManager
+
+
+def title(text="Hello", **config):
+    """A TitleScene scene."""
+    return {"type": "TitleScene", "config": {"text": text, **config}, "startFrame": 0, "durationInFrames": 90}
+
+
+def demo_box(label="Demo"):
+    """A DemoBox scene (template only, no registry schema)."""
+    return {"type": "DemoBox", "config": {"label": label}}
+
+
+@pytest.fixture
+def validator():
+    """Validator that also knows the template-only DemoBox."""
+    return SceneValidator(known_types=["DemoBox"])
+
+
+class TestCompileSchema:
+    """Test compiling registry-format schemas."""
+
+    def test_types_and_required(self):
+        """Test required fields and types are checked, and all errors collected."""
+        check = compile_schema({
+            "text": {"type": "string", "required": True},
+            "count": {"type": "integer"},
+            "scale": {"type": "float"},
+            "enabled": {"type": "boolean"}
+        })
+        errors, warnings = [], []
+
+        check({"count": 1.5, "scale": True, "enabled": "yes"}, "props", errors, warnings)
+
+        assert errors == [
+            "props: missing required prop 'text'",
+            "props.count: expected an integer, got float",
+            "props.scale: expected a number, got bool",
+            "props.enabled: expected a boolean, got str"
+        ]
+
+    def test_enum_mismatch_is_warning(self):
+        """Test values outside the registry enum warn instead of failing."""
+        check = compile_schema({"variant": {"type": "enum", "values": ["a", "b"]}})
+        errors, warnings = [], []
+
+        check({"variant": "c"}, "", errors, warnings)
+
+        assert errors == []
+        assert warnings == ["variant: 'c' is not one of ['a', 'b']"]
+
+    def test_nested_objects_and_items(self):
+        """Test labelled nested objects and array items."""
+        check = compile_schema({
+            "colors": {
+                "type": "object",
+                "label": "color token",
+                "schema": {"primary": {"type": "array", "required": True, "items": {"type": "string"}}}
+            },
+            "tags": {"type": "array", "items": {"type": "string"}}
+        })
+        errors = []
+
+        check({"colors": {}, "tags": ["ok", 3]}, "", errors, [])
+
+        assert errors == ["Missing color token: primary", "tags[1]: expected a string, got int"]
+
+
+class TestSceneValidator:
+    """Test validating scene lists."""
+
+    def test_registry_examples_are_valid(self, validator):
+        """Test every registry example validates as a scene config."""
+        scenes = [{"type": name, "config": entry["example"]} for name, entry in COMPONENT_REGISTRY.items()]
+        assert validator.validate(scenes) == {"valid": True, "errors": [], "warnings": []}
+
+    def test_collects_all_errors(self, validator):
+        """Test every bad scene is reported in one pass."""
+        scenes = [
+            title(),
+            {"type": "TitleScene", "config": {"subtitle": 3}},
+            {"type": "Nope", "startFrame": -1},
+            "not a scene"
+        ]
+
+        result = validator.validate(scenes)
+
+        assert result["valid"] is False
+        assert result["errors"] == [
+            "scenes[1].config: missing required prop 'text'",
+            "scenes[1].config.subtitle: expected a string, got int",
+            "scenes[2]: unknown component type 'Nope'",
+            "scenes[2].startFrame: expected a non-negative integer, got -1",
+            "scenes[3]: expected a scene object, got str"
+        ]
+
+    def test_timing_props_not_required(self, validator):
+        """Test registry timing props are covered by startFrame/durationInFrames."""
+        result = validator.validate([{"type": "LowerThird", "config": {"name": "Ada"}}])
+        assert result["valid"] is True
+
+    def test_nested_scenes_validated(self, validator):
+        """Test children and layout slots are validated recursively."""
+        scenes = [{
+            "type": "SplitScreen",
+            "config": {"orientation": "horizontal"},
+            "left": demo_box(),
+            "right": {"type": "TitleScene", "config": {}},
+        }]
+
+        result = validator.validate(scenes)
+
+        assert result["errors"] == ["scenes[0].right.config: missing required prop 'text'"]
+
+    def test_slot_props_need_nested_scene(self, validator):
+        """Test required component props are satisfied by nested scenes."""
+        grid = {"type": "Grid", "config": {"layout": "2x2"}, "children": [demo_box(), demo_box()]}
+        empty_grid = {"type": "Grid", "config": {"layout": "2x2"}}
+
+        assert validator.validate([grid])["valid"] is True
+        assert validator.validate([empty_grid])["errors"] == [
+            "scenes[0]: missing items (nested scene in children)"
+        ]
+
+    def test_unknown_types_only_checked_when_known_types_given(self):
+        """Test a validator without known types accepts template-only components."""
+        assert SceneValidator().validate([demo_box()])["valid"] is True
+        assert SceneValidator(known_types=["Other"]).validate([demo_box()])["valid"] is False
+
+    def test_scenes_must_be_list(self, validator):
+        """Test a non-list input is rejected."""
+        assert validator.validate({"type": "TitleScene"})["errors"] == ["scenes: expected a list, got dict"]
+
+    @pytest.mark.slow
+    def test_benchmark_10k_scenes(self, validator):
+        """Benchmark validating 10k scenes (with nested children) in one pass."""
+        scenes = []
+        for index in range(10_000):
+            if index % 2:
+                scenes.append(title(f"Scene {index}", variant="bold"))
+            else:
+                scenes.append({
+                    "type": "Grid",
+                    "config": {"layout": "2x2", "gap": 20},
+                    "children": [demo_box(), title()],
+                    "startFrame": index * 90,
+                    "durationInFrames": 90
+                })
+        scenes[1235]["config"]["subtitle"] = 7
+
+        start = time.perf_counter()
+        result = validator.validate(scenes)
+        elapsed = time.perf_counter() - start
+
+        print(f"\nValidated 10k scenes in {elapsed * 1000:.1f} ms")
+        assert result["errors"] == ["scenes[1235].config.subtitle: expected a string, got int"]
+        assert elapsed < 2.0
+
+
+class TestBuildCompositionValidation:
+    """Test scene validation in ProjectManager.build_composition_from_scenes."""
+
+    def test_invalid_scenes_rejected_before_generation(self, tmp_path):
+        """Test invalid scenes raise with every error and add nothing."""
+        manager = ProjectManager(workspace_dir=tmp_path)
+        manager.create_project("validated")
+
+        with pytest.raises(ValueError) as excinfo:
+            manager.build_composition_from_scenes([
+                {"type": "TitleScene", "config": {}},
+                {"type": "Missing"}
+            ])
+
+        assert "scenes[0].config: missing required prop 'text'" in str(excinfo.value)
+        assert "scenes[1]: unknown component type 'Missing'" in str(excinfo.value)
+        assert manager.current_composition.components == []
+
+    def test_valid_scenes_return_warnings(self, tmp_path):
+        """Test valid scenes build and report enum warnings."""
+        manager = ProjectManager(workspace_dir=tmp_path)
+        manager.create_project("validated")
+
+        result = manager.build_composition_from_scenes([title(variant="glass")])
+
+        assert result["component_types"] == ["TitleScene"]
+        assert len(result["warnings"]) == 1
+
+    def test_validation_can_be_skipped(self, tmp_path):
+        """Test validate=False keeps the unvalidated behaviour."""
+        manager = ProjectManager(workspace_dir=tmp_path)
+        manager.create_project("unvalidated")
+
+        result = manager.build_composition_from_scenes([title(variant=7)], validate=False)
+
+        assert result["warnings"] == []
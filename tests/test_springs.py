@@ -0,0 +1,222 @@
+"""
+Tests for spring settle times and precomputed spring tables.
+"""
+
+import pytest
+
+from chuk_mcp_remotion.generator import springs
+from chuk_mcp_remotion.generator.composition_builder import (
+    ENTRANCE_HOLD_SECONDS,
+    LOWER_THIRD_EXIT_FRAMES,
+    TITLE_EXIT_FRAMES,
+    CompositionBuilder,
+)
+from chuk_mcp_remotion.generator.springs import (
+    TABLE_SCALE,
+    measure_spring,
+    spring_key,
+    spring_key_tables,
+    spring_progress,
+    spring_table,
+    spring_tables,
+)
+from chuk_mcp_remotion.themes.resolved import builtin_theme
+from chuk_mcp_remotion.tokens.motion import MOTION_TOKENS
+
+SPRINGS = MOTION_TOKENS["spring_configs"]
+
+
+def integrate(config, fps, frames, substeps=400):
+    """Reference progress from RK4 integration of the spring equation."""
+    damping, mass, stiffness = config["damping"], config["mass"], config["stiffness"]
+    dt = 1 / fps / substeps
+
+    def acceleration(x, v):
+        return (stiffness * (1 - x) - damping * v) / mass
+
+    x, v, progress = 0.0, 0.0, []
+    for _ in range(frames):
+        progress.append(x)
+        for _ in range(substeps):
+            k1x, k1v = v, acceleration(x, v)
+            k2x, k2v = v + dt / 2 * k1v, acceleration(x + dt / 2 * k1x, v + dt / 2 * k1v)
+            k3x, k3v = v + dt / 2 * k2v, acceleration(x + dt / 2 * k2x, v + dt / 2 * k2v)
+            k4x, k4v = v + dt * k3v, acceleration(x + dt * k3x, v + dt * k3v)
+            x += dt / 6 * (k1x + 2 * k2x + 2 * k3x + k4x)
+            v += dt / 6 * (k1v + 2 * k2v + 2 * k3v + k4v)
+    return progress
+
+
+class TestSpringProgress:
+    """Tests for evaluating springs over the frame grid."""
+
+    @pytest.mark.parametrize("name", ["gentle", "bouncy", "elastic"])
+    def test_matches_integration(self, name):
+        """Test under- and overdamped springs match a numerical integration."""
+        config = SPRINGS[name]["config"]
+        progress = spring_progress(config, 30, 45)
+
+        assert max(abs(a - b) for a, b in zip(progress, integrate(config, 30, 45))) < 1e-6
+
+    def test_critically_damped(self):
+        """Test the critically damped case approaches the target without overshoot."""
+        progress = spring_progress({"damping": 20, "mass": 1, "stiffness": 100}, 30, 60)
+
+        assert progress[0] == 0
+        assert all(b >= a for a, b in zip(progress, progress[1:]))
+        assert progress[-1] == pytest.approx(1, abs=1e-3)
+
+    def test_overshoot_clamping(self):
+        """Test clamped springs stop at the target once they reach it."""
+        config = {**SPRINGS["bouncy"]["config"], "overshootClamping": True}
+        progress = spring_progress(config, 30, 30)
+
+        first = progress.index(1.0)
+        assert max(progress) == 1.0
+        assert progress[first:] == [1.0] * (30 - first)
+
+    def test_long_steps_clamped(self):
+        """Test frames below 16 fps advance at most 64 ms, like spring()."""
+        config = SPRINGS["bouncy"]["config"]
+        assert spring_progress(config, 10, 5) == spring_progress(config, 1000 / 64, 5)
+
+    def test_invalid_config(self):
+        """Test non-positive mass or stiffness is rejected."""
+        with pytest.raises(ValueError):
+            spring_progress({"damping": 10, "mass": 0, "stiffness": 100}, 30, 10)
+
+    @pytest.mark.skipif(springs.np is None, reason="NumPy not installed")
+    def test_numpy_matches_python(self, monkeypatch):
+        """Test the pure-Python path gives the same progress as NumPy."""
+        config = SPRINGS["elastic"]["config"]
+        with_numpy = spring_progress(config, 60, 120)
+
+        springs._progress.cache_clear()
+        monkeypatch.setattr(springs, "np", None)
+        without_numpy = spring_progress(config, 60, 120)
+        springs._progress.cache_clear()
+
+        assert without_numpy == pytest.approx(with_numpy, abs=1e-12)
+
+
+class TestMeasureSpring:
+    """Tests for settle frames and overshoot."""
+
+    def test_settle_and_overshoot(self):
+        """Test the settle frame is the first frame that stays within the threshold."""
+        config = SPRINGS["bouncy"]["config"]
+        result = measure_spring(config, 30)
+        progress = spring_progress(config, 30, 120)
+        settle = result["settle_frames"]
+
+        assert result["settled"] is True
+        assert result["overshoot"] == pytest.approx(max(progress) - 1, abs=1e-4)
+        assert abs(1 - progress[settle - 1]) >= 0.005
+        assert all(abs(1 - value) < 0.005 for value in progress[settle:])
+
+    def test_scales_with_fps(self):
+        """Test the settle time is about the same at any frame rate."""
+        config = SPRINGS["elastic"]["config"]
+        at_30 = measure_spring(config, 30)
+        at_60 = measure_spring(config, 60)
+
+        assert at_60["settle_seconds"] == pytest.approx(at_30["settle_seconds"], abs=1 / 30)
+        assert at_30["overshoot"] > 0.3
+
+    def test_overdamped_has_no_overshoot(self):
+        """Test overdamped springs never pass the target."""
+        assert measure_spring(SPRINGS["smooth"]["config"], 30)["overshoot"] == 0
+
+    def test_cut_off(self):
+        """Test springs still moving after max_seconds are reported as unsettled."""
+        result = measure_spring(SPRINGS["gentle"]["config"], 30, max_seconds=1)
+        assert result["settled"] is False
+
+
+class TestSpringTable:
+    """Tests for the lookup tables templates sample."""
+
+    def test_table_samples_progress(self):
+        """Test values are quantized progress up to the point the spring settles."""
+        config = SPRINGS["bouncy"]["config"]
+        table = spring_table(config, 30)
+        progress = spring_progress(config, 30, len(table["values"]) + 30)
+
+        assert table["fps"] == 30
+        assert table["scale"] == TABLE_SCALE
+        assert table["config"] == {"damping": 15, "mass": 1.0, "stiffness": 300}
+        for frame, value in enumerate(table["values"]):
+            assert value / TABLE_SCALE == pytest.approx(progress[frame], abs=1 / TABLE_SCALE)
+        # Frames past the table sample as 1
+        assert all(abs(1 - value) < 0.001 for value in progress[len(table["values"]):])
+
+    def test_clamping_recorded(self):
+        """Test clamped tables say so, for the template's config check."""
+        table = spring_table(SPRINGS["snappy"]["config"], 30)
+        assert table["config"]["overshootClamping"] is True
+
+    def test_tables_for_every_token(self):
+        """Test one call gives a table and measurements per spring token."""
+        tables = spring_tables(60)
+
+        assert set(tables) == set(SPRINGS)
+        assert all(table["fps"] == 60 and table["settle_frames"] > 0 for table in tables.values())
+
+    def test_key_tables(self):
+        """Test springs are keyed as springKey() in motion.ts names them, once each."""
+        bouncy = SPRINGS["bouncy"]["config"]
+        tables = spring_key_tables([bouncy, dict(bouncy), SPRINGS["snappy"]["config"]], 30)
+
+        assert spring_key({"damping": 200, "mass": 0.5, "stiffness": 200.0}) == "200/0.5/200"
+        assert list(tables) == [spring_key(bouncy), spring_key(SPRINGS["snappy"]["config"])]
+        assert list(tables)[1].endswith("/clamped")
+        assert tables[spring_key(bouncy)] == spring_table(bouncy, 30)["values"]
+
+
+class TestCompositionSprings:
+    """Tests for auto-sized durations in CompositionBuilder."""
+
+    def test_no_tables_in_props(self):
+        """Test spring tables live in motion.ts rather than in component props."""
+        builder = CompositionBuilder()
+        builder.add_title_scene("Hello", animation="slide_up")
+        builder.add_line_chart([[0, 1], [1, 2]])
+
+        assert "spring_table" not in builder.generate_composition_tsx()
+
+    def test_auto_sized_durations(self):
+        """Test None durations cover the entrance, a hold and the exit."""
+        builder = CompositionBuilder(fps=30)
+        builder.theme = "education"
+        builder.add_title_scene("Auto", duration_seconds=None)
+        builder.add_lower_third("Host", duration=None)
+
+        entrance = measure_spring(SPRINGS["bouncy"]["config"], 30)["settle_frames"]
+        hold = int(ENTRANCE_HOLD_SECONDS * 30)
+        assert builder.components[0].duration_frames == entrance + hold + TITLE_EXIT_FRAMES
+        assert builder.components[1].duration_frames == entrance + hold + LOWER_THIRD_EXIT_FRAMES
+
+    def test_theme_resolver(self):
+        """Test auto-sizing uses the spring of the theme the resolver returns."""
+        custom = builtin_theme("education")
+        resolver_calls = []
+
+        def resolver(name):
+            resolver_calls.append(name)
+            return custom
+
+        builder = CompositionBuilder(fps=30, theme_resolver=resolver)
+        builder.theme = "my-theme"
+        builder.add_lower_third("Host", duration=None)
+
+        entrance = measure_spring(SPRINGS["bouncy"]["config"], 30)["settle_frames"]
+        hold = int(ENTRANCE_HOLD_SECONDS * 30)
+        assert resolver_calls == ["my-theme"]
+        assert builder.components[0].duration_frames == entrance + hold + LOWER_THIRD_EXIT_FRAMES
+
+    def test_explicit_durations_unchanged(self):
+        """Test explicit durations are used as given."""
+        builder = CompositionBuilder(fps=30)
+        builder.add_title_scene("Fixed", duration_seconds=1.0)
+
+        assert builder.components[0].duration_frames == 30
@@ -0,0 +1,94 @@
+"""
+Tests for generation-time code tokenization.
+"""
+
+import pytest
+
+from chuk_mcp_remotion.generator.composition_builder import CompositionBuilder
+from chuk_mcp_remotion.generator.syntax import (
+    SUPPORTED_LANGUAGES,
+    resolve_language,
+    tokenize_code
+)
+from chuk_mcp_remotion.registry.components import COMPONENT_REGISTRY
+
+
+def decode(code, encoded):
+    """Expand encoded lines into (type, text) pairs."""
+    lines = []
+    for line in encoded["lines"]:
+        start, tokens = line[0], []
+        for i in range(1, len(line), 2):
+            tokens.append((encoded["types"][line[i]], code[start:line[i + 1]]))
+            start = line[i + 1]
+        lines.append(tokens)
+    return lines
+
+
+class TestTokenizeCode:
+    """Tests for the encoded token arrays."""
+
+    def test_python_tokens(self):
+        """Test keywords, functions, strings and comments are typed."""
+        code = 'def greet(name):\n    return f"hi {name}"  # wave'
+        lines = decode(code, tokenize_code(code, "python"))
+
+        assert lines[0][:2] == [("keyword", "def "), ("function", "greet")]
+        assert ("string", 'f"hi {name}"  ') in lines[1]
+        assert lines[1][-1] == ("comment", "# wave")
+
+    def test_tokens_cover_code(self):
+        """Test the tokens of each line reassemble the original source."""
+        code = "const a = 1;\n\n/* multi\n   line */\nlet b = `x\ny`;"
+        encoded = tokenize_code(code, "javascript")
+        lines = decode(code, encoded)
+
+        assert "\n".join("".join(text for _, text in line) for line in lines) == code
+        # The empty line keeps its start offset and has no tokens
+        assert encoded["lines"][1] == [code.index("\n") + 1]
+        assert lines[2] == [("comment", "/* multi")]
+        assert lines[3][0] == ("comment", "   line */")
+
+    def test_aliases(self):
+        """Test language aliases resolve to bundled lexers."""
+        assert resolve_language("tsx") == "typescript"
+        assert resolve_language("Shell") == "bash"
+        assert tokenize_code("x", "py")["language"] == "python"
+
+    def test_unsupported_language(self):
+        """Test languages without a lexer return None."""
+        assert tokenize_code("+++", "brainfuck") is None
+
+    @pytest.mark.parametrize("language", SUPPORTED_LANGUAGES)
+    def test_every_lexer_compiles(self, language):
+        """Test each bundled lexer tokenizes without gaps."""
+        code = 'x = "a" # 1\n{ y: [2, true] }'
+        lines = decode(code, tokenize_code(code, language))
+
+        assert "\n".join("".join(text for _, text in line) for line in lines) == code
+
+    def test_registry_languages_bundled(self):
+        """Test every language the registry advertises has a lexer."""
+        for component in ("CodeBlock", "TypingCode"):
+            languages = COMPONENT_REGISTRY[component]["schema"]["language"]["values"]
+            assert sorted(languages) == list(SUPPORTED_LANGUAGES)
+
+
+class TestCodeComponents:
+    """Tests for code_tokens props on code components."""
+
+    def test_code_block_tokens(self):
+        """Test add_code_block passes precomputed tokens."""
+        builder = CompositionBuilder()
+        builder.add_code_block("print(1)", language="python")
+
+        assert builder.components[0].props["code_tokens"]["language"] == "python"
+        assert "code_tokens={" in builder.generate_composition_tsx()
+
+    def test_typing_code_unsupported_language(self):
+        """Test unsupported languages fall back to in-browser highlighting."""
+        builder = CompositionBuilder()
+        builder.add_typing_code("10 PRINT HELLO", language="basic")
+
+        assert builder.components[0].props["code_tokens"] is None
+        assert "code_tokens" not in builder.generate_composition_tsx()
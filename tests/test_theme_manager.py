@@ -202,6 +202,103 @@ class TestThemeManagerComparison:
 
         assert "error" in comparison
 
+    def test_comparison_palette_distance(self, theme_manager):
+        """Test comparisons include the perceptual palette distance."""
+        same = theme_manager.compare_themes("tech", "tech")["comparison"]
+        different = theme_manager.compare_themes("tech", "gaming")["comparison"]
+
+        assert same["palette_distance"] == 0
+        assert different["palette_distance"] > 0
+
+
+class TestThemeManagerContrastAudit:
+    """Test the batch contrast audit."""
+
+    def test_audit_all_themes(self, theme_manager):
+        """Test every theme is audited with consistent counts."""
+        report = theme_manager.audit_theme_contrast()
+
+        assert set(report) == set(theme_manager.list_themes())
+        for result in report.values():
+            assert result["passed"] + len(result["failures"]) == result["total"]
+            assert all(pair["ratio"] < 4.5 for pair in result["failures"])
+
+    def test_audit_reports_pairs(self, theme_manager):
+        """Test pair entries carry roles, colors, ratio and level."""
+        pairs = theme_manager.audit_theme_contrast(["tech"])["tech"]["pairs"]
+        white_on_dark = next(
+            pair for pair in pairs
+            if pair["foreground"] == "text.on_dark" and pair["background"] == "background.dark"
+        )
+        assert white_on_dark["colors"] == ["#FFFFFF", "#0A0E1A"]
+        assert white_on_dark["level"] == "AAA"
+
+    def test_min_ratio(self, theme_manager):
+        """Test the failure threshold is configurable."""
+        strict = theme_manager.audit_theme_contrast(["tech"], min_ratio=7.0)["tech"]
+        lenient = theme_manager.audit_theme_contrast(["tech"], min_ratio=1.0)["tech"]
+        assert len(strict["failures"]) > 0
+        assert lenient["failures"] == []
+
+    def test_results_cached_per_version(self, theme_manager, sample_theme):
+        """Test results are reused until the theme changes."""
+        first = theme_manager.audit_theme_contrast(["tech"])["tech"]
+        assert theme_manager.audit_theme_contrast(["tech"])["tech"]["pairs"] is first["pairs"]
+
+        theme_manager.register_theme("tech", sample_theme)
+        changed = theme_manager.audit_theme_contrast(["tech"])["tech"]
+        assert changed["version"] != first["version"]
+        assert changed["pairs"] is not first["pairs"]
+
+    def test_unparsed_colors_reported(self, theme_manager):
+        """Test named and hsl() colors are reported instead of failing the audit."""
+        theme_manager.create_custom_theme(
+            "Named", "Named colors", base_theme="tech",
+            color_overrides={
+                "text": {"on_dark": "white", "on_light": "#000000"},
+                "background": {"dark": "hsl(220, 40%, 7%)", "light": "#FFFFFF", "glass": "#101010"}
+            }
+        )
+        report = theme_manager.audit_theme_contrast()
+
+        named = report["named"]
+        assert {"foreground": "text.on_dark", "background": "background.glass",
+                "colors": ["white", "#101010"]} in named["unparsed"]
+        assert all("white" not in pair["colors"] for pair in named["pairs"])
+        assert named["passed"] + len(named["failures"]) == named["total"] > 0
+        assert report["tech"]["unparsed"] == []
+
+    def test_unknown_themes_skipped(self, theme_manager):
+        """Test unknown keys are left out of the report."""
+        assert theme_manager.audit_theme_contrast(["nonexistent"]) == {}
+
+
+class TestThemeManagerSimilarity:
+    """Test finding perceptually similar themes."""
+
+    def test_find_similar_themes(self, theme_manager):
+        """Test similar themes are ranked by palette distance."""
+        similar = theme_manager.find_similar_themes("tech", limit=3)
+
+        assert len(similar) == 3
+        assert similar[0]["key"] == "business"
+        assert "tech" not in [entry["key"] for entry in similar]
+        distances = [entry["distance"] for entry in similar]
+        assert distances == sorted(distances)
+
+    def test_find_similar_includes_custom_themes(self, theme_manager):
+        """Test a near copy of a theme is found first."""
+        theme_manager.create_custom_theme("Tech Copy", "Copy", base_theme="tech")
+
+        similar = theme_manager.find_similar_themes("tech", limit=1)
+
+        assert similar[0]["key"] == "tech_copy"
+        assert similar[0]["distance"] == 0
+
+    def test_find_similar_unknown_theme(self, theme_manager):
+        """Test unknown themes have no similar themes."""
+        assert theme_manager.find_similar_themes("nonexistent") == []
+
 
 class TestThemeManagerSearch:
     """Test theme search functionality."""
@@ -299,6 +396,22 @@ class TestThemeManagerValidation:
 
         assert validation["valid"] is False
 
+    def test_validate_field_types(self, theme_manager, sample_theme_data):
+        """Test wrongly typed fields are reported together."""
+        theme_data = {**sample_theme_data, "name": 3, "colors": {**sample_theme_data["colors"], "primary": "#FF0000"}}
+
+        validation = theme_manager.validate_theme(theme_data)
+
+        assert validation["errors"] == [
+            "name: expected a string, got int",
+            "colors.primary: expected an array, got str"
+        ]
+
+    def test_builtin_themes_valid(self, theme_manager):
+        """Test every built-in theme passes validation."""
+        for key in theme_manager.list_themes():
+            assert theme_manager.validate_theme(theme_manager.get_theme(key).to_dict())["valid"]
+
 
 class TestThemeManagerExportImport:
     """Test theme export and import."""
@@ -373,6 +486,88 @@ class TestThemeManagerExportImport:
         assert original["description"] == reimported["description"]
 
 
+@pytest.mark.asyncio
+class TestThemeManagerBulkExportImport:
+    """Test directory-level bulk export and import."""
+
+    async def test_export_all_themes(self, theme_manager):
+        """Test every theme is written to the directory."""
+        report = await theme_manager.export_themes("bulk")
+
+        assert report["failed"] == {}
+        assert set(report["exported"]) == set(theme_manager.list_themes())
+        assert report["exported"]["tech"] == "bulk/tech_theme.json"
+        assert sorted(await theme_manager.vfs.ls("bulk")) == sorted(
+            f"{key}_theme.json" for key in theme_manager.list_themes()
+        )
+
+    async def test_export_reports_unknown_themes(self, theme_manager):
+        """Test unknown themes fail without stopping the batch."""
+        report = await theme_manager.export_themes("bulk", ["tech", "nonexistent"], concurrency=1)
+
+        assert list(report["exported"]) == ["tech"]
+        assert "nonexistent" in report["failed"]
+
+    async def test_bulk_roundtrip(self, vfs, theme_manager):
+        """Test exported themes import into a fresh manager."""
+        await theme_manager.export_themes("bulk")
+
+        other = ThemeManager(vfs)
+        report = await other.import_themes("bulk")
+
+        assert report["failed"] == {}
+        assert report["imported"]["finance_theme.json"] == "finance"
+        assert other.get_theme_info("finance") == theme_manager.get_theme_info("finance")
+
+    async def test_import_reports_per_file_failures(self, theme_manager, sample_theme_data, invalid_theme_data):
+        """Test bad files are reported and good ones still registered."""
+        await theme_manager.vfs.mkdir("incoming")
+        await theme_manager.vfs.write_file("incoming/good.json", json.dumps(sample_theme_data))
+        await theme_manager.vfs.write_file("incoming/invalid.json", json.dumps(invalid_theme_data))
+        await theme_manager.vfs.write_file("incoming/broken.json", "{not json")
+        await theme_manager.vfs.write_file("incoming/notes.txt", "ignored")
+
+        report = await theme_manager.import_themes("incoming")
+
+        assert report["imported"] == {"good.json": "test_theme"}
+        assert set(report["failed"]) == {"invalid.json", "broken.json"}
+        assert "test_theme" in theme_manager.list_themes()
+
+    async def test_import_duplicate_keys(self, theme_manager, sample_theme_data):
+        """Test two files with the same theme name keep the first."""
+        await theme_manager.vfs.mkdir("incoming")
+        await theme_manager.vfs.write_file("incoming/a.json", json.dumps(sample_theme_data))
+        await theme_manager.vfs.write_file("incoming/b.json", json.dumps(sample_theme_data))
+
+        report = await theme_manager.import_themes("incoming")
+
+        assert report["imported"] == {"a.json": "test_theme"}
+        assert "b.json" in report["failed"]
+
+    async def test_import_all_or_nothing(self, theme_manager, sample_theme_data):
+        """Test nothing is registered when a file fails in all-or-nothing mode."""
+        await theme_manager.vfs.mkdir("incoming")
+        await theme_manager.vfs.write_file("incoming/good.json", json.dumps(sample_theme_data))
+        await theme_manager.vfs.write_file("incoming/broken.json", "{not json")
+
+        report = await theme_manager.import_themes("incoming", all_or_nothing=True)
+
+        assert report["imported"] == {}
+        assert "broken.json" in report["failed"]
+        assert "test_theme" not in theme_manager.list_themes()
+
+    async def test_import_replaces_resolved_snapshot(self, theme_manager, sample_theme_data):
+        """Test bulk import invalidates resolved snapshots of replaced keys."""
+        stale = theme_manager.resolve_theme("tech")
+        await theme_manager.vfs.mkdir("incoming")
+        await theme_manager.vfs.write_file("incoming/tech.json", json.dumps({**sample_theme_data, "name": "Tech"}))
+
+        await theme_manager.import_themes("incoming")
+
+        assert theme_manager.resolve_theme("tech") is not stale
+        assert theme_manager.resolve_theme("tech").description == "A test theme"
+
+
 class TestThemeManagerCustomThemes:
     """Test custom theme creation."""
 
@@ -434,6 +629,40 @@ class TestThemeManagerCustomThemes:
         assert "Error" not in result
         assert result == "default_base"
 
+    def test_create_custom_theme_from_seed(self, theme_manager):
+        """Test generating primary and accent scales from a seed color."""
+        result = theme_manager.create_custom_theme(
+            name="Seeded",
+            description="Generated palette",
+            base_theme="tech",
+            seed_color="#E91E63"
+        )
+
+        colors = theme_manager.get_theme_info(result)["colors"]
+        assert colors["primary"][0] == "#E91E63"
+        assert len(colors["primary"]) == 3
+        assert len(colors["accent"]) == 3
+        assert colors["accent"] != theme_manager.get_theme_info("tech")["colors"]["accent"]
+
+    def test_create_custom_theme_seed_overridden(self, theme_manager):
+        """Test explicit color overrides win over the seed."""
+        result = theme_manager.create_custom_theme(
+            name="Seeded",
+            description="Generated palette",
+            base_theme="tech",
+            seed_color="#E91E63",
+            color_overrides={"accent": ["#000000", "#000000", "#000000"]}
+        )
+
+        colors = theme_manager.get_theme_info(result)["colors"]
+        assert colors["primary"][0] == "#E91E63"
+        assert colors["accent"] == ["#000000", "#000000", "#000000"]
+
+    def test_create_custom_theme_invalid_seed(self, theme_manager):
+        """Test an unparseable seed color is reported."""
+        result = theme_manager.create_custom_theme("Bad", "Bad seed", seed_color="not-a-color")
+        assert result.startswith("Error")
+
     def test_custom_theme_key_format(self, theme_manager):
         """Test that custom theme keys are formatted correctly."""
         result = theme_manager.create_custom_theme(
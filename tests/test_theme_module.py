@@ -0,0 +1,179 @@
+"""
+Tests for the shared theme module.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from chuk_mcp_remotion.generator.component_builder import ComponentBuilder
+from chuk_mcp_remotion.generator.theme_module import (
+    MARKER,
+    MOTION_MODULE,
+    THEME_IMPORT,
+    ThemeRef,
+    build_motion_module,
+    build_theme_index,
+    build_theme_module,
+    font_stack,
+    link_theme_references,
+    resolve_theme,
+    theme_files
+)
+from chuk_mcp_remotion.generator.springs import BLUR_IN_SPRING, SMOOTH_SPRING, spring_key
+from chuk_mcp_remotion.themes.youtube_themes import YOUTUBE_THEMES
+from chuk_mcp_remotion.utils.project_manager import ProjectManager
+
+TEMPLATE_DIR = Path(__file__).parent.parent / "src" / "chuk_mcp_remotion" / "generator" / "templates"
+COMPONENTS = sorted(path.name[:-len(".tsx.j2")] for path in TEMPLATE_DIR.rglob("*.tsx.j2"))
+SPRING_COMPONENTS = ["BarChartRace", "CodeBlock", "LineChart", "LowerThird", "TitleScene"]
+MOTION_IMPORT = "import { springProgress } from '../theme/motion';"
+
+
+def ref(expression):
+    """Marker for a theme expression."""
+    return f"{MARKER}{expression}{MARKER}"
+
+
+class TestThemeRef:
+    """Tests for theme placeholders."""
+
+    def test_nested_access(self):
+        """Test attribute, item and get access build JS expressions."""
+        theme = ThemeRef(resolve_theme("tech"))
+
+        assert theme.colors.primary[0] == ref("theme.colors.primary[0]")
+        assert theme.typography.get("primary_font").fonts == ref("theme.typography.primary_font.fonts")
+        assert theme.typography.get("missing", "fallback") == "fallback"
+
+    def test_font_stack(self):
+        """Test font lists format the same baked or shared."""
+        fonts = ["Inter", "system-ui"]
+        assert font_stack(fonts) == "'Inter', 'system-ui'"
+        assert font_stack(ThemeRef(fonts, "theme.fonts")) == ref("\"'\" + theme.fonts.join(\"', '\") + \"'\"")
+
+
+class TestLinkThemeReferences:
+    """Tests for rewriting markers into theme expressions."""
+
+    @pytest.mark.parametrize("source, expected", [
+        ("background: '" + ref("theme.a") + "',", "background: theme.a,"),
+        ("border: '2px solid " + ref("theme.a") + "',", "border: `2px solid ${theme.a}`,"),
+        ("border: `2px solid " + ref("theme.a") + "`,", "border: `2px solid ${theme.a}`,"),
+        ("x: `${on ? '" + ref("theme.a") + "' : 'none'}`", "x: `${on ? theme.a : 'none'}`"),
+        ("damping: " + ref("theme.a") + ",", "damping: theme.a,"),
+        ('<line stroke="' + ref("theme.a") + '" />', "<line stroke={theme.a} />"),
+        ("label: 'it\\'s " + ref("theme.a") + "'", "label: `it's ${theme.a}`"),
+    ])
+    def test_contexts(self, source, expected):
+        """Test markers in strings, template literals, code and JSX attributes."""
+        linked = link_theme_references("import React from 'react';\n" + source)
+
+        assert linked == "import React from 'react';\n" + THEME_IMPORT + "\n" + expected
+
+    def test_no_references(self):
+        """Test components without theme values are left alone."""
+        source = "import React from 'react';\nconst a = 'b';"
+        assert link_theme_references(source) == source
+
+
+class TestSharedThemeComponents:
+    """Tests for components built against the shared theme module."""
+
+    @pytest.mark.parametrize("component", COMPONENTS)
+    def test_every_template_links(self, component):
+        """Test every template links its theme references and no longer depends on the theme."""
+        builder = ComponentBuilder()
+        tsx = builder.build_component(component, {}, "tech", shared_theme=True)
+
+        assert MARKER not in tsx
+        assert (THEME_IMPORT in tsx) == ("theme." in tsx)
+        assert builder.build_component(component, {}, "finance", shared_theme=True) == tsx
+
+    def test_same_source_for_every_theme(self):
+        """Test one component source serves every theme."""
+        builder = ComponentBuilder()
+        sources = {builder.build_component("LowerThird", {}, theme, shared_theme=True) for theme in YOUTUBE_THEMES}
+
+        assert len(sources) == 1
+        assert YOUTUBE_THEMES["tech"]["colors"]["primary"][0] not in sources.pop()
+
+    def test_baked_output_unchanged(self):
+        """Test the default build still bakes the theme values in."""
+        tsx = ComponentBuilder().build_component("TitleScene", {}, "tech")
+
+        assert "fontFamily: \"'Inter', 'SF Pro Display', 'system-ui', 'sans-serif'\"" in tsx
+        assert THEME_IMPORT not in tsx
+
+    @pytest.mark.parametrize("component", SPRING_COMPONENTS)
+    def test_spring_helper_shared(self, component):
+        """Test shared-theme components import springProgress and baked ones define it."""
+        builder = ComponentBuilder()
+        shared = builder.build_component(component, {}, "tech", shared_theme=True)
+        baked = builder.build_component(component, {}, "tech")
+
+        assert MOTION_IMPORT in shared
+        assert "const springProgress" not in shared and "spring(" not in shared
+        assert MOTION_IMPORT not in baked
+        assert baked.count("const springProgress") == 1
+
+
+class TestProjectTheme:
+    """Tests for theme modules in projects."""
+
+    def test_theme_module_written(self, tmp_path):
+        """Test new projects get the theme module and components import it."""
+        manager = ProjectManager(workspace_dir=tmp_path)
+        manager.create_project("demo", theme="gaming")
+        theme_dir = tmp_path / "demo" / "src" / "theme"
+
+        assert (theme_dir / "gaming.ts").read_text() == build_theme_module("gaming")
+        assert (theme_dir / "index.ts").read_text() == build_theme_index("gaming")
+        assert {path.name: path.read_text() for path in theme_dir.iterdir()} == theme_files("gaming")
+
+        component = Path(manager.add_component_to_project("LowerThird", {}, "gaming")).read_text()
+        assert THEME_IMPORT in component
+
+    def test_motion_module_written(self, tmp_path):
+        """Test shared-theme projects get easing tables for their fps."""
+        manager = ProjectManager(workspace_dir=tmp_path)
+        manager.create_project("demo", fps=60)
+
+        motion = (tmp_path / "demo" / "src" / "theme" / MOTION_MODULE).read_text()
+        assert motion == theme_files("tech", fps=60)[MOTION_MODULE]
+        assert "export const MOTION_FPS = 60;" in motion
+        assert motion.count("export const springProgress") == 1
+        spring = resolve_theme("tech")["motion"]["default_spring"]["config"]
+        for config in (SMOOTH_SPRING, BLUR_IN_SPRING, spring):
+            assert f'"{spring_key(config)}": [0, ' in motion
+        assert '"ease_in_out": [0.0, ' in motion
+        assert "export const ease = (name: EasingName, progress: number): number =>" in motion
+
+    def test_switch_touches_theme_files_only(self, tmp_path):
+        """Test switching themes rewrites src/theme without touching components."""
+        manager = ProjectManager(workspace_dir=tmp_path)
+        manager.create_project("demo", theme="tech")
+        component = Path(manager.add_component_to_project("LowerThird", {}, "tech"))
+        before = component.stat().st_mtime_ns
+
+        result = manager.set_project_theme("finance")
+
+        assert result["regenerate_components"] is False
+        assert (tmp_path / "demo" / "src" / "theme" / "index.ts").read_text() == "export { theme } from './finance';\n"
+        assert component.stat().st_mtime_ns == before
+        assert manager.current_composition.theme == "finance"
+
+    def test_unknown_theme(self, tmp_path):
+        """Test switching to an unknown theme is rejected."""
+        manager = ProjectManager(workspace_dir=tmp_path)
+        manager.create_project("demo")
+        with pytest.raises(ValueError, match="Unknown theme"):
+            manager.set_project_theme("neon")
+
+    def test_shared_components_keep_baked_theme(self, tmp_path):
+        """Test library projects keep per-theme library components."""
+        manager = ProjectManager(workspace_dir=tmp_path)
+        result = manager.create_project("demo", shared_components=True)
+
+        assert result["shared_theme"] is False
+        assert not (tmp_path / "demo" / "src" / "theme").exists()
@@ -27,12 +27,16 @@ class TestThemeTools:
             "remotion_get_theme_info",
             "remotion_search_themes",
             "remotion_compare_themes",
+            "remotion_find_similar_themes",
+            "remotion_audit_theme_contrast",
             "remotion_set_current_theme",
             "remotion_get_current_theme",
             "remotion_validate_theme",
             "remotion_create_custom_theme",
             "remotion_export_theme",
             "remotion_import_theme",
+            "remotion_export_themes",
+            "remotion_import_themes",
             "remotion_get_theme_for_content"
         ]
 
@@ -102,6 +106,70 @@ class TestThemeTools:
         assert "primary_colors" in comparison
         assert "motion_feel" in comparison
 
+    async def test_find_similar_themes(self, mcp_with_theme_tools):
+        """Test finding perceptually similar themes."""
+        tool = mcp_with_theme_tools.tools["remotion_find_similar_themes"]
+        result = await tool(theme_name="tech", limit=2)
+
+        data = json.loads(result)
+        assert data["theme"] == "tech"
+        assert len(data["similar"]) == 2
+        assert data["similar"][0]["key"] == "business"
+
+    async def test_find_similar_themes_invalid(self, mcp_with_theme_tools):
+        """Test finding similar themes for an unknown theme."""
+        tool = mcp_with_theme_tools.tools["remotion_find_similar_themes"]
+        result = await tool(theme_name="nonexistent")
+
+        data = json.loads(result)
+        assert "error" in data
+        assert "available_themes" in data
+
+    async def test_audit_theme_contrast(self, mcp_with_theme_tools):
+        """Test auditing contrast of all themes."""
+        tool = mcp_with_theme_tools.tools["remotion_audit_theme_contrast"]
+        result = await tool()
+
+        data = json.loads(result)
+        assert data["min_ratio"] == 4.5
+        assert "tech" in data["themes"]
+        assert "failures" in data["themes"]["tech"]
+        assert "pairs" not in data["themes"]["tech"]
+
+    async def test_audit_theme_contrast_single(self, mcp_with_theme_tools):
+        """Test auditing one theme with every pair included."""
+        tool = mcp_with_theme_tools.tools["remotion_audit_theme_contrast"]
+        result = await tool(theme_name="gaming", include_pairs=True)
+
+        data = json.loads(result)
+        assert list(data["themes"]) == ["gaming"]
+        assert len(data["themes"]["gaming"]["pairs"]) == data["themes"]["gaming"]["total"]
+
+    async def test_audit_theme_contrast_invalid(self, mcp_with_theme_tools):
+        """Test auditing an unknown theme."""
+        tool = mcp_with_theme_tools.tools["remotion_audit_theme_contrast"]
+        data = json.loads(await tool(theme_name="nonexistent"))
+        assert "error" in data
+
+    async def test_bulk_export_import_themes(self, mcp_with_theme_tools):
+        """Test exporting and re-importing themes by directory."""
+        export_tool = mcp_with_theme_tools.tools["remotion_export_themes"]
+        import_tool = mcp_with_theme_tools.tools["remotion_import_themes"]
+
+        exported = json.loads(await export_tool(directory="bulk", theme_names='["tech", "gaming"]'))
+        assert exported["status"] == "success"
+        assert set(exported["exported"]) == {"tech", "gaming"}
+
+        imported = json.loads(await import_tool(directory="bulk"))
+        assert imported["status"] == "success"
+        assert sorted(imported["imported"].values()) == ["gaming", "tech"]
+
+    async def test_export_themes_invalid_names(self, mcp_with_theme_tools):
+        """Test invalid theme_names JSON is reported."""
+        tool = mcp_with_theme_tools.tools["remotion_export_themes"]
+        data = json.loads(await tool(directory="bulk", theme_names="not json"))
+        assert "error" in data
+
     async def test_set_current_theme_valid(self, mcp_with_theme_tools):
         """Test setting valid current theme."""
         tool = mcp_with_theme_tools.tools["remotion_set_current_theme"]
@@ -182,6 +250,15 @@ class TestThemeTools:
         assert "theme_key" in data
         assert "theme" in data
 
+    async def test_create_custom_theme_from_seed(self, mcp_with_theme_tools):
+        """Test creating a custom theme from a seed color."""
+        tool = mcp_with_theme_tools.tools["remotion_create_custom_theme"]
+        result = await tool(name="Seeded", description="From a seed", seed_color="#E91E63")
+
+        data = json.loads(result)
+        assert data["status"] == "success"
+        assert data["theme"]["colors"]["primary"][0] == "#E91E63"
+
     async def test_create_custom_theme_no_base(self, mcp_with_theme_tools):
         """Test creating custom theme without base (defaults to tech)."""
         tool = mcp_with_theme_tools.tools["remotion_create_custom_theme"]
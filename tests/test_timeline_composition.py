@@ -0,0 +1,119 @@
+"""
+Tests for data-driven timeline compositions.
+"""
+
+import json
+
+import pytest
+
+from chuk_mcp_remotion.generator.composition_builder import CompositionBuilder
+from chuk_mcp_remotion.utils.project_manager import ProjectManager
+
+
+@pytest.fixture
+def composition():
+    """Composition with a top-level component and nested layout children."""
+    builder = CompositionBuilder(fps=30)
+    builder.theme = "finance"
+    builder.add_title_scene("Hello Alice", subtitle="Your 2024 report")
+    left = builder.create_code_block_instance("print('left')", start_frame=150, duration_frames=90)
+    right = builder.create_code_block_instance("print('right')", start_frame=150, duration_frames=90)
+    builder.add_split_screen(left_panel=left, right_panel=right, start_time=5.0, duration=3.0)
+    return builder
+
+
+class TestSerialization:
+    """Tests for to_dict/from_dict."""
+
+    def test_to_dict_is_json_serializable(self, composition):
+        """Test nested children serialize to plain data."""
+        data = json.loads(json.dumps(composition.to_dict()))
+        split = data["components"][1]
+
+        assert split["type"] == "SplitScreen"
+        assert split["props"]["leftPanel"]["type"] == "CodeBlock"
+        assert split["props"]["leftPanel"]["props"]["code"] == "print('left')"
+
+    def test_round_trip(self, composition):
+        """Test from_dict restores an equivalent composition."""
+        restored = CompositionBuilder.from_dict(json.loads(json.dumps(composition.to_dict())))
+
+        assert restored.theme == "finance"
+        assert restored.get_total_duration_frames() == composition.get_total_duration_frames()
+        assert restored.generate_composition_tsx() == composition.generate_composition_tsx()
+
+    def test_nested_children_not_duplicated(self, composition):
+        """Test children appended to the timeline are only serialized under their parent."""
+        child = composition.create_code_block_instance("x = 1", start_frame=0, duration_frames=30)
+        composition.components.append(child)
+        composition.add_container(child)
+        types = [c["type"] for c in composition.to_dict()["components"]]
+
+        assert types.count("CodeBlock") == 0
+        assert "Container" in types
+
+
+class TestTimelineCompositionTSX:
+    """Tests for the generated timeline interpreter."""
+
+    def test_imports_component_types(self, composition):
+        """Test every used component type is imported and registered."""
+        tsx = composition.generate_timeline_composition_tsx()
+
+        for component_type in ("TitleScene", "SplitScreen", "CodeBlock"):
+            assert f"import {{ {component_type} }} from './components/{component_type}';" in tsx
+            assert f"  {component_type},\n" in tsx
+
+    def test_does_not_bake_content(self, composition):
+        """Test timeline content is not embedded in the interpreter."""
+        tsx = composition.generate_timeline_composition_tsx()
+
+        assert "Hello Alice" not in tsx
+        assert "print('left')" not in tsx
+        assert "export const TimelineComposition" in tsx
+
+    def test_explicit_component_types(self, composition):
+        """Test bundling an explicit set of component types."""
+        tsx = composition.generate_timeline_composition_tsx(["LowerThird"])
+
+        assert "import { LowerThird }" in tsx
+        assert "import { TitleScene }" not in tsx
+
+
+class TestProjectTimeline:
+    """Tests for generating timeline projects."""
+
+    @pytest.fixture
+    def manager(self, tmp_path, composition):
+        """Project manager with a project using the fixture composition."""
+        manager = ProjectManager(workspace_dir=tmp_path)
+        manager.create_project("variants_demo", theme="finance")
+        manager.current_composition = composition
+        return manager
+
+    def test_generate_timeline_composition(self, manager, tmp_path):
+        """Test the project gets an interpreter, timeline props and a data-driven root."""
+        result = manager.generate_timeline_composition()
+        src = tmp_path / "variants_demo" / "src"
+
+        assert (src / "TimelineComposition.tsx").exists()
+        assert (src / "components" / "CodeBlock.tsx").exists()
+        assert json.loads((src / "timeline.json").read_text()) == manager.current_composition.to_dict()
+
+        root = (src / "Root.tsx").read_text()
+        assert 'id="variants-demo"' in root
+        assert "calculateMetadata" in root
+        assert "import timeline from './timeline.json';" in root
+        assert result["component_types"] == ["CodeBlock", "SplitScreen", "TitleScene"]
+
+    def test_export_variant_timeline(self, manager, tmp_path):
+        """Test variants are exported as props files."""
+        path = manager.export_timeline(tmp_path / "variants" / "bob.json")
+        data = json.loads(open(path).read())
+
+        assert data["components"][0]["props"]["text"] == "Hello Alice"
+
+    def test_requires_project(self, tmp_path):
+        """Test generating without a project fails."""
+        with pytest.raises(ValueError):
+            ProjectManager(workspace_dir=tmp_path).generate_timeline_composition()
@@ -0,0 +1,173 @@
+"""
+Tests for the render timing store and learned cost model.
+"""
+
+import sqlite3
+
+import pytest
+
+from chuk_mcp_remotion.generator.composition_builder import CompositionBuilder
+from chuk_mcp_remotion.renderer.benchmark import RENDER_BENCHMARK
+from chuk_mcp_remotion.renderer.cost_estimator import RenderCostEstimator
+from chuk_mcp_remotion.renderer.timing_store import (
+    MIN_FIT_SAMPLES,
+    TIMING_DB_FILENAME,
+    RenderTimingStore,
+)
+
+
+@pytest.fixture
+def composition():
+    """Composition alternating cheap and expensive seconds."""
+    builder = CompositionBuilder(fps=10)
+    for second in range(0, 12, 2):
+        builder.add_lower_third("Host", start_time=second, duration=1.0)
+        builder.add_code_block("x = 1", start_time=second + 1, duration=1.0)
+    return builder
+
+
+def simulated_segments(composition, base_ms, weights):
+    """Produce one-second segment timings from a known cost model."""
+    estimator = RenderCostEstimator(weights=weights, base_frame_ms=base_ms)
+    costs = estimator.frame_profile(composition)["cost_ms"]
+    return [
+        {"start_frame": start, "end_frame": start + 10, "render_seconds": sum(costs[start:start + 10]) / 1000}
+        for start in range(0, len(costs), 10)
+    ]
+
+
+class TestRecording:
+    """Tests for recording render jobs."""
+
+    def test_creates_database(self, tmp_path):
+        """Test the SQLite database is created in the workspace."""
+        RenderTimingStore(tmp_path)
+        assert (tmp_path / TIMING_DB_FILENAME).exists()
+
+    def test_record_job_with_segments(self, tmp_path, composition):
+        """Test jobs and segments are persisted."""
+        store = RenderTimingStore(tmp_path)
+        entry = store.record_job(
+            composition, actual_seconds=60.0, concurrency=4, chunk_size=10,
+            segments=[{"start_frame": 0, "end_frame": 10, "render_seconds": 0.3}]
+        )
+
+        assert entry["frames"] == 120
+        assert entry["segments"] == 1
+        assert RenderTimingStore(tmp_path).job_count() == 1
+        assert RenderTimingStore(tmp_path).segment_count() == 1
+
+    def test_rejects_invalid_segment(self, tmp_path, composition):
+        """Test empty segment ranges are rejected."""
+        store = RenderTimingStore(tmp_path)
+        with pytest.raises(ValueError):
+            store.record_job(
+                composition, actual_seconds=60.0, concurrency=4,
+                segments=[{"start_frame": 10, "end_frame": 10, "render_seconds": 1.0}]
+            )
+        assert store.job_count() == 0
+
+
+class TestCalibration:
+    """Tests for whole-job calibration."""
+
+    def test_no_history(self, tmp_path):
+        """Test calibration defaults to 1.0 without history."""
+        assert RenderTimingStore(tmp_path).calibration() == 1.0
+
+    def test_median_ratio(self, tmp_path, composition):
+        """Test calibration is the median actual/baseline ratio."""
+        store = RenderTimingStore(tmp_path)
+        baseline = RenderCostEstimator().estimate(composition, concurrency=4)["predicted_render_seconds"]
+        for ratio in (2.0, 3.0, 20.0):
+            store.record_job(composition, actual_seconds=baseline * ratio, concurrency=4)
+
+        assert store.calibration() == pytest.approx(3.0, rel=0.01)
+
+    def test_estimator_uses_calibration_without_segments(self, tmp_path, composition):
+        """Test job-only history falls back to calibrated benchmark weights."""
+        store = RenderTimingStore(tmp_path)
+        baseline = RenderCostEstimator().estimate(composition, concurrency=4)["predicted_render_seconds"]
+        store.record_job(composition, actual_seconds=baseline * 2, concurrency=4)
+
+        assert store.build_estimator().calibration == pytest.approx(2.0, rel=0.01)
+
+
+class TestCostModel:
+    """Tests for fitting per-component weights."""
+
+    def test_not_enough_samples(self, tmp_path, composition):
+        """Test fitting needs a minimum number of segments."""
+        store = RenderTimingStore(tmp_path)
+        segments = simulated_segments(composition, 20.0, {})[:MIN_FIT_SAMPLES - 1]
+        store.record_job(composition, actual_seconds=10.0, concurrency=1, segments=segments)
+
+        assert store.fit_weights() is None
+
+    def test_recovers_component_weights(self, tmp_path, composition):
+        """Test the fit moves weights from the benchmark towards measured costs."""
+        store = RenderTimingStore(tmp_path)
+        for _ in range(5):
+            segments = simulated_segments(composition, 10.0, {"CodeBlock": 40.0, "LowerThird": 2.0})
+            store.record_job(composition, actual_seconds=10.0, concurrency=1, segments=segments)
+
+        fitted = store.fit_weights()
+
+        assert fitted["samples"] == 60
+        assert fitted["weights"]["CodeBlock"] > RENDER_BENCHMARK["component_ms_per_frame"]["CodeBlock"] * 2
+        assert fitted["weights"]["CodeBlock"] > fitted["weights"]["LowerThird"]
+
+    def test_matches_benchmark_when_measurements_agree(self, tmp_path, composition):
+        """Test timings generated by the benchmark reproduce the benchmark."""
+        store = RenderTimingStore(tmp_path)
+        segments = simulated_segments(composition, RENDER_BENCHMARK["base_frame_ms"], {})
+        store.record_job(composition, actual_seconds=10.0, concurrency=1, segments=segments)
+        fitted = store.fit_weights()
+
+        assert fitted["base_frame_ms"] == pytest.approx(RENDER_BENCHMARK["base_frame_ms"], rel=0.01)
+        assert fitted["weights"]["CodeBlock"] == pytest.approx(
+            RENDER_BENCHMARK["component_ms_per_frame"]["CodeBlock"], rel=0.01
+        )
+
+    def test_build_estimator_uses_fitted_weights(self, tmp_path, composition):
+        """Test the estimator switches to fitted weights once trained."""
+        store = RenderTimingStore(tmp_path)
+        segments = simulated_segments(composition, 10.0, {"CodeBlock": 40.0})
+        store.record_job(composition, actual_seconds=10.0, concurrency=1, segments=segments)
+        estimator = store.build_estimator()
+        fitted = store.fit_weights()
+
+        assert estimator.calibration == 1.0
+        assert estimator.component_weight("CodeBlock") == fitted["weights"]["CodeBlock"]
+        assert estimator.base_frame_ms == fitted["base_frame_ms"]
+
+    def test_fitted_estimator_keeps_bundle_calibration(self, tmp_path, composition):
+        """Test whole-job calibration still scales bundling once weights are fitted."""
+        store = RenderTimingStore(tmp_path)
+        baseline = RenderCostEstimator().estimate(composition, concurrency=1)["predicted_render_seconds"]
+        segments = simulated_segments(composition, 10.0, {})
+        store.record_job(composition, actual_seconds=baseline * 2, concurrency=1, segments=segments)
+        estimate = store.build_estimator().estimate(composition, concurrency=1)
+
+        assert estimate["predicted_breakdown"]["bundle_seconds"] == pytest.approx(
+            RENDER_BENCHMARK["bundle_ms"] * 2 / 1000, rel=0.01
+        )
+
+    def test_connections_closed(self, tmp_path, composition, monkeypatch):
+        """Test every connection the store opens is closed again."""
+        opened = []
+        connect = sqlite3.connect
+
+        def tracking_connect(*args, **kwargs):
+            opened.append(connect(*args, **kwargs))
+            return opened[-1]
+
+        monkeypatch.setattr(sqlite3, "connect", tracking_connect)
+        store = RenderTimingStore(tmp_path)
+        store.record_job(composition, actual_seconds=1.0, concurrency=1)
+        store.calibration()
+
+        assert len(opened) == 3
+        for conn in opened:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
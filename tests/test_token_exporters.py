@@ -0,0 +1,105 @@
+"""
+Tests for token exporters (CSS, TypeScript, Style Dictionary).
+"""
+
+import json
+
+import pytest
+
+from chuk_mcp_remotion.tokens.exporters import (
+    css_name,
+    render_token_files,
+    to_css,
+    to_style_dictionary,
+    to_typescript,
+    token_entries,
+)
+from chuk_mcp_remotion.tokens.token_store import DEFAULT_TOKENS
+
+
+class TestTokenEntries:
+    """Test flattening token trees into entries."""
+
+    def test_lists_and_meta_keys(self):
+        """Test font stacks, curves, numbered lists and skipped descriptive keys."""
+        tree = {
+            "display": {"name": "Display", "fonts": ["Inter", "sans-serif"], "usage": "Titles"},
+            "smooth": {"curve": [0.4, 0, 0.2, 1], "description": "Smooth ease"},
+            "primary": ["#000", "#111"]
+        }
+
+        assert token_entries(tree) == [
+            (("display", "fonts"), '"Inter", sans-serif', None),
+            (("smooth", "curve"), "cubic-bezier(0.4, 0, 0.2, 1)", "Smooth ease"),
+            (("primary", "0"), "#000", None),
+            (("primary", "1"), "#111", None)
+        ]
+
+    def test_css_name(self):
+        """Test camelCase and snake_case keys become kebab-case."""
+        assert css_name(["motion", "spring_configs", "smooth", "config", "damping"]) == (
+            "--motion-spring-configs-smooth-config-damping"
+        )
+        assert css_name(["motion", "from", "translateY"]) == "--motion-from-translate-y"
+
+
+class TestRenderers:
+    """Test the three output formats."""
+
+    TREE = {
+        "tech": {
+            "description": "Tech theme",
+            "primary": ["#0066FF"],
+            "dark_mode": True
+        }
+    }
+
+    def test_css(self):
+        """Test custom properties on :root."""
+        css = to_css("colors", self.TREE)
+
+        assert ":root {" in css
+        assert "  --colors-tech-primary-0: #0066FF;" in css
+        assert "  --colors-tech-dark-mode: true;" in css
+        assert "Tech theme" not in css
+
+    def test_typescript(self):
+        """Test a readonly constant and its type."""
+        ts = to_typescript("colors", self.TREE)
+
+        assert "export const colors = {" in ts
+        assert "} as const;" in ts
+        assert "export type ColorTokens = typeof colors;" in ts
+        assert '"description": "Tech theme"' in ts
+
+    def test_style_dictionary(self):
+        """Test value/comment leaves nested under the token type."""
+        data = json.loads(to_style_dictionary("colors", self.TREE))
+
+        assert data["colors"]["tech"]["primary"]["0"] == {
+            "value": "#0066FF",
+            "comment": "Tech theme"
+        }
+
+
+class TestRenderTokenFiles:
+    """Test rendering every format for a snapshot."""
+
+    def test_all_defaults(self):
+        """Test all formats render for every default token type."""
+        files = render_token_files(DEFAULT_TOKENS, ["css", "ts", "style-dictionary"])
+
+        assert sorted(files) == sorted(
+            f"{token_type}{suffix}"
+            for token_type in ("typography", "colors", "motion")
+            for suffix in (".css", ".ts", ".tokens.json")
+        )
+        assert "--typography-font-families-display-fonts:" in files["typography.css"]
+        assert "cubic-bezier(" in files["motion.css"]
+        for name in ("typography", "colors", "motion"):
+            assert json.loads(files[f"{name}.tokens.json"])[name]
+
+    def test_unknown_format(self):
+        """Test unknown formats are rejected."""
+        with pytest.raises(ValueError, match="Unknown export format"):
+            render_token_files(DEFAULT_TOKENS, ["css", "scss"])
@@ -347,6 +347,52 @@ class TestExportAllTokens:
         assert json.loads(motion_content)
 
 
+class TestExportTokenFormats:
+    """Test exporting tokens as CSS, TypeScript and Style Dictionary files."""
+
+    @pytest.mark.asyncio
+    async def test_export_writes_every_format(self, token_manager):
+        """Test one call writes each format for each token type."""
+        report = await token_manager.export_token_formats("front_end")
+
+        assert len(report["written"]) == 9
+        assert report["unchanged"] == []
+        assert report["failed"] == {}
+        css = await token_manager.vfs.read_text("front_end/colors.css")
+        assert "--colors-tech-primary-0:" in css
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_not_rewritten(self, token_manager):
+        """Test repeat exports only rewrite files whose content changed."""
+        await token_manager.export_token_formats("front_end")
+
+        again = await token_manager.export_token_formats("front_end")
+        assert again["written"] == []
+        assert len(again["unchanged"]) == 9
+
+        token_manager.custom_motion_tokens = {"durations": {"fast": {"frames": 7}}}
+        changed = await token_manager.export_token_formats("front_end")
+        assert sorted(changed["written"]) == [
+            "front_end/motion.css", "front_end/motion.tokens.json", "front_end/motion.ts"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_missing_file_rewritten(self, token_manager):
+        """Test a deleted output file is written again."""
+        await token_manager.export_token_formats("front_end", formats=["css"])
+        await token_manager.vfs.rm("front_end/colors.css")
+
+        report = await token_manager.export_token_formats("front_end", formats=["css"])
+
+        assert report["written"] == ["front_end/colors.css"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_token_type(self, token_manager):
+        """Test unknown token types are rejected."""
+        with pytest.raises(ValueError, match="Unknown token type"):
+            await token_manager.export_token_formats("front_end", token_types=["spacing"])
+
+
 class TestTokenGetters:
     """Test token getter methods."""
 
@@ -391,6 +437,67 @@ class TestTokenGetters:
         assert "config" in result
 
 
+class TestLayeredTokens:
+    """Test imported tokens and project overrides layered over the defaults."""
+
+    @pytest.mark.asyncio
+    async def test_merge_import_is_deep(self, token_manager):
+        """Test merging an import keeps sibling keys of earlier imports."""
+        token_manager.custom_motion_tokens = {"spring_configs": {"a": {"name": "A"}}}
+        await token_manager.vfs.write_file(
+            "motion.json", json.dumps({"spring_configs": {"b": {"name": "B"}}})
+        )
+
+        await token_manager.import_motion_tokens("motion.json", merge=True)
+
+        assert set(token_manager.custom_motion_tokens["spring_configs"]) == {"a", "b"}
+
+    @pytest.mark.asyncio
+    async def test_partial_override_falls_back_per_key(self, token_manager):
+        """Test overriding one key leaves the rest of the category from the defaults."""
+        token_manager.custom_color_tokens = {"tech": {"primary": ["#123456"]}}
+
+        assert token_manager.get_color_token("tech", "primary") == ["#123456"]
+        assert token_manager.get_color_token("tech", "accent") == ["#00D9FF", "#00B8D4", "#0097A7"]
+        assert token_manager.get_color_token("tech")["gradient"].startswith("linear-gradient")
+        assert token_manager.get_color_token("tech", "primary", use_custom=False)[0] == "#0066FF"
+
+    @pytest.mark.asyncio
+    async def test_project_overrides_apply_while_active(self, token_manager):
+        """Test project overrides sit above imports and follow the active project."""
+        token_manager.custom_motion_tokens = {"durations": {"fast": {"frames": 5}}}
+        token_manager.set_project_tokens("demo", "motion", {"durations": {"fast": {"frames": 7}}})
+
+        assert token_manager.get_motion_token("durations", "fast")["frames"] == 5
+
+        token_manager.activate_project("demo")
+        assert token_manager.get_motion_token("durations", "fast")["frames"] == 7
+
+        token_manager.activate_project("other")
+        assert token_manager.get_motion_token("durations", "fast")["frames"] == 5
+
+    @pytest.mark.asyncio
+    async def test_project_changes_notify_listeners(self, token_manager):
+        """Test switching projects reports the tokens that changed."""
+        changes = []
+        token_manager.add_change_listener(changes.append)
+        token_manager.activate_project("demo")
+
+        token_manager.set_project_tokens("demo", "typography", {"font_families": {"display": {"name": "X"}}})
+        token_manager.activate_project(None)
+
+        assert changes == [
+            {("typography", "font_families", "display")},
+            {("typography", "font_families", "display")}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unknown_token_type(self, token_manager):
+        """Test project overrides reject unknown token types."""
+        with pytest.raises(ValueError):
+            token_manager.set_project_tokens("demo", "sounds", {})
+
+
 class TestUtilityMethods:
     """Test utility methods."""
 
@@ -0,0 +1,90 @@
+"""
+Tests for the layered token store.
+"""
+
+from chuk_mcp_remotion.tokens.motion import MOTION_TOKENS
+from chuk_mcp_remotion.tokens.token_store import TokenStore, deep_merge, flatten
+
+
+class TestHelpers:
+    """Test merging and flattening."""
+
+    def test_deep_merge_keeps_siblings(self):
+        """Test nested keys are merged and untouched subtrees shared."""
+        shared = {"x": 1}
+        base = {"a": {"b": 1, "c": 2}, "d": shared}
+
+        merged = deep_merge(base, {"a": {"b": 5}, "e": [1]})
+
+        assert merged == {"a": {"b": 5, "c": 2}, "d": {"x": 1}, "e": [1]}
+        assert merged["d"] is shared
+        assert base["a"]["b"] == 1
+
+    def test_non_dict_values_replace(self):
+        """Test lists and scalars replace rather than merge."""
+        assert deep_merge({"a": [1, 2]}, {"a": [3]}) == {"a": [3]}
+        assert deep_merge({"a": {"b": 1}}, {"a": "flat"}) == {"a": "flat"}
+
+    def test_flatten_includes_interior_nodes(self):
+        """Test every node is keyed by its dotted path."""
+        flat = flatten({"a": {"b": {"c": 1}}, "d": 2})
+        assert flat == {"a": {"b": {"c": 1}}, "a.b": {"c": 1}, "a.b.c": 1, "d": 2}
+
+
+class TestTokenStore:
+    """Test layered lookups and change reporting."""
+
+    def test_defaults(self):
+        """Test lookups fall through to the defaults."""
+        store = TokenStore()
+        assert store.get("motion.spring_configs.smooth") is MOTION_TOKENS["spring_configs"]["smooth"]
+        assert store.get("motion") is MOTION_TOKENS
+        assert store.get("motion.nope") is None
+        assert store.get("sounds.any", "fallback") == "fallback"
+
+    def test_layer_order(self):
+        """Test project overrides win over imported tokens, which win over defaults."""
+        store = TokenStore()
+        store.set_layer("imported", "colors", {"tech": {"primary": ["#111111"], "gradient": "imported"}})
+        store.set_layer("project", "colors", {"tech": {"primary": ["#222222"]}})
+
+        assert store.get("colors.tech.primary") == ["#222222"]
+        assert store.get("colors.tech.gradient") == "imported"
+        assert store.get("colors.tech.accent") == store.get("colors.tech.accent", use_custom=False)
+        assert store.get("colors.tech.primary", use_custom=False) == ["#0066FF", "#0052CC", "#003D99"]
+        assert store.overrides("colors", "tech") == {"primary": ["#222222"], "gradient": "imported"}
+        assert store.overrides("colors", "finance") == {}
+
+    def test_tree_is_merged(self):
+        """Test the merged tree matches the flattened values."""
+        store = TokenStore()
+        store.set_layer("imported", "motion", {"durations": {"fast": {"frames": 1}}})
+
+        tree = store.tree("motion")
+
+        assert tree["durations"]["fast"]["frames"] == 1
+        assert tree["durations"]["fast"]["seconds"] == MOTION_TOKENS["durations"]["fast"]["seconds"]
+        assert tree["durations"]["normal"] is MOTION_TOKENS["durations"]["normal"]
+
+    def test_changes(self):
+        """Test changes are reported per token, and per theme for colors."""
+        store = TokenStore()
+
+        changes = store.set_layer("imported", "motion", {"spring_configs": {"smooth": {"name": "X"}}})
+        assert changes == {("motion", "spring_configs", "smooth")}
+
+        changes = store.set_layer("imported", "colors", {"tech": {"text": {"muted": "#000000"}}})
+        assert changes == {("colors", "tech", None)}
+
+        assert store.set_layer("imported", "colors", {"tech": {"text": {"muted": "#000000"}}}) == set()
+        assert store.set_layer("project", "motion", {}) == set()
+
+    def test_clearing_restores_defaults(self):
+        """Test an empty layer gives back the default values."""
+        store = TokenStore()
+        store.set_layer("imported", "motion", {"custom": 1})
+
+        changes = store.set_layer("imported", "motion", {})
+
+        assert changes == {("motion", "custom", None)}
+        assert store.tree("motion") is MOTION_TOKENS
@@ -47,6 +47,8 @@ class TestTokenTools:
             "remotion_import_color_tokens",
             "remotion_export_motion_tokens",
             "remotion_import_motion_tokens",
+            "remotion_set_project_tokens",
+            "remotion_export_token_formats",
             "remotion_export_all_tokens"
         ]
 
@@ -646,6 +648,21 @@ class TestTokenImportExportTools:
         assert "motion" in data["files"]
         assert "All tokens exported successfully" in data["message"]
 
+    @pytest.mark.asyncio
+    async def test_export_token_formats(self, mcp_with_token_tools):
+        """Test exporting selected formats and token types."""
+        tool = mcp_with_token_tools.tools["remotion_export_token_formats"]
+
+        data = json.loads(await tool(
+            output_dir="front_end", formats='["css", "ts"]', token_types='["colors"]'
+        ))
+        assert data["status"] == "success"
+        assert sorted(data["written"]) == ["front_end/colors.css", "front_end/colors.ts"]
+
+        bad = json.loads(await tool(output_dir="front_end", formats='["less"]'))
+        assert "Unknown export format" in bad["error"]
+        assert "error" in json.loads(await tool(output_dir="front_end", formats='"css"'))
+
     # Error Path Tests
 
     @pytest.mark.asyncio
@@ -677,3 +694,36 @@ class TestTokenImportExportTools:
         data = json.loads(result)
         assert "error" in data
         assert "VFS write error" in data["error"] or "Error" in data["error"]
+
+    @pytest.mark.asyncio
+    async def test_set_project_tokens_requires_project(self, mcp_with_token_tools):
+        """Test project overrides need a current project."""
+        tool = mcp_with_token_tools.tools["remotion_set_project_tokens"]
+        data = json.loads(await tool(token_type="motion", tokens="{}"))
+        assert "No active project" in data["error"]
+
+    @pytest.mark.asyncio
+    async def test_set_project_tokens_applies_to_lookups(self, mcp_with_token_tools, project_manager):
+        """Test project overrides show up in the token tools."""
+        project_manager.current_project = "demo"
+        set_tool = mcp_with_token_tools.tools["remotion_set_project_tokens"]
+        get_tool = mcp_with_token_tools.tools["remotion_get_font_sizes"]
+
+        data = json.loads(await set_tool(
+            token_type="typography",
+            tokens='{"font_sizes": {"video_1080p": {"xl": "99px"}}}'
+        ))
+        sizes = json.loads(await get_tool(resolution="video_1080p"))["font_sizes"]
+
+        assert data["status"] == "success"
+        assert sizes["xl"] == "99px"
+        assert sizes["base"] == "40px"
+
+    @pytest.mark.asyncio
+    async def test_set_project_tokens_invalid(self, mcp_with_token_tools, project_manager):
+        """Test bad JSON and unknown token types are reported."""
+        project_manager.current_project = "demo"
+        tool = mcp_with_token_tools.tools["remotion_set_project_tokens"]
+
+        assert "error" in json.loads(await tool(token_type="motion", tokens="nope"))
+        assert "error" in json.loads(await tool(token_type="sounds", tokens="{}"))
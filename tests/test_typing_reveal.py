@@ -0,0 +1,89 @@
+"""
+Tests for precomputed TypingCode reveal tables.
+"""
+
+import pytest
+
+from chuk_mcp_remotion.generator.composition_builder import CompositionBuilder
+from chuk_mcp_remotion.generator.syntax import tokenize_code
+from chuk_mcp_remotion.generator.typing_reveal import build_reveal_table, chars_per_second
+
+
+class TestRevealTable:
+    """Tests for the frame to (chars, line, token) table."""
+
+    def test_constant_speed(self):
+        """Test a constant rate reveals chars like the old chars-per-frame formula."""
+        table = build_reveal_table("abcdef", fps=30, duration_frames=100, typing_speed=60.0)
+
+        # Two characters per frame, starting after the start delay
+        assert table["start_delay"] == 10
+        assert table["chars"] == [0, 2, 4, 6]
+
+    def test_table_capped_by_duration(self):
+        """Test the table never extends past the component."""
+        table = build_reveal_table("x" * 1000, fps=30, duration_frames=40, typing_speed="slow")
+
+        assert len(table["chars"]) == 30
+        assert table["chars"] == sorted(table["chars"])
+
+    def test_instant(self):
+        """Test instant typing shows everything at once."""
+        table = build_reveal_table("a\nb", fps=30, duration_frames=60, typing_speed="instant")
+
+        assert table["chars"] == [3]
+        assert table["lines"] == [1]
+
+    def test_line_pause(self):
+        """Test typing lingers at the end of each line."""
+        plain = build_reveal_table("ab\ncd", fps=30, duration_frames=300, typing_speed=30.0)
+        paused = build_reveal_table("ab\ncd", fps=30, duration_frames=300, typing_speed=30.0, line_pause=1.0)
+
+        assert len(paused["chars"]) == len(plain["chars"]) + 30
+        assert paused["chars"].count(2) == plain["chars"].count(2) + 30
+
+    def test_jitter_is_seeded(self):
+        """Test jitter varies timing but is reproducible."""
+        code = "for i in range(10):\n    print(i)\n" * 3
+        first = build_reveal_table(code, 30, 600, jitter=0.5)
+        second = build_reveal_table(code, 30, 600, jitter=0.5)
+        smooth = build_reveal_table(code, 30, 600)
+        other_seed = build_reveal_table(code, 30, 600, jitter=0.5, seed=7)
+
+        assert first == second
+        assert first["chars"] != smooth["chars"]
+        assert first["chars"] != other_seed["chars"]
+
+    def test_cursor_line_and_token(self):
+        """Test each frame records the cursor's line and visible token count."""
+        code = "x = 1\ny = 2"
+        code_tokens = tokenize_code(code, "python")
+        table = build_reveal_table(code, 30, 100, typing_speed=30.0, code_tokens=code_tokens)
+
+        # One character per frame: "x" -> line 0, one token
+        assert (table["chars"][1], table["lines"][1], table["tokens"][1]) == (1, 0, 1)
+        # After the newline the cursor is on an empty second line
+        assert (table["chars"][6], table["lines"][6], table["tokens"][6]) == (6, 1, 0)
+        assert (table["lines"][-1], table["chars"][-1]) == (1, len(code))
+
+    def test_invalid_settings(self):
+        """Test unknown speeds and out-of-range jitter raise."""
+        with pytest.raises(ValueError, match="Unknown typing speed"):
+            chars_per_second("ludicrous")
+        with pytest.raises(ValueError, match="jitter"):
+            build_reveal_table("x", 30, 30, jitter=1.5)
+
+
+class TestTypingCodeComponent:
+    """Tests for add_typing_code props."""
+
+    def test_reveal_prop(self):
+        """Test add_typing_code passes the reveal table and a numeric speed."""
+        builder = CompositionBuilder(fps=30)
+        builder.add_typing_code("print(1)", language="python", typing_speed="normal", jitter=0.2)
+        props = builder.components[0].props
+
+        assert props["reveal"]["chars"][-1] == len("print(1)")
+        assert "tokens" in props["reveal"]
+        assert props["typing_speed"] == 1.5
+        assert "reveal={" in builder.generate_composition_tsx()